@@ -0,0 +1,74 @@
+"""Measures the cold-start import cost of the client
+
+Each statement is run in a fresh interpreter several times and the fastest run is reported: the wall-clock time of
+the statement and how many of the package's modules it imported. ``python -X importtime`` of the fastest run gives
+the slowest modules with ``--top``, e.g.::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --top 5 "from tikhub_generated_python_client.models import ResponseModel"
+
+``-X importtime`` only sees ``import`` statements, not ``importlib.import_module``, which is why the totals are
+timed separately.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+PACKAGE = "tikhub_generated_python_client"
+
+STATEMENTS = (
+    f"import {PACKAGE}",
+    f"from {PACKAGE} import Client",
+    f"from {PACKAGE}.api.tik_tok_web_api import fetch_user_post_api_v1_tiktok_web_fetch_user_post_get",
+    f"from {PACKAGE}.models import ResponseModel",
+    f"from {PACKAGE}.models import *",
+)
+
+_TIMER = """
+import sys, time
+started_at = time.perf_counter()
+exec(compile(sys.argv[1], "<statement>", "exec"), {})
+elapsed = time.perf_counter() - started_at
+print(elapsed, sum(1 for name in sys.modules if name == sys.argv[2] or name.startswith(sys.argv[2] + ".")))
+"""
+
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def measure(statement: str) -> tuple[float, int]:
+    """Run ``statement`` in a new interpreter, returning how long it took in ms and how many package modules it loaded"""
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMER, statement, PACKAGE], capture_output=True, text=True, check=True
+    )
+    elapsed, modules = result.stdout.split()
+    return float(elapsed) * 1000, int(modules)
+
+
+def slowest_modules(statement: str, top: int) -> list[tuple[float, str]]:
+    """Get the ``top`` modules with the largest self import time in ms, according to ``python -X importtime``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    modules = [(int(match.group(1)) / 1000, match.group(3)) for match in _IMPORTTIME_LINE.finditer(result.stderr)]
+    return sorted(modules, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("statements", nargs="*", default=STATEMENTS, help="Python statements to time")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per statement (the fastest wins)")
+    parser.add_argument("--top", type=int, default=0, help="Also list this many of the slowest modules to import")
+    args = parser.parse_args()
+
+    for statement in args.statements:
+        milliseconds, modules = min(measure(statement) for _ in range(args.repeat))
+        print(f"{milliseconds:8.1f} ms {modules:5d} modules  {statement}")
+        for module_milliseconds, name in slowest_modules(statement, args.top):
+            print(f"    {module_milliseconds:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compares the JSON decoders a client can parse response bodies with
+
+Pass recorded response bodies (e.g. saved from ``response.content``) to measure on real payloads; without any, a
+synthetic search result page of a few hundred KB is used::
+
+    python benchmarks/json_decode.py
+    python benchmarks/json_decode.py recorded/general_search_v3.json recorded/top_products.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Run from a checkout: the package is in the parent directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tikhub_generated_python_client.decoding import msgspec_loads, orjson_loads, stdlib_loads
+from tikhub_generated_python_client.models import ResponseModel
+
+DECODERS = {"json": stdlib_loads, "orjson": orjson_loads, "msgspec": msgspec_loads}
+
+
+def synthetic_payload(items: int = 200) -> bytes:
+    """A response shaped like a video search result page"""
+    rng = random.Random(0)
+
+    def video(i: int) -> dict:
+        return {
+            "aweme_id": str(7300000000000000000 + i),
+            "desc": "测试视频 #话题 " * rng.randint(1, 8) + "a test video description",
+            "create_time": 1700000000 + i,
+            "author": {
+                "uid": str(rng.getrandbits(62)),
+                "sec_uid": "MS4wLjABAAAA" + "x" * 64,
+                "nickname": f"用户{i}",
+                "avatar_thumb": {"url_list": [f"https://p3.example.com/avatar/{i}.jpeg?x-expires=1700000000"] * 3},
+                "follower_count": rng.randint(0, 10**7),
+            },
+            "statistics": {
+                "digg_count": rng.randint(0, 10**6),
+                "comment_count": rng.randint(0, 10**5),
+                "share_count": rng.randint(0, 10**5),
+                "play_count": rng.randint(0, 10**8),
+            },
+            "video": {
+                "duration": rng.randint(5000, 600000),
+                "ratio": "1080p",
+                "play_addr": {"url_list": [f"https://v3.example.com/video/{i}/{j}.mp4" for j in range(3)]},
+                "bit_rate": [{"bit_rate": rng.randint(10**5, 10**7), "gear_name": f"gear_{j}"} for j in range(4)],
+            },
+            "text_extra": [{"hashtag_name": f"话题{j}", "start": j, "end": j + 3} for j in range(rng.randint(0, 5))],
+            "is_top": rng.random() < 0.1,
+            "score": rng.random(),
+        }
+
+    data = {"data": [{"type": 1, "aweme_info": video(i)} for i in range(items)], "cursor": items, "has_more": 1}
+    return json.dumps({"code": 200, "router": "/api/v1/douyin/search/fetch_general_search_v3", "data": data}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payloads", nargs="*", type=Path, help="Files holding recorded response bodies")
+    parser.add_argument("--number", type=int, default=50, help="Decodes per measurement")
+    args = parser.parse_args()
+
+    payloads = {path.name: path.read_bytes() for path in args.payloads} or {"synthetic": synthetic_payload()}
+    for name, content in payloads.items():
+        print(f"{name} ({len(content) / 1024:.0f} KB)")
+        baseline = None
+        for decoder_name, loads in DECODERS.items():
+            try:
+                loads(content)
+            except ImportError:
+                print(f"    {decoder_name:8} not installed")
+                continue
+            decode = min(timeit.repeat(lambda: loads(content), number=args.number, repeat=5)) / args.number
+            parse = (
+                min(timeit.repeat(lambda: ResponseModel.from_dict(loads(content)), number=args.number, repeat=5))
+                / args.number
+            )
+            baseline = baseline or parse
+            print(
+                f"    {decoder_name:8} decode {decode * 1000:7.2f} ms   decode + from_dict {parse * 1000:7.2f} ms"
+                f"   {baseline / parse:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
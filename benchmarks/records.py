@@ -0,0 +1,84 @@
+"""Compares keeping videos as decoded dict trees with keeping them as records
+
+Memory is what stays allocated for the kept items; construction time is per item, from the decoded dict. Pass
+recorded response bodies (pages of Douyin awemes or tiktok_web items) to measure on real payloads; without any, the
+synthetic search page of json_decode.py is used::
+
+    python benchmarks/records.py
+    python benchmarks/records.py --pages 50 recorded/fetch_user_post.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Run from a checkout: the package is in the parent directory, json_decode.py next to this script
+sys.path[:0] = [str(Path(__file__).resolve().parent.parent), str(Path(__file__).resolve().parent)]
+
+from json_decode import synthetic_payload
+
+from tikhub_generated_python_client.records import Video
+
+
+def find_videos(value: Any) -> list[dict]:
+    """Get the videos of a decoded body: every dict with an ``aweme_id``, or a tiktok_web item"""
+    if isinstance(value, dict):
+        if "aweme_id" in value or ("id" in value and "stats" in value):
+            return [value]
+        return [video for child in value.values() for video in find_videos(child)]
+    if isinstance(value, list):
+        return [video for child in value for video in find_videos(child)]
+    return []
+
+
+def retained(keep: Callable[[bytes], list], bodies: list[bytes]) -> int:
+    """Bytes still allocated after keeping the result of ``keep`` for every body"""
+    gc.collect()
+    tracemalloc.start()
+    kept = [keep(body) for body in bodies]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payloads", nargs="*", type=Path, help="Files holding recorded response bodies")
+    parser.add_argument("--pages", type=int, default=20, help="Copies of each payload to keep")
+    args = parser.parse_args()
+
+    bodies = [path.read_bytes() for path in args.payloads] or [synthetic_payload()]
+    bodies = bodies * args.pages
+    videos = [video for body in bodies[: len(bodies) // args.pages] for video in find_videos(json.loads(body))]
+    print(f"{len(bodies)} pages, {len(videos) * args.pages} videos")
+
+    ways: dict[str, Callable[[bytes], list]] = {
+        "dict tree": lambda body: find_videos(json.loads(body)),
+        "flat dict": lambda body: [Video.from_dict(video).to_dict() for video in find_videos(json.loads(body))],
+        "record": lambda body: Video.from_dicts(find_videos(json.loads(body))),
+    }
+    baseline = None
+    for name, keep in ways.items():
+        size = retained(keep, bodies)
+        baseline = baseline or size
+        print(f"    {name:10} {size / 2**20:8.1f} MiB   {baseline / size:6.1f}x less")
+
+    number = 20
+    for name, build in (
+        ("flat dict", lambda: [Video.from_dict(video).to_dict() for video in videos]),
+        ("record", lambda: Video.from_dicts(videos)),
+    ):
+        per_item = min(timeit.repeat(build, number=number, repeat=5)) / number / len(videos)
+        print(f"    build {name:9} {per_item * 1e6:6.2f} µs per video")
+
+
+if __name__ == "__main__":
+    main()
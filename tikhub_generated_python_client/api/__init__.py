@@ -1 +1,58 @@
-"""Contains methods for accessing the API"""
+"""Contains methods for accessing the API
+
+Each API tag is a subpackage that is only imported the first time it is accessed, e.g. ``api.douyin_web_api``.
+"""
+
+import importlib
+from types import ModuleType
+
+_SUBPACKAGES = (
+    "bilibili_web_api",
+    "captcha_solver",
+    "douyin_app_v3_api",
+    "douyin_billboard_api",
+    "douyin_search_api",
+    "douyin_web_api",
+    "douyin_xingtu_api",
+    "health_check",
+    "hybrid_parsing",
+    "i_os_shortcut",
+    "instagram_web_and_app_api",
+    "kuaishou_app_api",
+    "kuaishou_web_api",
+    "lemon_8_app_api",
+    "net_ease_cloud_music_api",
+    "pi_pi_xia_app_api",
+    "temp_mail_api",
+    "tik_hub_downloader_api",
+    "tik_hub_user_api",
+    "tik_tok_ads_api",
+    "tik_tok_analytics_api",
+    "tik_tok_app_v3_api",
+    "tik_tok_creator_api",
+    "tik_tok_interaction_api",
+    "tik_tok_web_api",
+    "toutiao_app_api",
+    "toutiao_web_api",
+    "twitter_web_api",
+    "we_chat_media_platform_web_api",
+    "weibo_web_api",
+    "xiaohongshu_web_api",
+    "xiaohongshu_web_v2_api",
+    "xigua_app_v2_api",
+    "you_tube_web_api",
+    "zhihu_web_api",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBPACKAGES})
+
+
+__all__ = list(_SUBPACKAGES)
@@ -0,0 +1,799 @@
+"""Maps the namespaces and endpoint names of the client facade to the modules of this package"""
+
+# namespace: (API tag subpackage, {endpoint name: module})
+NAMESPACES: dict[str, tuple[str, dict[str, str]]] = {
+    "bilibili_web": (
+        "bilibili_web_api",
+        {
+            "bv_to_aid": "fetch_one_video_api_v1_bilibili_web_bv_to_aid_get",
+            "fetch_all_live_areas": "fetch_collect_folders_api_v1_bilibili_web_fetch_all_live_areas_get",
+            "fetch_collect_folders": "fetch_collect_folders_api_v1_bilibili_web_fetch_collect_folders_get",
+            "fetch_com_popular": "fetch_collect_folders_api_v1_bilibili_web_fetch_com_popular_get",
+            "fetch_comment_reply": "fetch_collect_folders_api_v1_bilibili_web_fetch_comment_reply_get",
+            "fetch_general_search": "fetch_general_search_api_v1_bilibili_web_fetch_general_search_get",
+            "fetch_hot_search": "fetch_hot_search_api_v1_bilibili_web_fetch_hot_search_get",
+            "fetch_live_room_detail": "fetch_collect_folders_api_v1_bilibili_web_fetch_live_room_detail_get",
+            "fetch_live_streamers": "fetch_collect_folders_api_v1_bilibili_web_fetch_live_streamers_get",
+            "fetch_live_videos": "fetch_collect_folders_api_v1_bilibili_web_fetch_live_videos_get",
+            "fetch_one_video": "fetch_one_video_api_v1_bilibili_web_fetch_one_video_get",
+            "fetch_one_video_v2": "fetch_one_video_v2_api_v1_bilibili_web_fetch_one_video_v2_get",
+            "fetch_user_collection_videos": "fetch_user_collection_videos_api_v1_bilibili_web_fetch_user_collection_videos_get",
+            "fetch_user_dynamic": "fetch_collect_folders_api_v1_bilibili_web_fetch_user_dynamic_get",
+            "fetch_user_post_videos": "fetch_user_post_videos_api_v1_bilibili_web_fetch_user_post_videos_get",
+            "fetch_user_profile": "fetch_collect_folders_api_v1_bilibili_web_fetch_user_profile_get",
+            "fetch_video_comments": "fetch_collect_folders_api_v1_bilibili_web_fetch_video_comments_get",
+            "fetch_video_danmaku": "fetch_one_video_api_v1_bilibili_web_fetch_video_danmaku_get",
+            "fetch_video_parts": "fetch_one_video_api_v1_bilibili_web_fetch_video_parts_get",
+            "fetch_video_playurl": "fetch_one_video_api_v1_bilibili_web_fetch_video_playurl_get",
+        },
+    ),
+    "captcha": (
+        "captcha_solver",
+        {
+            "amazon_captcha": "amazon_captcha_api_v1_captcha_amazon_captcha_post",
+            "cloudflare_turnstile": "cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post",
+            "hcaptcha": "hcaptcha_api_v1_captcha_hcaptcha_post",
+            "recaptcha_v2": "recaptcha_v2_api_v1_captcha_recaptcha_v2_post",
+            "recaptcha_v3": "recaptcha_v3_api_v1_captcha_recaptcha_v3_post",
+            "tencent_captcha": "tencent_captcha_api_v1_captcha_tencent_captcha_post",
+        },
+    ),
+    "douyin_app_v3": (
+        "douyin_app_v3_api",
+        {
+            "add_video_play_count": "add_video_play_count_api_v1_douyin_app_v3_add_video_play_count_get",
+            "fetch_brand_hot_search_list": "fetch_hot_brand_search_category_api_v1_douyin_app_v3_fetch_brand_hot_search_list_get",
+            "fetch_brand_hot_search_list_detail": "fetch_hot_brand_search_api_v1_douyin_app_v3_fetch_brand_hot_search_list_detail_get",
+            "fetch_general_search_result": "fetch_general_search_result_api_v1_douyin_app_v3_fetch_general_search_result_get",
+            "fetch_hashtag_detail": "fetch_hashtag_detail_api_v1_douyin_app_v3_fetch_hashtag_detail_get",
+            "fetch_hashtag_search_result": "fetch_hashtag_search_result_api_v1_douyin_app_v3_fetch_hashtag_search_result_get",
+            "fetch_hashtag_video_list": "fetch_hashtag_video_list_api_v1_douyin_app_v3_fetch_hashtag_video_list_get",
+            "fetch_hot_search_list": "fetch_hot_search_list_api_v1_douyin_app_v3_fetch_hot_search_list_get",
+            "fetch_live_hot_search_list": "fetch_live_hot_search_list_api_v1_douyin_app_v3_fetch_live_hot_search_list_get",
+            "fetch_live_search_result": "fetch_live_search_result_api_v1_douyin_app_v3_fetch_live_search_result_get",
+            "fetch_multi_video": "fetch_multi_video_api_v1_douyin_app_v3_fetch_multi_video_post",
+            "fetch_multi_video_statistics": "fetch_multi_video_statistics_api_v1_douyin_app_v3_fetch_multi_video_statistics_get",
+            "fetch_music_detail": "fetch_music_detail_api_v1_douyin_app_v3_fetch_music_detail_get",
+            "fetch_music_hot_search_list": "fetch_music_hot_search_list_api_v1_douyin_app_v3_fetch_music_hot_search_list_get",
+            "fetch_music_search_result": "fetch_music_search_result_api_v1_douyin_app_v3_fetch_music_search_result_get",
+            "fetch_music_video_list": "fetch_music_video_list_api_v1_douyin_app_v3_fetch_music_video_list_get",
+            "fetch_one_video": "fetch_one_video_api_v1_douyin_app_v3_fetch_one_video_get",
+            "fetch_one_video_by_share_url": "fetch_one_video_by_share_url_api_v1_douyin_app_v3_fetch_one_video_by_share_url_get",
+            "fetch_one_video_v2": "fetch_one_video_api_v1_douyin_app_v3_fetch_one_video_v2_get",
+            "fetch_user_fans_list": "fetch_user_fans_list_api_v1_douyin_app_v3_fetch_user_fans_list_get",
+            "fetch_user_following_list": "fetch_user_following_list_api_v1_douyin_app_v3_fetch_user_following_list_get",
+            "fetch_user_like_videos": "fetch_user_like_videos_api_v1_douyin_app_v3_fetch_user_like_videos_get",
+            "fetch_user_post_videos": "fetch_user_post_videos_api_v1_douyin_app_v3_fetch_user_post_videos_get",
+            "fetch_user_search_result": "fetch_user_search_result_api_v1_douyin_app_v3_fetch_user_search_result_get",
+            "fetch_video_comment_replies": "fetch_video_comments_reply_api_v1_douyin_app_v3_fetch_video_comment_replies_get",
+            "fetch_video_comments": "fetch_video_comments_api_v1_douyin_app_v3_fetch_video_comments_get",
+            "fetch_video_mix_detail": "fetch_video_mix_detail_api_v1_douyin_app_v3_fetch_video_mix_detail_get",
+            "fetch_video_mix_post_list": "fetch_video_mix_post_list_api_v1_douyin_app_v3_fetch_video_mix_post_list_get",
+            "fetch_video_search_result": "fetch_video_search_result_api_v1_douyin_app_v3_fetch_video_search_result_get",
+            "fetch_video_search_result_v2": "fetch_video_search_result_v2_api_v1_douyin_app_v3_fetch_video_search_result_v2_get",
+            "fetch_video_statistics": "fetch_video_statistics_api_v1_douyin_app_v3_fetch_video_statistics_get",
+            "generate_douyin_short_url": "generate_douyin_short_url_api_v1_douyin_app_v3_generate_douyin_short_url_get",
+            "generate_douyin_video_share_qrcode": "generate_douyin_video_share_qrcode_api_v1_douyin_app_v3_generate_douyin_video_share_qrcode_get",
+            "handler_user_profile": "handler_user_profile_api_v1_douyin_app_v3_handler_user_profile_get",
+            "open_douyin_app_to_keyword_search": "open_douyin_app_to_keyword_search_api_v1_douyin_app_v3_open_douyin_app_to_keyword_search_get",
+            "open_douyin_app_to_send_private_message": "open_douyin_app_to_send_private_message_api_v1_douyin_app_v3_open_douyin_app_to_send_private_message_get",
+            "open_douyin_app_to_user_profile": "open_douyin_app_to_user_profile_api_v1_douyin_app_v3_open_douyin_app_to_user_profile_get",
+            "open_douyin_app_to_video_detail": "open_douyin_app_to_video_detail_api_v1_douyin_app_v3_open_douyin_app_to_video_detail_get",
+            "register_device": "register_device_api_v1_douyin_app_v3_register_device_get",
+        },
+    ),
+    "douyin_billboard": (
+        "douyin_billboard_api",
+        {
+            "fetch_city_list": "fetch_city_list_api_v1_douyin_billboard_fetch_city_list_get",
+            "fetch_content_tag": "fetch_content_tag_api_v1_douyin_billboard_fetch_content_tag_get",
+            "fetch_hot_account_fans_interest_account_list": "fetch_hot_account_fans_interest_account_list_api_v1_douyin_billboard_fetch_hot_account_fans_interest_account_list_get",
+            "fetch_hot_account_fans_interest_search_list": "fetch_hot_account_fans_interest_search_list_api_v1_douyin_billboard_fetch_hot_account_fans_interest_search_list_get",
+            "fetch_hot_account_fans_interest_topic_list": "fetch_hot_account_fans_interest_topic_list_api_v1_douyin_billboard_fetch_hot_account_fans_interest_topic_list_get",
+            "fetch_hot_account_fans_portrait_list": "fetch_hot_account_fans_portrait_list_api_v1_douyin_billboard_fetch_hot_account_fans_portrait_list_get",
+            "fetch_hot_account_item_analysis_list": "fetch_hot_account_item_analysis_list_api_v1_douyin_billboard_fetch_hot_account_item_analysis_list_get",
+            "fetch_hot_account_list": "fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post",
+            "fetch_hot_account_search_list": "fetch_hot_account_search_list_api_v1_douyin_billboard_fetch_hot_account_search_list_get",
+            "fetch_hot_account_trends_list": "fetch_hot_account_trends_list_api_v1_douyin_billboard_fetch_hot_account_trends_list_get",
+            "fetch_hot_calendar_detail": "fetch_hot_calendar_detail_api_v1_douyin_billboard_fetch_hot_calendar_detail_get",
+            "fetch_hot_calendar_list": "fetch_hot_calendar_list_api_v1_douyin_billboard_fetch_hot_calendar_list_post",
+            "fetch_hot_category_list": "fetch_hot_category_list_api_v1_douyin_billboard_fetch_hot_category_list_get",
+            "fetch_hot_challenge_list": "fetch_hot_challenge_list_api_v1_douyin_billboard_fetch_hot_challenge_list_get",
+            "fetch_hot_city_list": "fetch_hot_city_list_api_v1_douyin_billboard_fetch_hot_city_list_get",
+            "fetch_hot_comment_word_list": "fetch_hot_comment_word_list_api_v1_douyin_billboard_fetch_hot_comment_word_list_get",
+            "fetch_hot_item_trends_list": "fetch_hot_item_trends_list_api_v1_douyin_billboard_fetch_hot_item_trends_list_get",
+            "fetch_hot_rise_list": "fetch_hot_rise_list_api_v1_douyin_billboard_fetch_hot_rise_list_get",
+            "fetch_hot_total_high_fan_list": "fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post",
+            "fetch_hot_total_high_like_list": "fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post",
+            "fetch_hot_total_high_play_list": "fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post",
+            "fetch_hot_total_high_search_list": "fetch_hot_total_high_search_list_api_v1_douyin_billboard_fetch_hot_total_high_search_list_post",
+            "fetch_hot_total_high_topic_list": "fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post",
+            "fetch_hot_total_hot_word_detail_list": "fetch_hot_total_hot_word_detail_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_detail_list_get",
+            "fetch_hot_total_hot_word_list": "fetch_hot_total_hot_word_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_list_post",
+            "fetch_hot_total_list": "fetch_hot_total_list_api_v1_douyin_billboard_fetch_hot_total_list_get",
+            "fetch_hot_total_low_fan_list": "fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post",
+            "fetch_hot_total_search_list": "fetch_hot_total_search_list_api_v1_douyin_billboard_fetch_hot_total_search_list_post",
+            "fetch_hot_total_topic_list": "fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post",
+            "fetch_hot_total_video_list": "fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post",
+            "fetch_hot_user_portrait_list": "fetch_hot_user_portrait_list_api_v1_douyin_billboard_fetch_hot_user_portrait_list_get",
+        },
+    ),
+    "douyin_search": (
+        "douyin_search_api",
+        {
+            "fetch_challenge_search_v1": "fetch_challenge_search_v1_api_v1_douyin_search_fetch_challenge_search_v1_post",
+            "fetch_challenge_search_v2": "fetch_challenge_search_v2_api_v1_douyin_search_fetch_challenge_search_v2_post",
+            "fetch_challenge_suggest": "fetch_challenge_suggest_api_v1_douyin_search_fetch_challenge_suggest_post",
+            "fetch_discuss_search": "fetch_discuss_search_api_v1_douyin_search_fetch_discuss_search_post",
+            "fetch_experience_search": "fetch_experience_search_api_v1_douyin_search_fetch_experience_search_post",
+            "fetch_general_search_v1": "fetch_general_search_v1_api_v1_douyin_search_fetch_general_search_v1_post",
+            "fetch_general_search_v2": "fetch_general_search_v2_api_v1_douyin_search_fetch_general_search_v2_post",
+            "fetch_general_search_v3": "fetch_general_search_v3_api_v1_douyin_search_fetch_general_search_v3_post",
+            "fetch_image_search": "fetch_image_search_api_v1_douyin_search_fetch_image_search_post",
+            "fetch_live_search_v1": "fetch_live_search_v1_api_v1_douyin_search_fetch_live_search_v1_post",
+            "fetch_live_search_v2": "fetch_live_search_v2_api_v1_douyin_search_fetch_live_search_v2_post",
+            "fetch_multi_search": "fetch_multi_search_api_v1_douyin_search_fetch_multi_search_post",
+            "fetch_music_search": "fetch_music_search_api_v1_douyin_search_fetch_music_search_post",
+            "fetch_school_search": "fetch_school_search_api_v1_douyin_search_fetch_school_search_post",
+            "fetch_search_suggest": "fetch_search_suggest_api_v1_douyin_search_fetch_search_suggest_post",
+            "fetch_user_search": "fetch_user_search_api_v1_douyin_search_fetch_user_search_post",
+            "fetch_user_search_v2": "fetch_user_search_v2_api_v1_douyin_search_fetch_user_search_v2_post",
+            "fetch_video_search_v1": "fetch_video_search_v1_api_v1_douyin_search_fetch_video_search_v1_post",
+            "fetch_video_search_v2": "fetch_video_search_v2_api_v1_douyin_search_fetch_video_search_v2_post",
+        },
+    ),
+    "douyin_web": (
+        "douyin_web_api",
+        {
+            "douyin_live_room": "douyin_live_room_api_v1_douyin_web_douyin_live_room_get",
+            "encrypt_uid_to_sec_user_id": "encrypt_uid_to_sec_user_id_api_v1_douyin_web_encrypt_uid_to_sec_user_id_get",
+            "fetch_cartoon_aweme": "fetch_cartoon_aweme_api_v1_douyin_web_fetch_cartoon_aweme_get",
+            "fetch_challenge_posts": "fetch_challenge_posts_api_v1_douyin_web_fetch_challenge_posts_post",
+            "fetch_douyin_web_guest_cookie": "fetch_douyin_web_guest_cookie_api_v1_douyin_web_fetch_douyin_web_guest_cookie_get",
+            "fetch_food_aweme": "fetch_cartoon_aweme_api_v1_douyin_web_fetch_food_aweme_get",
+            "fetch_game_aweme": "fetch_game_aweme_api_v1_douyin_web_fetch_game_aweme_get",
+            "fetch_general_search_result": "fetch_general_search_result_api_v1_douyin_web_fetch_general_search_result_get",
+            "fetch_home_feed": "fetch_home_feed_api_v1_douyin_web_fetch_home_feed_get",
+            "fetch_hot_search_result": "fetch_hot_search_result_api_v1_douyin_web_fetch_hot_search_result_get",
+            "fetch_knowledge_aweme": "fetch_knowledge_aweme_api_v1_douyin_web_fetch_knowledge_aweme_get",
+            "fetch_live_gift_ranking": "fetch_live_gift_ranking_api_v1_douyin_web_fetch_live_gift_ranking_get",
+            "fetch_live_im_fetch": "fetch_live_im_fetch_api_v1_douyin_web_fetch_live_im_fetch_get",
+            "fetch_live_room_product_result": "fetch_live_room_product_result_api_v1_douyin_web_fetch_live_room_product_result_get",
+            "fetch_live_search_result": "fetch_live_search_result_api_v1_douyin_web_fetch_live_search_result_get",
+            "fetch_multi_video": "fetch_multi_video_api_v1_douyin_web_fetch_multi_video_post",
+            "fetch_music_aweme": "fetch_cartoon_aweme_api_v1_douyin_web_fetch_music_aweme_get",
+            "fetch_one_video": "fetch_one_video_api_v1_douyin_web_fetch_one_video_get",
+            "fetch_one_video_by_share_url": "fetch_one_video_by_share_url_api_v1_douyin_web_fetch_one_video_by_share_url_get",
+            "fetch_one_video_danmaku": "fetch_one_video_danmaku_api_v1_douyin_web_fetch_one_video_danmaku_get",
+            "fetch_one_video_v2": "fetch_one_video_api_v1_douyin_web_fetch_one_video_v2_get",
+            "fetch_query_user": "fetch_query_user_api_v1_douyin_web_fetch_query_user_post",
+            "fetch_related_posts": "fetch_related_posts_api_v1_douyin_web_fetch_related_posts_get",
+            "fetch_search_challenge": "fetch_search_challenge_api_v1_douyin_web_fetch_search_challenge_post",
+            "fetch_series_aweme": "fetch_series_aweme_api_v1_douyin_web_fetch_series_aweme_get",
+            "fetch_user_collection_videos": "fetch_user_collection_videos_api_v1_douyin_web_fetch_user_collection_videos_post",
+            "fetch_user_collects": "fetch_user_collects_api_v1_douyin_web_fetch_user_collects_post",
+            "fetch_user_collects_videos": "fetch_user_collects_videos_api_v1_douyin_web_fetch_user_collects_videos_get",
+            "fetch_user_fans_list": "fetch_user_fans_list_api_v1_douyin_web_fetch_user_fans_list_get",
+            "fetch_user_following_list": "fetch_user_following_list_api_v1_douyin_web_fetch_user_following_list_get",
+            "fetch_user_like_videos": "fetch_user_like_videos_api_v1_douyin_web_fetch_user_like_videos_post",
+            "fetch_user_live_info_by_uid": "fetch_user_live_info_by_uid_api_v1_douyin_web_fetch_user_live_info_by_uid_get",
+            "fetch_user_live_videos": "fetch_user_live_videos_api_v1_douyin_web_fetch_user_live_videos_get",
+            "fetch_user_live_videos_by_room_id": "fetch_user_live_videos_by_room_id_api_v1_douyin_web_fetch_user_live_videos_by_room_id_get",
+            "fetch_user_live_videos_by_room_id_v2": "fetch_user_live_videos_by_room_id_v2_api_v1_douyin_web_fetch_user_live_videos_by_room_id_v2_get",
+            "fetch_user_live_videos_by_sec_uid": "fetch_user_live_videos_by_sec_uid_api_v1_douyin_web_fetch_user_live_videos_by_sec_uid_get",
+            "fetch_user_mix_videos": "fetch_user_mix_videos_api_v1_douyin_web_fetch_user_mix_videos_get",
+            "fetch_user_post_videos": "fetch_user_post_videos_api_v1_douyin_web_fetch_user_post_videos_get",
+            "fetch_user_profile_by_short_id": "fetch_user_profile_by_short_id_api_v1_douyin_web_fetch_user_profile_by_short_id_get",
+            "fetch_user_profile_by_uid": "fetch_user_profile_by_uid_api_v1_douyin_web_fetch_user_profile_by_uid_get",
+            "fetch_user_search_result": "fetch_user_search_result_api_v1_douyin_web_fetch_user_search_result_get",
+            "fetch_user_search_result_v2": "fetch_user_search_result_v2_api_v1_douyin_web_fetch_user_search_result_v2_get",
+            "fetch_user_search_result_v3": "fetch_user_search_result_v3_api_v1_douyin_web_fetch_user_search_result_v3_get",
+            "fetch_video_channel_result": "fetch_video_channel_result_api_v1_douyin_web_fetch_video_channel_result_get",
+            "fetch_video_comment_replies": "fetch_video_comments_reply_api_v1_douyin_web_fetch_video_comment_replies_get",
+            "fetch_video_comments": "fetch_video_comments_api_v1_douyin_web_fetch_video_comments_get",
+            "fetch_video_search_result": "fetch_video_search_result_api_v1_douyin_web_fetch_video_search_result_get",
+            "fetch_video_search_result_v2": "fetch_video_search_result_v2_api_v1_douyin_web_fetch_video_search_result_v2_get",
+            "generate_a_bogus": "generate_a_bogus_api_v1_douyin_web_generate_a_bogus_post",
+            "generate_real_msToken": "generate_real_ms_token_api_v_1_douyin_web_generate_real_ms_token_get",
+            "generate_s_v_web_id": "generate_s_v_web_id_api_v1_douyin_web_generate_s_v_web_id_get",
+            "generate_ttwid": "generate_ttwid_api_v1_douyin_web_generate_ttwid_get",
+            "generate_verify_fp": "generate_verify_fp_api_v1_douyin_web_generate_verify_fp_get",
+            "generate_wss_xb_signature": "generate_wss_xb_signature_api_v1_douyin_web_generate_wss_xb_signature_get",
+            "generate_x_bogus": "generate_x_bogus_api_v1_douyin_web_generate_x_bogus_post",
+            "get_all_aweme_id": "get_all_aweme_id_api_v1_douyin_web_get_all_aweme_id_post",
+            "get_all_sec_user_id": "get_all_sec_user_id_api_v1_douyin_web_get_all_sec_user_id_post",
+            "get_all_webcast_id": "get_all_webcast_id_api_v1_douyin_web_get_all_webcast_id_post",
+            "get_aweme_id": "get_aweme_id_api_v1_douyin_web_get_aweme_id_get",
+            "get_sec_user_id": "get_sec_user_id_api_v1_douyin_web_get_sec_user_id_get",
+            "get_webcast_id": "get_webcast_id_api_v1_douyin_web_get_webcast_id_get",
+            "handler_user_profile": "handler_user_profile_api_v1_douyin_web_handler_user_profile_get",
+            "handler_user_profile_v2": "handler_user_profile_v2_api_v1_douyin_web_handler_user_profile_v2_get",
+            "handler_user_profile_v3": "handler_user_profile_v3_api_v1_douyin_web_handler_user_profile_v3_get",
+            "handler_user_profile_v4": "handler_user_profile_v4_api_v1_douyin_web_handler_user_profile_v4_get",
+            "webcast_id_2_room_id": "webcast_id_2_room_id_api_v1_douyin_web_webcast_id_2_room_id_get",
+        },
+    ),
+    "douyin_xingtu": (
+        "douyin_xingtu_api",
+        {
+            "author_content_hot_comment_keywords_v1": "author_content_hot_comment_keywords_v1_api_v1_douyin_xingtu_author_content_hot_comment_keywords_v1_get",
+            "author_hot_comment_tokens_v1": "author_hot_comment_tokens_v1_api_v1_douyin_xingtu_author_hot_comment_tokens_v1_get",
+            "get_xingtu_kolid_by_sec_user_id": "get_xingtu_kolid_by_sec_user_id_api_v1_douyin_xingtu_get_xingtu_kolid_by_sec_user_id_get",
+            "get_xingtu_kolid_by_uid": "get_xingtu_kolid_by_uid_api_v1_douyin_xingtu_get_xingtu_kolid_by_uid_get",
+            "get_xingtu_kolid_by_unique_id": "get_xingtu_kolid_by_unique_id_api_v1_douyin_xingtu_get_xingtu_kolid_by_unique_id_get",
+            "kol_audience_portrait_v1": "kol_audience_portrait_v1_api_v1_douyin_xingtu_kol_audience_portrait_v1_get",
+            "kol_base_info_v1": "kol_base_info_v1_api_v1_douyin_xingtu_kol_base_info_v1_get",
+            "kol_conversion_ability_analysis_v1": "kol_conversion_ability_analysis_v1_api_v1_douyin_xingtu_kol_conversion_ability_analysis_v1_get",
+            "kol_convert_video_display_v1": "kol_convert_video_display_v1_api_v1_douyin_xingtu_kol_convert_video_display_v1_get",
+            "kol_cp_info_v1": "kol_cp_info_v1_api_v1_douyin_xingtu_kol_cp_info_v1_get",
+            "kol_daily_fans_v1": "kol_daily_fans_v1_api_v1_douyin_xingtu_kol_daily_fans_v1_get",
+            "kol_data_overview_v1": "kol_data_overview_v1_api_v1_douyin_xingtu_kol_data_overview_v1_get",
+            "kol_fans_portrait_v1": "kol_fans_portrait_v1_api_v1_douyin_xingtu_kol_fans_portrait_v1_get",
+            "kol_link_struct_v1": "kol_link_struct_v1_api_v1_douyin_xingtu_kol_link_struct_v1_get",
+            "kol_rec_videos_v1": "kol_rec_videos_v1_api_v1_douyin_xingtu_kol_rec_videos_v1_get",
+            "kol_service_price_v1": "kol_service_price_v1_api_v1_douyin_xingtu_kol_service_price_v1_get",
+            "kol_touch_distribution_v1": "kol_touch_distribution_v1_api_v1_douyin_xingtu_kol_touch_distribution_v1_get",
+            "kol_video_performance_v1": "kol_video_performance_v1_api_v1_douyin_xingtu_kol_video_performance_v1_get",
+            "kol_xingtu_index_v1": "kol_xingtu_index_v1_api_v1_douyin_xingtu_kol_xingtu_index_v1_get",
+            "search_kol_v1": "search_kol_v1_api_v1_douyin_xingtu_search_kol_v1_get",
+        },
+    ),
+    "health": (
+        "health_check",
+        {
+            "check": "health_check_api_v1_health_check_get",
+        },
+    ),
+    "hybrid": (
+        "hybrid_parsing",
+        {
+            "video_data": "hybrid_parsing_single_video_api_v1_hybrid_video_data_get",
+        },
+    ),
+    "instagram_web_app": (
+        "instagram_web_and_app_api",
+        {
+            "fetch_comment_replies_by_comment_id": "fetch_comment_replies_by_comment_id_api_v1_instagram_web_app_fetch_comment_replies_by_comment_id_get",
+            "fetch_global_search": "fetch_global_search_api_v1_instagram_web_app_fetch_global_search_get",
+            "fetch_global_search_v2": "fetch_global_search_v2_api_v1_instagram_web_app_fetch_global_search_v2_get",
+            "fetch_hashtag_posts_by_keyword": "fetch_hashtag_posts_by_keyword_api_v1_instagram_web_app_fetch_hashtag_posts_by_keyword_get",
+            "fetch_hashtag_posts_by_keyword_v3": "fetch_hashtag_posts_by_keyword_v3_api_v1_instagram_web_app_fetch_hashtag_posts_by_keyword_v3_get",
+            "fetch_highlights_by_highlight_id": "fetch_highlights_by_highlight_id_api_v1_instagram_web_app_fetch_highlights_by_highlight_id_get",
+            "fetch_location_info_by_location_id": "fetch_location_info_by_location_id_api_v1_instagram_web_app_fetch_location_info_by_location_id_get",
+            "fetch_location_posts_by_location_id": "fetch_location_posts_by_location_id_api_v1_instagram_web_app_fetch_location_posts_by_location_id_get",
+            "fetch_location_posts_by_location_id_v2": "fetch_location_posts_by_location_id_v2_api_v1_instagram_web_app_fetch_location_posts_by_location_id_v2_get",
+            "fetch_music_info_by_music_id": "fetch_music_info_by_music_id_api_v1_instagram_web_app_fetch_music_info_by_music_id_get",
+            "fetch_post_comments_by_url": "fetch_post_comments_by_url_api_v1_instagram_web_app_fetch_post_comments_by_url_get",
+            "fetch_post_details_by_code": "fetch_post_details_by_code_api_v1_instagram_web_app_fetch_post_details_by_code_get",
+            "fetch_post_details_by_id": "fetch_post_details_by_id_api_v1_instagram_web_app_fetch_post_details_by_id_get",
+            "fetch_post_details_by_url": "fetch_post_details_by_url_api_v1_instagram_web_app_fetch_post_details_by_url_get",
+            "fetch_post_info_by_post_id": "fetch_post_info_by_post_id_api_v1_instagram_web_app_fetch_post_info_by_post_id_get",
+            "fetch_post_info_by_url": "fetch_post_info_by_url_api_v1_instagram_web_app_fetch_post_info_by_url_get",
+            "fetch_post_likes_by_url": "fetch_post_likes_by_url_api_v1_instagram_web_app_fetch_post_likes_by_url_get",
+            "fetch_post_media_by_url": "fetch_post_media_by_url_api_v1_instagram_web_app_fetch_post_media_by_url_get",
+            "fetch_related_users_by_user_id": "fetch_related_users_by_user_id_api_v1_instagram_web_app_fetch_related_users_by_user_id_get",
+            "fetch_search_audios_by_keyword": "fetch_search_audios_by_keyword_api_v1_instagram_web_app_fetch_search_audios_by_keyword_get",
+            "fetch_search_coordinates_by_keyword": "fetch_search_coordinates_by_keyword_api_v1_instagram_web_app_fetch_search_coordinates_by_keyword_get",
+            "fetch_search_hashtags_by_keyword": "fetch_search_hashtags_by_keyword_api_v1_instagram_web_app_fetch_search_hashtags_by_keyword_get",
+            "fetch_search_hashtags_by_keyword_v2": "fetch_search_hashtags_by_keyword_v2_api_v1_instagram_web_app_fetch_search_hashtags_by_keyword_v2_get",
+            "fetch_search_locations_by_keyword": "fetch_search_locations_by_keyword_api_v1_instagram_web_app_fetch_search_locations_by_keyword_get",
+            "fetch_search_locations_by_keyword_v2": "fetch_search_locations_by_keyword_v2_api_v1_instagram_web_app_fetch_search_locations_by_keyword_v2_get",
+            "fetch_search_reels_by_keyword": "fetch_search_reels_by_keyword_api_v1_instagram_web_app_fetch_search_reels_by_keyword_get",
+            "fetch_search_users_by_keyword": "fetch_search_users_by_keyword_api_v1_instagram_web_app_fetch_search_users_by_keyword_get",
+            "fetch_search_users_by_keyword_v2": "fetch_search_users_by_keyword_v2_api_v1_instagram_web_app_fetch_search_users_by_keyword_v2_get",
+            "fetch_similar_accounts_by_id": "fetch_similar_accounts_by_id_api_v1_instagram_web_app_fetch_similar_accounts_by_id_get",
+            "fetch_similar_accounts_by_url": "fetch_similar_accounts_by_url_api_v1_instagram_web_app_fetch_similar_accounts_by_url_get",
+            "fetch_similar_accounts_by_username": "fetch_similar_accounts_by_username_api_v1_instagram_web_app_fetch_similar_accounts_by_username_get",
+            "fetch_user_about_info_by_user_id": "fetch_user_about_info_by_id_api_v1_instagram_web_app_fetch_user_about_info_by_user_id_get",
+            "fetch_user_followers_by_username": "fetch_user_followers_by_username_api_v1_instagram_web_app_fetch_user_followers_by_username_get",
+            "fetch_user_following_by_username": "fetch_user_following_by_username_api_v1_instagram_web_app_fetch_user_following_by_username_get",
+            "fetch_user_highlights_by_username": "fetch_user_highlights_by_username_api_v1_instagram_web_app_fetch_user_highlights_by_username_get",
+            "fetch_user_info_by_url_v2": "fetch_user_info_by_url_v2_api_v1_instagram_web_app_fetch_user_info_by_url_v2_get",
+            "fetch_user_info_by_user_id": "fetch_user_info_by_id_api_v1_instagram_web_app_fetch_user_info_by_user_id_get",
+            "fetch_user_info_by_user_id_v2": "fetch_user_info_by_user_id_v2_api_v1_instagram_web_app_fetch_user_info_by_user_id_v2_get",
+            "fetch_user_info_by_username": "fetch_user_info_by_username_api_v1_instagram_web_app_fetch_user_info_by_username_get",
+            "fetch_user_info_by_username_v2": "fetch_user_info_by_username_v2_api_v1_instagram_web_app_fetch_user_info_by_username_v2_get",
+            "fetch_user_info_by_username_v3": "fetch_user_info_by_username_v3_api_v1_instagram_web_app_fetch_user_info_by_username_v3_get",
+            "fetch_user_info_by_username_web": "fetch_user_info_by_username_web_api_v1_instagram_web_app_fetch_user_info_by_username_web_get",
+            "fetch_user_posts_and_reels_by_url": "fetch_user_posts_and_reels_by_url_api_v1_instagram_web_app_fetch_user_posts_and_reels_by_url_get",
+            "fetch_user_posts_and_reels_by_user_id": "fetch_user_posts_and_reels_by_user_id_api_v1_instagram_web_app_fetch_user_posts_and_reels_by_user_id_get",
+            "fetch_user_posts_and_reels_by_username": "fetch_user_posts_and_reels_by_username_api_v1_instagram_web_app_fetch_user_posts_and_reels_by_username_get",
+            "fetch_user_posts_by_user_id": "fetch_user_posts_by_user_id_api_v1_instagram_web_app_fetch_user_posts_by_user_id_get",
+            "fetch_user_reels_by_url": "fetch_user_reels_by_url_api_v1_instagram_web_app_fetch_user_reels_by_url_get",
+            "fetch_user_reels_by_user_id": "fetch_user_reels_by_user_id_api_v1_instagram_web_app_fetch_user_reels_by_user_id_get",
+            "fetch_user_reels_by_user_id_v2": "fetch_user_reels_by_user_id_v2_api_v1_instagram_web_app_fetch_user_reels_by_user_id_v2_get",
+            "fetch_user_reels_by_username": "fetch_user_reels_by_username_api_v1_instagram_web_app_fetch_user_reels_by_username_get",
+            "fetch_user_reels_by_username_v2": "fetch_user_reels_by_username_v2_api_v1_instagram_web_app_fetch_user_reels_by_username_v2_get",
+            "fetch_user_reels_by_username_v3": "fetch_user_reels_by_username_v3_api_v1_instagram_web_app_fetch_user_reels_by_username_v3_get",
+            "fetch_user_stories_by_username": "fetch_user_stories_by_username_api_v1_instagram_web_app_fetch_user_stories_by_username_get",
+            "fetch_user_tagged_posts_by_user_id": "fetch_user_tagged_posts_by_user_id_api_v1_instagram_web_app_fetch_user_tagged_posts_by_user_id_get",
+            "fetch_user_tagged_posts_by_username": "fetch_user_tagged_posts_by_username_api_v1_instagram_web_app_fetch_user_tagged_posts_by_username_get",
+        },
+    ),
+    "ios_shortcut": (
+        "i_os_shortcut",
+        {
+            "shortcut": "get_shortcut_api_v1_ios_shortcut_shortcut_get",
+        },
+    ),
+    "kuaishou_app": (
+        "kuaishou_app_api",
+        {
+            "fetch_brand_top_list": "fetch_brand_top_list_api_v1_kuaishou_app_fetch_brand_top_list_get",
+            "fetch_hot_board_categories": "fetch_hot_board_categories_api_v1_kuaishou_app_fetch_hot_board_categories_get",
+            "fetch_hot_board_detail": "fetch_hot_board_detail_api_v1_kuaishou_app_fetch_hot_board_detail_get",
+            "fetch_hot_search_person": "fetch_hot_search_person_api_v1_kuaishou_app_fetch_hot_search_person_get",
+            "fetch_live_top_list": "fetch_live_top_list_api_v1_kuaishou_app_fetch_live_top_list_get",
+            "fetch_one_user_v2": "fetch_one_user_v2_api_v1_kuaishou_app_fetch_one_user_v2_get",
+            "fetch_one_video": "fetch_one_video_v1_api_v1_kuaishou_app_fetch_one_video_get",
+            "fetch_one_video_by_url": "fetch_one_video_by_share_text_api_v1_kuaishou_app_fetch_one_video_by_url_get",
+            "fetch_one_video_comment": "fetch_video_comment_api_v1_kuaishou_app_fetch_one_video_comment_get",
+            "fetch_one_video_v2": "fetch_one_video_v2_api_v1_kuaishou_app_fetch_one_video_v2_get",
+            "fetch_shopping_top_list": "fetch_shopping_top_list_api_v1_kuaishou_app_fetch_shopping_top_list_get",
+            "fetch_user_hot_post": "fetch_user_hot_post_api_v1_kuaishou_app_fetch_user_hot_post_get",
+            "fetch_user_live_info": "fetch_user_live_info_api_v1_kuaishou_app_fetch_user_live_info_get",
+            "fetch_user_post_v2": "fetch_user_post_v2_api_v1_kuaishou_app_fetch_user_post_v2_get",
+            "generate_kuaishou_share_link": "generate_kuaishou_share_link_api_v1_kuaishou_app_generate_kuaishou_share_link_get",
+            "search_user_v2": "search_user_v2_api_v1_kuaishou_app_search_user_v2_get",
+            "search_video_v2": "search_video_v2_api_v1_kuaishou_app_search_video_v2_get",
+        },
+    ),
+    "kuaishou_web": (
+        "kuaishou_web_api",
+        {
+            "fetch_one_video_by_url": "fetch_one_video_by_url_api_v1_kuaishou_web_fetch_one_video_by_url_get",
+            "fetch_one_video_v2": "fetch_one_video_v2_api_v1_kuaishou_web_fetch_one_video_v2_get",
+        },
+    ),
+    "lemon8_app": (
+        "lemon_8_app_api",
+        {
+            "fetch_discover_banners": "fetch_discover_banners_api_v1_lemon8_app_fetch_discover_banners_get",
+            "fetch_discover_tab": "fetch_discover_tab_api_v1_lemon8_app_fetch_discover_tab_get",
+            "fetch_discover_tab_information_tabs": "fetch_discover_tab_information_tabs_api_v1_lemon8_app_fetch_discover_tab_information_tabs_get",
+            "fetch_hot_search_keywords": "fetch_hot_search_keywords_api_v1_lemon8_app_fetch_hot_search_keywords_get",
+            "fetch_post_comment_list": "fetch_post_comment_list_api_v1_lemon8_app_fetch_post_comment_list_get",
+            "fetch_post_detail": "fetch_post_detail_api_v1_lemon8_app_fetch_post_detail_get",
+            "fetch_search": "fetch_search_api_v1_lemon8_app_fetch_search_get",
+            "fetch_topic_info": "fetch_topic_info_api_v1_lemon8_app_fetch_topic_info_get",
+            "fetch_topic_post_list": "fetch_topic_post_list_api_v1_lemon8_app_fetch_topic_post_list_get",
+            "fetch_user_follower_list": "fetch_user_follower_list_api_v1_lemon8_app_fetch_user_follower_list_get",
+            "fetch_user_following_list": "fetch_user_following_list_api_v1_lemon8_app_fetch_user_following_list_get",
+            "fetch_user_profile": "handler_user_profile_api_v1_lemon8_app_fetch_user_profile_get",
+            "get_item_id": "get_item_id_api_v1_lemon8_app_get_item_id_get",
+            "get_item_ids": "get_item_ids_api_v1_lemon8_app_get_item_ids_post",
+            "get_user_id": "get_user_id_api_v1_lemon8_app_get_user_id_get",
+            "get_user_ids": "get_user_ids_api_v1_lemon8_app_get_user_ids_post",
+        },
+    ),
+    "net_ease_cloud_music_app": (
+        "net_ease_cloud_music_api",
+        {
+            "decrypt_post_payload": "decrypt_post_payload_api_v1_net_ease_cloud_music_app_decrypt_post_payload_post",
+            "encrypt_post_payload": "encrypt_post_payload_api_v1_net_ease_cloud_music_app_encrypt_post_payload_post",
+            "fetch_artist_detail": "fetch_artist_detail_api_v1_net_ease_cloud_music_app_fetch_artist_detail_get",
+            "fetch_music_comment": "fetch_music_comment_api_v1_net_ease_cloud_music_app_fetch_music_comment_get",
+            "fetch_music_log_video_url": "fetch_music_log_video_url_api_v1_net_ease_cloud_music_app_fetch_music_log_video_url_get",
+            "fetch_one_music_lyric": "fetch_one_music_lyric_api_v1_net_ease_cloud_music_app_fetch_one_music_lyric_get",
+            "fetch_one_music_url_v1": "fetch_one_music_url_v1_api_v1_net_ease_cloud_music_app_fetch_one_music_url_v1_get",
+            "fetch_one_music_url_v2": "fetch_one_music_url_v2_api_v1_net_ease_cloud_music_app_fetch_one_music_url_v2_get",
+            "fetch_one_music_v1": "fetch_one_music_v1_api_v1_net_ease_cloud_music_app_fetch_one_music_v1_get",
+            "fetch_one_music_v2": "fetch_one_music_v2_api_v1_net_ease_cloud_music_app_fetch_one_music_v2_get",
+            "fetch_user_event": "fetch_user_event_api_v1_net_ease_cloud_music_app_fetch_user_event_get",
+            "fetch_user_followers": "fetch_user_followers_api_v1_net_ease_cloud_music_app_fetch_user_followers_get",
+            "fetch_user_follows": "fetch_user_follows_api_v1_net_ease_cloud_music_app_fetch_user_follows_get",
+            "fetch_user_info": "fetch_user_info_api_v1_net_ease_cloud_music_app_fetch_user_info_get",
+            "fetch_user_playlist": "fetch_user_playlist_api_v1_net_ease_cloud_music_app_fetch_user_playlist_get",
+            "search_v1": "search_v1_api_v1_net_ease_cloud_music_app_search_v1_get",
+        },
+    ),
+    "pipixia_app": (
+        "pi_pi_xia_app_api",
+        {
+            "fetch_hashtag_detail": "fetch_hashtag_detail_api_v1_pipixia_app_fetch_hashtag_detail_get",
+            "fetch_hashtag_post_list": "fetch_hashtag_post_list_api_v1_pipixia_app_fetch_hashtag_post_list_get",
+            "fetch_home_feed": "fetch_home_feed_api_v1_pipixia_app_fetch_home_feed_get",
+            "fetch_home_short_drama_feed": "fetch_home_short_drama_feed_api_v1_pipixia_app_fetch_home_short_drama_feed_get",
+            "fetch_hot_search_board_detail": "fetch_hot_search_board_detail_api_v1_pipixia_app_fetch_hot_search_board_detail_get",
+            "fetch_hot_search_board_list": "fetch_hot_search_board_list_api_v1_pipixia_app_fetch_hot_search_board_list_get",
+            "fetch_hot_search_words": "fetch_hot_search_words_api_v1_pipixia_app_fetch_hot_search_words_get",
+            "fetch_increase_post_view_count": "fetch_increase_post_view_count_api_v1_pipixia_app_fetch_increase_post_view_count_get",
+            "fetch_post_comment_list": "fetch_post_comment_list_api_v1_pipixia_app_fetch_post_comment_list_get",
+            "fetch_post_detail": "fetch_post_detail_api_v1_pipixia_app_fetch_post_detail_get",
+            "fetch_post_statistics": "fetch_post_statistics_api_v1_pipixia_app_fetch_post_statistics_get",
+            "fetch_search": "fetch_search_api_v1_pipixia_app_fetch_search_get",
+            "fetch_short_url": "fetch_short_url_api_v1_pipixia_app_fetch_short_url_get",
+            "fetch_user_follower_list": "fetch_user_follower_list_api_v1_pipixia_app_fetch_user_follower_list_get",
+            "fetch_user_following_list": "fetch_user_following_list_api_v1_pipixia_app_fetch_user_following_list_get",
+            "fetch_user_info": "fetch_user_info_api_v1_pipixia_app_fetch_user_info_get",
+            "fetch_user_post_list": "fetch_user_post_list_api_v1_pipixia_app_fetch_user_post_list_get",
+        },
+    ),
+    "temp_mail_v1": (
+        "temp_mail_api",
+        {
+            "get_email_by_id": "get_email_by_id_api_v1_temp_mail_v1_get_email_by_id_get",
+            "get_emails_inbox": "get_emails_api_v1_temp_mail_v1_get_emails_inbox_get",
+            "get_temp_email_address": "get_temp_email_api_v1_temp_mail_v1_get_temp_email_address_get",
+        },
+    ),
+    "tikhub_downloader": (
+        "tik_hub_downloader_api",
+        {
+            "redirect_download": "redirect_download_api_v1_tikhub_downloader_redirect_download_get",
+            "version": "update_check_api_v1_tikhub_downloader_version_get",
+        },
+    ),
+    "tikhub_user": (
+        "tik_hub_user_api",
+        {
+            "calculate_price": "calculate_price_api_v1_tikhub_user_calculate_price_get",
+            "get_all_endpoints_info": "get_all_endpoints_info_api_v1_tikhub_user_get_all_endpoints_info_get",
+            "get_endpoint_info": "get_endpoint_info_api_v1_tikhub_user_get_endpoint_info_get",
+            "get_tiered_discount_info": "get_tiered_discount_info_api_v1_tikhub_user_get_tiered_discount_info_get",
+            "get_user_daily_usage": "get_user_daily_usage_api_v1_tikhub_user_get_user_daily_usage_get",
+            "get_user_info": "get_user_info_api_v1_tikhub_user_get_user_info_get",
+        },
+    ),
+    "tiktok_ads": (
+        "tik_tok_ads_api",
+        {
+            "get_ad_interactive_analysis": "get_ad_interactive_analysis_api_v1_tiktok_ads_get_ad_interactive_analysis_get",
+            "get_ad_keyframe_analysis": "get_ad_keyframe_analysis_api_v1_tiktok_ads_get_ad_keyframe_analysis_get",
+            "get_ad_percentile": "get_ad_percentile_api_v1_tiktok_ads_get_ad_percentile_get",
+            "get_ads_detail": "get_ads_detail_api_v1_tiktok_ads_get_ads_detail_get",
+            "get_creative_patterns": "get_creative_patterns_api_v1_tiktok_ads_get_creative_patterns_get",
+            "get_creator_filters": "get_creator_filters_api_v1_tiktok_ads_get_creator_filters_get",
+            "get_creator_list": "get_creator_list_api_v1_tiktok_ads_get_creator_list_get",
+            "get_hashtag_creator": "get_hashtag_creator_api_v1_tiktok_ads_get_hashtag_creator_get",
+            "get_hashtag_filters": "get_hashtag_filters_api_v1_tiktok_ads_get_hashtag_filters_get",
+            "get_hashtag_list": "get_hashtag_list_api_v1_tiktok_ads_get_hashtag_list_get",
+            "get_keyword_details": "get_keyword_details_api_v1_tiktok_ads_get_keyword_details_get",
+            "get_keyword_filters": "get_keyword_filters_api_v1_tiktok_ads_get_keyword_filters_get",
+            "get_keyword_insights": "get_keyword_insights_api_v1_tiktok_ads_get_keyword_insights_get",
+            "get_keyword_list": "get_keyword_list_api_v1_tiktok_ads_get_keyword_list_get",
+            "get_popular_trends": "get_popular_trends_api_v1_tiktok_ads_get_popular_trends_get",
+            "get_product_detail": "get_product_detail_api_v1_tiktok_ads_get_product_detail_get",
+            "get_product_filters": "get_product_filters_api_v1_tiktok_ads_get_product_filters_get",
+            "get_product_metrics": "get_product_metrics_api_v1_tiktok_ads_get_product_metrics_get",
+            "get_query_suggestions": "get_query_suggestions_api_v1_tiktok_ads_get_query_suggestions_get",
+            "get_recommended_ads": "get_recommended_ads_api_v1_tiktok_ads_get_recommended_ads_get",
+            "get_related_keywords": "get_related_keywords_api_v1_tiktok_ads_get_related_keywords_get",
+            "get_sound_detail": "get_sound_detail_api_v1_tiktok_ads_get_sound_detail_get",
+            "get_sound_filters": "get_sound_filters_api_v1_tiktok_ads_get_sound_filters_get",
+            "get_sound_rank_list": "get_sound_rank_list_api_v1_tiktok_ads_get_sound_rank_list_get",
+            "get_sound_recommendations": "get_sound_recommendations_api_v1_tiktok_ads_get_sound_recommendations_get",
+            "get_top_ads_spotlight": "get_top_ads_spotlight_api_v1_tiktok_ads_get_top_ads_spotlight_get",
+            "get_top_products": "get_top_products_api_v1_tiktok_ads_get_top_products_get",
+            "search_ads": "search_ads_api_v1_tiktok_ads_search_ads_get",
+            "search_creators": "search_creators_api_v1_tiktok_ads_search_creators_get",
+            "search_sound": "search_sound_api_v1_tiktok_ads_search_sound_get",
+            "search_sound_hint": "search_sound_hint_api_v1_tiktok_ads_search_sound_hint_get",
+        },
+    ),
+    "tiktok_analytics": (
+        "tik_tok_analytics_api",
+        {
+            "detect_fake_views": "detect_fake_views_api_v1_tiktok_analytics_detect_fake_views_get",
+            "fetch_comment_keywords": "fetch_comment_keywords_api_v1_tiktok_analytics_fetch_comment_keywords_get",
+            "fetch_creator_info_and_milestones": "fetch_creator_info_and_milestones_api_v1_tiktok_analytics_fetch_creator_info_and_milestones_get",
+            "fetch_video_metrics": "fetch_video_metrics_api_v1_tiktok_analytics_fetch_video_metrics_get",
+        },
+    ),
+    "tiktok_app_v3": (
+        "tik_tok_app_v3_api",
+        {
+            "TTencrypt_algorithm": "t_tencrypt_algorithm_api_v_1_tiktok_app_v_3_t_tencrypt_algorithm_post",
+            "add_video_play_count": "add_video_play_count_api_v1_tiktok_app_v3_add_video_play_count_get",
+            "check_live_room_online": "check_live_room_online_api_v1_tiktok_app_v3_check_live_room_online_get",
+            "check_live_room_online_batch": "check_live_room_online_batch_api_v1_tiktok_app_v3_check_live_room_online_batch_post",
+            "encrypt_decrypt_login_request": "encrypt_decrypt_login_request_api_v1_tiktok_app_v3_encrypt_decrypt_login_request_post",
+            "fetch_content_translate": "fetch_content_translate_api_v1_tiktok_app_v3_fetch_content_translate_post",
+            "fetch_creator_info": "fetch_creator_info_api_v1_tiktok_app_v3_fetch_creator_info_get",
+            "fetch_creator_showcase_product_list": "fetch_creator_showcase_product_list_api_v1_tiktok_app_v3_fetch_creator_showcase_product_list_get",
+            "fetch_general_search_result": "fetch_general_search_result_api_v1_tiktok_app_v3_fetch_general_search_result_get",
+            "fetch_hashtag_detail": "fetch_hashtag_detail_api_v1_tiktok_app_v3_fetch_hashtag_detail_get",
+            "fetch_hashtag_search_result": "fetch_hashtag_search_result_api_v1_tiktok_app_v3_fetch_hashtag_search_result_get",
+            "fetch_hashtag_video_list": "fetch_hashtag_video_list_api_v1_tiktok_app_v3_fetch_hashtag_video_list_get",
+            "fetch_home_feed": "fetch_home_feed_api_v1_tiktok_app_v3_fetch_home_feed_post",
+            "fetch_live_daily_rank": "fetch_live_daily_rank_api_v1_tiktok_app_v3_fetch_live_daily_rank_get",
+            "fetch_live_ranking_list": "fetch_live_ranking_list_api_v1_tiktok_app_v3_fetch_live_ranking_list_get",
+            "fetch_live_room_info": "fetch_live_room_info_api_v1_tiktok_app_v3_fetch_live_room_info_get",
+            "fetch_live_room_product_list": "fetch_live_room_product_list_api_v1_tiktok_app_v3_fetch_live_room_product_list_get",
+            "fetch_live_room_product_list_v2": "fetch_live_room_product_list_v2_api_v1_tiktok_app_v3_fetch_live_room_product_list_v2_get",
+            "fetch_live_search_result": "fetch_live_search_result_api_v1_tiktok_app_v3_fetch_live_search_result_get",
+            "fetch_location_search": "fetch_location_search_api_v1_tiktok_app_v3_fetch_location_search_get",
+            "fetch_multi_video": "fetch_multi_video_api_v1_tiktok_app_v3_fetch_multi_video_post",
+            "fetch_multi_video_v2": "fetch_multi_video_v2_api_v1_tiktok_app_v3_fetch_multi_video_v2_post",
+            "fetch_music_detail": "fetch_music_detail_api_v1_tiktok_app_v3_fetch_music_detail_get",
+            "fetch_music_search_result": "fetch_music_search_result_api_v1_tiktok_app_v3_fetch_music_search_result_get",
+            "fetch_music_video_list": "fetch_music_video_list_api_v1_tiktok_app_v3_fetch_music_video_list_get",
+            "fetch_one_video": "fetch_one_video_api_v1_tiktok_app_v3_fetch_one_video_get",
+            "fetch_one_video_by_share_url": "fetch_one_video_by_share_url_api_v1_tiktok_app_v3_fetch_one_video_by_share_url_get",
+            "fetch_one_video_v2": "fetch_one_video_v2_api_v1_tiktok_app_v3_fetch_one_video_v2_get",
+            "fetch_product_detail": "fetch_product_detail_api_v1_tiktok_app_v3_fetch_product_detail_get",
+            "fetch_product_detail_v2": "fetch_product_detail_v2_api_v1_tiktok_app_v3_fetch_product_detail_v2_get",
+            "fetch_product_detail_v3": "fetch_product_detail_v3_api_v1_tiktok_app_v3_fetch_product_detail_v3_get",
+            "fetch_product_id_by_share_link": "fetch_product_id_by_share_link_api_v1_tiktok_app_v3_fetch_product_id_by_share_link_get",
+            "fetch_product_review": "fetch_product_review_api_v1_tiktok_app_v3_fetch_product_review_get",
+            "fetch_product_search": "fetch_product_search_api_v1_tiktok_app_v3_fetch_product_search_get",
+            "fetch_share_qr_code": "fetch_share_qr_code_api_v1_tiktok_app_v3_fetch_share_qr_code_get",
+            "fetch_share_short_link": "fetch_share_short_link_api_v1_tiktok_app_v3_fetch_share_short_link_get",
+            "fetch_shop_home": "fetch_shop_home_api_v1_tiktok_app_v3_fetch_shop_home_get",
+            "fetch_shop_home_page_list": "fetch_shop_home_page_list_api_v1_tiktok_app_v3_fetch_shop_home_page_list_get",
+            "fetch_shop_id_by_share_link": "fetch_shop_id_by_share_link_api_v1_tiktok_app_v3_fetch_shop_id_by_share_link_get",
+            "fetch_shop_info": "fetch_shop_info_api_v1_tiktok_app_v3_fetch_shop_info_get",
+            "fetch_shop_product_category": "fetch_shop_product_category_api_v1_tiktok_app_v3_fetch_shop_product_category_get",
+            "fetch_shop_product_list": "fetch_shop_product_list_api_v1_tiktok_app_v3_fetch_shop_product_list_get",
+            "fetch_shop_product_list_v2": "fetch_shop_product_list_v2_api_v1_tiktok_app_v3_fetch_shop_product_list_v2_get",
+            "fetch_shop_product_recommend": "fetch_shop_product_recommend_api_v1_tiktok_app_v3_fetch_shop_product_recommend_get",
+            "fetch_user_follower_list": "fetch_user_follower_list_api_v1_tiktok_app_v3_fetch_user_follower_list_get",
+            "fetch_user_following_list": "fetch_user_following_list_api_v1_tiktok_app_v3_fetch_user_following_list_get",
+            "fetch_user_like_videos": "fetch_user_like_videos_api_v1_tiktok_app_v3_fetch_user_like_videos_get",
+            "fetch_user_music_list": "fetch_user_music_list_api_v1_tiktok_app_v3_fetch_user_music_list_get",
+            "fetch_user_post_videos": "fetch_user_post_videos_api_v1_tiktok_app_v3_fetch_user_post_videos_get",
+            "fetch_user_repost_videos": "fetch_user_repost_videos_api_v1_tiktok_app_v3_fetch_user_repost_videos_get",
+            "fetch_user_search_result": "fetch_user_search_result_api_v1_tiktok_app_v3_fetch_user_search_result_get",
+            "fetch_video_comment_replies": "fetch_video_comments_reply_api_v1_tiktok_app_v3_fetch_video_comment_replies_get",
+            "fetch_video_comments": "fetch_video_comments_api_v1_tiktok_app_v3_fetch_video_comments_get",
+            "fetch_video_search_result": "fetch_video_search_result_api_v1_tiktok_app_v3_fetch_video_search_result_get",
+            "handler_user_profile": "handler_user_profile_api_v1_tiktok_app_v3_handler_user_profile_get",
+            "open_tiktok_app_to_keyword_search": "open_tiktok_app_to_keyword_search_api_v1_tiktok_app_v3_open_tiktok_app_to_keyword_search_get",
+            "open_tiktok_app_to_send_private_message": "open_tiktok_app_to_send_private_message_api_v1_tiktok_app_v3_open_tiktok_app_to_send_private_message_get",
+            "open_tiktok_app_to_user_profile": "open_tiktok_app_to_user_profile_api_v1_tiktok_app_v3_open_tiktok_app_to_user_profile_get",
+            "open_tiktok_app_to_video_detail": "open_tiktok_app_to_video_detail_api_v1_tiktok_app_v3_open_tiktok_app_to_video_detail_get",
+            "register_device": "register_device_api_v1_tiktok_app_v3_register_device_get",
+        },
+    ),
+    "tiktok_creator": (
+        "tik_tok_creator_api",
+        {
+            "get_account_health_status": "get_account_health_status_api_v1_tiktok_creator_get_account_health_status_post",
+            "get_account_insights_overview": "get_account_insights_overview_api_v1_tiktok_creator_get_account_insights_overview_post",
+            "get_account_violation_list": "get_account_violation_list_api_v1_tiktok_creator_get_account_violation_list_post",
+            "get_creator_account_info": "get_creator_account_info_api_v1_tiktok_creator_get_creator_account_info_post",
+            "get_live_analytics_summary": "get_live_overview_api_v1_tiktok_creator_get_live_analytics_summary_post",
+            "get_product_analytics_list": "get_product_analytics_list_api_v1_tiktok_creator_get_product_analytics_list_post",
+            "get_product_related_videos": "get_product_related_videos_api_v1_tiktok_creator_get_product_related_videos_post",
+            "get_showcase_product_list": "get_showcase_product_list_api_v1_tiktok_creator_get_showcase_product_list_post",
+            "get_video_analytics_summary": "get_video_analytics_summary_api_v1_tiktok_creator_get_video_analytics_summary_post",
+            "get_video_associated_product_list": "get_video_associated_product_list_api_v1_tiktok_creator_get_video_associated_product_list_post",
+            "get_video_audience_stats": "get_video_audience_stats_api_v1_tiktok_creator_get_video_audience_stats_post",
+            "get_video_detailed_stats": "get_video_detailed_stats_api_v1_tiktok_creator_get_video_detailed_stats_post",
+            "get_video_list_analytics": "get_video_list_api_v1_tiktok_creator_get_video_list_analytics_post",
+            "get_video_to_product_stats": "get_video_to_product_stats_api_v1_tiktok_creator_get_video_to_product_stats_post",
+        },
+    ),
+    "tiktok_interaction": (
+        "tik_tok_interaction_api",
+        {
+            "apply": "apply_for_scope_api_v1_tiktok_interaction_apply_get",
+            "collect": "collect_api_v1_tiktok_interaction_collect_post",
+            "follow": "follow_api_v1_tiktok_interaction_follow_post",
+            "forward": "forward_api_v1_tiktok_interaction_forward_post",
+            "like": "like_api_v1_tiktok_interaction_like_post",
+            "post_comment": "post_comment_api_v1_tiktok_interaction_post_comment_post",
+            "reply_comment": "reply_comment_api_v1_tiktok_interaction_reply_comment_post",
+        },
+    ),
+    "tiktok_web": (
+        "tik_tok_web_api",
+        {
+            "fetch_check_live_alive": "fetch_check_live_alive_api_v1_tiktok_web_fetch_check_live_alive_get",
+            "fetch_explore_post": "fetch_explore_post_api_v1_tiktok_web_fetch_explore_post_get",
+            "fetch_general_search": "fetch_general_search_api_v1_tiktok_web_fetch_general_search_get",
+            "fetch_home_feed": "fetch_home_feed_api_v1_tiktok_web_fetch_home_feed_post",
+            "fetch_live_im_fetch": "fetch_live_im_fetch_api_v1_tiktok_web_fetch_live_im_fetch_get",
+            "fetch_live_recommend": "fetch_live_recommend_api_v1_tiktok_web_fetch_live_recommend_get",
+            "fetch_post_comment": "fetch_post_comment_api_v1_tiktok_web_fetch_post_comment_get",
+            "fetch_post_comment_reply": "fetch_post_comment_reply_api_v1_tiktok_web_fetch_post_comment_reply_get",
+            "fetch_post_detail": "fetch_post_detail_api_v1_tiktok_web_fetch_post_detail_get",
+            "fetch_search_keyword_suggest": "fetch_search_keyword_suggest_api_v1_tiktok_web_fetch_search_keyword_suggest_get",
+            "fetch_search_live": "fetch_search_live_api_v1_tiktok_web_fetch_search_live_get",
+            "fetch_search_user": "fetch_search_user_api_v1_tiktok_web_fetch_search_user_get",
+            "fetch_search_video": "fetch_search_video_api_v1_tiktok_web_fetch_search_video_get",
+            "fetch_sso_login_auth": "fetch_sso_login_auth_api_v1_tiktok_web_fetch_sso_login_auth_get",
+            "fetch_sso_login_qrcode": "fetch_sso_login_qrcode_api_v1_tiktok_web_fetch_sso_login_qrcode_get",
+            "fetch_sso_login_status": "fetch_sso_login_status_api_v1_tiktok_web_fetch_sso_login_status_get",
+            "fetch_tag_detail": "fetch_tag_detail_api_v1_tiktok_web_fetch_tag_detail_get",
+            "fetch_tag_post": "fetch_tag_post_api_v1_tiktok_web_fetch_tag_post_get",
+            "fetch_tiktok_live_data": "fetch_tiktok_live_data_api_v1_tiktok_web_fetch_tiktok_live_data_get",
+            "fetch_trending_post": "fetch_trending_post_api_v1_tiktok_web_fetch_trending_post_get",
+            "fetch_user_collect": "fetch_user_collect_api_v1_tiktok_web_fetch_user_collect_get",
+            "fetch_user_fans": "fetch_user_fans_api_v1_tiktok_web_fetch_user_fans_get",
+            "fetch_user_follow": "fetch_user_follow_api_v1_tiktok_web_fetch_user_follow_get",
+            "fetch_user_like": "fetch_user_like_api_v1_tiktok_web_fetch_user_like_get",
+            "fetch_user_mix": "fetch_user_mix_api_v1_tiktok_web_fetch_user_mix_get",
+            "fetch_user_play_list": "fetch_user_play_list_api_v1_tiktok_web_fetch_user_play_list_get",
+            "fetch_user_post": "fetch_user_post_api_v1_tiktok_web_fetch_user_post_get",
+            "fetch_user_profile": "fetch_user_profile_api_v1_tiktok_web_fetch_user_profile_get",
+            "generate_real_msToken": "generate_real_ms_token_api_v_1_tiktok_web_generate_real_ms_token_get",
+            "generate_ttwid": "generate_ttwid_api_v1_tiktok_web_generate_ttwid_get",
+            "generate_xbogus": "generate_xbogus_api_v1_tiktok_web_generate_xbogus_post",
+            "get_all_aweme_id": "get_all_aweme_id_api_v1_tiktok_web_get_all_aweme_id_post",
+            "get_all_sec_user_id": "get_all_sec_user_id_api_v1_tiktok_web_get_all_sec_user_id_post",
+            "get_all_unique_id": "get_all_unique_id_api_v1_tiktok_web_get_all_unique_id_post",
+            "get_aweme_id": "get_aweme_id_api_v1_tiktok_web_get_aweme_id_get",
+            "get_live_room_id": "get_live_room_id_api_v1_tiktok_web_get_live_room_id_get",
+            "get_sec_user_id": "get_sec_user_id_api_v1_tiktok_web_get_sec_user_id_get",
+            "get_unique_id": "get_unique_id_api_v1_tiktok_web_get_unique_id_get",
+            "get_user_id": "get_user_id_api_v1_tiktok_web_get_user_id_get",
+            "tiktok_live_room": "douyin_live_room_api_v1_tiktok_web_tiktok_live_room_get",
+        },
+    ),
+    "toutiao_app": (
+        "toutiao_app_api",
+        {
+            "get_article_info": "get_article_info_api_v1_toutiao_app_get_article_info_get",
+            "get_comments": "get_comments_api_v1_toutiao_app_get_comments_get",
+            "get_user_id": "get_user_id_api_v1_toutiao_app_get_user_id_get",
+            "get_user_info": "get_user_info_api_v1_toutiao_app_get_user_info_get",
+            "get_video_info": "get_video_info_api_v1_toutiao_app_get_video_info_get",
+        },
+    ),
+    "toutiao_web": (
+        "toutiao_web_api",
+        {
+            "get_article_info": "get_article_info_api_v1_toutiao_web_get_article_info_get",
+            "get_video_info": "get_video_info_api_v1_toutiao_web_get_video_info_get",
+        },
+    ),
+    "twitter_web": (
+        "twitter_web_api",
+        {
+            "fetch_latest_post_comments": "fetch_latest_post_comments_api_v1_twitter_web_fetch_latest_post_comments_get",
+            "fetch_post_comments": "fetch_post_comments_api_v1_twitter_web_fetch_post_comments_get",
+            "fetch_retweet_user_list": "fetch_retweet_user_list_api_v1_twitter_web_fetch_retweet_user_list_get",
+            "fetch_search_timeline": "fetch_search_timeline_api_v1_twitter_web_fetch_search_timeline_get",
+            "fetch_trending": "fetch_trending_api_v1_twitter_web_fetch_trending_get",
+            "fetch_tweet_detail": "fetch_tweet_detail_api_v1_twitter_web_fetch_tweet_detail_get",
+            "fetch_user_followers": "fetch_user_followers_api_v1_twitter_web_fetch_user_followers_get",
+            "fetch_user_followings": "fetch_user_followings_api_v1_twitter_web_fetch_user_followings_get",
+            "fetch_user_highlights_tweets": "fetch_user_highlights_tweets_api_v1_twitter_web_fetch_user_highlights_tweets_get",
+            "fetch_user_media": "fetch_user_media_api_v1_twitter_web_fetch_user_media_get",
+            "fetch_user_post_tweet": "fetch_user_post_tweet_api_v1_twitter_web_fetch_user_post_tweet_get",
+            "fetch_user_profile": "fetch_user_profile_api_v1_twitter_web_fetch_user_profile_get",
+            "fetch_user_tweet_replies": "fetch_user_tweet_replies_api_v1_twitter_web_fetch_user_tweet_replies_get",
+        },
+    ),
+    "wechat_mp_web": (
+        "we_chat_media_platform_web_api",
+        {
+            "fetch_mp_article_ad": "fetch_mp_article_ad_api_v1_wechat_mp_web_fetch_mp_article_ad_get",
+            "fetch_mp_article_comment_list": "fetch_mp_article_comment_list_api_v1_wechat_mp_web_fetch_mp_article_comment_list_get",
+            "fetch_mp_article_comment_reply_list": "fetch_mp_article_comment_reply_list_api_v1_wechat_mp_web_fetch_mp_article_comment_reply_list_get",
+            "fetch_mp_article_detail_html": "fetch_mp_article_detail_html_api_v1_wechat_mp_web_fetch_mp_article_detail_html_get",
+            "fetch_mp_article_detail_json": "fetch_mp_article_detail_json_api_v1_wechat_mp_web_fetch_mp_article_detail_json_get",
+            "fetch_mp_article_list": "fetch_mp_article_list_api_v1_wechat_mp_web_fetch_mp_article_list_get",
+            "fetch_mp_article_read_count": "fetch_mp_article_read_count_api_v1_wechat_mp_web_fetch_mp_article_read_count_get",
+            "fetch_mp_article_url": "fetch_mp_article_url_api_v1_wechat_mp_web_fetch_mp_article_url_get",
+            "fetch_mp_article_url_conversion": "fetch_mp_article_url_conversion_api_v1_wechat_mp_web_fetch_mp_article_url_conversion_get",
+            "fetch_mp_related_articles": "fetch_mp_related_articles_api_v1_wechat_mp_web_fetch_mp_related_articles_get",
+        },
+    ),
+    "weibo_web": (
+        "weibo_web_api",
+        {
+            "fetch_post_detail": "fetch_post_detail_api_v1_weibo_web_fetch_post_detail_get",
+            "fetch_search_data": "fetch_search_data_api_v1_weibo_web_fetch_search_data_get",
+            "fetch_short_video_data": "fetch_short_video_data_api_v1_weibo_web_fetch_short_video_data_get",
+            "fetch_topic_detail": "fetch_topic_detail_api_v1_weibo_web_fetch_topic_detail_get",
+            "fetch_topic_stats": "fetch_topic_stats_api_v1_weibo_web_fetch_topic_stats_get",
+            "fetch_user_info": "fetch_user_info_api_v1_weibo_web_fetch_user_info_get",
+            "fetch_user_info_v2": "fetch_user_info_v2_api_v1_weibo_web_fetch_user_info_v2_get",
+            "fetch_user_posts": "fetch_user_posts_api_v1_weibo_web_fetch_user_posts_get",
+        },
+    ),
+    "xiaohongshu_web": (
+        "xiaohongshu_web_api",
+        {
+            "get_home_recommend": "get_home_recommend_api_v1_xiaohongshu_web_get_home_recommend_post",
+            "get_note_comment_replies": "get_note_comment_replies_api_v1_xiaohongshu_web_get_note_comment_replies_get",
+            "get_note_comment_replies_v2": "get_note_comment_replies_api_v1_xiaohongshu_web_get_note_comment_replies_v2_get",
+            "get_note_comments": "get_note_comments_api_v1_xiaohongshu_web_get_note_comments_get",
+            "get_note_comments_v2": "get_note_comments_api_v1_xiaohongshu_web_get_note_comments_v2_get",
+            "get_note_id_and_xsec_token": "get_note_id_and_xsec_token_api_v1_xiaohongshu_web_get_note_id_and_xsec_token_get",
+            "get_note_info": "get_note_info_v1_api_v1_xiaohongshu_web_get_note_info_get",
+            "get_note_info_v2": "get_note_info_v2_api_v1_xiaohongshu_web_get_note_info_v2_get",
+            "get_note_info_v3": "get_note_info_v3_api_v1_xiaohongshu_web_get_note_info_v3_get",
+            "get_note_info_v4": "get_note_info_v4_api_v1_xiaohongshu_web_get_note_info_v4_get",
+            "get_note_info_v5": "get_note_info_v5_api_v1_xiaohongshu_web_get_note_info_v5_post",
+            "get_note_info_v7": "get_note_info_v7_api_v1_xiaohongshu_web_get_note_info_v7_get",
+            "get_product_info": "get_product_info_api_v1_xiaohongshu_web_get_product_info_get",
+            "get_user_info": "get_user_info_api_v1_xiaohongshu_web_get_user_info_get",
+            "get_user_info_v2": "get_user_info_v2_api_v1_xiaohongshu_web_get_user_info_v2_get",
+            "get_user_info_v3": "get_user_info_v3_api_v1_xiaohongshu_web_get_user_info_v3_get",
+            "get_user_notes": "get_user_notes_api_v1_xiaohongshu_web_get_user_notes_get",
+            "get_user_notes_v2": "get_user_notes_api_v1_xiaohongshu_web_get_user_notes_v2_get",
+            "get_visitor_cookie": "get_visitor_cookie_api_v1_xiaohongshu_web_get_visitor_cookie_get",
+            "search_notes": "search_notes_api_v1_xiaohongshu_web_search_notes_get",
+            "search_users": "search_users_api_v1_xiaohongshu_web_search_users_get",
+            "sign": "sign_api_v1_xiaohongshu_web_sign_post",
+        },
+    ),
+    "xiaohongshu_web_v2": (
+        "xiaohongshu_web_v2_api",
+        {
+            "fetch_feed_notes": "fetch_feed_notes_api_v1_xiaohongshu_web_v2_fetch_feed_notes_get",
+            "fetch_feed_notes_v2": "fetch_feed_notes_v2_api_v1_xiaohongshu_web_v2_fetch_feed_notes_v2_get",
+            "fetch_feed_notes_v3": "fetch_feed_notes_v2_api_v1_xiaohongshu_web_v2_fetch_feed_notes_v3_get",
+            "fetch_follower_list": "fetch_follower_list_api_v1_xiaohongshu_web_v2_fetch_follower_list_get",
+            "fetch_following_list": "fetch_following_list_api_v1_xiaohongshu_web_v2_fetch_following_list_get",
+            "fetch_home_notes": "fetch_home_notes_api_v1_xiaohongshu_web_v2_fetch_home_notes_get",
+            "fetch_home_notes_app": "fetch_home_notes_app_api_v1_xiaohongshu_web_v2_fetch_home_notes_app_get",
+            "fetch_note_comments": "fetch_note_comments_api_v1_xiaohongshu_web_v2_fetch_note_comments_get",
+            "fetch_note_image": "fetch_note_image_api_v1_xiaohongshu_web_v2_fetch_note_image_get",
+            "fetch_search_notes": "fetch_search_notes_api_v1_xiaohongshu_web_v2_fetch_search_notes_get",
+            "fetch_search_users": "fetch_search_notes_api_v1_xiaohongshu_web_v2_fetch_search_users_get",
+            "fetch_sub_comments": "fetch_sub_comments_api_v1_xiaohongshu_web_v2_fetch_sub_comments_get",
+            "fetch_user_info": "fetch_user_info_api_v1_xiaohongshu_web_v2_fetch_user_info_get",
+            "fetch_user_info_app": "fetch_user_info_api_v1_xiaohongshu_web_v2_fetch_user_info_app_get",
+        },
+    ),
+    "xigua_app_v2": (
+        "xigua_app_v2_api",
+        {
+            "fetch_one_video": "fetch_one_video_api_v1_xigua_app_v2_fetch_one_video_get",
+            "fetch_one_video_play_url": "fetch_one_video_play_url_api_v1_xigua_app_v2_fetch_one_video_play_url_get",
+            "fetch_one_video_v2": "fetch_one_video_v2_api_v1_xigua_app_v2_fetch_one_video_v2_get",
+            "fetch_user_info": "fetch_user_info_api_v1_xigua_app_v2_fetch_user_info_get",
+            "fetch_user_post_list": "fetch_user_post_list_api_v1_xigua_app_v2_fetch_user_post_list_get",
+            "fetch_video_comment_list": "fetch_video_comment_list_api_v1_xigua_app_v2_fetch_video_comment_list_get",
+            "search_video": "search_video_api_v1_xigua_app_v2_search_video_get",
+        },
+    ),
+    "youtube_web": (
+        "you_tube_web_api",
+        {
+            "get_channel_id": "get_channel_id_api_v1_youtube_web_get_channel_id_get",
+            "get_channel_info": "get_channel_info_api_v1_youtube_web_get_channel_info_get",
+            "get_channel_short_videos": "get_channel_short_videos_api_v1_youtube_web_get_channel_short_videos_get",
+            "get_channel_videos": "get_channel_videos_api_v1_youtube_web_get_channel_videos_get",
+            "get_channel_videos_v2": "get_channel_videos_v2_api_v1_youtube_web_get_channel_videos_v2_get",
+            "get_relate_video": "get_relate_video_api_v1_youtube_web_get_relate_video_get",
+            "get_trending_videos": "get_trending_videos_api_v1_youtube_web_get_trending_videos_get",
+            "get_video_comments": "get_video_comments_api_v1_youtube_web_get_video_comments_get",
+            "get_video_comments_v2": "get_video_comments_v2_api_v1_youtube_web_get_video_comments_v2_get",
+            "get_video_info": "get_video_info_api_v1_youtube_web_get_video_info_get",
+            "get_video_subtitles": "api_get_video_subtitles_api_v1_youtube_web_get_video_subtitles_get",
+            "search_channel": "search_channel_api_v1_youtube_web_search_channel_get",
+            "search_video": "search_video_api_v1_youtube_web_search_video_get",
+        },
+    ),
+    "zhihu_web": (
+        "zhihu_web_api",
+        {
+            "fetch_ai_search": "fetch_ai_search_api_v1_zhihu_web_fetch_ai_search_get",
+            "fetch_ai_search_result": "fetch_ai_search_result_api_v1_zhihu_web_fetch_ai_search_result_get",
+            "fetch_article_search_v3": "fetch_article_search_v3_api_v1_zhihu_web_fetch_article_search_v3_get",
+            "fetch_column_article_detail": "fetch_column_article_detail_api_v1_zhihu_web_fetch_column_article_detail_get",
+            "fetch_column_articles": "fetch_column_articles_api_v1_zhihu_web_fetch_column_articles_get",
+            "fetch_column_comment_config": "fetch_column_comment_config_api_v1_zhihu_web_fetch_column_comment_config_get",
+            "fetch_column_recommend": "fetch_column_recommend_api_v1_zhihu_web_fetch_column_recommend_get",
+            "fetch_column_relationship": "fetch_column_relationship_api_v1_zhihu_web_fetch_column_relationship_get",
+            "fetch_column_search_v3": "fetch_column_search_v3_api_v1_zhihu_web_fetch_column_search_v3_get",
+            "fetch_comment_v5": "fetch_comment_v5_api_v1_zhihu_web_fetch_comment_v5_get",
+            "fetch_ebook_search_v3": "fetch_ebook_search_v3_api_v1_zhihu_web_fetch_ebook_search_v3_get",
+            "fetch_hot_list": "fetch_hot_list_api_v1_zhihu_web_fetch_hot_list_get",
+            "fetch_hot_recommend": "fetch_hot_recommend_api_v1_zhihu_web_fetch_hot_recommend_get",
+            "fetch_preset_search": "fetch_preset_search_api_v1_zhihu_web_fetch_preset_search_get",
+            "fetch_recommend_followees": "fetch_recommend_followees_api_v1_zhihu_web_fetch_recommend_followees_get",
+            "fetch_salt_search_v3": "fetch_salt_search_v3_api_v1_zhihu_web_fetch_salt_search_v3_get",
+            "fetch_scholar_search_v3": "fetch_scholar_search_v3_api_v1_zhihu_web_fetch_scholar_search_v3_post",
+            "fetch_search_recommend": "fetch_search_recommend_api_v1_zhihu_web_fetch_search_recommend_get",
+            "fetch_search_suggest": "fetch_search_suggest_api_v1_zhihu_web_fetch_search_suggest_get",
+            "fetch_sub_comment_v5": "fetch_sub_comment_v5_api_v1_zhihu_web_fetch_sub_comment_v5_get",
+            "fetch_topic_search_v3": "fetch_topic_search_v3_api_v1_zhihu_web_fetch_topic_search_v3_get",
+            "fetch_user_follow_collections": "fetch_user_follow_collections_api_v1_zhihu_web_fetch_user_follow_collections_get",
+            "fetch_user_follow_columns": "fetch_user_follow_columns_api_v1_zhihu_web_fetch_user_follow_columns_get",
+            "fetch_user_follow_questions": "fetch_user_follow_questions_api_v1_zhihu_web_fetch_user_follow_questions_get",
+            "fetch_user_follow_topics": "fetch_user_follow_topics_api_v1_zhihu_web_fetch_user_follow_topics_get",
+            "fetch_user_followees": "fetch_user_followees_api_v1_zhihu_web_fetch_user_followees_get",
+            "fetch_user_followers": "fetch_user_followers_api_v1_zhihu_web_fetch_user_followers_get",
+            "fetch_user_info": "fetch_user_info_api_v1_zhihu_web_fetch_user_info_get",
+            "fetch_user_search_v3": "fetch_user_search_v3_api_v1_zhihu_web_fetch_user_search_v3_get",
+            "fetch_video_list": "fetch_video_list_api_v1_zhihu_web_fetch_video_list_get",
+            "fetch_video_search_v3": "fetch_video_search_v3_api_v1_zhihu_web_fetch_video_search_v3_get",
+        },
+    ),
+}
@@ -1,125 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    a_id: str,
-    c_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["a_id"] = a_id
-
-    params["c_id"] = c_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/bilibili/web/fetch_one_video_v2",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response
 
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/bilibili/web/fetch_one_video_v2",
+    params={"a_id": "a_id", "c_id": "c_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, a_id: str, c_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    a_id: str,
-    c_id: str,
+    *, client: AuthenticatedClient, a_id: str, c_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取单个视频详情信息V2/Get single video data V2
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取单个视频详情信息V2
-    ### 参数:
-    - a_id: 作品id
-    - c_id: 作品cid
-    ### 返回:
-    - 视频详情信息V2
+    return ENDPOINT.sync_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get single video data V2
-    ### Parameters:
-    - a_id: Video id
-    - c_id: Video cid
-    ### Return:
-    - Video data V2
 
-    # [示例/Example]
-    a_id = \"114006081739452\"
-    c_id = \"28400484458\"
-
-    Args:
-        a_id (str): 作品id/Video id
-        c_id (str): 作品cid/Video cid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        a_id=a_id,
-        c_id=c_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    a_id: str,
-    c_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, a_id: str, c_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取单个视频详情信息V2/Get single video data V2
 
      # [中文]
@@ -156,111 +63,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        a_id=a_id,
-        c_id=c_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    a_id: str,
-    c_id: str,
+    *, client: AuthenticatedClient, a_id: str, c_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取单个视频详情信息V2/Get single video data V2
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取单个视频详情信息V2
-    ### 参数:
-    - a_id: 作品id
-    - c_id: 作品cid
-    ### 返回:
-    - 视频详情信息V2
-
-    # [English]
-    ### Purpose:
-    - Get single video data V2
-    ### Parameters:
-    - a_id: Video id
-    - c_id: Video cid
-    ### Return:
-    - Video data V2
-
-    # [示例/Example]
-    a_id = \"114006081739452\"
-    c_id = \"28400484458\"
-
-    Args:
-        a_id (str): 作品id/Video id
-        c_id (str): 作品cid/Video cid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        a_id=a_id,
-        c_id=c_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    a_id: str,
-    c_id: str,
+    *, client: AuthenticatedClient, a_id: str, c_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取单个视频详情信息V2/Get single video data V2
-
-     # [中文]
-    ### 用途:
-    - 获取单个视频详情信息V2
-    ### 参数:
-    - a_id: 作品id
-    - c_id: 作品cid
-    ### 返回:
-    - 视频详情信息V2
-
-    # [English]
-    ### Purpose:
-    - Get single video data V2
-    ### Parameters:
-    - a_id: Video id
-    - c_id: Video cid
-    ### Return:
-    - Video data V2
-
-    # [示例/Example]
-    a_id = \"114006081739452\"
-    c_id = \"28400484458\"
-
-    Args:
-        a_id (str): 作品id/Video id
-        c_id (str): 作品cid/Video cid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            a_id=a_id,
-            c_id=c_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
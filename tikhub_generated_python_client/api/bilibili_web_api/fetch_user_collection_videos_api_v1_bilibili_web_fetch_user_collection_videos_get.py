@@ -1,124 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    folder_id: str,
-    pn: Union[Unset, int] = 1,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["folder_id"] = folder_id
+from ...types import Response, Unset
 
-    params["pn"] = pn
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/bilibili/web/fetch_user_collection_videos",
+    params={"folder_id": "folder_id", "pn": "pn"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/bilibili/web/fetch_user_collection_videos",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, folder_id: str, pn: Union[Unset, int] = 1) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    folder_id: str,
-    pn: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, folder_id: str, pn: Union[Unset, int] = 1
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定收藏夹内视频数据/Gets video data from a collection folder
-
-     # [中文]
-    ### 用途:
-    - 获取指定收藏夹内视频数据
-    ### 参数:
-    - folder_id: 用户UID
-    - pn: 页码
-    ### 返回:
-    - 指定收藏夹内视频数据
-
-    # [English]
-    ### Purpose:
-    - Gets video data from a collection folder
-    ### Parameters:
-    - folder_id: collection folder id
-    - pn: Page number
-    ### Return:
-    - video data from collection folder
-
-    # [示例/Example]
-    folder_id = \"1756059545\"
-    pn = 1
-
-    Args:
-        folder_id (str): 收藏夹id/collection folder id
-        pn (Union[Unset, int]): 页码/Page number Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        folder_id=folder_id,
-        pn=pn,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    folder_id: str,
-    pn: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, folder_id: str, pn: Union[Unset, int] = 1
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定收藏夹内视频数据/Gets video data from a collection folder
 
@@ -156,111 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        folder_id=folder_id,
-        pn=pn,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    folder_id: str,
-    pn: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, folder_id: str, pn: Union[Unset, int] = 1
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定收藏夹内视频数据/Gets video data from a collection folder
-
-     # [中文]
-    ### 用途:
-    - 获取指定收藏夹内视频数据
-    ### 参数:
-    - folder_id: 用户UID
-    - pn: 页码
-    ### 返回:
-    - 指定收藏夹内视频数据
-
-    # [English]
-    ### Purpose:
-    - Gets video data from a collection folder
-    ### Parameters:
-    - folder_id: collection folder id
-    - pn: Page number
-    ### Return:
-    - video data from collection folder
-
-    # [示例/Example]
-    folder_id = \"1756059545\"
-    pn = 1
-
-    Args:
-        folder_id (str): 收藏夹id/collection folder id
-        pn (Union[Unset, int]): 页码/Page number Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        folder_id=folder_id,
-        pn=pn,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    folder_id: str,
-    pn: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, folder_id: str, pn: Union[Unset, int] = 1
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定收藏夹内视频数据/Gets video data from a collection folder
-
-     # [中文]
-    ### 用途:
-    - 获取指定收藏夹内视频数据
-    ### 参数:
-    - folder_id: 用户UID
-    - pn: 页码
-    ### 返回:
-    - 指定收藏夹内视频数据
-
-    # [English]
-    ### Purpose:
-    - Gets video data from a collection folder
-    ### Parameters:
-    - folder_id: collection folder id
-    - pn: Page number
-    ### Return:
-    - video data from collection folder
-
-    # [示例/Example]
-    folder_id = \"1756059545\"
-    pn = 1
-
-    Args:
-        folder_id (str): 收藏夹id/collection folder id
-        pn (Union[Unset, int]): 页码/Page number Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            folder_id=folder_id,
-            pn=pn,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,10 +1,7 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post import (
     BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
 )
@@ -12,114 +9,28 @@ from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import Response
 
-
-def _get_kwargs(
-    *,
-    body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/captcha/cloudflare_turnstile",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/captcha/cloudflare_turnstile",
+    body=BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    *, client: AuthenticatedClient, body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""Cloudflare Turnstile Solver/Cloudflare Turnstile解决器
-
-     # [中文]
-    ### 用途:
-    - Cloudflare Turnstile验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - Cloudflare Turnstile captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - action: Default is None
-    - data: Default is None
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    # [Example/示例]
-    sitekey = \"1x00000000000000000000AA\"
-    url = \"https://demo.turnstile.workers.dev\"
-    proxy = None
-
-    Args:
-        body (BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    *, client: AuthenticatedClient, body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""Cloudflare Turnstile Solver/Cloudflare Turnstile解决器
 
@@ -161,114 +72,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    *, client: AuthenticatedClient, body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""Cloudflare Turnstile Solver/Cloudflare Turnstile解决器
-
-     # [中文]
-    ### 用途:
-    - Cloudflare Turnstile验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - Cloudflare Turnstile captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - action: Default is None
-    - data: Default is None
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
+    """Like sync_detailed, for use with await"""
 
-    # [Example/示例]
-    sitekey = \"1x00000000000000000000AA\"
-    url = \"https://demo.turnstile.workers.dev\"
-    proxy = None
-
-    Args:
-        body (BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    *, client: AuthenticatedClient, body: BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""Cloudflare Turnstile Solver/Cloudflare Turnstile解决器
-
-     # [中文]
-    ### 用途:
-    - Cloudflare Turnstile验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - Cloudflare Turnstile captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - action: Default is None
-    - data: Default is None
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
-
-    # [Example/示例]
-    sitekey = \"1x00000000000000000000AA\"
-    url = \"https://demo.turnstile.workers.dev\"
-    proxy = None
-
-    Args:
-        body (BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,121 +1,34 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.body_hcaptcha_api_v1_captcha_hcaptcha_post import BodyHcaptchaApiV1CaptchaHcaptchaPost
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/captcha/hcaptcha",
+    body=BodyHcaptchaApiV1CaptchaHcaptchaPost,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _get_kwargs(
-    *,
-    body: BodyHcaptchaApiV1CaptchaHcaptchaPost,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/captcha/hcaptcha",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, body: BodyHcaptchaApiV1CaptchaHcaptchaPost) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyHcaptchaApiV1CaptchaHcaptchaPost,
+    *, client: AuthenticatedClient, body: BodyHcaptchaApiV1CaptchaHcaptchaPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""hCaptcha Solver/hCaptcha解决器
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - hCaptcha验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - hCaptcha captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
-
-    # [Example/示例]
-    sitekey = \"10000000-ffff-ffff-ffff-000000000001\"
-    url = \"https://www.hcaptcha.com/\"
-    proxy = None
-
-    Args:
-        body (BodyHcaptchaApiV1CaptchaHcaptchaPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: BodyHcaptchaApiV1CaptchaHcaptchaPost,
+    *, client: AuthenticatedClient, body: BodyHcaptchaApiV1CaptchaHcaptchaPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""hCaptcha Solver/hCaptcha解决器
 
@@ -155,110 +68,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyHcaptchaApiV1CaptchaHcaptchaPost,
+    *, client: AuthenticatedClient, body: BodyHcaptchaApiV1CaptchaHcaptchaPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""hCaptcha Solver/hCaptcha解决器
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - hCaptcha验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - hCaptcha captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
-
-    # [Example/示例]
-    sitekey = \"10000000-ffff-ffff-ffff-000000000001\"
-    url = \"https://www.hcaptcha.com/\"
-    proxy = None
-
-    Args:
-        body (BodyHcaptchaApiV1CaptchaHcaptchaPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: BodyHcaptchaApiV1CaptchaHcaptchaPost,
+    *, client: AuthenticatedClient, body: BodyHcaptchaApiV1CaptchaHcaptchaPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""hCaptcha Solver/hCaptcha解决器
-
-     # [中文]
-    ### 用途:
-    - hCaptcha验证码解决器
-    ### 参数:
-    - sitekey: 在HTML中可以找到网站对应的sitekey
-    - url: 需要解决验证码的URL
-    - proxy: 默认为None
-    ### 返回:
-    - 返回验证码解决结果
-
-    # [English]
-    ### Purpose:
-    - hCaptcha captcha solver
-    ### Parameters:
-    - sitekey: The sitekey corresponding to the website can be found in the HTML
-    - url: URL that needs to solve the captcha
-    - proxy: Default is None
-    ### Return:
-    - Return the captcha solution result
-
-    # [Example/示例]
-    sitekey = \"10000000-ffff-ffff-ffff-000000000001\"
-    url = \"https://www.hcaptcha.com/\"
-    proxy = None
-
-    Args:
-        body (BodyHcaptchaApiV1CaptchaHcaptchaPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,85 +1,28 @@
-from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Any, Optional
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.response_model import ResponseModel
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/app/v3/fetch_live_hot_search_list",
+    responses={200: ResponseModel},
+)
 
-def _get_kwargs() -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/app/v3/fetch_live_hot_search_list",
-    }
-
-    return _kwargs
-
-
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[ResponseModel]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[ResponseModel]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-) -> Response[ResponseModel]:
-    """获取抖音直播热搜榜数据/Get Douyin live hot search list data
 
-     # [中文]
-    ### 用途:
-    - 获取抖音直播热搜榜数据
-    ### 返回:
-    - 直播热搜榜数据
-
-    # [English]
-    ### Purpose:
-    - Get Douyin live hot search list data
-    ### Return:
-    - Live hot search list data
-
-    # [示例/Example]
-    pass
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[ResponseModel]
-    """
+def _get_kwargs() -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-    kwargs = _get_kwargs()
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+def sync_detailed(*, client: AuthenticatedClient) -> Response[ResponseModel]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync(
-    *,
-    client: AuthenticatedClient,
-) -> Optional[ResponseModel]:
+def sync(*, client: AuthenticatedClient) -> Optional[ResponseModel]:
     """获取抖音直播热搜榜数据/Get Douyin live hot search list data
 
      # [中文]
@@ -105,78 +48,16 @@ def sync(
         ResponseModel
     """
 
-    return sync_detailed(
-        client=client,
-    ).parsed
-
-
-async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-) -> Response[ResponseModel]:
-    """获取抖音直播热搜榜数据/Get Douyin live hot search list data
-
-     # [中文]
-    ### 用途:
-    - 获取抖音直播热搜榜数据
-    ### 返回:
-    - 直播热搜榜数据
-
-    # [English]
-    ### Purpose:
-    - Get Douyin live hot search list data
-    ### Return:
-    - Live hot search list data
-
-    # [示例/Example]
-    pass
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[ResponseModel]
-    """
-
-    kwargs = _get_kwargs()
+    return ENDPOINT.sync(**locals())
 
-    response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(client=client, response=response)
+async def asyncio_detailed(*, client: AuthenticatedClient) -> Response[ResponseModel]:
+    """Like sync_detailed, for use with await"""
 
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-) -> Optional[ResponseModel]:
-    """获取抖音直播热搜榜数据/Get Douyin live hot search list data
 
-     # [中文]
-    ### 用途:
-    - 获取抖音直播热搜榜数据
-    ### 返回:
-    - 直播热搜榜数据
-
-    # [English]
-    ### Purpose:
-    - Get Douyin live hot search list data
-    ### Return:
-    - Live hot search list data
-
-    # [示例/Example]
-    pass
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        ResponseModel
-    """
+async def asyncio(*, client: AuthenticatedClient) -> Optional[ResponseModel]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,138 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["keyword"] = keyword
-
-    params["offset"] = offset
+from ...types import Response, Unset
 
-    params["count"] = count
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/app/v3/fetch_music_search_result",
+    params={"keyword": "keyword", "offset": "offset", "count": "count"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/app/v3/fetch_music_search_result",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
+    *, client: AuthenticatedClient, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的音乐搜索结果（弃用，替代接口见下方文档说明）/Get music search results of specified keywords (deprecated, see the
-    documentation below for alternative interfaces)
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的音乐搜索结果
-    - 该接口已弃用，替代接口为：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量，请保持默认，否则会出现BUG。
-    ### 返回:
-    - 音乐搜索结果
-
-    # [English]
-    ### Purpose:
-    - Get music search results of specified keywords
-    - This interface has been deprecated, and the alternative interface is:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number Please keep the default, otherwise there will be BUG.
-    ### Return:
-    - Music search results
-
-    # [示例/Example]
-    keyword = \"中华娘\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        count=count,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
+    *, client: AuthenticatedClient, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定关键词的音乐搜索结果（弃用，替代接口见下方文档说明）/Get music search results of specified keywords (deprecated, see the
     documentation below for alternative interfaces)
@@ -178,132 +73,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        keyword=keyword,
-        offset=offset,
-        count=count,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
+    *, client: AuthenticatedClient, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的音乐搜索结果（弃用，替代接口见下方文档说明）/Get music search results of specified keywords (deprecated, see the
-    documentation below for alternative interfaces)
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的音乐搜索结果
-    - 该接口已弃用，替代接口为：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量，请保持默认，否则会出现BUG。
-    ### 返回:
-    - 音乐搜索结果
-
-    # [English]
-    ### Purpose:
-    - Get music search results of specified keywords
-    - This interface has been deprecated, and the alternative interface is:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number Please keep the default, otherwise there will be BUG.
-    ### Return:
-    - Music search results
-
-    # [示例/Example]
-    keyword = \"中华娘\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        count=count,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
+    *, client: AuthenticatedClient, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的音乐搜索结果（弃用，替代接口见下方文档说明）/Get music search results of specified keywords (deprecated, see the
-    documentation below for alternative interfaces)
-
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的音乐搜索结果
-    - 该接口已弃用，替代接口为：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量，请保持默认，否则会出现BUG。
-    ### 返回:
-    - 音乐搜索结果
-
-    # [English]
-    ### Purpose:
-    - Get music search results of specified keywords
-    - This interface has been deprecated, and the alternative interface is:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number Please keep the default, otherwise there will be BUG.
-    ### Return:
-    - Music search results
-
-    # [示例/Example]
-    keyword = \"中华娘\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            keyword=keyword,
-            offset=offset,
-            count=count,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
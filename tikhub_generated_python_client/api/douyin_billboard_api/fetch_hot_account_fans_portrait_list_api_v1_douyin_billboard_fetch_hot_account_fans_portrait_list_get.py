@@ -1,128 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    sec_uid: str,
-    option: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["sec_uid"] = sec_uid
-
-    params["option"] = option
+from ...types import Response
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/billboard/fetch_hot_account_fans_portrait_list",
+    params={"sec_uid": "sec_uid", "option": "option"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/billboard/fetch_hot_account_fans_portrait_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, sec_uid: str, option: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    option: str,
+    *, client: AuthenticatedClient, sec_uid: str, option: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取粉丝画像/Fetch fan portrait
-
-     # [中文]
-    ### 用途:
-    - 获取粉丝画像
-    ### 参数:
-    - sec_uid: 用户sec_id
-    - option: 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-    ### 返回:
-    - 粉丝画像
-
-    # [English]
-    ### Purpose:
-    - Get the fan portrait
-    ### Parameters:
-    - sec_uid: User sec_id
-    - option: Option
-        - 1 Mobile price
-        - 2 Gender distribution
-        - 3 Age distribution
-        - 4 Regional distribution - province
-        - 5 Regional distribution - city
-        - 6 City level
-        - 7 Mobile brand distribution
-        - 8 Interest tag analysis percentage
-    ### Return:
-    - Fan portrait
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Args:
-        sec_uid (str): 用户sec_id
-        option (str): 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_uid=sec_uid,
-        option=option,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    option: str,
+    *, client: AuthenticatedClient, sec_uid: str, option: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """获取粉丝画像/Fetch fan portrait
 
@@ -164,119 +69,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        sec_uid=sec_uid,
-        option=option,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    option: str,
+    *, client: AuthenticatedClient, sec_uid: str, option: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取粉丝画像/Fetch fan portrait
-
-     # [中文]
-    ### 用途:
-    - 获取粉丝画像
-    ### 参数:
-    - sec_uid: 用户sec_id
-    - option: 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-    ### 返回:
-    - 粉丝画像
-
-    # [English]
-    ### Purpose:
-    - Get the fan portrait
-    ### Parameters:
-    - sec_uid: User sec_id
-    - option: Option
-        - 1 Mobile price
-        - 2 Gender distribution
-        - 3 Age distribution
-        - 4 Regional distribution - province
-        - 5 Regional distribution - city
-        - 6 City level
-        - 7 Mobile brand distribution
-        - 8 Interest tag analysis percentage
-    ### Return:
-    - Fan portrait
+    """Like sync_detailed, for use with await"""
 
-    Args:
-        sec_uid (str): 用户sec_id
-        option (str): 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_uid=sec_uid,
-        option=option,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    option: str,
+    *, client: AuthenticatedClient, sec_uid: str, option: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """获取粉丝画像/Fetch fan portrait
-
-     # [中文]
-    ### 用途:
-    - 获取粉丝画像
-    ### 参数:
-    - sec_uid: 用户sec_id
-    - option: 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-    ### 返回:
-    - 粉丝画像
-
-    # [English]
-    ### Purpose:
-    - Get the fan portrait
-    ### Parameters:
-    - sec_uid: User sec_id
-    - option: Option
-        - 1 Mobile price
-        - 2 Gender distribution
-        - 3 Age distribution
-        - 4 Regional distribution - province
-        - 5 Regional distribution - city
-        - 6 City level
-        - 7 Mobile brand distribution
-        - 8 Interest tag analysis percentage
-    ### Return:
-    - Fan portrait
-
-    Args:
-        sec_uid (str): 用户sec_id
-        option (str): 选项，1 手机价格分布 2 性别分布 3 年龄分布 4 地域分布-省份 5 地域分布-城市 6 城市等级 7 手机品牌分布 8 兴趣标签分析 百分比
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            sec_uid=sec_uid,
-            option=option,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
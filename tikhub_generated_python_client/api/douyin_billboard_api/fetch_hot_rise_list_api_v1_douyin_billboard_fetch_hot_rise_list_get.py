@@ -1,72 +1,29 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/billboard/fetch_hot_rise_list",
+    params={
+        "page": "page",
+        "page_size": "page_size",
+        "order": "order",
+        "sentence_tag": "sentence_tag",
+        "keyword": "keyword",
+    },
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
-    *,
-    page: int,
-    page_size: int,
-    order: str,
-    sentence_tag: Union[Unset, str] = "",
-    keyword: Union[Unset, str] = "",
+    *, page: int, page_size: int, order: str, sentence_tag: Union[Unset, str] = "", keyword: Union[Unset, str] = ""
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["page"] = page
-
-    params["page_size"] = page_size
-
-    params["order"] = order
-
-    params["sentence_tag"] = sentence_tag
-
-    params["keyword"] = keyword
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/billboard/fetch_hot_rise_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -78,65 +35,9 @@ def sync_detailed(
     sentence_tag: Union[Unset, str] = "",
     keyword: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取上升热点榜/Fetch rising hot list
-
-     # [中文]
-    ### 用途:
-    - 获取上升热点榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - order: 排序方式
-        - rank 按热度排序
-        - rank_diff 按排名变化
-    - sentence_tag: 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部
-    - keyword: 热点搜索词
-    ### 返回:
-    - 上升热点榜
-
-    # [English]
-    ### Purpose:
-    - Get the rising hot list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - order: Sorting method
-        - rank Sort by popularity
-        - rank_diff Sort by ranking change
-    - sentence_tag: Hot category tag, get from hot list category, multiple categories separated by
-    commas, empty for all
-    - keyword: Hot search term
-    ### Return:
-    - Rising hot list
-
-    Args:
-        page (int): 页码
-        page_size (int): 每页数量
-        order (str): 排序方式
-        sentence_tag (Union[Unset, str]): 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部 Default: ''.
-        keyword (Union[Unset, str]): 热点搜索词 Default: ''.
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        page=page,
-        page_size=page_size,
-        order=order,
-        sentence_tag=sentence_tag,
-        keyword=keyword,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -194,14 +95,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        page=page,
-        page_size=page_size,
-        order=order,
-        sentence_tag=sentence_tag,
-        keyword=keyword,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -213,63 +107,9 @@ async def asyncio_detailed(
     sentence_tag: Union[Unset, str] = "",
     keyword: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取上升热点榜/Fetch rising hot list
-
-     # [中文]
-    ### 用途:
-    - 获取上升热点榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - order: 排序方式
-        - rank 按热度排序
-        - rank_diff 按排名变化
-    - sentence_tag: 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部
-    - keyword: 热点搜索词
-    ### 返回:
-    - 上升热点榜
-
-    # [English]
-    ### Purpose:
-    - Get the rising hot list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - order: Sorting method
-        - rank Sort by popularity
-        - rank_diff Sort by ranking change
-    - sentence_tag: Hot category tag, get from hot list category, multiple categories separated by
-    commas, empty for all
-    - keyword: Hot search term
-    ### Return:
-    - Rising hot list
-
-    Args:
-        page (int): 页码
-        page_size (int): 每页数量
-        order (str): 排序方式
-        sentence_tag (Union[Unset, str]): 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部 Default: ''.
-        keyword (Union[Unset, str]): 热点搜索词 Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """Like sync_detailed, for use with await"""
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        page=page,
-        page_size=page_size,
-        order=order,
-        sentence_tag=sentence_tag,
-        keyword=keyword,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -281,59 +121,6 @@ async def asyncio(
     sentence_tag: Union[Unset, str] = "",
     keyword: Union[Unset, str] = "",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """获取上升热点榜/Fetch rising hot list
-
-     # [中文]
-    ### 用途:
-    - 获取上升热点榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - order: 排序方式
-        - rank 按热度排序
-        - rank_diff 按排名变化
-    - sentence_tag: 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部
-    - keyword: 热点搜索词
-    ### 返回:
-    - 上升热点榜
-
-    # [English]
-    ### Purpose:
-    - Get the rising hot list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - order: Sorting method
-        - rank Sort by popularity
-        - rank_diff Sort by ranking change
-    - sentence_tag: Hot category tag, get from hot list category, multiple categories separated by
-    commas, empty for all
-    - keyword: Hot search term
-    ### Return:
-    - Rising hot list
-
-    Args:
-        page (int): 页码
-        page_size (int): 每页数量
-        order (str): 排序方式
-        sentence_tag (Union[Unset, str]): 热点分类标签，从热点榜分类获取，多个分类用逗号分隔，空为全部 Default: ''.
-        keyword (Union[Unset, str]): 热点搜索词 Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            page=page,
-            page_size=page_size,
-            order=order,
-            sentence_tag=sentence_tag,
-            keyword=keyword,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,10 +1,7 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post import (
     BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
 )
@@ -12,117 +9,30 @@ from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/douyin/billboard/fetch_hot_total_high_fan_list",
+    body=BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
+
 
 def _get_kwargs(
-    *,
-    body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    *, body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/douyin/billboard/fetch_hot_total_high_fan_list",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取高涨粉率榜/Fetch high fan rate list
-
-     # [中文]
-    ### 用途:
-    - 获取高涨粉率榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - tags: 子级垂类标签，空则为全部，多个标签需传入
-        {\"value\": \"{顶级垂类标签id}\", \"children\": [
-            {\"value\": \"{子级垂类标签id}\"},
-            {\"value\": \"{子级垂类标签id}\"}
-        ]}
-    ### 返回:
-    - 高涨粉率榜
-
-    # [English]
-    ### Purpose:
-    - Get the high fan rate list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - tags: Sub-level vertical category tag, empty for all, multiple tags need to be passed in
-        {\"value\": \"{top-level vertical category id}\", \"children\": [
-            {\"value\": \"{sub-level vertical category id}\"},
-            {\"value\": \"{sub-level vertical category id}\"}
-        ]}
-    ### Return:
-    - High fan rate list
-
-    Args:
-        body (BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取高涨粉率榜/Fetch high fan rate list
 
@@ -167,120 +77,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取高涨粉率榜/Fetch high fan rate list
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取高涨粉率榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - tags: 子级垂类标签，空则为全部，多个标签需传入
-        {\"value\": \"{顶级垂类标签id}\", \"children\": [
-            {\"value\": \"{子级垂类标签id}\"},
-            {\"value\": \"{子级垂类标签id}\"}
-        ]}
-    ### 返回:
-    - 高涨粉率榜
-
-    # [English]
-    ### Purpose:
-    - Get the high fan rate list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - tags: Sub-level vertical category tag, empty for all, multiple tags need to be passed in
-        {\"value\": \"{top-level vertical category id}\", \"children\": [
-            {\"value\": \"{sub-level vertical category id}\"},
-            {\"value\": \"{sub-level vertical category id}\"}
-        ]}
-    ### Return:
-    - High fan rate list
-
-    Args:
-        body (BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取高涨粉率榜/Fetch high fan rate list
-
-     # [中文]
-    ### 用途:
-    - 获取高涨粉率榜
-    ### 参数:
-    - page: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - tags: 子级垂类标签，空则为全部，多个标签需传入
-        {\"value\": \"{顶级垂类标签id}\", \"children\": [
-            {\"value\": \"{子级垂类标签id}\"},
-            {\"value\": \"{子级垂类标签id}\"}
-        ]}
-    ### 返回:
-    - 高涨粉率榜
-
-    # [English]
-    ### Purpose:
-    - Get the high fan rate list
-    ### Parameters:
-    - page: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - tags: Sub-level vertical category tag, empty for all, multiple tags need to be passed in
-        {\"value\": \"{top-level vertical category id}\", \"children\": [
-            {\"value\": \"{sub-level vertical category id}\"},
-            {\"value\": \"{sub-level vertical category id}\"}
-        ]}
-    ### Return:
-    - High fan rate list
-
-    Args:
-        body (BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,10 +1,7 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.body_fetch_hot_total_hot_word_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_list_post import (
     BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
 )
@@ -12,109 +9,30 @@ from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/douyin/billboard/fetch_hot_total_hot_word_list",
+    body=BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
+
 
 def _get_kwargs(
-    *,
-    body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    *, body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/douyin/billboard/fetch_hot_total_hot_word_list",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取全部热门内容词/Fetch all hot content words
-
-     # [中文]
-    ### 用途:
-    - 获取全部内容词
-    ### 参数:
-    - page_num: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - keyword: 搜索关键字
-    ### 返回:
-    - 全部内容词
-
-    # [English]
-    ### Purpose:
-    - Get the list of all content words
-    ### Parameters:
-    - page_num: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - keyword: Search keyword
-    ### Return:
-    - List of all content words
-
-    Args:
-        body (BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """获取全部热门内容词/Fetch all hot content words
 
@@ -151,104 +69,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取全部热门内容词/Fetch all hot content words
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取全部内容词
-    ### 参数:
-    - page_num: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - keyword: 搜索关键字
-    ### 返回:
-    - 全部内容词
-
-    # [English]
-    ### Purpose:
-    - Get the list of all content words
-    ### Parameters:
-    - page_num: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - keyword: Search keyword
-    ### Return:
-    - List of all content words
-
-    Args:
-        body (BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    *, client: AuthenticatedClient, body: BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """获取全部热门内容词/Fetch all hot content words
-
-     # [中文]
-    ### 用途:
-    - 获取全部内容词
-    ### 参数:
-    - page_num: 页码
-    - page_size: 每页数量
-    - date_window: 时间窗口，1 按小时 2 按天
-    - keyword: 搜索关键字
-    ### 返回:
-    - 全部内容词
-
-    # [English]
-    ### Purpose:
-    - Get the list of all content words
-    ### Parameters:
-    - page_num: Page number
-    - page_size: Number of items per page
-    - date_window: Time window, 1 by hour 2 by day
-    - keyword: Search keyword
-    ### Return:
-    - List of all content words
-
-    Args:
-        body (BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,124 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    room_id: str,
-    rank_type: Union[Unset, int] = 30,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["room_id"] = room_id
+from ...types import Response, Unset
 
-    params["rank_type"] = rank_type
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/web/fetch_live_gift_ranking",
+    params={"room_id": "room_id", "rank_type": "rank_type"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/web/fetch_live_gift_ranking",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, room_id: str, rank_type: Union[Unset, int] = 30) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    rank_type: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, room_id: str, rank_type: Union[Unset, int] = 30
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间送礼用户排行榜/Get live room gift user ranking
-
-     # [中文]
-    ### 用途:
-    - 获取直播间送礼用户排行榜
-    ### 参数:
-    - room_id: 直播间room_id
-    - rank_type: 排行类型，默认为30不用修改。
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get live room gift user ranking
-    ### Parameters:
-    - room_id: Room room_id
-    - rank_type: Leaderboard type, default is 30, no need to modify.
-    ### Return:
-    - Leaderboard data
-
-    # [示例/Example]
-    room_id = \"7356585666190461731\"
-    rank_type = 30
-
-    Args:
-        room_id (str): 直播间room_id/Room room_id
-        rank_type (Union[Unset, int]): 排行类型/Leaderboard type Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        room_id=room_id,
-        rank_type=rank_type,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    rank_type: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, room_id: str, rank_type: Union[Unset, int] = 30
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取直播间送礼用户排行榜/Get live room gift user ranking
 
@@ -156,111 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        room_id=room_id,
-        rank_type=rank_type,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    rank_type: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, room_id: str, rank_type: Union[Unset, int] = 30
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间送礼用户排行榜/Get live room gift user ranking
-
-     # [中文]
-    ### 用途:
-    - 获取直播间送礼用户排行榜
-    ### 参数:
-    - room_id: 直播间room_id
-    - rank_type: 排行类型，默认为30不用修改。
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get live room gift user ranking
-    ### Parameters:
-    - room_id: Room room_id
-    - rank_type: Leaderboard type, default is 30, no need to modify.
-    ### Return:
-    - Leaderboard data
-
-    # [示例/Example]
-    room_id = \"7356585666190461731\"
-    rank_type = 30
-
-    Args:
-        room_id (str): 直播间room_id/Room room_id
-        rank_type (Union[Unset, int]): 排行类型/Leaderboard type Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        room_id=room_id,
-        rank_type=rank_type,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    rank_type: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, room_id: str, rank_type: Union[Unset, int] = 30
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间送礼用户排行榜/Get live room gift user ranking
-
-     # [中文]
-    ### 用途:
-    - 获取直播间送礼用户排行榜
-    ### 参数:
-    - room_id: 直播间room_id
-    - rank_type: 排行类型，默认为30不用修改。
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get live room gift user ranking
-    ### Parameters:
-    - room_id: Room room_id
-    - rank_type: Leaderboard type, default is 30, no need to modify.
-    ### Return:
-    - Leaderboard data
-
-    # [示例/Example]
-    room_id = \"7356585666190461731\"
-    rank_type = 30
-
-    Args:
-        room_id (str): 直播间room_id/Room room_id
-        rank_type (Union[Unset, int]): 排行类型/Leaderboard type Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            room_id=room_id,
-            rank_type=rank_type,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
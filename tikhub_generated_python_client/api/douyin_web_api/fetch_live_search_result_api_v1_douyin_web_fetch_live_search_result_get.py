@@ -1,69 +1,23 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/web/fetch_live_search_result",
+    params={"keyword": "keyword", "offset": "offset", "count": "count", "search_id": "search_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
-    *,
-    keyword: str,
-    offset: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 20,
-    search_id: Union[Unset, str] = "",
+    *, keyword: str, offset: Union[Unset, int] = 0, count: Union[Unset, int] = 20, search_id: Union[Unset, str] = ""
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["keyword"] = keyword
-
-    params["offset"] = offset
-
-    params["count"] = count
-
-    params["search_id"] = search_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/web/fetch_live_search_result",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -74,63 +28,9 @@ def sync_detailed(
     count: Union[Unset, int] = 20,
     search_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的直播搜索结果/Get live search results of specified keywords
-
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的直播搜索结果
-    - 推荐默认使用专门的搜索接口，稳定性更好：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量
-    ### 返回:
-    - 直播搜索结果
-
-    # [English]
-    ### Purpose:
-    - Get live search results of specified keywords
-    - It is recommended to use the dedicated search interface by default, which is more stable:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number
-    ### Return:
-    - Live search results
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    # [示例/Example]
-    keyword = \"动漫\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-        search_id (Union[Unset, str]): 搜索id，翻页时需要提供/Search id, need to provide when paging
-            Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        count=count,
-        search_id=search_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -186,13 +86,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        keyword=keyword,
-        offset=offset,
-        count=count,
-        search_id=search_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -203,61 +97,9 @@ async def asyncio_detailed(
     count: Union[Unset, int] = 20,
     search_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的直播搜索结果/Get live search results of specified keywords
-
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的直播搜索结果
-    - 推荐默认使用专门的搜索接口，稳定性更好：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量
-    ### 返回:
-    - 直播搜索结果
+    """Like sync_detailed, for use with await"""
 
-    # [English]
-    ### Purpose:
-    - Get live search results of specified keywords
-    - It is recommended to use the dedicated search interface by default, which is more stable:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number
-    ### Return:
-    - Live search results
-
-    # [示例/Example]
-    keyword = \"动漫\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-        search_id (Union[Unset, str]): 搜索id，翻页时需要提供/Search id, need to provide when paging
-            Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        count=count,
-        search_id=search_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -268,57 +110,6 @@ async def asyncio(
     count: Union[Unset, int] = 20,
     search_id: Union[Unset, str] = "",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定关键词的直播搜索结果/Get live search results of specified keywords
-
-     # [中文]
-    ### 用途:
-    - 获取指定关键词的直播搜索结果
-    - 推荐默认使用专门的搜索接口，稳定性更好：https://api.tikhub.io/#/Douyin-Search-API
-    ### 参数:
-    - keyword: 关键词
-    - offset: 偏移量
-    - count: 数量
-    ### 返回:
-    - 直播搜索结果
-
-    # [English]
-    ### Purpose:
-    - Get live search results of specified keywords
-    - It is recommended to use the dedicated search interface by default, which is more stable:
-    https://api.tikhub.io/#/Douyin-Search-API
-    ### Parameters:
-    - keyword: Keyword
-    - offset: Offset
-    - count: Number
-    ### Return:
-    - Live search results
-
-    # [示例/Example]
-    keyword = \"动漫\"
-    offset = 0
-    count = 20
-
-    Args:
-        keyword (str): 关键词/Keyword
-        offset (Union[Unset, int]): 偏移量/Offset Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 20.
-        search_id (Union[Unset, str]): 搜索id，翻页时需要提供/Search id, need to provide when paging
-            Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            keyword=keyword,
-            offset=offset,
-            count=count,
-            search_id=search_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,135 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    user_agent: str,
-    room_id: str,
-    user_unique_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["user_agent"] = user_agent
-
-    params["room_id"] = room_id
+from ...types import Response
 
-    params["user_unique_id"] = user_unique_id
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/web/generate_wss_xb_signature",
+    params={"user_agent": "user_agent", "room_id": "room_id", "user_unique_id": "user_unique_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/web/generate_wss_xb_signature",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, user_agent: str, room_id: str, user_unique_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    user_agent: str,
-    room_id: str,
-    user_unique_id: str,
+    *, client: AuthenticatedClient, user_agent: str, room_id: str, user_unique_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""生成弹幕xb签名/Generate barrage xb signature
-
-     # [中文]
-    ### 用途:
-    - 生成弹幕xb签名
-    ### 参数:
-    - user_agent: 用户浏览器代理
-    - room_id: 房间号
-    - user_unique_id: 用户唯一ID
-    ### 返回:
-    - 弹幕xb签名
-
-    # [English]
-    ### Purpose:
-    - Generate danmu xb signature
-    ### Parameters:
-    - user_agent: User browser agent
-    - room_id: Room ID
-    - user_unique_id: User unique ID
-    ### Return:
-    - Danmu xb signature
-
-    # [示例/Example]
-    user_agent = \"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)
-    Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0\"
-    room_id = \"7382517534467115826\"
-    user_unique_id = \"7382524529011246630\"
-
-    Args:
-        user_agent (str): 用户浏览器代理/User browser agent
-        room_id (str): 房间号/Room ID
-        user_unique_id (str): 用户唯一ID/User unique ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_agent=user_agent,
-        room_id=room_id,
-        user_unique_id=user_unique_id,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    user_agent: str,
-    room_id: str,
-    user_unique_id: str,
+    *, client: AuthenticatedClient, user_agent: str, room_id: str, user_unique_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""生成弹幕xb签名/Generate barrage xb signature
 
@@ -172,126 +70,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        user_agent=user_agent,
-        room_id=room_id,
-        user_unique_id=user_unique_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    user_agent: str,
-    room_id: str,
-    user_unique_id: str,
+    *, client: AuthenticatedClient, user_agent: str, room_id: str, user_unique_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""生成弹幕xb签名/Generate barrage xb signature
-
-     # [中文]
-    ### 用途:
-    - 生成弹幕xb签名
-    ### 参数:
-    - user_agent: 用户浏览器代理
-    - room_id: 房间号
-    - user_unique_id: 用户唯一ID
-    ### 返回:
-    - 弹幕xb签名
-
-    # [English]
-    ### Purpose:
-    - Generate danmu xb signature
-    ### Parameters:
-    - user_agent: User browser agent
-    - room_id: Room ID
-    - user_unique_id: User unique ID
-    ### Return:
-    - Danmu xb signature
-
-    # [示例/Example]
-    user_agent = \"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)
-    Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0\"
-    room_id = \"7382517534467115826\"
-    user_unique_id = \"7382524529011246630\"
-
-    Args:
-        user_agent (str): 用户浏览器代理/User browser agent
-        room_id (str): 房间号/Room ID
-        user_unique_id (str): 用户唯一ID/User unique ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        user_agent=user_agent,
-        room_id=room_id,
-        user_unique_id=user_unique_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    user_agent: str,
-    room_id: str,
-    user_unique_id: str,
+    *, client: AuthenticatedClient, user_agent: str, room_id: str, user_unique_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""生成弹幕xb签名/Generate barrage xb signature
-
-     # [中文]
-    ### 用途:
-    - 生成弹幕xb签名
-    ### 参数:
-    - user_agent: 用户浏览器代理
-    - room_id: 房间号
-    - user_unique_id: 用户唯一ID
-    ### 返回:
-    - 弹幕xb签名
-
-    # [English]
-    ### Purpose:
-    - Generate danmu xb signature
-    ### Parameters:
-    - user_agent: User browser agent
-    - room_id: Room ID
-    - user_unique_id: User unique ID
-    ### Return:
-    - Danmu xb signature
-
-    # [示例/Example]
-    user_agent = \"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)
-    Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0\"
-    room_id = \"7382517534467115826\"
-    user_unique_id = \"7382524529011246630\"
-
-    Args:
-        user_agent (str): 用户浏览器代理/User browser agent
-        room_id (str): 房间号/Room ID
-        user_unique_id (str): 用户唯一ID/User unique ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            user_agent=user_agent,
-            room_id=room_id,
-            user_unique_id=user_unique_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
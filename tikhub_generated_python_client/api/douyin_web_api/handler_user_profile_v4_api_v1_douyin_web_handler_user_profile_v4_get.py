@@ -1,122 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    sec_user_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["sec_user_id"] = sec_user_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+from ...types import Response
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/web/handler_user_profile_v4",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/web/handler_user_profile_v4",
+    params={"sec_user_id": "sec_user_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, sec_user_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_user_id: str,
+    *, client: AuthenticatedClient, sec_user_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据sec_user_id获取指定用户的信息（性别，年龄，直播等级、牌子）/Get information of specified user by sec_user_id (gender, age,
-    live level、brand)
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id
-    ### 返回:
-    - 用户信息，包含性别，年龄，直播等级，直播间牌子
-    ### 说明：
-    - 性别：1为男，2为女，0为未知，在live_user字段中。
-    - 年龄：在user字段中，-1为未知。
+    return ENDPOINT.sync_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    ### Return:
-    - User information, including gender, age, live level, live room brand
-    ### Description:
-    - gender: 1 male, 2 female, 0 unknown, in the live_user field.
-    - age: in the user field, -1 unknown.
-
-    # [示例/Example]
-    sec_user_id = \"MS4wLjABAAAAW9FWcqS7RdQAWPd2AA5fL_ilmqsIFUCQ_Iym6Yh9_cUa6ZRqVLjVQSUjlHrfXY1Y\"
-
-    Args:
-        sec_user_id (str): 用户sec_user_id/User sec_user_id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_user_id=sec_user_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
 
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    sec_user_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, sec_user_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""根据sec_user_id获取指定用户的信息（性别，年龄，直播等级、牌子）/Get information of specified user by sec_user_id (gender, age,
     live level、brand)
 
@@ -156,112 +66,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        sec_user_id=sec_user_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_user_id: str,
+    *, client: AuthenticatedClient, sec_user_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据sec_user_id获取指定用户的信息（性别，年龄，直播等级、牌子）/Get information of specified user by sec_user_id (gender, age,
-    live level、brand)
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id
-    ### 返回:
-    - 用户信息，包含性别，年龄，直播等级，直播间牌子
-    ### 说明：
-    - 性别：1为男，2为女，0为未知，在live_user字段中。
-    - 年龄：在user字段中，-1为未知。
-
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    ### Return:
-    - User information, including gender, age, live level, live room brand
-    ### Description:
-    - gender: 1 male, 2 female, 0 unknown, in the live_user field.
-    - age: in the user field, -1 unknown.
-
-    # [示例/Example]
-    sec_user_id = \"MS4wLjABAAAAW9FWcqS7RdQAWPd2AA5fL_ilmqsIFUCQ_Iym6Yh9_cUa6ZRqVLjVQSUjlHrfXY1Y\"
-
-    Args:
-        sec_user_id (str): 用户sec_user_id/User sec_user_id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_user_id=sec_user_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    sec_user_id: str,
+    *, client: AuthenticatedClient, sec_user_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据sec_user_id获取指定用户的信息（性别，年龄，直播等级、牌子）/Get information of specified user by sec_user_id (gender, age,
-    live level、brand)
-
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id
-    ### 返回:
-    - 用户信息，包含性别，年龄，直播等级，直播间牌子
-    ### 说明：
-    - 性别：1为男，2为女，0为未知，在live_user字段中。
-    - 年龄：在user字段中，-1为未知。
-
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    ### Return:
-    - User information, including gender, age, live level, live room brand
-    ### Description:
-    - gender: 1 male, 2 female, 0 unknown, in the live_user field.
-    - age: in the user field, -1 unknown.
-
-    # [示例/Example]
-    sec_user_id = \"MS4wLjABAAAAW9FWcqS7RdQAWPd2AA5fL_ilmqsIFUCQ_Iym6Yh9_cUa6ZRqVLjVQSUjlHrfXY1Y\"
-
-    Args:
-        sec_user_id (str): 用户sec_user_id/User sec_user_id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            sec_user_id=sec_user_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
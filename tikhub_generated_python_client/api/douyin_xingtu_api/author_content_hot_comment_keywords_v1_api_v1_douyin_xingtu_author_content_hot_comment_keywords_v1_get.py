@@ -1,125 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    kol_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["kolId"] = kol_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+from ...types import Response
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/xingtu/author_content_hot_comment_keywords_v1",
-        "params": params,
-    }
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/xingtu/author_content_hot_comment_keywords_v1",
+    params={"kol_id": "kolId"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    return _kwargs
 
+def _get_kwargs(*, kol_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+def sync_detailed(*, client: AuthenticatedClient, kol_id: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol热词分析内容V1/Get Author Content Hot Comment Keywords V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol热词分析内容V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### 返回:
-    - kol热词分析内容
-
-    # [English]
-    ### Purpose:
-    - Get Author Content Hot Comment Keywords V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### Return:
-    - Author Content Hot Comment Keywords
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, kol_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取kol热词分析内容V1/Get Author Content Hot Comment Keywords V1
 
      # [中文]
@@ -162,118 +67,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        kol_id=kol_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
+    *, client: AuthenticatedClient, kol_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol热词分析内容V1/Get Author Content Hot Comment Keywords V1
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取kol热词分析内容V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### 返回:
-    - kol热词分析内容
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get Author Content Hot Comment Keywords V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### Return:
-    - Author Content Hot Comment Keywords
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol热词分析内容V1/Get Author Content Hot Comment Keywords V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol热词分析内容V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### 返回:
-    - kol热词分析内容
-
-    # [English]
-    ### Purpose:
-    - Get Author Content Hot Comment Keywords V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    ### Return:
-    - Author Content Hot Comment Keywords
 
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, kol_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            kol_id=kol_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,140 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    kol_id: str,
-    field_range_: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
+from ...types import Response
 
-    params["kolId"] = kol_id
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/xingtu/kol_conversion_ability_analysis_v1",
+    params={"kol_id": "kolId", "field_range_": "_range"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params["_range"] = field_range_
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/xingtu/kol_conversion_ability_analysis_v1",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, kol_id: str, field_range_: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    field_range_: str,
+    *, client: AuthenticatedClient, kol_id: str, field_range_: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化能力分析V1/Get kol Conversion Ability Analysis V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化能力分析V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: 时间范围, 支持以下参数:
-        - _1 :近7天(last 7 days)
-        - _2 :30天(last 30 days)
-        - _3 :90天(last 90 days)
-    ### 返回:
-    - kol转化能力分析
-
-    # [English]
-    ### Purpose:
-    - Get kol Conversion Ability Analysis V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: Time range, supports the following parameters:
-        - _1 :Last 7 days
-        - _2 :Last 30 days
-        - _3 :Last 90 days
-    ### Return:
-    - kol Conversion Ability Analysis
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    _range = \"_1\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        field_range_ (str): 时间范围/Time Range
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-        field_range_=field_range_,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    field_range_: str,
+    *, client: AuthenticatedClient, kol_id: str, field_range_: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取kol转化能力分析V1/Get kol Conversion Ability Analysis V1
 
@@ -188,143 +81,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        kol_id=kol_id,
-        field_range_=field_range_,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    field_range_: str,
+    *, client: AuthenticatedClient, kol_id: str, field_range_: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化能力分析V1/Get kol Conversion Ability Analysis V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化能力分析V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: 时间范围, 支持以下参数:
-        - _1 :近7天(last 7 days)
-        - _2 :30天(last 30 days)
-        - _3 :90天(last 90 days)
-    ### 返回:
-    - kol转化能力分析
-
-    # [English]
-    ### Purpose:
-    - Get kol Conversion Ability Analysis V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: Time range, supports the following parameters:
-        - _1 :Last 7 days
-        - _2 :Last 30 days
-        - _3 :Last 90 days
-    ### Return:
-    - kol Conversion Ability Analysis
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    _range = \"_1\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        field_range_ (str): 时间范围/Time Range
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-        field_range_=field_range_,
-    )
+    """Like sync_detailed, for use with await"""
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    field_range_: str,
+    *, client: AuthenticatedClient, kol_id: str, field_range_: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化能力分析V1/Get kol Conversion Ability Analysis V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化能力分析V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: 时间范围, 支持以下参数:
-        - _1 :近7天(last 7 days)
-        - _2 :30天(last 30 days)
-        - _3 :90天(last 90 days)
-    ### 返回:
-    - kol转化能力分析
-
-    # [English]
-    ### Purpose:
-    - Get kol Conversion Ability Analysis V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - _range: Time range, supports the following parameters:
-        - _1 :Last 7 days
-        - _2 :Last 30 days
-        - _3 :Last 90 days
-    ### Return:
-    - kol Conversion Ability Analysis
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    _range = \"_1\"
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        field_range_ (str): 时间范围/Time Range
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            kol_id=kol_id,
-            field_range_=field_range_,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,147 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    kol_id: str,
-    detail_type: str,
-    page: int,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["kolId"] = kol_id
-
-    params["detailType"] = detail_type
-
-    params["page"] = page
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/douyin/xingtu/kol_convert_video_display_v1",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+from ...types import Response
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/douyin/xingtu/kol_convert_video_display_v1",
+    params={"kol_id": "kolId", "detail_type": "detailType", "page": "page"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, kol_id: str, detail_type: str, page: int) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    detail_type: str,
-    page: int,
+    *, client: AuthenticatedClient, kol_id: str, detail_type: str, page: int
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化视频展示V1/Get kol Convert Video Display V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化视频展示V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: 详情类型, 支持以下参数:
-        - _1 :相关视频数据(Video Data)
-        - _2 :相关商品数据(Product Data)
-    ### 返回:
-    - kol转化视频展示
-
-    # [English]
-    ### Purpose:
-    - Get kol Convert Video Display V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: Detail type, supports the following parameters:
-        - _1 :Video Data
-        - _2 :Product Data
-    - page: Page number, starting from 1
-    ### Return:
-    - kol Convert Video Display
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    detailType = \"_1\"
-    page = 1
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        detail_type (str): 详情类型/Detail Type
-        page (int): 页码/Page
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-        detail_type=detail_type,
-        page=page,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    detail_type: str,
-    page: int,
+    *, client: AuthenticatedClient, kol_id: str, detail_type: str, page: int
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取kol转化视频展示V1/Get kol Convert Video Display V1
 
@@ -196,150 +82,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        kol_id=kol_id,
-        detail_type=detail_type,
-        page=page,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    detail_type: str,
-    page: int,
+    *, client: AuthenticatedClient, kol_id: str, detail_type: str, page: int
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化视频展示V1/Get kol Convert Video Display V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化视频展示V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: 详情类型, 支持以下参数:
-        - _1 :相关视频数据(Video Data)
-        - _2 :相关商品数据(Product Data)
-    ### 返回:
-    - kol转化视频展示
-
-    # [English]
-    ### Purpose:
-    - Get kol Convert Video Display V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: Detail type, supports the following parameters:
-        - _1 :Video Data
-        - _2 :Product Data
-    - page: Page number, starting from 1
-    ### Return:
-    - kol Convert Video Display
+    """Like sync_detailed, for use with await"""
 
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    detailType = \"_1\"
-    page = 1
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        detail_type (str): 详情类型/Detail Type
-        page (int): 页码/Page
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        kol_id=kol_id,
-        detail_type=detail_type,
-        page=page,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    kol_id: str,
-    detail_type: str,
-    page: int,
+    *, client: AuthenticatedClient, kol_id: str, detail_type: str, page: int
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取kol转化视频展示V1/Get kol Convert Video Display V1
-
-     # [中文]
-    ### 用途:
-    - 获取kol转化视频展示V1
-    - 该接口数据使用企业账号进行请求，收费较贵。
-    - 价格：0.02$ / 次
-    ### 参数:
-    - kolId: 用户的kolId, 可以从接口以下接口获取：
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: 详情类型, 支持以下参数:
-        - _1 :相关视频数据(Video Data)
-        - _2 :相关商品数据(Product Data)
-    ### 返回:
-    - kol转化视频展示
-
-    # [English]
-    ### Purpose:
-    - Get kol Convert Video Display V1
-    - The interface data is requested using an enterprise account, which is more expensive.
-    - Price: 0.02$ / time
-    ### Parameters:
-    - kolId: User kolId, can be obtained from the following interfaces:
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_uid`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_sec_user_id`
-        - `/api/v1/douyin/xingtu/get_xingtu_kolid_by_unique_id`
-    - detailType: Detail type, supports the following parameters:
-        - _1 :Video Data
-        - _2 :Product Data
-    - page: Page number, starting from 1
-    ### Return:
-    - kol Convert Video Display
-
-    # [示例/Example]
-    kolId = \"7048929565493690398\"
-    detailType = \"_1\"
-    page = 1
-
-    Args:
-        kol_id (str): 用户的kolId/User kolId
-        detail_type (str): 详情类型/Detail Type
-        page (int): 页码/Page
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            kol_id=kol_id,
-            detail_type=detail_type,
-            page=page,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
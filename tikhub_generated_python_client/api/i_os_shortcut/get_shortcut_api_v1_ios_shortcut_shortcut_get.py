@@ -1,70 +1,28 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...endpoint import Endpoint
 from ...models.ios_shortcut import IOSShortcut
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/ios_shortcut/shortcut",
+    responses={200: IOSShortcut},
+)
 
-def _get_kwargs() -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/ios_shortcut/shortcut",
-    }
-
-    return _kwargs
-
-
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[IOSShortcut]:
-    if response.status_code == 200:
-        response_200 = IOSShortcut.from_dict(response.json())
 
-        return response_200
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[IOSShortcut]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: Union[AuthenticatedClient, Client],
-) -> Response[IOSShortcut]:
-    """用于iOS快捷指令的版本更新信息/Version update information for iOS shortcuts
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[IOSShortcut]
-    """
+def _get_kwargs() -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-    kwargs = _get_kwargs()
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+def sync_detailed(*, client: Union[AuthenticatedClient, Client]) -> Response[IOSShortcut]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync(
-    *,
-    client: Union[AuthenticatedClient, Client],
-) -> Optional[IOSShortcut]:
+def sync(*, client: Union[AuthenticatedClient, Client]) -> Optional[IOSShortcut]:
     """用于iOS快捷指令的版本更新信息/Version update information for iOS shortcuts
 
     Raises:
@@ -75,48 +33,16 @@ def sync(
         IOSShortcut
     """
 
-    return sync_detailed(
-        client=client,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
-async def asyncio_detailed(
-    *,
-    client: Union[AuthenticatedClient, Client],
-) -> Response[IOSShortcut]:
-    """用于iOS快捷指令的版本更新信息/Version update information for iOS shortcuts
+async def asyncio_detailed(*, client: Union[AuthenticatedClient, Client]) -> Response[IOSShortcut]:
+    """Like sync_detailed, for use with await"""
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[IOSShortcut]
-    """
-
-    kwargs = _get_kwargs()
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
-async def asyncio(
-    *,
-    client: Union[AuthenticatedClient, Client],
-) -> Optional[IOSShortcut]:
-    """用于iOS快捷指令的版本更新信息/Version update information for iOS shortcuts
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        IOSShortcut
-    """
+async def asyncio(*, client: Union[AuthenticatedClient, Client]) -> Optional[IOSShortcut]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,121 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    keyword: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["keyword"] = keyword
+from ...types import Response
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/instagram/web_app/fetch_global_search_v2",
+    params={"keyword": "keyword"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/instagram/web_app/fetch_global_search_v2",
-        "params": params,
-    }
 
-    return _kwargs
+def _get_kwargs(*, keyword: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
+def sync_detailed(*, client: AuthenticatedClient, keyword: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""综合搜索V2/Search results V2
-
-     # [中文]
-    ### 用途:
-    - 综合搜索V2
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    ### 返回:
-    - 搜索结果
-
-    # [English]
-    ### Purpose:
-    - Search results V2
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    ### Return:
-    - Search result
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-
-    Args:
-        keyword (str): 关键词/Query
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, keyword: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""综合搜索V2/Search results V2
 
      # [中文]
@@ -154,110 +63,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        keyword=keyword,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
+    *, client: AuthenticatedClient, keyword: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""综合搜索V2/Search results V2
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 综合搜索V2
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    ### 返回:
-    - 搜索结果
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Search results V2
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    ### Return:
-    - Search result
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-
-    Args:
-        keyword (str): 关键词/Query
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""综合搜索V2/Search results V2
-
-     # [中文]
-    ### 用途:
-    - 综合搜索V2
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    ### 返回:
-    - 搜索结果
 
-    # [English]
-    ### Purpose:
-    - Search results V2
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    ### Return:
-    - Search result
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-
-    Args:
-        keyword (str): 关键词/Query
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, keyword: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            keyword=keyword,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
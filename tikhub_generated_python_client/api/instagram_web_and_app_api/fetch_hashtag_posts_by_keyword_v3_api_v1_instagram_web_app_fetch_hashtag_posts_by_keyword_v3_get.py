@@ -1,143 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import UNSET, Response, Unset
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/instagram/web_app/fetch_hashtag_posts_by_keyword_v3",
+    params={"keyword": "keyword", "feed_type": "feed_type", "pagination_token": "pagination_token"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _get_kwargs(
-    *,
-    keyword: str,
-    feed_type: str,
-    pagination_token: Union[Unset, str] = UNSET,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["keyword"] = keyword
-
-    params["feed_type"] = feed_type
-
-    params["pagination_token"] = pagination_token
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/instagram/web_app/fetch_hashtag_posts_by_keyword_v3",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, keyword: str, feed_type: str, pagination_token: Union[Unset, str] = UNSET) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    feed_type: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, keyword: str, feed_type: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""话题作品V3/Get hashtag posts by keyword V3
-
-     # [中文]
-    ### 用途:
-    - 话题作品V3
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    - feed_type: Feed类型
-        - top: 热门
-        - recent: 最新
-        - clips: 短视频
-    - pagination_token: 分页token，第一次请求不需要传值，后续页需要传入上一页的返回值。
-    ### 返回:
-    - 话题作品数据
-
-    # [English]
-    ### Purpose:
-    - Get hashtag posts by keyword V3
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    - pagination_token: Pagination token, no need to pass value for the first request, pass the return
-    value of the previous page for subsequent pages.
-    ### Return:
-    - Hashtag posts data
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-    feed_type = \"top\"
-    pagination_token = None
-
-    Args:
-        keyword (str): 关键词/Query
-        feed_type (str): Feed类型/Feed type: top, recent
-        pagination_token (Union[Unset, str]): 分页token/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        feed_type=feed_type,
-        pagination_token=pagination_token,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    feed_type: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, keyword: str, feed_type: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""话题作品V3/Get hashtag posts by keyword V3
 
@@ -188,142 +78,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        keyword=keyword,
-        feed_type=feed_type,
-        pagination_token=pagination_token,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    feed_type: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, keyword: str, feed_type: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""话题作品V3/Get hashtag posts by keyword V3
-
-     # [中文]
-    ### 用途:
-    - 话题作品V3
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    - feed_type: Feed类型
-        - top: 热门
-        - recent: 最新
-        - clips: 短视频
-    - pagination_token: 分页token，第一次请求不需要传值，后续页需要传入上一页的返回值。
-    ### 返回:
-    - 话题作品数据
-
-    # [English]
-    ### Purpose:
-    - Get hashtag posts by keyword V3
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    - pagination_token: Pagination token, no need to pass value for the first request, pass the return
-    value of the previous page for subsequent pages.
-    ### Return:
-    - Hashtag posts data
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-    feed_type = \"top\"
-    pagination_token = None
-
-    Args:
-        keyword (str): 关键词/Query
-        feed_type (str): Feed类型/Feed type: top, recent
-        pagination_token (Union[Unset, str]): 分页token/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        feed_type=feed_type,
-        pagination_token=pagination_token,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    keyword: str,
-    feed_type: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, keyword: str, feed_type: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""话题作品V3/Get hashtag posts by keyword V3
-
-     # [中文]
-    ### 用途:
-    - 话题作品V3
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - keyword: 关键词
-    - feed_type: Feed类型
-        - top: 热门
-        - recent: 最新
-        - clips: 短视频
-    - pagination_token: 分页token，第一次请求不需要传值，后续页需要传入上一页的返回值。
-    ### 返回:
-    - 话题作品数据
-
-    # [English]
-    ### Purpose:
-    - Get hashtag posts by keyword V3
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - keyword: Query
-    - pagination_token: Pagination token, no need to pass value for the first request, pass the return
-    value of the previous page for subsequent pages.
-    ### Return:
-    - Hashtag posts data
-
-    # [示例/Example]
-    keyword = \"mrbeast\"
-    feed_type = \"top\"
-    pagination_token = None
-
-    Args:
-        keyword (str): 关键词/Query
-        feed_type (str): Feed类型/Feed type: top, recent
-        pagination_token (Union[Unset, str]): 分页token/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            keyword=keyword,
-            feed_type=feed_type,
-            pagination_token=pagination_token,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
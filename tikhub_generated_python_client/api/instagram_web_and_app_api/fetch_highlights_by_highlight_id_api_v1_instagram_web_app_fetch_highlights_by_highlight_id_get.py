@@ -1,121 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    highlight_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["highlight_id"] = highlight_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/instagram/web_app/fetch_highlights_by_highlight_id",
-        "params": params,
-    }
-
-    return _kwargs
-
+from ...types import Response
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/instagram/web_app/fetch_highlights_by_highlight_id",
+    params={"highlight_id": "highlight_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, highlight_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    highlight_id: str,
+    *, client: AuthenticatedClient, highlight_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据highlights ID获取highlight数据/Get highlights by highlight ID
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 根据Instagram highlight ID获取highlight数据
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - highlight_id: Instagram highlight ID
-    ### 返回:
-    - highlight数据
+    return ENDPOINT.sync_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get highlights by Instagram highlight ID
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - highlight_id: Instagram highlight ID
-    ### Return:
-    - Highlight data
-
-    # [示例/Example]
-    highlight_id = \"17871373118984285\"
-
-    Args:
-        highlight_id (str): Instagram highlight ID/Instagram highlight ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        highlight_id=highlight_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
 
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    highlight_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, highlight_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""根据highlights ID获取highlight数据/Get highlights by highlight ID
 
      # [中文]
@@ -154,110 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        highlight_id=highlight_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    highlight_id: str,
+    *, client: AuthenticatedClient, highlight_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据highlights ID获取highlight数据/Get highlights by highlight ID
-
-     # [中文]
-    ### 用途:
-    - 根据Instagram highlight ID获取highlight数据
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - highlight_id: Instagram highlight ID
-    ### 返回:
-    - highlight数据
-
-    # [English]
-    ### Purpose:
-    - Get highlights by Instagram highlight ID
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - highlight_id: Instagram highlight ID
-    ### Return:
-    - Highlight data
-
-    # [示例/Example]
-    highlight_id = \"17871373118984285\"
-
-    Args:
-        highlight_id (str): Instagram highlight ID/Instagram highlight ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        highlight_id=highlight_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    highlight_id: str,
+    *, client: AuthenticatedClient, highlight_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据highlights ID获取highlight数据/Get highlights by highlight ID
-
-     # [中文]
-    ### 用途:
-    - 根据Instagram highlight ID获取highlight数据
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    ### 参数:
-    - highlight_id: Instagram highlight ID
-    ### 返回:
-    - highlight数据
-
-    # [English]
-    ### Purpose:
-    - Get highlights by Instagram highlight ID
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    ### Parameters:
-    - highlight_id: Instagram highlight ID
-    ### Return:
-    - Highlight data
-
-    # [示例/Example]
-    highlight_id = \"17871373118984285\"
-
-    Args:
-        highlight_id (str): Instagram highlight ID/Instagram highlight ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            highlight_id=highlight_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
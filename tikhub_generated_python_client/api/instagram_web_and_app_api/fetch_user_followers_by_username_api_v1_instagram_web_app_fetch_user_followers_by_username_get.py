@@ -1,134 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import UNSET, Response, Unset
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/instagram/web_app/fetch_user_followers_by_username",
+    params={"username": "username", "pagination_token": "pagination_token"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _get_kwargs(
-    *,
-    username: str,
-    pagination_token: Union[Unset, str] = UNSET,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["username"] = username
-
-    params["pagination_token"] = pagination_token
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/instagram/web_app/fetch_user_followers_by_username",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, username: str, pagination_token: Union[Unset, str] = UNSET) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    username: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, username: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据用户名获取用户的粉丝数据/Get user followers by username
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 根据Instagram用户名获取用户的粉丝数据，只能获取公开账号的粉丝数据，一次最多获取50个粉丝数据。
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    - 为了获取更多的粉丝数据，可以使用返回的pagination_token参数进行分页。
-    ### 参数:
-    - username: Instagram用户名
-    - pagination_token: 分页令牌，用于翻页，第一次请求不需要传值，后续请求需要传入上一次请求的返回值。
-    ### 返回:
-    - 用户的粉丝数据
-
-    # [English]
-    ### Purpose:
-    - Get user followers by Instagram username, can only get the followers data of public accounts, up
-    to 50 followers data at a time.
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    - To get more followers data, you can use the returned pagination_token parameter for pagination.
-    ### Parameters:
-    - username: Instagram username
-    - pagination_token: Pagination token, used for pagination, no need to pass value for the first
-    request, pass the return value of the previous request for subsequent requests.
-    ### Return:
-    - User followers data
-
-    # [示例/Example]
-    username = \"instagram\"
-    pagination_token = None
-
-    Args:
-        username (str): Instagram用户名/Instagram username
-        pagination_token (Union[Unset, str]): 分页令牌/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        username=username,
-        pagination_token=pagination_token,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    username: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, username: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""根据用户名获取用户的粉丝数据/Get user followers by username
 
@@ -176,131 +75,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        username=username,
-        pagination_token=pagination_token,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    username: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, username: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据用户名获取用户的粉丝数据/Get user followers by username
-
-     # [中文]
-    ### 用途:
-    - 根据Instagram用户名获取用户的粉丝数据，只能获取公开账号的粉丝数据，一次最多获取50个粉丝数据。
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    - 为了获取更多的粉丝数据，可以使用返回的pagination_token参数进行分页。
-    ### 参数:
-    - username: Instagram用户名
-    - pagination_token: 分页令牌，用于翻页，第一次请求不需要传值，后续请求需要传入上一次请求的返回值。
-    ### 返回:
-    - 用户的粉丝数据
-
-    # [English]
-    ### Purpose:
-    - Get user followers by Instagram username, can only get the followers data of public accounts, up
-    to 50 followers data at a time.
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    - To get more followers data, you can use the returned pagination_token parameter for pagination.
-    ### Parameters:
-    - username: Instagram username
-    - pagination_token: Pagination token, used for pagination, no need to pass value for the first
-    request, pass the return value of the previous request for subsequent requests.
-    ### Return:
-    - User followers data
-
-    # [示例/Example]
-    username = \"instagram\"
-    pagination_token = None
-
-    Args:
-        username (str): Instagram用户名/Instagram username
-        pagination_token (Union[Unset, str]): 分页令牌/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        username=username,
-        pagination_token=pagination_token,
-    )
+    """Like sync_detailed, for use with await"""
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    username: str,
-    pagination_token: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, username: str, pagination_token: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""根据用户名获取用户的粉丝数据/Get user followers by username
-
-     # [中文]
-    ### 用途:
-    - 根据Instagram用户名获取用户的粉丝数据，只能获取公开账号的粉丝数据，一次最多获取50个粉丝数据。
-    - 由于此接口收到后端代理服务器的影响，请在请求此接口时适当调整timeout参数。
-    - 建议将timeout设置为60秒，以确保能够获取到数据，大多数情况下，数据获取时间在10秒以内。
-    - 为了获取更多的粉丝数据，可以使用返回的pagination_token参数进行分页。
-    ### 参数:
-    - username: Instagram用户名
-    - pagination_token: 分页令牌，用于翻页，第一次请求不需要传值，后续请求需要传入上一次请求的返回值。
-    ### 返回:
-    - 用户的粉丝数据
-
-    # [English]
-    ### Purpose:
-    - Get user followers by Instagram username, can only get the followers data of public accounts, up
-    to 50 followers data at a time.
-    - Due to the impact of the backend proxy server, please adjust the timeout parameter appropriately
-    when requesting this interface.
-    - It is recommended to set the timeout to 60 seconds to ensure that the data can be obtained. In
-    most cases, the data acquisition time is within 10 seconds.
-    - To get more followers data, you can use the returned pagination_token parameter for pagination.
-    ### Parameters:
-    - username: Instagram username
-    - pagination_token: Pagination token, used for pagination, no need to pass value for the first
-    request, pass the return value of the previous request for subsequent requests.
-    ### Return:
-    - User followers data
-
-    # [示例/Example]
-    username = \"instagram\"
-    pagination_token = None
-
-    Args:
-        username (str): Instagram用户名/Instagram username
-        pagination_token (Union[Unset, str]): 分页令牌/Pagination token
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            username=username,
-            pagination_token=pagination_token,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
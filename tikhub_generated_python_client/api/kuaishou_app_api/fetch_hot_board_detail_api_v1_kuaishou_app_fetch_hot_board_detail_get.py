@@ -1,126 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    board_type: Union[Unset, int] = 1,
-    board_id: Union[Unset, int] = 1,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["boardType"] = board_type
-
-    params["boardId"] = board_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/kuaishou/app/fetch_hot_board_detail",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response, Unset
 
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/kuaishou/app/fetch_hot_board_detail",
+    params={"board_type": "boardType", "board_id": "boardId"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, board_type: Union[Unset, int] = 1, board_id: Union[Unset, int] = 1) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    board_type: Union[Unset, int] = 1,
-    board_id: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, board_type: Union[Unset, int] = 1, board_id: Union[Unset, int] = 1
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """快手热榜详情/Kuaishou hot board detail
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 快手热榜详情
-    ### 参数:
-    - boardType: 榜单类型
-    - boardId: 榜单ID
-    - boardType 和 boardId 可以从热榜分类接口中获取。
-    ### 返回:
-    - 详情数据
-
-    # [English]
-    ### Purpose:
-    - Kuaishou hot board detail
-    ### Parameters:
-    - boardType: Board type
-    - boardId: Board ID
-    - boardType and boardId can be obtained from the hot board categories interface.
-    ### Returns:
-    - Detail data
-
-    # [示例/Example]
-    boardType = 1
-    boardId = 1
-
-    Args:
-        board_type (Union[Unset, int]):  Default: 1.
-        board_id (Union[Unset, int]):  Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        board_type=board_type,
-        board_id=board_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    board_type: Union[Unset, int] = 1,
-    board_id: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, board_type: Union[Unset, int] = 1, board_id: Union[Unset, int] = 1
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """快手热榜详情/Kuaishou hot board detail
 
@@ -160,115 +67,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        board_type=board_type,
-        board_id=board_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    board_type: Union[Unset, int] = 1,
-    board_id: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, board_type: Union[Unset, int] = 1, board_id: Union[Unset, int] = 1
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """快手热榜详情/Kuaishou hot board detail
-
-     # [中文]
-    ### 用途:
-    - 快手热榜详情
-    ### 参数:
-    - boardType: 榜单类型
-    - boardId: 榜单ID
-    - boardType 和 boardId 可以从热榜分类接口中获取。
-    ### 返回:
-    - 详情数据
-
-    # [English]
-    ### Purpose:
-    - Kuaishou hot board detail
-    ### Parameters:
-    - boardType: Board type
-    - boardId: Board ID
-    - boardType and boardId can be obtained from the hot board categories interface.
-    ### Returns:
-    - Detail data
-
-    # [示例/Example]
-    boardType = 1
-    boardId = 1
-
-    Args:
-        board_type (Union[Unset, int]):  Default: 1.
-        board_id (Union[Unset, int]):  Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        board_type=board_type,
-        board_id=board_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    board_type: Union[Unset, int] = 1,
-    board_id: Union[Unset, int] = 1,
+    *, client: AuthenticatedClient, board_type: Union[Unset, int] = 1, board_id: Union[Unset, int] = 1
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """快手热榜详情/Kuaishou hot board detail
-
-     # [中文]
-    ### 用途:
-    - 快手热榜详情
-    ### 参数:
-    - boardType: 榜单类型
-    - boardId: 榜单ID
-    - boardType 和 boardId 可以从热榜分类接口中获取。
-    ### 返回:
-    - 详情数据
-
-    # [English]
-    ### Purpose:
-    - Kuaishou hot board detail
-    ### Parameters:
-    - boardType: Board type
-    - boardId: Board ID
-    - boardType and boardId can be obtained from the hot board categories interface.
-    ### Returns:
-    - Detail data
-
-    # [示例/Example]
-    boardType = 1
-    boardId = 1
-
-    Args:
-        board_type (Union[Unset, int]):  Default: 1.
-        board_id (Union[Unset, int]):  Default: 1.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            board_type=board_type,
-            board_id=board_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
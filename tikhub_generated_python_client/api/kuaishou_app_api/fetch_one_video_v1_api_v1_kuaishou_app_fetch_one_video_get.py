@@ -1,116 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    photo_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["photo_id"] = photo_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/kuaishou/app/fetch_one_video",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V1/Kuaishou single video query API V1
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据，如果此接口连续请求失败，可以尝试使用价格更昂贵的V2接口进行冗余请求。
-    ### 参数:
-    - photo_id: 作品ID，作品ID可以从分享链接中提取
-    ### 返回:
-    - 视频数据
-
-    # [English]
-    ### Purpose:
-    - Fetch single video data, if this API continuously fails, you can try to use the more expensive V2
-    API for redundant requests.
-    ### Parameters:
-    - photo_id: Photo ID, the photo ID can be extracted from the share link
-    ### Returns:
-    - Video data
+from ...types import Response
 
-    # [示例/Example]
-    photo_id = \"3xhpk3xcf6e4iac\"
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/kuaishou/app/fetch_one_video",
+    params={"photo_id": "photo_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    Args:
-        photo_id (str):
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
+def _get_kwargs(*, photo_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        photo_id=photo_id,
-    )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+def sync_detailed(*, client: AuthenticatedClient, photo_id: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, photo_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""快手单一视频查询接口V1/Kuaishou single video query API V1
 
      # [中文]
@@ -144,100 +58,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        photo_id=photo_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
+    *, client: AuthenticatedClient, photo_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V1/Kuaishou single video query API V1
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据，如果此接口连续请求失败，可以尝试使用价格更昂贵的V2接口进行冗余请求。
-    ### 参数:
-    - photo_id: 作品ID，作品ID可以从分享链接中提取
-    ### 返回:
-    - 视频数据
-
-    # [English]
-    ### Purpose:
-    - Fetch single video data, if this API continuously fails, you can try to use the more expensive V2
-    API for redundant requests.
-    ### Parameters:
-    - photo_id: Photo ID, the photo ID can be extracted from the share link
-    ### Returns:
-    - Video data
-
-    # [示例/Example]
-    photo_id = \"3xhpk3xcf6e4iac\"
-
-    Args:
-        photo_id (str):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        photo_id=photo_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V1/Kuaishou single video query API V1
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据，如果此接口连续请求失败，可以尝试使用价格更昂贵的V2接口进行冗余请求。
-    ### 参数:
-    - photo_id: 作品ID，作品ID可以从分享链接中提取
-    ### 返回:
-    - 视频数据
+    """Like sync_detailed, for use with await"""
 
-    # [English]
-    ### Purpose:
-    - Fetch single video data, if this API continuously fails, you can try to use the more expensive V2
-    API for redundant requests.
-    ### Parameters:
-    - photo_id: Photo ID, the photo ID can be extracted from the share link
-    ### Returns:
-    - Video data
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    # [示例/Example]
-    photo_id = \"3xhpk3xcf6e4iac\"
 
-    Args:
-        photo_id (str):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, photo_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            photo_id=photo_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
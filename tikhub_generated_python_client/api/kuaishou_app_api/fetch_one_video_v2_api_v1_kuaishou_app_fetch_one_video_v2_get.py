@@ -1,118 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    photo_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["photo_id"] = photo_id
+from ...types import Response
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/kuaishou/app/fetch_one_video_v2",
+    params={"photo_id": "photo_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/kuaishou/app/fetch_one_video_v2",
-        "params": params,
-    }
 
-    return _kwargs
+def _get_kwargs(*, photo_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
+def sync_detailed(*, client: AuthenticatedClient, photo_id: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+    return ENDPOINT.sync_detailed(**locals())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V2/Kuaishou single video query API V2
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据接口 V2，此接口仅作为备选接口，收费较贵，但稳定性更高。
-    - 此接口请求价格为 0.01 美元/次，请求不成功不收费。
-    ### 参数:
-    - photo_id: 作品ID
-    ### 返回:
-    - 视频数据
-
-    # [English]
-    ### Purpose:
-    - Single video query API V2, this API is only used as an alternative API, it is more expensive, but
-    more stable.
-    - The request price of this API is 0.01 USD/time, and the request is not successful without charge.
-    ### Parameters:
-    - photo_id: Photo ID
-    ### Returns:
-    - Video data
-
-    # [示例/Example]
-    photo_id = \"3xtdqvdnqd3psuc\"
-
-    Args:
-        photo_id (str):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        photo_id=photo_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, photo_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""快手单一视频查询接口V2/Kuaishou single video query API V2
 
      # [中文]
@@ -148,104 +60,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        photo_id=photo_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
+    *, client: AuthenticatedClient, photo_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V2/Kuaishou single video query API V2
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据接口 V2，此接口仅作为备选接口，收费较贵，但稳定性更高。
-    - 此接口请求价格为 0.01 美元/次，请求不成功不收费。
-    ### 参数:
-    - photo_id: 作品ID
-    ### 返回:
-    - 视频数据
-
-    # [English]
-    ### Purpose:
-    - Single video query API V2, this API is only used as an alternative API, it is more expensive, but
-    more stable.
-    - The request price of this API is 0.01 USD/time, and the request is not successful without charge.
-    ### Parameters:
-    - photo_id: Photo ID
-    ### Returns:
-    - Video data
+    """Like sync_detailed, for use with await"""
 
-    # [示例/Example]
-    photo_id = \"3xtdqvdnqd3psuc\"
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    Args:
-        photo_id (str):
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        photo_id=photo_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    photo_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""快手单一视频查询接口V2/Kuaishou single video query API V2
-
-     # [中文]
-    ### 用途:
-    - 获取单个作品数据接口 V2，此接口仅作为备选接口，收费较贵，但稳定性更高。
-    - 此接口请求价格为 0.01 美元/次，请求不成功不收费。
-    ### 参数:
-    - photo_id: 作品ID
-    ### 返回:
-    - 视频数据
-
-    # [English]
-    ### Purpose:
-    - Single video query API V2, this API is only used as an alternative API, it is more expensive, but
-    more stable.
-    - The request price of this API is 0.01 USD/time, and the request is not successful without charge.
-    ### Parameters:
-    - photo_id: Photo ID
-    ### Returns:
-    - Video data
-
-    # [示例/Example]
-    photo_id = \"3xtdqvdnqd3psuc\"
-
-    Args:
-        photo_id (str):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, photo_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            photo_id=photo_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
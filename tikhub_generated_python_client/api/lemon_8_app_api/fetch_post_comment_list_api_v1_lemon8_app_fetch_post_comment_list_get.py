@@ -1,146 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    group_id: str,
-    item_id: str,
-    media_id: str,
-    offset: Union[Unset, str] = "0",
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["group_id"] = group_id
-
-    params["item_id"] = item_id
+from ...types import Response, Unset
 
-    params["media_id"] = media_id
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/lemon8/app/fetch_post_comment_list",
+    params={"group_id": "group_id", "item_id": "item_id", "media_id": "media_id", "offset": "offset"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params["offset"] = offset
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/lemon8/app/fetch_post_comment_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, group_id: str, item_id: str, media_id: str, offset: Union[Unset, str] = "0") -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-    item_id: str,
-    media_id: str,
-    offset: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, group_id: str, item_id: str, media_id: str, offset: Union[Unset, str] = "0"
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的评论列表/Get comments list of specified post
-
-     # [中文]
-    ### 用途:
-    - 获取指定作品的评论列表
-    ### 参数:
-    - group_id: 作品的group_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - item_id: 作品的item_id，可以从接口`/lemon8/app/fetch_post_detail` 或 `/lemon8/app/get_item_id`获取
-    - media_id: 作品的media_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - offset: 翻页参数，可以从上一次请求的返回结果中获取，第一次请求为空，后续请求使用上一次请求返回的offset进行翻页。
-    ### 返回:
-    - 评论列表
-
-    # [English]
-    ### Purpose:
-    - Get comments list of specified post
-    ### Parameters:
-    - group_id: Post's group_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - item_id: Post's item_id, can be obtained from the interface `/lemon8/app/fetch_post_detail` or
-    `/lemon8/app/get_item_id`
-    - media_id: Post's media_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - offset: Pagination parameter, can be obtained from the return result of the last request. It is
-    empty for the first request, and the offset returned by the last request is used for subsequent
-    requests.
-    ### Return:
-    - Comments list
-
-    # [示例/Example]
-    group_id = \"7361926875709129222\"
-    item_id = \"7361926875709129222\"
-    media_id = \"7428056850216862763\"
-
-    Args:
-        group_id (str): 作品的group_id/Post's group_id
-        item_id (str): 作品的item_id/Post's item_id
-        media_id (str): 作品的media_id/Post's media_id
-        offset (Union[Unset, str]): 翻页参数/Pagination parameter Default: '0'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        group_id=group_id,
-        item_id=item_id,
-        media_id=media_id,
-        offset=offset,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-    item_id: str,
-    media_id: str,
-    offset: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, group_id: str, item_id: str, media_id: str, offset: Union[Unset, str] = "0"
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定作品的评论列表/Get comments list of specified post
 
@@ -188,141 +75,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        group_id=group_id,
-        item_id=item_id,
-        media_id=media_id,
-        offset=offset,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-    item_id: str,
-    media_id: str,
-    offset: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, group_id: str, item_id: str, media_id: str, offset: Union[Unset, str] = "0"
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的评论列表/Get comments list of specified post
-
-     # [中文]
-    ### 用途:
-    - 获取指定作品的评论列表
-    ### 参数:
-    - group_id: 作品的group_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - item_id: 作品的item_id，可以从接口`/lemon8/app/fetch_post_detail` 或 `/lemon8/app/get_item_id`获取
-    - media_id: 作品的media_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - offset: 翻页参数，可以从上一次请求的返回结果中获取，第一次请求为空，后续请求使用上一次请求返回的offset进行翻页。
-    ### 返回:
-    - 评论列表
-
-    # [English]
-    ### Purpose:
-    - Get comments list of specified post
-    ### Parameters:
-    - group_id: Post's group_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - item_id: Post's item_id, can be obtained from the interface `/lemon8/app/fetch_post_detail` or
-    `/lemon8/app/get_item_id`
-    - media_id: Post's media_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - offset: Pagination parameter, can be obtained from the return result of the last request. It is
-    empty for the first request, and the offset returned by the last request is used for subsequent
-    requests.
-    ### Return:
-    - Comments list
-
-    # [示例/Example]
-    group_id = \"7361926875709129222\"
-    item_id = \"7361926875709129222\"
-    media_id = \"7428056850216862763\"
-
-    Args:
-        group_id (str): 作品的group_id/Post's group_id
-        item_id (str): 作品的item_id/Post's item_id
-        media_id (str): 作品的media_id/Post's media_id
-        offset (Union[Unset, str]): 翻页参数/Pagination parameter Default: '0'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        group_id=group_id,
-        item_id=item_id,
-        media_id=media_id,
-        offset=offset,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-    item_id: str,
-    media_id: str,
-    offset: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, group_id: str, item_id: str, media_id: str, offset: Union[Unset, str] = "0"
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的评论列表/Get comments list of specified post
-
-     # [中文]
-    ### 用途:
-    - 获取指定作品的评论列表
-    ### 参数:
-    - group_id: 作品的group_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - item_id: 作品的item_id，可以从接口`/lemon8/app/fetch_post_detail` 或 `/lemon8/app/get_item_id`获取
-    - media_id: 作品的media_id，可以从接口`/lemon8/app/fetch_post_detail`获取
-    - offset: 翻页参数，可以从上一次请求的返回结果中获取，第一次请求为空，后续请求使用上一次请求返回的offset进行翻页。
-    ### 返回:
-    - 评论列表
-
-    # [English]
-    ### Purpose:
-    - Get comments list of specified post
-    ### Parameters:
-    - group_id: Post's group_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - item_id: Post's item_id, can be obtained from the interface `/lemon8/app/fetch_post_detail` or
-    `/lemon8/app/get_item_id`
-    - media_id: Post's media_id, can be obtained from the interface `/lemon8/app/fetch_post_detail`
-    - offset: Pagination parameter, can be obtained from the return result of the last request. It is
-    empty for the first request, and the offset returned by the last request is used for subsequent
-    requests.
-    ### Return:
-    - Comments list
-
-    # [示例/Example]
-    group_id = \"7361926875709129222\"
-    item_id = \"7361926875709129222\"
-    media_id = \"7428056850216862763\"
-
-    Args:
-        group_id (str): 作品的group_id/Post's group_id
-        item_id (str): 作品的item_id/Post's item_id
-        media_id (str): 作品的media_id/Post's media_id
-        offset (Union[Unset, str]): 翻页参数/Pagination parameter Default: '0'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            group_id=group_id,
-            item_id=item_id,
-            media_id=media_id,
-            offset=offset,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,115 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    item_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["item_id"] = item_id
+from ...types import Response
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/lemon8/app/fetch_post_detail",
+    params={"item_id": "item_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/lemon8/app/fetch_post_detail",
-        "params": params,
-    }
 
-    return _kwargs
+def _get_kwargs(*, item_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
+def sync_detailed(*, client: AuthenticatedClient, item_id: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+    return ENDPOINT.sync_detailed(**locals())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    item_id: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的信息/Get information of specified post
-
-     # [中文]
-    ### 用途:
-    - 获取指定作品的信息
-    ### 参数:
-    - item_id: 作品ID，可以从接口`/lemon8/app/get_item_id`获取
-    ### 返回:
-    - 作品信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - item_id: Post ID, can be obtained from the interface `/lemon8/app/get_item_id`
-    ### Return:
-    - Post information
-
-    # [示例/Example]
-    item_id = \"7361926875709129222\"
-
-    Args:
-        item_id (str): 作品ID/Post ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        item_id=item_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    item_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, item_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定作品的信息/Get information of specified post
 
      # [中文]
@@ -142,98 +57,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        item_id=item_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    item_id: str,
+    *, client: AuthenticatedClient, item_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的信息/Get information of specified post
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定作品的信息
-    ### 参数:
-    - item_id: 作品ID，可以从接口`/lemon8/app/get_item_id`获取
-    ### 返回:
-    - 作品信息
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - item_id: Post ID, can be obtained from the interface `/lemon8/app/get_item_id`
-    ### Return:
-    - Post information
-
-    # [示例/Example]
-    item_id = \"7361926875709129222\"
-
-    Args:
-        item_id (str): 作品ID/Post ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        item_id=item_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    item_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定作品的信息/Get information of specified post
-
-     # [中文]
-    ### 用途:
-    - 获取指定作品的信息
-    ### 参数:
-    - item_id: 作品ID，可以从接口`/lemon8/app/get_item_id`获取
-    ### 返回:
-    - 作品信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - item_id: Post ID, can be obtained from the interface `/lemon8/app/get_item_id`
-    ### Return:
-    - Post information
 
-    # [示例/Example]
-    item_id = \"7361926875709129222\"
-
-    Args:
-        item_id (str): 作品ID/Post ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, item_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            item_id=item_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,115 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    cursor: Union[Unset, str] = "0",
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["cursor"] = cursor
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/pipixia/app/fetch_home_feed",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response, Unset
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/pipixia/app/fetch_home_feed",
+    params={"cursor": "cursor"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, cursor: Union[Unset, str] = "0") -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    cursor: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, cursor: Union[Unset, str] = "0"
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取首页推荐/Get home feed
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取首页推荐数据。
-    ### 参数:
-    - cursor: 翻页游标，默认为0，后续页码从上一页返回的 `loadmore_cursor` Key中获取对应值。
-    ### 返回:
-    - 首页推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed data.
-    ### Parameters:
-    - cursor: Page cursor, default is 0, get the corresponding value from the `loadmore_cursor` Key in
-    the previous page.
-    ### Return:
-    - Home feed data
-
-    # [示例/Example]
-    cursor = \"0\"
-
-    Args:
-        cursor (Union[Unset, str]): 翻页游标/Page cursor Default: '0'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        cursor=cursor,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    cursor: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, cursor: Union[Unset, str] = "0"
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取首页推荐/Get home feed
 
@@ -144,100 +62,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        cursor=cursor,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    cursor: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, cursor: Union[Unset, str] = "0"
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取首页推荐/Get home feed
-
-     # [中文]
-    ### 用途:
-    - 获取首页推荐数据。
-    ### 参数:
-    - cursor: 翻页游标，默认为0，后续页码从上一页返回的 `loadmore_cursor` Key中获取对应值。
-    ### 返回:
-    - 首页推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed data.
-    ### Parameters:
-    - cursor: Page cursor, default is 0, get the corresponding value from the `loadmore_cursor` Key in
-    the previous page.
-    ### Return:
-    - Home feed data
-
-    # [示例/Example]
-    cursor = \"0\"
-
-    Args:
-        cursor (Union[Unset, str]): 翻页游标/Page cursor Default: '0'.
+    """Like sync_detailed, for use with await"""
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        cursor=cursor,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    cursor: Union[Unset, str] = "0",
+    *, client: AuthenticatedClient, cursor: Union[Unset, str] = "0"
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取首页推荐/Get home feed
-
-     # [中文]
-    ### 用途:
-    - 获取首页推荐数据。
-    ### 参数:
-    - cursor: 翻页游标，默认为0，后续页码从上一页返回的 `loadmore_cursor` Key中获取对应值。
-    ### 返回:
-    - 首页推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed data.
-    ### Parameters:
-    - cursor: Page cursor, default is 0, get the corresponding value from the `loadmore_cursor` Key in
-    the previous page.
-    ### Return:
-    - Home feed data
-
-    # [示例/Example]
-    cursor = \"0\"
-
-    Args:
-        cursor (Union[Unset, str]): 翻页游标/Page cursor Default: '0'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            cursor=cursor,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,120 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    token: str,
-    message_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["token"] = token
-
-    params["message_id"] = message_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/temp_mail/v1/get_email_by_id",
-        "params": params,
-    }
+from ...types import Response
 
-    return _kwargs
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/temp_mail/v1/get_email_by_id",
+    params={"token": "token", "message_id": "message_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, token: str, message_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    token: str,
-    message_id: str,
+    *, client: AuthenticatedClient, token: str, message_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """Get Email By Id
-
-     # [中文]
-    ### 用途:
-    - 通过邮件ID获取邮件数据
-    ### 参数:
-    - token: 邮箱Bearer Token
-    - message_id: 邮件ID
-    ### 返回:
-    - 邮件数据
-
-    # [English]
-    ### Purpose:
-    - Get email data by email ID
-    ### Parameters:
-    - token: Email Bearer Token
-    - message_id: Email ID
-    ### Returns:
-    - Email data
-
-    Args:
-        token (str): Bearer Token
-        message_id (str): Message ID
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        token=token,
-        message_id=message_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    token: str,
-    message_id: str,
+    *, client: AuthenticatedClient, token: str, message_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """Get Email By Id
 
@@ -148,103 +61,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        token=token,
-        message_id=message_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    token: str,
-    message_id: str,
+    *, client: AuthenticatedClient, token: str, message_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """Get Email By Id
-
-     # [中文]
-    ### 用途:
-    - 通过邮件ID获取邮件数据
-    ### 参数:
-    - token: 邮箱Bearer Token
-    - message_id: 邮件ID
-    ### 返回:
-    - 邮件数据
+    """Like sync_detailed, for use with await"""
 
-    # [English]
-    ### Purpose:
-    - Get email data by email ID
-    ### Parameters:
-    - token: Email Bearer Token
-    - message_id: Email ID
-    ### Returns:
-    - Email data
-
-    Args:
-        token (str): Bearer Token
-        message_id (str): Message ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        token=token,
-        message_id=message_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    token: str,
-    message_id: str,
+    *, client: AuthenticatedClient, token: str, message_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """Get Email By Id
-
-     # [中文]
-    ### 用途:
-    - 通过邮件ID获取邮件数据
-    ### 参数:
-    - token: 邮箱Bearer Token
-    - message_id: 邮件ID
-    ### 返回:
-    - 邮件数据
-
-    # [English]
-    ### Purpose:
-    - Get email data by email ID
-    ### Parameters:
-    - token: Email Bearer Token
-    - message_id: Email ID
-    ### Returns:
-    - Email data
-
-    Args:
-        token (str): Bearer Token
-        message_id (str): Message ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            token=token,
-            message_id=message_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,112 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    endpoint: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["endpoint"] = endpoint
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tikhub/user/get_endpoint_info",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    endpoint: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取一个端点的信息/Get information of an endpoint
-
-     # [中文]
-    ### 用途:
-    - 获取一个端点的信息
-    ### 参数:
-    - endpoint: 请求的端点
-    ### 返回:
-    - 端点信息
+from ...types import Response
 
-    # [English]
-    ### Purpose:
-    - Get information of an endpoint
-    ### Parameters:
-    - endpoint: Requested endpoint
-    ### Return:
-    - Endpoint information
-
-    Args:
-        endpoint (str): 请求的端点/Requested endpoint
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tikhub/user/get_endpoint_info",
+    params={"endpoint": "endpoint"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+def _get_kwargs(*, endpoint: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-    kwargs = _get_kwargs(
-        endpoint=endpoint,
-    )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+def sync_detailed(*, client: AuthenticatedClient, endpoint: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync(
-    *,
-    client: AuthenticatedClient,
-    endpoint: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, endpoint: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """获取一个端点的信息/Get information of an endpoint
 
      # [中文]
@@ -136,92 +54,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        endpoint=endpoint,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    endpoint: str,
+    *, client: AuthenticatedClient, endpoint: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取一个端点的信息/Get information of an endpoint
-
-     # [中文]
-    ### 用途:
-    - 获取一个端点的信息
-    ### 参数:
-    - endpoint: 请求的端点
-    ### 返回:
-    - 端点信息
+    """Like sync_detailed, for use with await"""
 
-    # [English]
-    ### Purpose:
-    - Get information of an endpoint
-    ### Parameters:
-    - endpoint: Requested endpoint
-    ### Return:
-    - Endpoint information
-
-    Args:
-        endpoint (str): 请求的端点/Requested endpoint
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        endpoint=endpoint,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
-
-
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    endpoint: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """获取一个端点的信息/Get information of an endpoint
-
-     # [中文]
-    ### 用途:
-    - 获取一个端点的信息
-    ### 参数:
-    - endpoint: 请求的端点
-    ### 返回:
-    - 端点信息
-
-    # [English]
-    ### Purpose:
-    - Get information of an endpoint
-    ### Parameters:
-    - endpoint: Requested endpoint
-    ### Return:
-    - Endpoint information
-
-    Args:
-        endpoint (str): 请求的端点/Requested endpoint
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
 
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+async def asyncio(*, client: AuthenticatedClient, endpoint: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            endpoint=endpoint,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
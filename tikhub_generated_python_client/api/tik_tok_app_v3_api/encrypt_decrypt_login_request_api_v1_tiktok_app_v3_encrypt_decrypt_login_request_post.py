@@ -1,131 +1,34 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...models.tik_tok_app_login_encrypt_decrypt_request import TikTokAPPLoginEncryptDecryptRequest
 from ...types import Response
 
-
-def _get_kwargs(
-    *,
-    body: TikTokAPPLoginEncryptDecryptRequest,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/tiktok/app/v3/encrypt_decrypt_login_request",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/tiktok/app/v3/encrypt_decrypt_login_request",
+    body=TikTokAPPLoginEncryptDecryptRequest,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, body: TikTokAPPLoginEncryptDecryptRequest) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPLoginEncryptDecryptRequest,
+    *, client: AuthenticatedClient, body: TikTokAPPLoginEncryptDecryptRequest
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""加密或解密 TikTok APP 登录请求体/Encrypt or Decrypt TikTok APP login request body
-
-     # [中文]
-    ### 用途:
-    - 加密/解密 TikTok APP 登录请求体，用于登录接口的请求体加密和解密。
-    ### 参数:
-    - username: 用户名，可以是密文或明文。
-    - password: 密码，可以是密文或明文。
-    - mode: 模式
-        - `encrypt`: 加密
-        - `decrypt`: 解密
-    ### 返回:
-    - 加密/解密后的请求体
-
-    # [English]
-    ### Purpose:
-    - Encrypt/decrypt the TikTok APP login request body, used for encrypting and decrypting the request
-    body of the login interface.
-    ### Parameters:
-    - username: Username, can be ciphertext or plaintext.
-    - password: Password, can be ciphertext or plaintext.
-    - mode: Mode
-        - `encrypt`: Encrypt
-        - `decrypt`: Decrypt
-    ### Return:
-    - Encrypted/decrypted request body
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    # [示例/Example]
-    ```json
-    {
-        \"username\": \"example_username\",
-        \"password\": \"example_password\",
-        \"mode\": \"encrypt\"
-    }
-    ```
-
-    Args:
-        body (TikTokAPPLoginEncryptDecryptRequest):  Example: {'mode': 'encrypt', 'password':
-            'example_password', 'username': 'example_username'}.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPLoginEncryptDecryptRequest,
+    *, client: AuthenticatedClient, body: TikTokAPPLoginEncryptDecryptRequest
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""加密或解密 TikTok APP 登录请求体/Encrypt or Decrypt TikTok APP login request body
 
@@ -175,130 +78,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPLoginEncryptDecryptRequest,
+    *, client: AuthenticatedClient, body: TikTokAPPLoginEncryptDecryptRequest
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""加密或解密 TikTok APP 登录请求体/Encrypt or Decrypt TikTok APP login request body
-
-     # [中文]
-    ### 用途:
-    - 加密/解密 TikTok APP 登录请求体，用于登录接口的请求体加密和解密。
-    ### 参数:
-    - username: 用户名，可以是密文或明文。
-    - password: 密码，可以是密文或明文。
-    - mode: 模式
-        - `encrypt`: 加密
-        - `decrypt`: 解密
-    ### 返回:
-    - 加密/解密后的请求体
-
-    # [English]
-    ### Purpose:
-    - Encrypt/decrypt the TikTok APP login request body, used for encrypting and decrypting the request
-    body of the login interface.
-    ### Parameters:
-    - username: Username, can be ciphertext or plaintext.
-    - password: Password, can be ciphertext or plaintext.
-    - mode: Mode
-        - `encrypt`: Encrypt
-        - `decrypt`: Decrypt
-    ### Return:
-    - Encrypted/decrypted request body
+    """Like sync_detailed, for use with await"""
 
-    # [示例/Example]
-    ```json
-    {
-        \"username\": \"example_username\",
-        \"password\": \"example_password\",
-        \"mode\": \"encrypt\"
-    }
-    ```
-
-    Args:
-        body (TikTokAPPLoginEncryptDecryptRequest):  Example: {'mode': 'encrypt', 'password':
-            'example_password', 'username': 'example_username'}.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPLoginEncryptDecryptRequest,
+    *, client: AuthenticatedClient, body: TikTokAPPLoginEncryptDecryptRequest
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""加密或解密 TikTok APP 登录请求体/Encrypt or Decrypt TikTok APP login request body
-
-     # [中文]
-    ### 用途:
-    - 加密/解密 TikTok APP 登录请求体，用于登录接口的请求体加密和解密。
-    ### 参数:
-    - username: 用户名，可以是密文或明文。
-    - password: 密码，可以是密文或明文。
-    - mode: 模式
-        - `encrypt`: 加密
-        - `decrypt`: 解密
-    ### 返回:
-    - 加密/解密后的请求体
-
-    # [English]
-    ### Purpose:
-    - Encrypt/decrypt the TikTok APP login request body, used for encrypting and decrypting the request
-    body of the login interface.
-    ### Parameters:
-    - username: Username, can be ciphertext or plaintext.
-    - password: Password, can be ciphertext or plaintext.
-    - mode: Mode
-        - `encrypt`: Encrypt
-        - `decrypt`: Decrypt
-    ### Return:
-    - Encrypted/decrypted request body
-
-    # [示例/Example]
-    ```json
-    {
-        \"username\": \"example_username\",
-        \"password\": \"example_password\",
-        \"mode\": \"encrypt\"
-    }
-    ```
-
-    Args:
-        body (TikTokAPPLoginEncryptDecryptRequest):  Example: {'mode': 'encrypt', 'password':
-            'example_password', 'username': 'example_username'}.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,116 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    creator_uid: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["creator_uid"] = creator_uid
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/fetch_creator_info",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/fetch_creator_info",
+    params={"creator_uid": "creator_uid"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, creator_uid: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    creator_uid: str,
+    *, client: AuthenticatedClient, creator_uid: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取创作者信息/Get creator information
-
-     # [中文]
-    ### 用途:
-    - 获取创作者信息，包括创作者的基本信息、粉丝数、橱窗商品数量等信息。
-    ### 参数:
-    - creator_uid: 创作者uid
-    ### 返回:
-    - 创作者信息
-
-    # [English]
-    ### Purpose:
-    - Get creator information, including the creator's basic information, number of fans, number of
-    storefront products, etc.
-    ### Parameters:
-    - creator_uid: Creator uid
-    ### Return:
-    - Creator information
-
-    # [示例/Example]
-    creator_uid = \"6555451606845243393\"
-
-    Args:
-        creator_uid (str): 创作者uid/Creator uid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        creator_uid=creator_uid,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    return ENDPOINT.sync_detailed(**locals())
 
-    return _build_response(client=client, response=response)
 
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    creator_uid: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, creator_uid: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取创作者信息/Get creator information
 
      # [中文]
@@ -144,100 +60,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        creator_uid=creator_uid,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    creator_uid: str,
+    *, client: AuthenticatedClient, creator_uid: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取创作者信息/Get creator information
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取创作者信息，包括创作者的基本信息、粉丝数、橱窗商品数量等信息。
-    ### 参数:
-    - creator_uid: 创作者uid
-    ### 返回:
-    - 创作者信息
-
-    # [English]
-    ### Purpose:
-    - Get creator information, including the creator's basic information, number of fans, number of
-    storefront products, etc.
-    ### Parameters:
-    - creator_uid: Creator uid
-    ### Return:
-    - Creator information
-
-    # [示例/Example]
-    creator_uid = \"6555451606845243393\"
-
-    Args:
-        creator_uid (str): 创作者uid/Creator uid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        creator_uid=creator_uid,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    creator_uid: str,
+    *, client: AuthenticatedClient, creator_uid: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取创作者信息/Get creator information
-
-     # [中文]
-    ### 用途:
-    - 获取创作者信息，包括创作者的基本信息、粉丝数、橱窗商品数量等信息。
-    ### 参数:
-    - creator_uid: 创作者uid
-    ### 返回:
-    - 创作者信息
-
-    # [English]
-    ### Purpose:
-    - Get creator information, including the creator's basic information, number of fans, number of
-    storefront products, etc.
-    ### Parameters:
-    - creator_uid: Creator uid
-    ### Return:
-    - Creator information
-
-    # [示例/Example]
-    creator_uid = \"6555451606845243393\"
-
-    Args:
-        creator_uid (str): 创作者uid/Creator uid
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            creator_uid=creator_uid,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
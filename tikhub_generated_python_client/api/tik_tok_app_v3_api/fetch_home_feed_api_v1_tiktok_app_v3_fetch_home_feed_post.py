@@ -1,113 +1,34 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...models.tik_tok_appv3_home_feed import TikTokAPPV3HomeFeed
 from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="post",
+    url="/api/v1/tiktok/app/v3/fetch_home_feed",
+    body=TikTokAPPV3HomeFeed,
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _get_kwargs(
-    *,
-    body: TikTokAPPV3HomeFeed,
-) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
-        "method": "post",
-        "url": "/api/v1/tiktok/app/v3/fetch_home_feed",
-    }
-
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
 
-    _kwargs["headers"] = headers
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, body: TikTokAPPV3HomeFeed) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPV3HomeFeed,
+    *, client: AuthenticatedClient, body: TikTokAPPV3HomeFeed
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取主页视频推荐数据/Get home feed(recommend) video data
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取主页视频推荐数据
-    ### 参数:
-    - cookie: 用户自己的cookie，可选参数，用于接口返回数据的个性化推荐。
-    ### 返回:
-    - 视频推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed(recommend) video data
-    ### Parameters:
-    - cookie: User's own cookie, optional parameter, used for personalized recommendation of interface
-    returned data.
-    ### Return:
-    - Video recommend data
-
-    Args:
-        body (TikTokAPPV3HomeFeed):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPV3HomeFeed,
+    *, client: AuthenticatedClient, body: TikTokAPPV3HomeFeed
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     """获取主页视频推荐数据/Get home feed(recommend) video data
 
@@ -139,94 +60,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        body=body,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPV3HomeFeed,
+    *, client: AuthenticatedClient, body: TikTokAPPV3HomeFeed
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    """获取主页视频推荐数据/Get home feed(recommend) video data
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取主页视频推荐数据
-    ### 参数:
-    - cookie: 用户自己的cookie，可选参数，用于接口返回数据的个性化推荐。
-    ### 返回:
-    - 视频推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed(recommend) video data
-    ### Parameters:
-    - cookie: User's own cookie, optional parameter, used for personalized recommendation of interface
-    returned data.
-    ### Return:
-    - Video recommend data
-
-    Args:
-        body (TikTokAPPV3HomeFeed):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        body=body,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    body: TikTokAPPV3HomeFeed,
+    *, client: AuthenticatedClient, body: TikTokAPPV3HomeFeed
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    """获取主页视频推荐数据/Get home feed(recommend) video data
-
-     # [中文]
-    ### 用途:
-    - 获取主页视频推荐数据
-    ### 参数:
-    - cookie: 用户自己的cookie，可选参数，用于接口返回数据的个性化推荐。
-    ### 返回:
-    - 视频推荐数据
-
-    # [English]
-    ### Purpose:
-    - Get home feed(recommend) video data
-    ### Parameters:
-    - cookie: User's own cookie, optional parameter, used for personalized recommendation of interface
-    returned data.
-    ### Return:
-    - Video recommend data
-
-    Args:
-        body (TikTokAPPV3HomeFeed):
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            body=body,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,124 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    room_id: str,
-    anchor_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["room_id"] = room_id
+from ...types import Response
 
-    params["anchor_id"] = anchor_id
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/fetch_live_ranking_list",
+    params={"room_id": "room_id", "anchor_id": "anchor_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/fetch_live_ranking_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, room_id: str, anchor_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    anchor_id: str,
+    *, client: AuthenticatedClient, room_id: str, anchor_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间排行榜数据/Get live room ranking list
-
-     # [中文]
-    ### 用途:
-    - 获取直播间内观众的排行榜数据
-    ### 参数:
-    - room_id: 直播间id
-    - anchor_id: 主播id
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get ranking list of audience in live room
-    ### Parameters:
-    - room_id: Live room id
-    - anchor_id: Anchor id
-    ### Return:
-    - Ranking list data
-
-    # [示例/Example]
-    room_id = \"7358603858249009962\"
-    anchor_id = \"7222941468722758702\"
-
-    Args:
-        room_id (str): 直播间id/Live room id
-        anchor_id (str): 主播id/Anchor id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        room_id=room_id,
-        anchor_id=anchor_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    anchor_id: str,
+    *, client: AuthenticatedClient, room_id: str, anchor_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取直播间排行榜数据/Get live room ranking list
 
@@ -156,111 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        room_id=room_id,
-        anchor_id=anchor_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    anchor_id: str,
+    *, client: AuthenticatedClient, room_id: str, anchor_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间排行榜数据/Get live room ranking list
-
-     # [中文]
-    ### 用途:
-    - 获取直播间内观众的排行榜数据
-    ### 参数:
-    - room_id: 直播间id
-    - anchor_id: 主播id
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get ranking list of audience in live room
-    ### Parameters:
-    - room_id: Live room id
-    - anchor_id: Anchor id
-    ### Return:
-    - Ranking list data
-
-    # [示例/Example]
-    room_id = \"7358603858249009962\"
-    anchor_id = \"7222941468722758702\"
-
-    Args:
-        room_id (str): 直播间id/Live room id
-        anchor_id (str): 主播id/Anchor id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        room_id=room_id,
-        anchor_id=anchor_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    room_id: str,
-    anchor_id: str,
+    *, client: AuthenticatedClient, room_id: str, anchor_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取直播间排行榜数据/Get live room ranking list
-
-     # [中文]
-    ### 用途:
-    - 获取直播间内观众的排行榜数据
-    ### 参数:
-    - room_id: 直播间id
-    - anchor_id: 主播id
-    ### 返回:
-    - 排行榜数据
-
-    # [English]
-    ### Purpose:
-    - Get ranking list of audience in live room
-    ### Parameters:
-    - room_id: Live room id
-    - anchor_id: Anchor id
-    ### Return:
-    - Ranking list data
-
-    # [示例/Example]
-    room_id = \"7358603858249009962\"
-    anchor_id = \"7222941468722758702\"
-
-    Args:
-        room_id (str): 直播间id/Live room id
-        anchor_id (str): 主播id/Anchor id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            room_id=room_id,
-            anchor_id=anchor_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
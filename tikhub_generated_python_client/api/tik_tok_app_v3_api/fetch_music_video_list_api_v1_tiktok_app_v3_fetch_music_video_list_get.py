@@ -1,135 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    music_id: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 10,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["music_id"] = music_id
-
-    params["cursor"] = cursor
+from ...types import Response, Unset
 
-    params["count"] = count
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/fetch_music_video_list",
+    params={"music_id": "music_id", "cursor": "cursor", "count": "count"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/fetch_music_video_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, music_id: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 10) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    music_id: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 10,
+    *, client: AuthenticatedClient, music_id: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 10
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定音乐的视频列表数据/Get video list of specified music
-
-     # [中文]
-    ### 用途:
-    - 获取指定音乐的视频列表数据
-    ### 参数:
-    - music_id: 音乐id
-    - cursor: 游标，用于翻页，第一页为0，第二页为第一次响应中的cursor值。
-    - count: 数量
-    ### 返回:
-    - 音乐视频列表数据
-
-    # [English]
-    ### Purpose:
-    - Get video list of specified music
-    ### Parameters:
-    - music_id: Music id
-    - cursor: Cursor, used for paging, the first page is 0, the second page is the cursor value in the
-    first response.
-    - count: Number
-    ### Return:
-    - Music video list data
-
-    # [示例/Example]
-    music_id = \"6943027371519772674\"
-    cursor = 0
-    count = 10
-
-    Args:
-        music_id (str): 音乐id/Music id
-        cursor (Union[Unset, int]): 游标/Cursor Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 10.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        music_id=music_id,
-        cursor=cursor,
-        count=count,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    music_id: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 10,
+    *, client: AuthenticatedClient, music_id: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 10
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定音乐的视频列表数据/Get video list of specified music
 
@@ -172,126 +70,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        music_id=music_id,
-        cursor=cursor,
-        count=count,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    music_id: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 10,
+    *, client: AuthenticatedClient, music_id: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 10
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定音乐的视频列表数据/Get video list of specified music
-
-     # [中文]
-    ### 用途:
-    - 获取指定音乐的视频列表数据
-    ### 参数:
-    - music_id: 音乐id
-    - cursor: 游标，用于翻页，第一页为0，第二页为第一次响应中的cursor值。
-    - count: 数量
-    ### 返回:
-    - 音乐视频列表数据
-
-    # [English]
-    ### Purpose:
-    - Get video list of specified music
-    ### Parameters:
-    - music_id: Music id
-    - cursor: Cursor, used for paging, the first page is 0, the second page is the cursor value in the
-    first response.
-    - count: Number
-    ### Return:
-    - Music video list data
-
-    # [示例/Example]
-    music_id = \"6943027371519772674\"
-    cursor = 0
-    count = 10
-
-    Args:
-        music_id (str): 音乐id/Music id
-        cursor (Union[Unset, int]): 游标/Cursor Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 10.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        music_id=music_id,
-        cursor=cursor,
-        count=count,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    music_id: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 10,
+    *, client: AuthenticatedClient, music_id: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 10
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定音乐的视频列表数据/Get video list of specified music
-
-     # [中文]
-    ### 用途:
-    - 获取指定音乐的视频列表数据
-    ### 参数:
-    - music_id: 音乐id
-    - cursor: 游标，用于翻页，第一页为0，第二页为第一次响应中的cursor值。
-    - count: 数量
-    ### 返回:
-    - 音乐视频列表数据
-
-    # [English]
-    ### Purpose:
-    - Get video list of specified music
-    ### Parameters:
-    - music_id: Music id
-    - cursor: Cursor, used for paging, the first page is 0, the second page is the cursor value in the
-    first response.
-    - count: Number
-    ### Return:
-    - Music video list data
-
-    # [示例/Example]
-    music_id = \"6943027371519772674\"
-    cursor = 0
-    count = 10
-
-    Args:
-        music_id (str): 音乐id/Music id
-        cursor (Union[Unset, int]): 游标/Cursor Default: 0.
-        count (Union[Unset, int]): 数量/Number Default: 10.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            music_id=music_id,
-            cursor=cursor,
-            count=count,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,116 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    share_link: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["share_link"] = share_link
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/fetch_product_id_by_share_link",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/fetch_product_id_by_share_link",
+    params={"share_link": "share_link"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, share_link: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    share_link: str,
+    *, client: AuthenticatedClient, share_link: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""通过分享链接获取商品ID/Get Product ID by Share Link
-
-     # [中文]
-    ### 用途:
-    - 通过分享链接获取商品ID
-    ### 参数:
-    - share_link: 分享链接
-    ### 返回:
-    - 商品ID
-
-    # [English]
-    ### Purpose:
-    - Get Product ID by Share Link
-    ### Parameters:
-    - share_link: Share link
-    ### Return:
-    - Product ID
-
-    # [示例/Example]
-    share_link = \"https://www.tiktok.com/t/ZT2A9N1kw/\"
-    share_link2 = \"https://affiliate-us.tiktok.com/api/v1/share/AJ4hS3OdXmSg\"
-
-    Args:
-        share_link (str): 分享链接/Share link
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        share_link=share_link,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    return ENDPOINT.sync_detailed(**locals())
 
-    return _build_response(client=client, response=response)
 
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    share_link: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, share_link: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""通过分享链接获取商品ID/Get Product ID by Share Link
 
      # [中文]
@@ -144,100 +60,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        share_link=share_link,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    share_link: str,
+    *, client: AuthenticatedClient, share_link: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""通过分享链接获取商品ID/Get Product ID by Share Link
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 通过分享链接获取商品ID
-    ### 参数:
-    - share_link: 分享链接
-    ### 返回:
-    - 商品ID
-
-    # [English]
-    ### Purpose:
-    - Get Product ID by Share Link
-    ### Parameters:
-    - share_link: Share link
-    ### Return:
-    - Product ID
-
-    # [示例/Example]
-    share_link = \"https://www.tiktok.com/t/ZT2A9N1kw/\"
-    share_link2 = \"https://affiliate-us.tiktok.com/api/v1/share/AJ4hS3OdXmSg\"
-
-    Args:
-        share_link (str): 分享链接/Share link
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        share_link=share_link,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    share_link: str,
+    *, client: AuthenticatedClient, share_link: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""通过分享链接获取商品ID/Get Product ID by Share Link
-
-     # [中文]
-    ### 用途:
-    - 通过分享链接获取商品ID
-    ### 参数:
-    - share_link: 分享链接
-    ### 返回:
-    - 商品ID
-
-    # [English]
-    ### Purpose:
-    - Get Product ID by Share Link
-    ### Parameters:
-    - share_link: Share link
-    ### Return:
-    - Product ID
-
-    # [示例/Example]
-    share_link = \"https://www.tiktok.com/t/ZT2A9N1kw/\"
-    share_link2 = \"https://affiliate-us.tiktok.com/api/v1/share/AJ4hS3OdXmSg\"
-
-    Args:
-        share_link (str): 分享链接/Share link
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            share_link=share_link,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
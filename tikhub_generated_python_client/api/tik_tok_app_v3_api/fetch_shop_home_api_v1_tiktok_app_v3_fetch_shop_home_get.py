@@ -1,125 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    page_id: str,
-    seller_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["page_id"] = page_id
-
-    params["seller_id"] = seller_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/fetch_shop_home",
-        "params": params,
-    }
-
-    return _kwargs
+from ...types import Response
 
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/fetch_shop_home",
+    params={"page_id": "page_id", "seller_id": "seller_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, page_id: str, seller_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    page_id: str,
-    seller_id: str,
+    *, client: AuthenticatedClient, page_id: str, seller_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取商家主页数据/Get shop home page data
-
-     # [中文]
-    ### 用途:
-    - 获取商家主页的商品数据
-    ### 参数:
-    - page_id: 爬取的商家主页Page id，可以从`fetch_shop_home_page_list`这个接口获取
-    - seller_id: 商家id,店铺id
-    ### 返回:
-    - 商家主页数据
-
-    # [English]
-    ### Purpose:
-    - Get product data of the shop home page
-    ### Parameters:
-    - page_id: Page id of the crawled shop home page, which can be obtained from the interface
-    `fetch_shop_home_page_list`
-    - seller_id: Seller id, shop id
-    ### Return:
-    - Shop home page data
-
-    # [示例/Example]
-    page_id = \"7314705727611930410\"
-    seller_id = \"8646929864612614278\"
-
-    Args:
-        page_id (str): 爬取的商家主页Page id/Page id of the crawled shop home page
-        seller_id (str): 商家id,店铺id/Seller id, shop id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        page_id=page_id,
-        seller_id=seller_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    page_id: str,
-    seller_id: str,
+    *, client: AuthenticatedClient, page_id: str, seller_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取商家主页数据/Get shop home page data
 
@@ -158,113 +66,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        page_id=page_id,
-        seller_id=seller_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    page_id: str,
-    seller_id: str,
+    *, client: AuthenticatedClient, page_id: str, seller_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取商家主页数据/Get shop home page data
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取商家主页的商品数据
-    ### 参数:
-    - page_id: 爬取的商家主页Page id，可以从`fetch_shop_home_page_list`这个接口获取
-    - seller_id: 商家id,店铺id
-    ### 返回:
-    - 商家主页数据
-
-    # [English]
-    ### Purpose:
-    - Get product data of the shop home page
-    ### Parameters:
-    - page_id: Page id of the crawled shop home page, which can be obtained from the interface
-    `fetch_shop_home_page_list`
-    - seller_id: Seller id, shop id
-    ### Return:
-    - Shop home page data
-
-    # [示例/Example]
-    page_id = \"7314705727611930410\"
-    seller_id = \"8646929864612614278\"
-
-    Args:
-        page_id (str): 爬取的商家主页Page id/Page id of the crawled shop home page
-        seller_id (str): 商家id,店铺id/Seller id, shop id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        page_id=page_id,
-        seller_id=seller_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    page_id: str,
-    seller_id: str,
+    *, client: AuthenticatedClient, page_id: str, seller_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取商家主页数据/Get shop home page data
-
-     # [中文]
-    ### 用途:
-    - 获取商家主页的商品数据
-    ### 参数:
-    - page_id: 爬取的商家主页Page id，可以从`fetch_shop_home_page_list`这个接口获取
-    - seller_id: 商家id,店铺id
-    ### 返回:
-    - 商家主页数据
-
-    # [English]
-    ### Purpose:
-    - Get product data of the shop home page
-    ### Parameters:
-    - page_id: Page id of the crawled shop home page, which can be obtained from the interface
-    `fetch_shop_home_page_list`
-    - seller_id: Seller id, shop id
-    ### Return:
-    - Shop home page data
-
-    # [示例/Example]
-    page_id = \"7314705727611930410\"
-    seller_id = \"8646929864612614278\"
-
-    Args:
-        page_id (str): 爬取的商家主页Page id/Page id of the crawled shop home page
-        seller_id (str): 商家id,店铺id/Seller id, shop id
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            page_id=page_id,
-            seller_id=seller_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,66 +1,23 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/app/v3/handler_user_profile",
+    params={"user_id": "user_id", "sec_user_id": "sec_user_id", "unique_id": "unique_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
-    *,
-    user_id: Union[Unset, str] = "",
-    sec_user_id: Union[Unset, str] = "",
-    unique_id: Union[Unset, str] = "",
+    *, user_id: Union[Unset, str] = "", sec_user_id: Union[Unset, str] = "", unique_id: Union[Unset, str] = ""
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["user_id"] = user_id
-
-    params["sec_user_id"] = sec_user_id
-
-    params["unique_id"] = unique_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/app/v3/handler_user_profile",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -70,64 +27,9 @@ def sync_detailed(
     sec_user_id: Union[Unset, str] = "",
     unique_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定用户的信息/Get information of specified user
-
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id，优先使用sec_user_id获取用户信息。
-    - user_id: 用户uid，可选参数，纯数字，如果使用请保持sec_user_id以及unique_id为空。
-    - unique_id:
-    用户unique_id，可选参数，如果sec_user_id为空，则使用unique_id获取用户信息，unique_id也是用户的用户名，如果使用请保持sec_user_id以及user_id为空。
-    - 以上参数必须至少填写一个，优先级为sec_user_id > user_id > unique_id，优先级越高速度越快。
-    ### 返回:
-    - 用户信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    - user_id: User uid, optional parameter, pure number, if used, please keep sec_user_id and unique_id
-    empty.
-    - unique_id: User unique_id, optional parameter, if sec_user_id is empty, use unique_id to get user
-    information, unique_id is also the user's username, if used, please keep sec_user_id and user_id
-    empty.
-    - At least one of the above parameters must be filled in, the priority is sec_user_id > user_id >
-    unique_id, the higher the priority, the faster the speed.
-    ### Return:
-    - User information
-
-    # [示例/Example]
-    user_id = \"107955\"
-    sec_user_id = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    unique_id = \"tiktok\"
-
-    Args:
-        user_id (Union[Unset, str]): 用户uid （可选，纯数字）/User uid (optional, pure number) Default: ''.
-        sec_user_id (Union[Unset, str]): 用户sec_user_id/User sec_user_id Default: ''.
-        unique_id (Union[Unset, str]): 用户unique_id （用户名）/User unique_id (username) Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    kwargs = _get_kwargs(
-        user_id=user_id,
-        sec_user_id=sec_user_id,
-        unique_id=unique_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -184,12 +86,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        user_id=user_id,
-        sec_user_id=sec_user_id,
-        unique_id=unique_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -199,62 +96,9 @@ async def asyncio_detailed(
     sec_user_id: Union[Unset, str] = "",
     unique_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定用户的信息/Get information of specified user
-
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id，优先使用sec_user_id获取用户信息。
-    - user_id: 用户uid，可选参数，纯数字，如果使用请保持sec_user_id以及unique_id为空。
-    - unique_id:
-    用户unique_id，可选参数，如果sec_user_id为空，则使用unique_id获取用户信息，unique_id也是用户的用户名，如果使用请保持sec_user_id以及user_id为空。
-    - 以上参数必须至少填写一个，优先级为sec_user_id > user_id > unique_id，优先级越高速度越快。
-    ### 返回:
-    - 用户信息
+    """Like sync_detailed, for use with await"""
 
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    - user_id: User uid, optional parameter, pure number, if used, please keep sec_user_id and unique_id
-    empty.
-    - unique_id: User unique_id, optional parameter, if sec_user_id is empty, use unique_id to get user
-    information, unique_id is also the user's username, if used, please keep sec_user_id and user_id
-    empty.
-    - At least one of the above parameters must be filled in, the priority is sec_user_id > user_id >
-    unique_id, the higher the priority, the faster the speed.
-    ### Return:
-    - User information
-
-    # [示例/Example]
-    user_id = \"107955\"
-    sec_user_id = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    unique_id = \"tiktok\"
-
-    Args:
-        user_id (Union[Unset, str]): 用户uid （可选，纯数字）/User uid (optional, pure number) Default: ''.
-        sec_user_id (Union[Unset, str]): 用户sec_user_id/User sec_user_id Default: ''.
-        unique_id (Union[Unset, str]): 用户unique_id （用户名）/User unique_id (username) Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_id=user_id,
-        sec_user_id=sec_user_id,
-        unique_id=unique_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -264,58 +108,6 @@ async def asyncio(
     sec_user_id: Union[Unset, str] = "",
     unique_id: Union[Unset, str] = "",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定用户的信息/Get information of specified user
-
-     # [中文]
-    ### 用途:
-    - 获取指定用户的信息
-    ### 参数:
-    - sec_user_id: 用户sec_user_id，优先使用sec_user_id获取用户信息。
-    - user_id: 用户uid，可选参数，纯数字，如果使用请保持sec_user_id以及unique_id为空。
-    - unique_id:
-    用户unique_id，可选参数，如果sec_user_id为空，则使用unique_id获取用户信息，unique_id也是用户的用户名，如果使用请保持sec_user_id以及user_id为空。
-    - 以上参数必须至少填写一个，优先级为sec_user_id > user_id > unique_id，优先级越高速度越快。
-    ### 返回:
-    - 用户信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified user
-    ### Parameters:
-    - sec_user_id: User sec_user_id
-    - user_id: User uid, optional parameter, pure number, if used, please keep sec_user_id and unique_id
-    empty.
-    - unique_id: User unique_id, optional parameter, if sec_user_id is empty, use unique_id to get user
-    information, unique_id is also the user's username, if used, please keep sec_user_id and user_id
-    empty.
-    - At least one of the above parameters must be filled in, the priority is sec_user_id > user_id >
-    unique_id, the higher the priority, the faster the speed.
-    ### Return:
-    - User information
-
-    # [示例/Example]
-    user_id = \"107955\"
-    sec_user_id = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    unique_id = \"tiktok\"
-
-    Args:
-        user_id (Union[Unset, str]): 用户uid （可选，纯数字）/User uid (optional, pure number) Default: ''.
-        sec_user_id (Union[Unset, str]): 用户sec_user_id/User sec_user_id Default: ''.
-        unique_id (Union[Unset, str]): 用户unique_id （用户名）/User unique_id (username) Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            user_id=user_id,
-            sec_user_id=sec_user_id,
-            unique_id=unique_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,134 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    challenge_id: str,
-    count: Union[Unset, int] = 30,
-    cursor: Union[Unset, int] = 0,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["challengeID"] = challenge_id
-
-    params["count"] = count
+from ...types import Response, Unset
 
-    params["cursor"] = cursor
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/web/fetch_tag_post",
+    params={"challenge_id": "challengeID", "count": "count", "cursor": "cursor"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/web/fetch_tag_post",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, challenge_id: str, count: Union[Unset, int] = 30, cursor: Union[Unset, int] = 0) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    challenge_id: str,
-    count: Union[Unset, int] = 30,
-    cursor: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, challenge_id: str, count: Union[Unset, int] = 30, cursor: Union[Unset, int] = 0
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""Tag作品/Tag Post
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - Tag作品
-    ### 参数:
-    - challengeID: Tag ID
-    - count: 每页数量
-    - cursor: 翻页游标
-    ### 返回:
-    - Tag作品
-
-    # [English]
-    ### Purpose:
-    - Tag Post
-    ### Parameters:
-    - challengeID: Tag ID
-    - count: Number per page
-    - cursor: Page cursor
-    ### Return:
-    - Tag Post
-
-    # [示例/Example]
-    challengeID = \"7551\"
-    count = 30
-    cursor = 0
-
-    Args:
-        challenge_id (str): Tag ID
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        challenge_id=challenge_id,
-        count=count,
-        cursor=cursor,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    challenge_id: str,
-    count: Union[Unset, int] = 30,
-    cursor: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, challenge_id: str, count: Union[Unset, int] = 30, cursor: Union[Unset, int] = 0
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""Tag作品/Tag Post
 
@@ -170,124 +69,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        challenge_id=challenge_id,
-        count=count,
-        cursor=cursor,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    challenge_id: str,
-    count: Union[Unset, int] = 30,
-    cursor: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, challenge_id: str, count: Union[Unset, int] = 30, cursor: Union[Unset, int] = 0
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""Tag作品/Tag Post
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - Tag作品
-    ### 参数:
-    - challengeID: Tag ID
-    - count: 每页数量
-    - cursor: 翻页游标
-    ### 返回:
-    - Tag作品
-
-    # [English]
-    ### Purpose:
-    - Tag Post
-    ### Parameters:
-    - challengeID: Tag ID
-    - count: Number per page
-    - cursor: Page cursor
-    ### Return:
-    - Tag Post
-
-    # [示例/Example]
-    challengeID = \"7551\"
-    count = 30
-    cursor = 0
-
-    Args:
-        challenge_id (str): Tag ID
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        challenge_id=challenge_id,
-        count=count,
-        cursor=cursor,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    challenge_id: str,
-    count: Union[Unset, int] = 30,
-    cursor: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, challenge_id: str, count: Union[Unset, int] = 30, cursor: Union[Unset, int] = 0
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""Tag作品/Tag Post
-
-     # [中文]
-    ### 用途:
-    - Tag作品
-    ### 参数:
-    - challengeID: Tag ID
-    - count: 每页数量
-    - cursor: 翻页游标
-    ### 返回:
-    - Tag作品
-
-    # [English]
-    ### Purpose:
-    - Tag Post
-    ### Parameters:
-    - challengeID: Tag ID
-    - count: Number per page
-    - cursor: Page cursor
-    ### Return:
-    - Tag Post
-
-    # [示例/Example]
-    challengeID = \"7551\"
-    count = 30
-    cursor = 0
-
-    Args:
-        challenge_id (str): Tag ID
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            challenge_id=challenge_id,
-            count=count,
-            cursor=cursor,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,134 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    sec_uid: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 30,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["secUid"] = sec_uid
-
-    params["cursor"] = cursor
+from ...types import Response, Unset
 
-    params["count"] = count
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/tiktok/web/fetch_user_play_list",
+    params={"sec_uid": "secUid", "cursor": "cursor", "count": "count"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/tiktok/web/fetch_user_play_list",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, sec_uid: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 30) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, sec_uid: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 30
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的播放列表/Get user play list
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取用户的播放列表
-    ### 参数:
-    - secUid: 用户secUid
-    - cursor: 翻页游标
-    - count: 每页数量
-    ### 返回:
-    - 用户的播放列表
-
-    # [English]
-    ### Purpose:
-    - Get user play list
-    ### Parameters:
-    - secUid: User secUid
-    - cursor: Page cursor
-    - count: Number per page
-    ### Return:
-    - User play list
-
-    # [示例/Eample]
-    secUid = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    cursor = 0
-    count = 30
-
-    Args:
-        sec_uid (str): 用户secUid/User secUid
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_uid=sec_uid,
-        cursor=cursor,
-        count=count,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, sec_uid: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 30
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取用户的播放列表/Get user play list
 
@@ -170,124 +69,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        sec_uid=sec_uid,
-        cursor=cursor,
-        count=count,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, sec_uid: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 30
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的播放列表/Get user play list
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取用户的播放列表
-    ### 参数:
-    - secUid: 用户secUid
-    - cursor: 翻页游标
-    - count: 每页数量
-    ### 返回:
-    - 用户的播放列表
-
-    # [English]
-    ### Purpose:
-    - Get user play list
-    ### Parameters:
-    - secUid: User secUid
-    - cursor: Page cursor
-    - count: Number per page
-    ### Return:
-    - User play list
-
-    # [示例/Eample]
-    secUid = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    cursor = 0
-    count = 30
-
-    Args:
-        sec_uid (str): 用户secUid/User secUid
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        sec_uid=sec_uid,
-        cursor=cursor,
-        count=count,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    sec_uid: str,
-    cursor: Union[Unset, int] = 0,
-    count: Union[Unset, int] = 30,
+    *, client: AuthenticatedClient, sec_uid: str, cursor: Union[Unset, int] = 0, count: Union[Unset, int] = 30
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的播放列表/Get user play list
-
-     # [中文]
-    ### 用途:
-    - 获取用户的播放列表
-    ### 参数:
-    - secUid: 用户secUid
-    - cursor: 翻页游标
-    - count: 每页数量
-    ### 返回:
-    - 用户的播放列表
-
-    # [English]
-    ### Purpose:
-    - Get user play list
-    ### Parameters:
-    - secUid: User secUid
-    - cursor: Page cursor
-    - count: Number per page
-    ### Return:
-    - User play list
-
-    # [示例/Eample]
-    secUid = \"MS4wLjABAAAAv7iSuuXDJGDvJkmH_vz1qkDZYo1apxgzaxdBSeIuPiM\"
-    cursor = 0
-    count = 30
-
-    Args:
-        sec_uid (str): 用户secUid/User secUid
-        cursor (Union[Unset, int]): 翻页游标/Page cursor Default: 0.
-        count (Union[Unset, int]): 每页数量/Number per page Default: 30.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            sec_uid=sec_uid,
-            cursor=cursor,
-            count=count,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
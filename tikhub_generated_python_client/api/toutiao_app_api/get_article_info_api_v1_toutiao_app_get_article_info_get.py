@@ -1,117 +1,30 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    group_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["group_id"] = group_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/toutiao/app/get_article_info",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
-
-
-def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定文章的信息/Get information of specified article
-
-     # [中文]
-    ### 用途:
-    - 获取指定文章的信息
-    ### 参数:
-    - group_id: 作品ID，可以从链接中获取
-        - 例如: https://www.toutiao.com/article/7450114952884503059/
-    ### 返回:
-    - 作品信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - group_id: Post ID, can be obtained from the link
-        - For example: https://www.toutiao.com/article/7450114952884503059/
-    ### Return:
-    - Post information
-
-    # [示例/Example]
-    group_id = \"7450114952884503059\"
+from ...types import Response
 
-    Args:
-        group_id (str): 作品ID/Post ID
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/toutiao/app/get_article_info",
+    params={"group_id": "group_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
 
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+def _get_kwargs(*, group_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
-    kwargs = _get_kwargs(
-        group_id=group_id,
-    )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+def sync_detailed(*, client: AuthenticatedClient, group_id: str) -> Response[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
-def sync(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, group_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取指定文章的信息/Get information of specified article
 
      # [中文]
@@ -146,102 +59,18 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        group_id=group_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
+    *, client: AuthenticatedClient, group_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定文章的信息/Get information of specified article
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取指定文章的信息
-    ### 参数:
-    - group_id: 作品ID，可以从链接中获取
-        - 例如: https://www.toutiao.com/article/7450114952884503059/
-    ### 返回:
-    - 作品信息
+    return await ENDPOINT.asyncio_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - group_id: Post ID, can be obtained from the link
-        - For example: https://www.toutiao.com/article/7450114952884503059/
-    ### Return:
-    - Post information
-
-    # [示例/Example]
-    group_id = \"7450114952884503059\"
-
-    Args:
-        group_id (str): 作品ID/Post ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        group_id=group_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
 
+async def asyncio(*, client: AuthenticatedClient, group_id: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+    """Like sync, for use with await"""
 
-async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    group_id: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取指定文章的信息/Get information of specified article
-
-     # [中文]
-    ### 用途:
-    - 获取指定文章的信息
-    ### 参数:
-    - group_id: 作品ID，可以从链接中获取
-        - 例如: https://www.toutiao.com/article/7450114952884503059/
-    ### 返回:
-    - 作品信息
-
-    # [English]
-    ### Purpose:
-    - Get information of specified post
-    ### Parameters:
-    - group_id: Post ID, can be obtained from the link
-        - For example: https://www.toutiao.com/article/7450114952884503059/
-    ### Return:
-    - Post information
-
-    # [示例/Example]
-    group_id = \"7450114952884503059\"
-
-    Args:
-        group_id (str): 作品ID/Post ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
-
-    return (
-        await asyncio_detailed(
-            client=client,
-            group_id=group_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,121 +1,32 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    url_query: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["url"] = url_query
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/wechat_mp/web/fetch_mp_article_detail_json",
-        "params": params,
-    }
-
-    return _kwargs
-
+from ...types import Response
 
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/wechat_mp/web/fetch_mp_article_detail_json",
+    params={"url_query": "url"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
 
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, url_query: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
+    *, client: AuthenticatedClient, url_query: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章详情的JSON/Get Wechat MP Article Detail JSON
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章详情的JSON格式数据
-    - 此接口收费便宜，如果你需要获取详细的HTML格式数据，请使用`/api/v1/wechat_mp/web/fetch_mp_article_detail_html`接口，但是此接口收费更贵。
-    - 价格：0.001$/次
-    ### 参数:
-    - url: 文章链接
-    ### 返回:
-    - 文章详情的HTML
+    return ENDPOINT.sync_detailed(**locals())
 
-    # [English]
-    ### Purpose:
-    - Get WeChat MP Article Detail in JSON format
-    - This interface is cheaper, if you need detailed HTML format data, please use the
-    `/api/v1/wechat_mp/web/fetch_mp_article_detail_html` interface, but this interface is more
-    expensive.
-    - Price: 0.001$/time
-    ### Parameters:
-    - url: Article URL
-    ### Returns:
-    - Article Detail HTML
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/TSNQKkRpN1qbKsT7BvzqIw\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        url_query=url_query,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
 
-    return _build_response(client=client, response=response)
-
-
-def sync(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
+def sync(*, client: AuthenticatedClient, url_query: str) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取微信公众号文章详情的JSON/Get Wechat MP Article Detail JSON
 
      # [中文]
@@ -154,110 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        url_query=url_query,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
+    *, client: AuthenticatedClient, url_query: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章详情的JSON/Get Wechat MP Article Detail JSON
-
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章详情的JSON格式数据
-    - 此接口收费便宜，如果你需要获取详细的HTML格式数据，请使用`/api/v1/wechat_mp/web/fetch_mp_article_detail_html`接口，但是此接口收费更贵。
-    - 价格：0.001$/次
-    ### 参数:
-    - url: 文章链接
-    ### 返回:
-    - 文章详情的HTML
-
-    # [English]
-    ### Purpose:
-    - Get WeChat MP Article Detail in JSON format
-    - This interface is cheaper, if you need detailed HTML format data, please use the
-    `/api/v1/wechat_mp/web/fetch_mp_article_detail_html` interface, but this interface is more
-    expensive.
-    - Price: 0.001$/time
-    ### Parameters:
-    - url: Article URL
-    ### Returns:
-    - Article Detail HTML
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/TSNQKkRpN1qbKsT7BvzqIw\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        url_query=url_query,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
+    *, client: AuthenticatedClient, url_query: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章详情的JSON/Get Wechat MP Article Detail JSON
-
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章详情的JSON格式数据
-    - 此接口收费便宜，如果你需要获取详细的HTML格式数据，请使用`/api/v1/wechat_mp/web/fetch_mp_article_detail_html`接口，但是此接口收费更贵。
-    - 价格：0.001$/次
-    ### 参数:
-    - url: 文章链接
-    ### 返回:
-    - 文章详情的HTML
-
-    # [English]
-    ### Purpose:
-    - Get WeChat MP Article Detail in JSON format
-    - This interface is cheaper, if you need detailed HTML format data, please use the
-    `/api/v1/wechat_mp/web/fetch_mp_article_detail_html` interface, but this interface is more
-    expensive.
-    - Price: 0.001$/time
-    ### Parameters:
-    - url: Article URL
-    ### Returns:
-    - Article Detail HTML
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/TSNQKkRpN1qbKsT7BvzqIw\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            url_query=url_query,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,124 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response
-
-
-def _get_kwargs(
-    *,
-    url_query: str,
-    comment_id: str,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["url"] = url_query
+from ...types import Response
 
-    params["comment_id"] = comment_id
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/wechat_mp/web/fetch_mp_article_read_count",
+    params={"url_query": "url", "comment_id": "comment_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/wechat_mp/web/fetch_mp_article_read_count",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, url_query: str, comment_id: str) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
-    comment_id: str,
+    *, client: AuthenticatedClient, url_query: str, comment_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章阅读量/Get Wechat MP Article Read Count
-
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章阅读量
-    ### 参数:
-    - url: 文章链接
-    - comment_id: 评论ID
-    ### 返回:
-    - 阅读量
-
-    # [English]
-    ### Purpose:
-    - Get Wechat MP Article Read Count
-    ### Parameters:
-    - url: Article URL
-    - comment_id: Comment ID
-    ### Returns:
-    - Read Count
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/hrTDuwh0pWyJFYC93kKCrg\"
-    comment_id = \"3363399664632332289\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-        comment_id (str): 评论ID/Comment ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        url_query=url_query,
-        comment_id=comment_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
-    comment_id: str,
+    *, client: AuthenticatedClient, url_query: str, comment_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取微信公众号文章阅读量/Get Wechat MP Article Read Count
 
@@ -156,111 +65,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        url_query=url_query,
-        comment_id=comment_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
-    comment_id: str,
+    *, client: AuthenticatedClient, url_query: str, comment_id: str
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章阅读量/Get Wechat MP Article Read Count
-
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章阅读量
-    ### 参数:
-    - url: 文章链接
-    - comment_id: 评论ID
-    ### 返回:
-    - 阅读量
-
-    # [English]
-    ### Purpose:
-    - Get Wechat MP Article Read Count
-    ### Parameters:
-    - url: Article URL
-    - comment_id: Comment ID
-    ### Returns:
-    - Read Count
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/hrTDuwh0pWyJFYC93kKCrg\"
-    comment_id = \"3363399664632332289\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-        comment_id (str): 评论ID/Comment ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
+    """Like sync_detailed, for use with await"""
 
-    kwargs = _get_kwargs(
-        url_query=url_query,
-        comment_id=comment_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    url_query: str,
-    comment_id: str,
+    *, client: AuthenticatedClient, url_query: str, comment_id: str
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微信公众号文章阅读量/Get Wechat MP Article Read Count
-
-     # [中文]
-    ### 用途:
-    - 获取微信公众号文章阅读量
-    ### 参数:
-    - url: 文章链接
-    - comment_id: 评论ID
-    ### 返回:
-    - 阅读量
-
-    # [English]
-    ### Purpose:
-    - Get Wechat MP Article Read Count
-    ### Parameters:
-    - url: Article URL
-    - comment_id: Comment ID
-    ### Returns:
-    - Read Count
-
-    # [示例/Example]
-    url = \"https://mp.weixin.qq.com/s/hrTDuwh0pWyJFYC93kKCrg\"
-    comment_id = \"3363399664632332289\"
-
-    Args:
-        url_query (str): 文章链接/Article URL
-        comment_id (str): 评论ID/Comment ID
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            url_query=url_query,
-            comment_id=comment_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
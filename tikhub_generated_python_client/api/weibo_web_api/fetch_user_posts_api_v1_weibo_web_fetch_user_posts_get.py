@@ -1,134 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
-
-
-def _get_kwargs(
-    *,
-    uid: str,
-    page: Union[Unset, int] = 1,
-    feature: Union[Unset, int] = 0,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["uid"] = uid
-
-    params["page"] = page
+from ...types import Response, Unset
 
-    params["feature"] = feature
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/weibo/web/fetch_user_posts",
+    params={"uid": "uid", "page": "page", "feature": "feature"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/weibo/web/fetch_user_posts",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, uid: str, page: Union[Unset, int] = 1, feature: Union[Unset, int] = 0) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    uid: str,
-    page: Union[Unset, int] = 1,
-    feature: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, uid: str, page: Union[Unset, int] = 1, feature: Union[Unset, int] = 0
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微博用户文章数据/Get Weibo user article data
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取微博用户文章数据
-    ### 参数:
-    - uid: 用户id
-    - page: 页数
-    - feature: 特征
-    ### 返回:
-    - 用户文章数据
-
-    # [English]
-    ### Purpose:
-    - Get Weibo user article data
-    ### Parameters:
-    - uid: User id
-    - page: Page number
-    - feature: Feature
-    ### Return:
-    - User article data
-
-    # [示例/Example]
-    uid = \"7277477906\"
-    page = 1
-    feature = 0
-
-    Args:
-        uid (str): 用户id/User id
-        page (Union[Unset, int]): 页数/Page number Default: 1.
-        feature (Union[Unset, int]): 特征/Feature Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        uid=uid,
-        page=page,
-        feature=feature,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    uid: str,
-    page: Union[Unset, int] = 1,
-    feature: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, uid: str, page: Union[Unset, int] = 1, feature: Union[Unset, int] = 0
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取微博用户文章数据/Get Weibo user article data
 
@@ -170,124 +69,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        uid=uid,
-        page=page,
-        feature=feature,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    uid: str,
-    page: Union[Unset, int] = 1,
-    feature: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, uid: str, page: Union[Unset, int] = 1, feature: Union[Unset, int] = 0
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微博用户文章数据/Get Weibo user article data
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取微博用户文章数据
-    ### 参数:
-    - uid: 用户id
-    - page: 页数
-    - feature: 特征
-    ### 返回:
-    - 用户文章数据
-
-    # [English]
-    ### Purpose:
-    - Get Weibo user article data
-    ### Parameters:
-    - uid: User id
-    - page: Page number
-    - feature: Feature
-    ### Return:
-    - User article data
-
-    # [示例/Example]
-    uid = \"7277477906\"
-    page = 1
-    feature = 0
-
-    Args:
-        uid (str): 用户id/User id
-        page (Union[Unset, int]): 页数/Page number Default: 1.
-        feature (Union[Unset, int]): 特征/Feature Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        uid=uid,
-        page=page,
-        feature=feature,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    uid: str,
-    page: Union[Unset, int] = 1,
-    feature: Union[Unset, int] = 0,
+    *, client: AuthenticatedClient, uid: str, page: Union[Unset, int] = 1, feature: Union[Unset, int] = 0
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取微博用户文章数据/Get Weibo user article data
-
-     # [中文]
-    ### 用途:
-    - 获取微博用户文章数据
-    ### 参数:
-    - uid: 用户id
-    - page: 页数
-    - feature: 特征
-    ### 返回:
-    - 用户文章数据
-
-    # [English]
-    ### Purpose:
-    - Get Weibo user article data
-    ### Parameters:
-    - uid: User id
-    - page: Page number
-    - feature: Feature
-    ### Return:
-    - User article data
-
-    # [示例/Example]
-    uid = \"7277477906\"
-    page = 1
-    feature = 0
-
-    Args:
-        uid (str): 用户id/User id
-        page (Union[Unset, int]): 页数/Page number Default: 1.
-        feature (Union[Unset, int]): 特征/Feature Default: 0.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            uid=uid,
-            page=page,
-            feature=feature,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,129 +1,33 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
 from ...types import UNSET, Response, Unset
 
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/xiaohongshu/web/get_user_notes",
+    params={"user_id": "user_id", "last_cursor": "lastCursor"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
-def _get_kwargs(
-    *,
-    user_id: str,
-    last_cursor: Union[Unset, str] = UNSET,
-) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["user_id"] = user_id
-
-    params["lastCursor"] = last_cursor
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/xiaohongshu/web/get_user_notes",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
 
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+def _get_kwargs(*, user_id: str, last_cursor: Union[Unset, str] = UNSET) -> dict[str, Any]:
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
-    *,
-    client: AuthenticatedClient,
-    user_id: str,
-    last_cursor: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, user_id: str, last_cursor: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的笔记 V1/Get user notes V1
-
-     # [中文]
-    ### 用途:
-    - 获取用户的笔记 V1
-    ### 参数:
-    - user_id: 用户ID，可以从小红书的分享链接中获取
-    - lastCursor: 第一次请求时为空，之后请求时使用上一次请求响应中返回的最后一个NoteID
-        - 例如: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### 返回:
-    - 用户的笔记列表
-
-    # [English]
-    ### Purpose:
-    - Get user notes V1
-    ### Parameters:
-    - user_id: User ID, can be obtained from the sharing link of Xiaohongshu website.
-    - lastCursor: Last cursor, empty for the first request, use the last NoteID returned in the last
-    response for subsequent requests
-        - Example: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### Return:
-    - User notes list
-
-    # [示例/Example]
-    user_id=\"5f4a10070000000001006fc7\"
-    lastCursor=None
-
-    Args:
-        user_id (str): 用户ID/User ID
-        last_cursor (Union[Unset, str]): 上一页的游标/Last cursor
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_id=user_id,
-        last_cursor=last_cursor,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
-    *,
-    client: AuthenticatedClient,
-    user_id: str,
-    last_cursor: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, user_id: str, last_cursor: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
     r"""获取用户的笔记 V1/Get user notes V1
 
@@ -166,121 +70,20 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        user_id=user_id,
-        last_cursor=last_cursor,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
-    *,
-    client: AuthenticatedClient,
-    user_id: str,
-    last_cursor: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, user_id: str, last_cursor: Union[Unset, str] = UNSET
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的笔记 V1/Get user notes V1
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取用户的笔记 V1
-    ### 参数:
-    - user_id: 用户ID，可以从小红书的分享链接中获取
-    - lastCursor: 第一次请求时为空，之后请求时使用上一次请求响应中返回的最后一个NoteID
-        - 例如: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### 返回:
-    - 用户的笔记列表
-
-    # [English]
-    ### Purpose:
-    - Get user notes V1
-    ### Parameters:
-    - user_id: User ID, can be obtained from the sharing link of Xiaohongshu website.
-    - lastCursor: Last cursor, empty for the first request, use the last NoteID returned in the last
-    response for subsequent requests
-        - Example: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### Return:
-    - User notes list
-
-    # [示例/Example]
-    user_id=\"5f4a10070000000001006fc7\"
-    lastCursor=None
-
-    Args:
-        user_id (str): 用户ID/User ID
-        last_cursor (Union[Unset, str]): 上一页的游标/Last cursor
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_id=user_id,
-        last_cursor=last_cursor,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
-    *,
-    client: AuthenticatedClient,
-    user_id: str,
-    last_cursor: Union[Unset, str] = UNSET,
+    *, client: AuthenticatedClient, user_id: str, last_cursor: Union[Unset, str] = UNSET
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取用户的笔记 V1/Get user notes V1
-
-     # [中文]
-    ### 用途:
-    - 获取用户的笔记 V1
-    ### 参数:
-    - user_id: 用户ID，可以从小红书的分享链接中获取
-    - lastCursor: 第一次请求时为空，之后请求时使用上一次请求响应中返回的最后一个NoteID
-        - 例如: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### 返回:
-    - 用户的笔记列表
-
-    # [English]
-    ### Purpose:
-    - Get user notes V1
-    ### Parameters:
-    - user_id: User ID, can be obtained from the sharing link of Xiaohongshu website.
-    - lastCursor: Last cursor, empty for the first request, use the last NoteID returned in the last
-    response for subsequent requests
-        - Example: \"662908190000000001007366\"
-        - JSON Path: $.data.data.notes.[-1].id
-    ### Return:
-    - User notes list
-
-    # [示例/Example]
-    user_id=\"5f4a10070000000001006fc7\"
-    lastCursor=None
-
-    Args:
-        user_id (str): 用户ID/User ID
-        last_cursor (Union[Unset, str]): 上一页的游标/Last cursor
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            user_id=user_id,
-            last_cursor=last_cursor,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
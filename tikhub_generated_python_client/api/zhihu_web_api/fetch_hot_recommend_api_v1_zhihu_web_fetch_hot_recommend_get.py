@@ -1,66 +1,23 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/zhihu/web/fetch_hot_recommend",
+    params={"offset": "offset", "page_number": "page_number", "session_token": "session_token"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
-    *,
-    offset: Union[Unset, str] = "0",
-    page_number: Union[Unset, str] = "1",
-    session_token: Union[Unset, str] = "",
+    *, offset: Union[Unset, str] = "0", page_number: Union[Unset, str] = "1", session_token: Union[Unset, str] = ""
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["offset"] = offset
-
-    params["page_number"] = page_number
-
-    params["session_token"] = session_token
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/zhihu/web/fetch_hot_recommend",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -70,55 +27,9 @@ def sync_detailed(
     page_number: Union[Unset, str] = "1",
     session_token: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎首页推荐/Get Zhihu Hot Recommend
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-     # [中文]
-    ### 用途:
-    - 获取知乎首页推荐
-    ### 参数:
-    - offset: 偏移量
-    - page_number: 页码
-    - session_token: 会话令牌
-    ### 返回:
-    - 知乎首页推荐
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Hot Recommend
-    ### Parameters:
-    - offset: Offset
-    - page_number: Page Number
-    - session_token: Session Token
-
-    # [示例/Example]
-    offset = \"0\"
-    page_number = \"1\"
-    session_token = \"\"
-
-    Args:
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        page_number (Union[Unset, str]): 页码/Page Number Default: '1'.
-        session_token (Union[Unset, str]): 会话令牌/Session Token Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        offset=offset,
-        page_number=page_number,
-        session_token=session_token,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -166,12 +77,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        offset=offset,
-        page_number=page_number,
-        session_token=session_token,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -181,53 +87,9 @@ async def asyncio_detailed(
     page_number: Union[Unset, str] = "1",
     session_token: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎首页推荐/Get Zhihu Hot Recommend
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取知乎首页推荐
-    ### 参数:
-    - offset: 偏移量
-    - page_number: 页码
-    - session_token: 会话令牌
-    ### 返回:
-    - 知乎首页推荐
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Hot Recommend
-    ### Parameters:
-    - offset: Offset
-    - page_number: Page Number
-    - session_token: Session Token
-
-    # [示例/Example]
-    offset = \"0\"
-    page_number = \"1\"
-    session_token = \"\"
-
-    Args:
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        page_number (Union[Unset, str]): 页码/Page Number Default: '1'.
-        session_token (Union[Unset, str]): 会话令牌/Session Token Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        offset=offset,
-        page_number=page_number,
-        session_token=session_token,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -237,49 +99,6 @@ async def asyncio(
     page_number: Union[Unset, str] = "1",
     session_token: Union[Unset, str] = "",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎首页推荐/Get Zhihu Hot Recommend
-
-     # [中文]
-    ### 用途:
-    - 获取知乎首页推荐
-    ### 参数:
-    - offset: 偏移量
-    - page_number: 页码
-    - session_token: 会话令牌
-    ### 返回:
-    - 知乎首页推荐
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Hot Recommend
-    ### Parameters:
-    - offset: Offset
-    - page_number: Page Number
-    - session_token: Session Token
-
-    # [示例/Example]
-    offset = \"0\"
-    page_number = \"1\"
-    session_token = \"\"
-
-    Args:
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        page_number (Union[Unset, str]): 页码/Page Number Default: '1'.
-        session_token (Union[Unset, str]): 会话令牌/Session Token Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            offset=offset,
-            page_number=page_number,
-            session_token=session_token,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,13 +1,17 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/zhihu/web/fetch_salt_search_v3",
+    params={"keyword": "keyword", "offset": "offset", "limit": "limit", "search_hash_id": "search_hash_id"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
@@ -17,53 +21,7 @@ def _get_kwargs(
     limit: Union[Unset, str] = "20",
     search_hash_id: Union[Unset, str] = "",
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["keyword"] = keyword
-
-    params["offset"] = offset
-
-    params["limit"] = limit
-
-    params["search_hash_id"] = search_hash_id
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/zhihu/web/fetch_salt_search_v3",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -74,62 +32,9 @@ def sync_detailed(
     limit: Union[Unset, str] = "20",
     search_hash_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎盐选内容搜索V3/Get Zhihu Salt Search V3
-
-     # [中文]
-    ### 用途:
-    - 获取知乎盐选内容搜索V3
-    ### 参数:
-    - keyword: 搜索关键词
-    - offset: 偏移量
-    - limit: 每页内容数量
-    - search_hash_id: 搜索哈希ID
-    ### 返回:
-    - 知乎盐选内容搜索V3
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Salt Search V3
-    ### Parameters:
-    - keyword: Search Keywords
-    - offset: Offset
-    - limit: Number of contents per page
-    - search_hash_id: Search Hash ID
-    ### Returns:
-    - Zhihu Salt Search V3
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    # [示例/Example]
-    keyword = \"deepseek\"
-    limit = \"20\"
-    offset = \"0\"
-    search_hash_id = \"\"
-
-    Args:
-        keyword (str): 搜索关键词/Search Keywords
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页内容数量/Number of contents per page Default: '20'.
-        search_hash_id (Union[Unset, str]): 搜索哈希ID/Search Hash ID Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        limit=limit,
-        search_hash_id=search_hash_id,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -184,13 +89,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        keyword=keyword,
-        offset=offset,
-        limit=limit,
-        search_hash_id=search_hash_id,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -201,60 +100,9 @@ async def asyncio_detailed(
     limit: Union[Unset, str] = "20",
     search_hash_id: Union[Unset, str] = "",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎盐选内容搜索V3/Get Zhihu Salt Search V3
-
-     # [中文]
-    ### 用途:
-    - 获取知乎盐选内容搜索V3
-    ### 参数:
-    - keyword: 搜索关键词
-    - offset: 偏移量
-    - limit: 每页内容数量
-    - search_hash_id: 搜索哈希ID
-    ### 返回:
-    - 知乎盐选内容搜索V3
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Salt Search V3
-    ### Parameters:
-    - keyword: Search Keywords
-    - offset: Offset
-    - limit: Number of contents per page
-    - search_hash_id: Search Hash ID
-    ### Returns:
-    - Zhihu Salt Search V3
+    """Like sync_detailed, for use with await"""
 
-    # [示例/Example]
-    keyword = \"deepseek\"
-    limit = \"20\"
-    offset = \"0\"
-    search_hash_id = \"\"
-
-    Args:
-        keyword (str): 搜索关键词/Search Keywords
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页内容数量/Number of contents per page Default: '20'.
-        search_hash_id (Union[Unset, str]): 搜索哈希ID/Search Hash ID Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        keyword=keyword,
-        offset=offset,
-        limit=limit,
-        search_hash_id=search_hash_id,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -265,56 +113,6 @@ async def asyncio(
     limit: Union[Unset, str] = "20",
     search_hash_id: Union[Unset, str] = "",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎盐选内容搜索V3/Get Zhihu Salt Search V3
-
-     # [中文]
-    ### 用途:
-    - 获取知乎盐选内容搜索V3
-    ### 参数:
-    - keyword: 搜索关键词
-    - offset: 偏移量
-    - limit: 每页内容数量
-    - search_hash_id: 搜索哈希ID
-    ### 返回:
-    - 知乎盐选内容搜索V3
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu Salt Search V3
-    ### Parameters:
-    - keyword: Search Keywords
-    - offset: Offset
-    - limit: Number of contents per page
-    - search_hash_id: Search Hash ID
-    ### Returns:
-    - Zhihu Salt Search V3
-
-    # [示例/Example]
-    keyword = \"deepseek\"
-    limit = \"20\"
-    offset = \"0\"
-    search_hash_id = \"\"
-
-    Args:
-        keyword (str): 搜索关键词/Search Keywords
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页内容数量/Number of contents per page Default: '20'.
-        search_hash_id (Union[Unset, str]): 搜索哈希ID/Search Hash ID Default: ''.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            keyword=keyword,
-            offset=offset,
-            limit=limit,
-            search_hash_id=search_hash_id,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -1,66 +1,23 @@
-from http import HTTPStatus
 from typing import Any, Optional, Union
 
-import httpx
-
-from ... import errors
-from ...client import AuthenticatedClient, Client
+from ...client import AuthenticatedClient
+from ...endpoint import Endpoint
 from ...models.http_validation_error import HTTPValidationError
 from ...models.response_model import ResponseModel
-from ...types import UNSET, Response, Unset
+from ...types import Response, Unset
+
+ENDPOINT = Endpoint(
+    method="get",
+    url="/api/v1/zhihu/web/fetch_user_follow_collections",
+    params={"user_url_token": "user_url_token", "offset": "offset", "limit": "limit"},
+    responses={200: ResponseModel, 422: HTTPValidationError},
+)
 
 
 def _get_kwargs(
-    *,
-    user_url_token: str,
-    offset: Union[Unset, str] = "0",
-    limit: Union[Unset, str] = "20",
+    *, user_url_token: str, offset: Union[Unset, str] = "0", limit: Union[Unset, str] = "20"
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {}
-
-    params["user_url_token"] = user_url_token
-
-    params["offset"] = offset
-
-    params["limit"] = limit
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
-    _kwargs: dict[str, Any] = {
-        "method": "get",
-        "url": "/api/v1/zhihu/web/fetch_user_follow_collections",
-        "params": params,
-    }
-
-    return _kwargs
-
-
-def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    if response.status_code == 200:
-        response_200 = ResponseModel.from_dict(response.json())
-
-        return response_200
-    if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
-
-        return response_422
-    if client.raise_on_unexpected_status:
-        raise errors.UnexpectedStatus(response.status_code, response.content)
-    else:
-        return None
-
-
-def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    return Response(
-        status_code=HTTPStatus(response.status_code),
-        content=response.content,
-        headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
-    )
+    return ENDPOINT.request_kwargs(**locals())
 
 
 def sync_detailed(
@@ -70,57 +27,9 @@ def sync_detailed(
     offset: Union[Unset, str] = "0",
     limit: Union[Unset, str] = "20",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎用户关注的收藏/Get Zhihu User Follow Collections
-
-     # [中文]
-    ### 用途:
-    - 获取知乎用户关注的收藏
-    ### 参数:
-    - user_url_token: 用户ID
-    - offset: 偏移量
-    - limit: 每页收藏数量
-    ### 返回:
-    - 知乎用户关注的收藏
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu User Follow Collections
-    ### Parameters:
-    - user_url_token: User ID
-    - offset: Offset
-    - limit: Number of collections per page
-    ### Returns:
-    - Zhihu User Follow Collections
-
-    # [示例/Example]
-    user_url_token = \"ming-he-43-93\"
-    offset = \"0\"
-    limit = \"20\"
+    """Like sync, but returns the whole Response: status code, headers and content as well as the parsed value"""
 
-    Args:
-        user_url_token (str): 用户ID/User ID
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页收藏数量/Number of collections per page Default: '20'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_url_token=user_url_token,
-        offset=offset,
-        limit=limit,
-    )
-
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return ENDPOINT.sync_detailed(**locals())
 
 
 def sync(
@@ -170,12 +79,7 @@ def sync(
         Union[HTTPValidationError, ResponseModel]
     """
 
-    return sync_detailed(
-        client=client,
-        user_url_token=user_url_token,
-        offset=offset,
-        limit=limit,
-    ).parsed
+    return ENDPOINT.sync(**locals())
 
 
 async def asyncio_detailed(
@@ -185,55 +89,9 @@ async def asyncio_detailed(
     offset: Union[Unset, str] = "0",
     limit: Union[Unset, str] = "20",
 ) -> Response[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎用户关注的收藏/Get Zhihu User Follow Collections
+    """Like sync_detailed, for use with await"""
 
-     # [中文]
-    ### 用途:
-    - 获取知乎用户关注的收藏
-    ### 参数:
-    - user_url_token: 用户ID
-    - offset: 偏移量
-    - limit: 每页收藏数量
-    ### 返回:
-    - 知乎用户关注的收藏
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu User Follow Collections
-    ### Parameters:
-    - user_url_token: User ID
-    - offset: Offset
-    - limit: Number of collections per page
-    ### Returns:
-    - Zhihu User Follow Collections
-
-    # [示例/Example]
-    user_url_token = \"ming-he-43-93\"
-    offset = \"0\"
-    limit = \"20\"
-
-    Args:
-        user_url_token (str): 用户ID/User ID
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页收藏数量/Number of collections per page Default: '20'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Response[Union[HTTPValidationError, ResponseModel]]
-    """
-
-    kwargs = _get_kwargs(
-        user_url_token=user_url_token,
-        offset=offset,
-        limit=limit,
-    )
-
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await ENDPOINT.asyncio_detailed(**locals())
 
 
 async def asyncio(
@@ -243,51 +101,6 @@ async def asyncio(
     offset: Union[Unset, str] = "0",
     limit: Union[Unset, str] = "20",
 ) -> Optional[Union[HTTPValidationError, ResponseModel]]:
-    r"""获取知乎用户关注的收藏/Get Zhihu User Follow Collections
-
-     # [中文]
-    ### 用途:
-    - 获取知乎用户关注的收藏
-    ### 参数:
-    - user_url_token: 用户ID
-    - offset: 偏移量
-    - limit: 每页收藏数量
-    ### 返回:
-    - 知乎用户关注的收藏
-
-    # [English]
-    ### Purpose:
-    - Get Zhihu User Follow Collections
-    ### Parameters:
-    - user_url_token: User ID
-    - offset: Offset
-    - limit: Number of collections per page
-    ### Returns:
-    - Zhihu User Follow Collections
-
-    # [示例/Example]
-    user_url_token = \"ming-he-43-93\"
-    offset = \"0\"
-    limit = \"20\"
-
-    Args:
-        user_url_token (str): 用户ID/User ID
-        offset (Union[Unset, str]): 偏移量/Offset Default: '0'.
-        limit (Union[Unset, str]): 每页收藏数量/Number of collections per page Default: '20'.
-
-    Raises:
-        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
-        httpx.TimeoutException: If the request takes longer than Client.timeout.
-
-    Returns:
-        Union[HTTPValidationError, ResponseModel]
-    """
+    """Like sync, for use with await"""
 
-    return (
-        await asyncio_detailed(
-            client=client,
-            user_url_token=user_url_token,
-            offset=offset,
-            limit=limit,
-        )
-    ).parsed
+    return await ENDPOINT.asyncio(**locals())
@@ -0,0 +1,229 @@
+"""Contains response archives: files that raw response bodies are appended to, without decoding them
+
+Each record is a small JSON envelope (endpoint, method, query parameters, JSON request body, timestamp, status) and
+the response body exactly as received. Two formats are supported:
+
+    ``"ndjson"``: one JSON object per line, with the body spliced in as its last value, ``"body"``. Newlines in the
+    body are turned into spaces, which does not change JSON (they can only appear between tokens). The first key,
+    ``"body_length"``, says where the body starts, since ``,"body":`` can also appear in the params or in the body
+    itself. Bodies that are not JSON are stored base64-encoded as ``"body_base64"``.
+
+    ``"length_prefixed"``: the lengths of the envelope and of the body as two big-endian 32-bit integers, followed by
+    the envelope and the body as they are.
+
+Records are buffered and written in blocks, optionally as zstd frames (``compression="zstd"``, which needs the
+zstandard package: ``pip install "tikhub_generated_python_client[zstd]"``). Every block is a complete frame, so an
+archive stays readable up to its last flush even if the process dies.
+"""
+
+import base64
+import json
+import os
+import re
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from typing import IO, Any, Literal, Optional, Union
+
+import httpx
+from attrs import define
+
+ArchiveFormat = Literal["ndjson", "length_prefixed"]
+ArchiveCompression = Optional[Literal["zstd"]]
+
+# Separates the envelope of an NDJSON record from the JSON body spliced in after it
+BODY_KEY = b',"body":'
+_BODY_LENGTH = re.compile(rb'\{"body_length":(\d+),')
+_LENGTHS = struct.Struct(">II")
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            'zstd compression needs zstandard, install it with: pip install "tikhub_generated_python_client[zstd]"'
+        ) from None
+    return zstandard
+
+
+def _envelope(response: httpx.Response, timestamp: Optional[float]) -> dict[str, Any]:
+    request = response.request
+    envelope: dict[str, Any] = {
+        "endpoint": request.url.path,
+        "method": request.method,
+        "params": dict(request.url.params.items()),
+        "timestamp": time.time() if timestamp is None else timestamp,
+        "status": response.status_code,
+    }
+    if request.content and request.headers.get("Content-Type", "").startswith("application/json"):
+        # Kept as text: a JSON object here could hold a "body" key and throw off where readers find the body
+        envelope["json"] = request.content.decode()
+    return envelope
+
+
+def _is_json(response: httpx.Response) -> bool:
+    return "json" in response.headers.get("Content-Type", "") and response.content.lstrip()[:1] in (b"{", b"[")
+
+
+@define
+class ArchivedResponse:
+    """A record read back from an archive
+
+    Attributes:
+        envelope: The metadata written with the body: endpoint, method, params, timestamp, status and, for requests
+            with a JSON body, json (decoded again)
+        content: The response body (for the ndjson format, with newlines turned into spaces)
+    """
+
+    envelope: dict[str, Any]
+    content: bytes
+
+
+class ResponseArchive:
+    """Appends responses to an archive file, see the module documentation for the formats
+
+    Set it as a client's ``archive`` to archive the response of every endpoint call, or ``write`` httpx responses to
+    it directly. It can be shared by threads and clients; use it as a context manager, or call ``close`` once done.
+
+    Attributes:
+        path: The path of the archive, created if it does not exist and appended to otherwise
+        format: "ndjson" or "length_prefixed"
+        compression: None or "zstd"
+        buffer_size: The number of bytes of records buffered before they are written out (as one zstd frame)
+        level: The zstd compression level
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        format: ArchiveFormat = "ndjson",
+        compression: ArchiveCompression = None,
+        buffer_size: int = 1 << 20,
+        level: int = 3,
+    ):
+        if format not in ("ndjson", "length_prefixed"):
+            raise ValueError(f"Unknown archive format {format!r}, expected 'ndjson' or 'length_prefixed'")
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.level = level
+        self._compressor = _import_zstandard().ZstdCompressor(level=level) if compression == "zstd" else None
+        self._file: Optional[IO[bytes]] = open(path, "ab")
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def write(self, response: httpx.Response, *, timestamp: Optional[float] = None) -> None:
+        """Append a response that has been read, with the current time unless ``timestamp`` is given"""
+        envelope = _envelope(response, timestamp)
+        content = response.content
+        if self.format == "length_prefixed":
+            header = json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode()
+            record = b"".join((_LENGTHS.pack(len(header), len(content)), header, content))
+        elif _is_json(response):
+            if b"\n" in content or b"\r" in content:
+                content = content.replace(b"\n", b" ").replace(b"\r", b" ")
+            envelope = {"body_length": len(content), **envelope}
+            header = json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode()
+            record = b"".join((header[:-1], BODY_KEY, content, b"}\n"))
+        else:
+            envelope["body_base64"] = base64.b64encode(content).decode()
+            record = json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            if self._file is None:
+                raise ValueError(f"The archive {self.path} is closed")
+            self._buffer += record
+            if len(self._buffer) >= self.buffer_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer or self._file is None:
+            return
+        block = bytes(self._buffer)
+        self._file.write(self._compressor.compress(block) if self._compressor is not None else block)
+        self._file.flush()
+        self._buffer.clear()
+
+    def flush(self) -> None:
+        """Write out the buffered records"""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Write out the buffered records and close the file"""
+        with self._lock:
+            self._flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_archive(
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    format: ArchiveFormat = "ndjson",
+    compression: ArchiveCompression = None,
+) -> Iterator[ArchivedResponse]:
+    """Read back the records of an archive, in the order they were written
+
+    Bodies are not decoded: for the ndjson format, only the envelope before ``"body"`` is.
+    """
+    with open(path, "rb") as file:
+        stream: IO[bytes] = file
+        if compression == "zstd":
+            stream = _import_zstandard().ZstdDecompressor().stream_reader(file, read_across_frames=True)
+        if format == "length_prefixed":
+            while header_lengths := stream.read(_LENGTHS.size):
+                header_length, content_length = _LENGTHS.unpack(header_lengths)
+                envelope = json.loads(stream.read(header_length))
+                yield _archived(envelope, stream.read(content_length))
+            return
+        buffered = stream if compression is None else _lines(stream)
+        for line in buffered:
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            match = _BODY_LENGTH.match(line)
+            if match is None:
+                envelope = json.loads(line)
+                yield _archived(envelope, base64.b64decode(envelope.pop("body_base64", "")))
+                continue
+            # The body ends right before the closing brace of the line
+            body_start = len(line) - 1 - int(match.group(1))
+            envelope = json.loads(line[: body_start - len(BODY_KEY)] + b"}")
+            del envelope["body_length"]
+            yield _archived(envelope, line[body_start:-1])
+
+
+def _archived(envelope: dict[str, Any], content: bytes) -> ArchivedResponse:
+    if "json" in envelope:
+        envelope["json"] = json.loads(envelope["json"])
+    return ArchivedResponse(envelope, content)
+
+
+def _lines(stream: IO[bytes]) -> Iterator[bytes]:
+    rest = b""
+    while chunk := stream.read(1 << 20):
+        *lines, rest = (rest + chunk).split(b"\n")
+        yield from lines
+    if rest:
+        yield rest
+
+
+__all__ = [
+    "BODY_KEY",
+    "ArchiveCompression",
+    "ArchiveFormat",
+    "ArchivedResponse",
+    "ResponseArchive",
+    "read_archive",
+]
@@ -0,0 +1,346 @@
+"""Contains helpers for batch endpoints, which take a list of IDs and cost the same for one ID as for a full batch
+
+A MicroBatcher groups single-item lookups made one at a time: every caller asks for one item
+(``await batcher.get(aweme_id)``) while it collects the keys for a few milliseconds, or until a batch is full, sends
+them in one request and hands each caller its item. ``sweep`` splits a large set of keys known up front into
+batches and sends them concurrently.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from types import ModuleType
+from typing import Any, Generic, Optional, TypeVar, Union
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .decoding import default_json_loads
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def _retrieve_exception(future: "asyncio.Future[Any]") -> None:
+    # Every caller of a key may have given up, which is no reason to log its exception as never retrieved
+    if not future.cancelled():
+        future.exception()
+
+
+class MicroBatcher(Generic[K, V]):
+    """Collects keys asked for one at a time into batches
+
+    A batch is sent as soon as it holds ``max_batch_size`` keys, or ``max_wait`` seconds after its first key arrived.
+    Keys the batch's result does not have are looked up one by one with ``fetch_one`` (if given); keys that are
+    still not found give None. Callers asking for a key that is already waiting share its result. If a batch
+    request fails, every caller of that batch gets the exception; if a single lookup fails, only that key's callers
+    do.
+
+    A batcher belongs to the event loop it is first used in. Call ``aclose`` (or use ``async with``) to send the
+    last batch and wait for the requests still running.
+
+    Attributes:
+        fetch_batch: Gets the items of a list of keys, as a dict that leaves out the keys it has no item for
+        fetch_one: Gets the item of a single key, or None if there is none
+        max_batch_size: The most keys sent in one batch
+        max_wait: The most seconds a key waits for its batch to fill up
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[list[K]], Awaitable[dict[K, V]]],
+        fetch_one: Optional[Callable[[K], Awaitable[Optional[V]]]] = None,
+        *,
+        max_batch_size: int = 10,
+        max_wait: float = 0.01,
+    ):
+        self.fetch_batch = fetch_batch
+        self.fetch_one = fetch_one
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._waiting: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._pending: list[K] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def get(self, key: K) -> Optional[V]:
+        """Get the item of ``key``, or None if there is none"""
+        future = self._waiting.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._waiting[key] = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+            self._pending.append(key)
+            if len(self._pending) >= self.max_batch_size:
+                self._send()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait, self._send)
+        # A caller giving up must not cancel the result for the others waiting for the same key
+        return await asyncio.shield(future)
+
+    def _send(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[K]) -> None:
+        try:
+            try:
+                items: dict[K, Any] = await self.fetch_batch(batch)
+            except Exception as error:
+                items = dict.fromkeys(batch, error)
+            else:
+                missing = [key for key in batch if key not in items]
+                if missing and self.fetch_one is not None:
+                    # Each key looked up on its own only fails its own callers
+                    found = await asyncio.gather(*(self.fetch_one(key) for key in missing), return_exceptions=True)
+                    items = {**items, **dict(zip(missing, found))}
+            for key in batch:
+                item = items.get(key)
+                if isinstance(item, Exception):
+                    self._waiting.pop(key).set_exception(item)
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    self._waiting.pop(key).set_result(item)
+        finally:
+            # Only left over if this task was cancelled
+            for key in batch:
+                future = self._waiting.pop(key, None)
+                if future is not None:
+                    future.cancel()
+
+    async def flush(self) -> None:
+        """Send the keys collected so far without waiting for the batch to fill up, and wait for every batch"""
+        self._send()
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def aclose(self) -> None:
+        """Same as flush"""
+        await self.flush()
+
+    async def __aenter__(self) -> "MicroBatcher[K, V]":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+async def fetch_data(endpoint: ModuleType, *, client: Union[AuthenticatedClient, Client], **kwargs: Any) -> Any:
+    """Call an endpoint module and get the ``data`` of its decoded response body, without building models
+
+    Raises:
+        errors.UnexpectedStatus: If the response status, or the ``code`` of its body, is not 200.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """
+    response = await client.get_async_httpx_client().request(**endpoint._get_kwargs(**kwargs))
+    if response.status_code != 200:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    body = (client.json_loads or default_json_loads())(response.content)
+    # The API also reports failures it has no status for as a 200 with another code in the body
+    if not isinstance(body, dict) or body.get("code", 200) != 200:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return body.get("data")
+
+
+def _is_not_found(error: errors.UnexpectedStatus) -> bool:
+    # A 404 response, or a 200 response whose body code is 404
+    if error.status_code == 404:
+        return True
+    try:
+        body = default_json_loads()(error.content)
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("code") == 404
+
+
+def find_awemes(data: Any, depth: int = 3) -> dict[str, dict[str, Any]]:
+    """Find the awemes (dicts with an ``aweme_id``) in decoded JSON, by ID, looking at most ``depth`` levels deep"""
+    found: dict[str, dict[str, Any]] = {}
+    if isinstance(data, dict):
+        if "aweme_id" in data:
+            found[str(data["aweme_id"])] = data
+        elif depth:
+            for value in data.values():
+                found.update(find_awemes(value, depth - 1))
+    elif isinstance(data, list) and depth:
+        for value in data:
+            found.update(find_awemes(value, depth - 1))
+    return found
+
+
+async def sweep(
+    keys: Iterable[K],
+    fetch_chunk: Callable[[list[K]], Awaitable[dict[K, V]]],
+    *,
+    chunk_size: int,
+    concurrency: int = 8,
+    retries: int = 2,
+    retry_delay: float = 0.5,
+) -> dict[K, V]:
+    """Get the items of all ``keys`` by sending them in chunks of ``chunk_size`` to ``fetch_chunk``
+
+    Duplicate keys are sent once. Up to ``concurrency`` chunks are in flight at a time. The chunks that fail (raise)
+    are sent again, up to ``retries`` more times, ``retry_delay`` seconds after the first round and twice as long
+    after each further one; the chunks that succeeded are not.
+
+    Returns:
+        The items of every chunk merged into one dict. Keys ``fetch_chunk`` had no item for are left out.
+
+    Raises:
+        errors.PartialSweepError: If chunks still fail after their retries. It holds the results of the others.
+    """
+    unique = list(dict.fromkeys(keys))
+    chunks = [unique[start : start + chunk_size] for start in range(0, len(unique), chunk_size)]
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[K, V] = {}
+
+    async def run(chunk: list[K]) -> dict[K, V]:
+        async with semaphore:
+            return await fetch_chunk(chunk)
+
+    failed: list[tuple[list[K], Exception]] = []
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+        outcomes = await asyncio.gather(*(run(chunk) for chunk in chunks), return_exceptions=True)
+        failed = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                failed.append((chunk, outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.update(outcome)
+        if not failed:
+            return results
+        chunks = [chunk for chunk, _ in failed]
+    raise errors.PartialSweepError(results, {key: error for chunk, error in failed for key in chunk})
+
+
+def tiktok_video_batcher(
+    client: AuthenticatedClient, *, v2: bool = False, max_wait: float = 0.01
+) -> MicroBatcher[str, dict[str, Any]]:
+    """Get a batcher of TikTok videos (awemes, as decoded JSON) by ID
+
+    Batches of up to 10 IDs go to ``tiktok_app_v3.fetch_multi_video`` (``fetch_multi_video_v2`` with ``v2``); the IDs
+    a batch does not return are fetched one by one with ``fetch_one_video`` (``fetch_one_video_v2``). IDs that are
+    not found give None; other failures of their lookup are raised to the callers of that ID.
+    """
+    endpoints = client.tiktok_app_v3
+    multi = (endpoints.fetch_multi_video_v2 if v2 else endpoints.fetch_multi_video).module
+    one = (endpoints.fetch_one_video_v2 if v2 else endpoints.fetch_one_video).module
+
+    async def fetch_batch(aweme_ids: list[str]) -> dict[str, dict[str, Any]]:
+        return find_awemes(await fetch_data(multi, client=client, body=aweme_ids))
+
+    async def fetch_single(aweme_id: str) -> Optional[dict[str, Any]]:
+        try:
+            data = await fetch_data(one, client=client, aweme_id=aweme_id)
+        except errors.UnexpectedStatus as error:
+            # Only a missing video is None; throttling and server errors fail the callers of this ID
+            if _is_not_found(error):
+                return None
+            raise
+        return find_awemes(data).get(aweme_id)
+
+    return MicroBatcher(fetch_batch, fetch_single, max_batch_size=10, max_wait=max_wait)
+
+
+# Keys that say whether a live room is on air, by how common they are
+_ONLINE_KEYS = ("is_online", "online", "alive", "is_alive", "is_live")
+# The room status TikTok and Douyin use for rooms that are on air
+_LIVE_STATUS = 2
+
+
+def _is_online(value: Any) -> bool:
+    if isinstance(value, dict):
+        for key in _ONLINE_KEYS:
+            if key in value:
+                return bool(value[key])
+        return value.get("status") == _LIVE_STATUS
+    if isinstance(value, bool):
+        return value
+    return value == _LIVE_STATUS
+
+
+def _is_status(value: Any) -> bool:
+    # A room record or a status, as opposed to the other fields of a response such as a message or a count
+    if isinstance(value, dict):
+        return "status" in value or any(key in value for key in _ONLINE_KEYS)
+    return isinstance(value, (bool, int))
+
+
+def online_statuses(data: Any) -> dict[str, bool]:
+    """Get whether each live room is online from a batch check response's ``data``
+
+    Accepts a mapping of room IDs to statuses, or a list of room objects (``room_id``/``id_str``/``id`` with
+    ``is_online``, ``alive``, ``status``, ...), either as is or under a single key. In a mapping, only numeric keys
+    whose value is a status (a boolean, a number or a dict with one of those keys) are taken as rooms.
+    """
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list):
+                return online_statuses(value)
+        return {
+            str(room_id): _is_online(value)
+            for room_id, value in data.items()
+            if str(room_id).isdigit() and _is_status(value)
+        }
+    if isinstance(data, list):
+        statuses = {}
+        for room in data:
+            if isinstance(room, dict):
+                room_id = room.get("room_id") or room.get("id_str") or room.get("id")
+                if room_id is not None:
+                    statuses[str(room_id)] = _is_online(room)
+        return statuses
+    return {}
+
+
+async def check_live_rooms_online(
+    client: AuthenticatedClient,
+    room_ids: Iterable[str],
+    *,
+    concurrency: int = 8,
+    retries: int = 2,
+) -> dict[str, bool]:
+    """Check whether any number of TikTok live rooms are online, with ``tiktok_app_v3.check_live_room_online_batch``
+
+    The rooms are checked 50 at a time, ``concurrency`` requests at once, see sweep.
+
+    Returns:
+        Whether each room the API reported on is online, by room ID
+
+    Raises:
+        errors.PartialSweepError: If some chunks of rooms still fail after their retries. A chunk whose response
+            reports on none of its rooms counts as failed.
+    """
+    from .models.live_room_batch_check_request import LiveRoomBatchCheckRequest
+
+    endpoint = client.tiktok_app_v3.check_live_room_online_batch.module
+
+    async def check(chunk: list[str]) -> dict[str, bool]:
+        data = await fetch_data(endpoint, client=client, body=LiveRoomBatchCheckRequest(room_ids=chunk))
+        statuses = online_statuses(data)
+        if not statuses:
+            raise ValueError(f"The live room check response has no room statuses: {data!r:.200}")
+        return statuses
+
+    return await sweep(map(str, room_ids), check, chunk_size=50, concurrency=concurrency, retries=retries)
+
+
+__all__ = [
+    "MicroBatcher",
+    "check_live_rooms_online",
+    "fetch_data",
+    "find_awemes",
+    "online_statuses",
+    "sweep",
+    "tiktok_video_batcher",
+]
@@ -0,0 +1,343 @@
+"""Contains response caches (in memory or on disk) that clients consult before sending read-only requests"""
+
+import abc
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Optional, Union
+
+import httpx
+from attrs import define, field
+
+from .decoding import default_json_loads
+from .single_flight import RawResponse, is_streamed, request_key
+
+# Endpoint path patterns and how long their responses stay fresh, in seconds. None keeps a response forever and 0
+# never caches it. The first matching pattern wins.
+DEFAULT_TTLS: dict[str, Optional[float]] = {
+    # Writes and account actions
+    "/api/v1/tiktok/interaction/*": 0,
+    "/api/v1/temp_mail/*": 0,
+    "/api/v1/tikhub/*": 0,
+    # Pure ID conversions, which always give the same answer
+    "/api/v1/bilibili/web/bv_to_aid": None,
+    "/api/v1/douyin/web/encrypt_uid_to_sec_user_id": None,
+    "/api/v1/douyin/web/get_aweme_id": None,
+    "/api/v1/douyin/web/get_sec_user_id": None,
+    "/api/v1/douyin/web/get_webcast_id": None,
+    "/api/v1/douyin/web/webcast_id_2_room_id": None,
+    "/api/v1/lemon8/app/get_item_id": None,
+    "/api/v1/lemon8/app/get_user_id": None,
+    "/api/v1/tiktok/web/get_aweme_id": None,
+    "/api/v1/tiktok/web/get_sec_user_id": None,
+    "/api/v1/tiktok/web/get_unique_id": None,
+    "/api/v1/tiktok/web/get_user_id": None,
+    "/api/v1/youtube/web/get_channel_id": None,
+    # Bulk conversions, whose listings are kept a day rather than forever
+    "*/get_all_*": 86_400,
+    "/api/v1/lemon8/app/get_item_ids": 86_400,
+    "/api/v1/lemon8/app/get_user_ids": 86_400,
+    # Hot lists change by the minute
+    "*hot_search*": 60,
+    "/api/v1/douyin/billboard/*": 60,
+    # Profiles change slowly
+    "*user_profile*": 600,
+    "*user_info*": 600,
+}
+
+
+@define
+class CacheStats:
+    """Counts how often a cache could answer a request
+
+    Attributes:
+        hits: Requests answered from the cache
+        misses: Cacheable requests that had to be sent
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def count(self, hit: bool) -> None:
+        """Count a hit or a miss"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@define(kw_only=True)
+class ResponseCache(abc.ABC):
+    """Decides which responses are cached and for how long; subclasses decide where they are stored
+
+    Only successful responses are cached: status 200, and a body ``code`` of 200 if it has one. Requests with a
+    method not in ``methods`` bypass the cache unless their path matches one of ``paths``, which keeps
+    non-idempotent POSTs out of it; streamed requests (see single_flight.is_streamed) always bypass it.
+
+    Attributes:
+        default_ttl: How long responses of endpoints not matching ``ttls`` stay fresh, in seconds. None keeps them
+            forever and 0 never caches them.
+        ttls: Endpoint path patterns (``fnmatch`` style) and their TTL. The first matching pattern wins.
+        methods: Methods whose responses may be cached
+        paths: Path patterns of endpoints with other methods whose responses may be cached, e.g. POST endpoints
+            that only read data
+        stats: Hit and miss counters
+    """
+
+    default_ttl: Optional[float] = 300.0
+    ttls: dict[str, Optional[float]] = field(factory=lambda: dict(DEFAULT_TTLS))
+    methods: frozenset[str] = field(factory=lambda: frozenset({"GET"}))
+    paths: tuple[str, ...] = ("*/get_all_*", "/api/v1/lemon8/app/get_item_ids", "/api/v1/lemon8/app/get_user_ids")
+    stats: CacheStats = field(factory=CacheStats)
+
+    def ttl_for(self, request: httpx.Request) -> Optional[float]:
+        path = request.url.path
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        if is_streamed(request):
+            return False
+        if request.method not in self.methods and not any(fnmatchcase(request.url.path, p) for p in self.paths):
+            return False
+        return self.ttl_for(request) != 0
+
+    def lookup(self, key: str) -> Optional[RawResponse]:
+        """Get a fresh cached response, counting a hit or a miss"""
+        response = self.get(key)
+        self.stats.count(response is not None)
+        return response
+
+    async def alookup(self, key: str) -> Optional[RawResponse]:
+        """Like lookup, for the event loop: the storage is read in a worker thread so a slow disk does not block it"""
+        return await asyncio.to_thread(self.lookup, key)
+
+    async def aset(self, key: str, response: RawResponse, ttl: Optional[float]) -> None:
+        """Like set, for the event loop"""
+        await asyncio.to_thread(self.set, key, response, ttl)
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[RawResponse]:
+        """Get the response stored under ``key`` if it is still fresh"""
+
+    @abc.abstractmethod
+    def set(self, key: str, response: RawResponse, ttl: Optional[float]) -> None:
+        """Store a response under ``key`` for ``ttl`` seconds (None for forever)"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every stored response"""
+
+
+@define
+class MemoryCache(ResponseCache):
+    """A thread-safe in-memory ResponseCache that evicts the least recently used responses beyond ``max_bytes``
+
+    Attributes:
+        max_bytes: The approximate memory the stored responses (bodies, headers and keys) may take up
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    _entries: OrderedDict[str, tuple[Optional[float], RawResponse, int]] = field(init=False, factory=OrderedDict)
+    _size: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[RawResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: RawResponse, ttl: Optional[float]) -> None:
+        size = len(key) + len(response.content) + sum(len(name) + len(value) for name, value in response.headers)
+        if size > self.max_bytes:
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (expires_at, response, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    # Memory is never slow enough to be worth a thread
+    async def alookup(self, key: str) -> Optional[RawResponse]:
+        return self.lookup(key)
+
+    async def aset(self, key: str, response: RawResponse, ttl: Optional[float]) -> None:
+        self.set(key, response, ttl)
+
+
+@define
+class SQLiteCache(ResponseCache):
+    """A ResponseCache in an SQLite database, shared by every process on the host that opens the same file
+
+    Raw response bytes and headers are stored, so a response is replayed exactly as it was received. The database
+    uses write-ahead logging, letting readers in other processes continue while one process writes. Entries
+    survive restarts; expiry uses wall-clock time for the same reason.
+
+    Since the cache outlives the process, a common setup is ``SQLiteCache(path, default_ttl=0)``, which only keeps
+    the endpoints that ``ttls`` gives a TTL, such as the ID conversions in DEFAULT_TTLS.
+
+    Attributes:
+        path: The database file, created if it does not exist
+        timeout: How long in seconds to wait for another process's write lock before giving up
+    """
+
+    path: Union[str, os.PathLike[str]] = "tikhub_cache.sqlite3"
+    timeout: float = 30.0
+    _local: threading.local = field(init=False, factory=threading.local)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so each thread opens its own
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(os.fspath(self.path), timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, content BLOB, expires_at REAL)"
+            )
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[RawResponse]:
+        row = (
+            self._connection()
+            .execute("SELECT status_code, headers, content, expires_at FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        status_code, headers, content, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self._connection().execute("DELETE FROM responses WHERE key = ? AND expires_at <= ?", (key, time.time()))
+            return None
+        return RawResponse(
+            status_code,
+            [(name.encode("latin-1"), value.encode("latin-1")) for name, value in json.loads(headers)],
+            content,
+        )
+
+    def set(self, key: str, response: RawResponse, ttl: Optional[float]) -> None:
+        headers = json.dumps([(name.decode("latin-1"), value.decode("latin-1")) for name, value in response.headers])
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (key, response.status_code, headers, response.content, None if ttl is None else time.time() + ttl),
+        )
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Delete every expired response, returning how many there were"""
+        return self._connection().execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def close(self) -> None:
+        """Close this thread's connection to the database"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def _is_success(response: RawResponse, request: httpx.Request) -> bool:
+    if response.status_code != 200:
+        return False
+    # The API also reports failures as a 200 with another code in the body, which must not be served again
+    try:
+        body = default_json_loads()(response.replay(request).read())
+    except (ValueError, httpx.DecodingError):
+        return False
+    return not isinstance(body, dict) or body.get("code", 200) == 200
+
+
+class CacheTransport(httpx.BaseTransport):
+    """An httpx transport that answers cacheable requests from a ResponseCache when it can"""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.cache.is_cacheable(request):
+            return self.transport.handle_request(request)
+        key = request_key(request)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            return cached.replay(request)
+        response = RawResponse.read(self.transport.handle_request(request))
+        if _is_success(response, request):
+            self.cache.set(key, response, self.cache.ttl_for(request))
+        return response.replay(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Like CacheTransport, for httpx.AsyncClient. The cache is read and written with ResponseCache.alookup and aset."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.cache.is_cacheable(request):
+            return await self.transport.handle_async_request(request)
+        key = request_key(request)
+        cached = await self.cache.alookup(key)
+        if cached is not None:
+            return cached.replay(request)
+        response = await RawResponse.aread(await self.transport.handle_async_request(request))
+        if _is_success(response, request):
+            await self.cache.aset(key, response, self.cache.ttl_for(request))
+        return response.replay(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "DEFAULT_TTLS",
+    "AsyncCacheTransport",
+    "CacheStats",
+    "CacheTransport",
+    "MemoryCache",
+    "ResponseCache",
+    "SQLiteCache",
+]
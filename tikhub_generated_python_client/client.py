@@ -1,9 +1,85 @@
 import ssl
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 from attrs import define, evolve, field
 
+if TYPE_CHECKING:
+    from .archive import ResponseArchive
+    from .cache import ResponseCache
+    from .decoding import JsonLoads, ParseMode
+    from .facade import Namespace
+    from .hedging import HedgePolicy
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+    from .single_flight import SingleFlight
+
+# Arguments that httpx passes on to the default transport it creates when no transport is given
+_TRANSPORT_ARGS = ("cert", "http1", "http2", "limits", "trust_env")
+
+
+def _build_httpx_args(client: Union["Client", "AuthenticatedClient"], *, is_async: bool) -> dict[str, Any]:
+    """Get the httpx_args of a client with its transport wrapped in the configured request middleware
+
+    The middleware modules are only imported for the options that are set, keeping ``import`` of the package fast.
+    """
+    middleware = (client._rate_limiter, client._hedging, client._retry, client._single_flight, client._cache)
+    if all(option is None for option in middleware):
+        return client._httpx_args
+    args = dict(client._httpx_args)
+    transport = args.pop("transport", None)
+    transport_args = {key: args[key] for key in _TRANSPORT_ARGS if key in args}
+    # Every request actually sent, including each retry and hedge, waits for its own rate limiter token
+    if is_async:
+        transport = transport or httpx.AsyncHTTPTransport(verify=client._verify_ssl, **transport_args)
+        if client._rate_limiter is not None:
+            from .rate_limit import AsyncRateLimitTransport
+
+            transport = AsyncRateLimitTransport(transport, client._rate_limiter)
+        if client._hedging is not None:
+            from .hedging import AsyncHedgingTransport
+
+            transport = AsyncHedgingTransport(transport, client._hedging)
+        if client._retry is not None:
+            from .retry import AsyncRetryTransport
+
+            transport = AsyncRetryTransport(transport, client._retry)
+        if client._single_flight is not None:
+            from .single_flight import AsyncSingleFlightTransport
+
+            transport = AsyncSingleFlightTransport(transport, client._single_flight)
+        if client._cache is not None:
+            from .cache import AsyncCacheTransport
+
+            transport = AsyncCacheTransport(transport, client._cache)
+    else:
+        transport = transport or httpx.HTTPTransport(verify=client._verify_ssl, **transport_args)
+        if client._rate_limiter is not None:
+            from .rate_limit import RateLimitTransport
+
+            transport = RateLimitTransport(transport, client._rate_limiter)
+        if client._hedging is not None:
+            from .hedging import HedgingTransport
+
+            limits = args.get("limits")
+            transport = HedgingTransport(
+                transport, client._hedging, max_workers=limits.max_connections if limits is not None else None
+            )
+        if client._retry is not None:
+            from .retry import RetryTransport
+
+            transport = RetryTransport(transport, client._retry)
+        if client._single_flight is not None:
+            from .single_flight import SingleFlightTransport
+
+            transport = SingleFlightTransport(transport, client._single_flight)
+        if client._cache is not None:
+            from .cache import CacheTransport
+
+            transport = CacheTransport(transport, client._cache)
+    args["transport"] = transport
+    return args
+
 
 @define
 class Client:
@@ -27,11 +103,38 @@ class Client:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A rate_limit.RateLimiter that every request waits for before it is sent. The same limiter is
+        shared by the sync and async clients.
+
+        ``retry``: A retry.RetryPolicy for sending requests again after connection errors, timeouts, 429s and 5xx
+        responses. Without one, every request is sent exactly once.
+
+        ``hedging``: A hedging.HedgePolicy for sending a duplicate of GET requests that take longer than usual for
+        their endpoint, using whichever response arrives first.
+
+        ``single_flight``: A single_flight.SingleFlight to let identical requests made at the same time (from
+        different threads, or different coroutines) share one request and its response.
+
+        ``cache``: A cache.ResponseCache (e.g. cache.MemoryCache) to answer repeated read-only requests from while
+        their responses are fresh.
+
+    Endpoints can also be called through the client, which imports each endpoint module on first use:
+    ``client.douyin_web.fetch_one_video(aweme_id=...)``, or ``await client.douyin_web.fetch_one_video.asyncio(...)``.
+    See facade for how the names are derived.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_loads: The function that decodes JSON response bodies from bytes. Defaults to the fastest one installed
+            (see decoding.default_json_loads). Can also be provided as a keyword argument to the constructor.
+        parse_mode: How endpoint functions parse response bodies. ``"eager"`` parses them right away, ``"lazy"`` returns
+            a decoding.LazyParsed that parses the body the first time it is used, and ``"raw"`` never parses them,
+            leaving ``parsed`` None so ``Response.content`` can be used as is. Can also be provided as a keyword
+            argument to the constructor.
+        archive: An archive.ResponseArchive that endpoint functions append every response they get to, raw bytes and
+            all. Can also be provided as a keyword argument to the constructor.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
@@ -42,8 +145,17 @@ class Client:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _rate_limiter: Optional["RateLimiter"] = field(default=None, kw_only=True, alias="rate_limiter")
+    _retry: Optional["RetryPolicy"] = field(default=None, kw_only=True, alias="retry")
+    _hedging: Optional["HedgePolicy"] = field(default=None, kw_only=True, alias="hedging")
+    _single_flight: Optional["SingleFlight"] = field(default=None, kw_only=True, alias="single_flight")
+    _cache: Optional["ResponseCache"] = field(default=None, kw_only=True, alias="cache")
+    json_loads: Optional["JsonLoads"] = field(default=None, kw_only=True)
+    parse_mode: "ParseMode" = field(default="eager", kw_only=True)
+    archive: Optional["ResponseArchive"] = field(default=None, kw_only=True)
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _namespaces: dict[str, "Namespace"] = field(factory=dict, init=False)
 
     def with_headers(self, headers: dict[str, str]) -> "Client":
         """Get a new client matching this one with additional headers"""
@@ -87,7 +199,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_build_httpx_args(self, is_async=False),
             )
         return self._client
 
@@ -118,7 +230,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_build_httpx_args(self, is_async=True),
             )
         return self._async_client
 
@@ -131,6 +243,18 @@ class Client:
         """Exit a context manager for underlying httpx.AsyncClient (see httpx docs)"""
         await self.get_async_httpx_client().__aexit__(*args, **kwargs)
 
+    def __getattr__(self, name: str) -> "Namespace":
+        """Get a namespace of endpoints bound to this client, e.g. ``client.douyin_web`` (see facade)"""
+        # Only reached for attributes the client doesn't have
+        if name.startswith("_"):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            from .facade import get_namespace
+
+            namespace = self._namespaces[name] = get_namespace(self, name)
+        return namespace
+
 
 @define
 class AuthenticatedClient:
@@ -154,11 +278,38 @@ class AuthenticatedClient:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A rate_limit.RateLimiter that every request waits for before it is sent. The same limiter is
+        shared by the sync and async clients.
+
+        ``retry``: A retry.RetryPolicy for sending requests again after connection errors, timeouts, 429s and 5xx
+        responses. Without one, every request is sent exactly once.
+
+        ``hedging``: A hedging.HedgePolicy for sending a duplicate of GET requests that take longer than usual for
+        their endpoint, using whichever response arrives first.
+
+        ``single_flight``: A single_flight.SingleFlight to let identical requests made at the same time (from
+        different threads, or different coroutines) share one request and its response.
+
+        ``cache``: A cache.ResponseCache (e.g. cache.MemoryCache) to answer repeated read-only requests from while
+        their responses are fresh.
+
+    Endpoints can also be called through the client, which imports each endpoint module on first use:
+    ``client.douyin_web.fetch_one_video(aweme_id=...)``, or ``await client.douyin_web.fetch_one_video.asyncio(...)``.
+    See facade for how the names are derived.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_loads: The function that decodes JSON response bodies from bytes. Defaults to the fastest one installed
+            (see decoding.default_json_loads). Can also be provided as a keyword argument to the constructor.
+        parse_mode: How endpoint functions parse response bodies. ``"eager"`` parses them right away, ``"lazy"`` returns
+            a decoding.LazyParsed that parses the body the first time it is used, and ``"raw"`` never parses them,
+            leaving ``parsed`` None so ``Response.content`` can be used as is. Can also be provided as a keyword
+            argument to the constructor.
+        archive: An archive.ResponseArchive that endpoint functions append every response they get to, raw bytes and
+            all. Can also be provided as a keyword argument to the constructor.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
@@ -172,8 +323,17 @@ class AuthenticatedClient:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _rate_limiter: Optional["RateLimiter"] = field(default=None, kw_only=True, alias="rate_limiter")
+    _retry: Optional["RetryPolicy"] = field(default=None, kw_only=True, alias="retry")
+    _hedging: Optional["HedgePolicy"] = field(default=None, kw_only=True, alias="hedging")
+    _single_flight: Optional["SingleFlight"] = field(default=None, kw_only=True, alias="single_flight")
+    _cache: Optional["ResponseCache"] = field(default=None, kw_only=True, alias="cache")
+    json_loads: Optional["JsonLoads"] = field(default=None, kw_only=True)
+    parse_mode: "ParseMode" = field(default="eager", kw_only=True)
+    archive: Optional["ResponseArchive"] = field(default=None, kw_only=True)
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _namespaces: dict[str, "Namespace"] = field(factory=dict, init=False)
 
     token: str
     prefix: str = "Bearer"
@@ -222,7 +382,7 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_build_httpx_args(self, is_async=False),
             )
         return self._client
 
@@ -254,7 +414,7 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_build_httpx_args(self, is_async=True),
             )
         return self._async_client
 
@@ -266,3 +426,15 @@ class AuthenticatedClient:
     async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
         """Exit a context manager for underlying httpx.AsyncClient (see httpx docs)"""
         await self.get_async_httpx_client().__aexit__(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> "Namespace":
+        """Get a namespace of endpoints bound to this client, e.g. ``client.douyin_web`` (see facade)"""
+        # Only reached for attributes the client doesn't have
+        if name.startswith("_"):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            from .facade import get_namespace
+
+            namespace = self._namespaces[name] = get_namespace(self, name)
+        return namespace
@@ -0,0 +1,147 @@
+"""Contains the JSON decoders that endpoint functions can parse response bodies with
+
+Bodies are decoded straight from the response bytes, without first decoding them to text.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from functools import cache
+from typing import Any, Literal, Optional
+
+JsonLoads = Callable[[bytes], Any]
+ParseMode = Literal["eager", "lazy", "raw"]
+
+
+def stdlib_loads(content: bytes) -> Any:
+    """Decode JSON with the standard library"""
+    return json.loads(content)
+
+
+def orjson_loads(content: bytes) -> Any:
+    """Decode JSON with orjson, falling back to the standard library for what orjson rejects
+
+    orjson refuses a few things the standard library accepts, such as NaN and integers beyond 64 bits, so those
+    responses still decode (or fail) exactly as before.
+    """
+    import orjson
+
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content)
+
+
+def msgspec_loads(content: bytes) -> Any:
+    """Decode JSON with msgspec, falling back to the standard library for what msgspec rejects"""
+    import msgspec
+
+    try:
+        return msgspec.json.decode(content)
+    except msgspec.DecodeError:
+        return json.loads(content)
+
+
+@cache
+def default_json_loads() -> JsonLoads:
+    """Get the fastest installed JSON decoder: orjson, then msgspec, then the standard library"""
+    try:
+        import orjson  # noqa: F401
+
+        return orjson_loads
+    except ImportError:
+        pass
+    try:
+        import msgspec  # noqa: F401
+
+        return msgspec_loads
+    except ImportError:
+        return stdlib_loads
+
+
+class LazyParsed:
+    """A response body that is only decoded and parsed the first time it is used
+
+    Attribute access, indexing, iteration, comparison and ``repr`` all go to the parsed value; until then only the
+    raw bytes are held, and they are released once decoded. Use ``resolve`` to get the parsed value itself, e.g.
+    for ``isinstance`` checks. It can be shared by threads: the body is parsed once, by whichever uses it first.
+    """
+
+    __slots__ = ("_content", "_lock", "_parse", "_value")
+
+    def __init__(self, content: bytes, parse: Callable[[bytes], Any]):
+        self._content: Optional[bytes] = content
+        self._parse: Optional[Callable[[bytes], Any]] = parse
+        self._value: Any = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """Get the parsed value, parsing the body if that has not happened yet"""
+        if self._parse is not None:
+            with self._lock:
+                # Another thread may have parsed it while this one waited for the lock
+                if self._parse is not None and self._content is not None:
+                    self._value = self._parse(self._content)
+                    self._content = self._parse = None
+        return self._value
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._parse is None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots, or slots not set yet by a copy or unpickling, which must not
+        # look up _parse again; private names are never delegated
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __getstate__(self) -> tuple[Optional[bytes], Optional[Callable[[bytes], Any]], Any]:
+        # Copies and unpickled instances get a lock of their own
+        return self._content, self._parse, self._value
+
+    def __setstate__(self, state: tuple[Optional[bytes], Optional[Callable[[bytes], Any]], Any]) -> None:
+        self._content, self._parse, self._value = state
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.resolve()[key]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.resolve()
+
+    def __iter__(self) -> Any:
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __eq__(self, other: object) -> bool:
+        return self.resolve() == resolve(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if not self.is_resolved:
+            return f"<LazyParsed ({len(self._content or b'')} bytes, not parsed yet)>"
+        return repr(self._value)
+
+
+def resolve(value: Any) -> Any:
+    """Get the parsed value of a LazyParsed, or ``value`` itself if it is anything else"""
+    return value.resolve() if isinstance(value, LazyParsed) else value
+
+
+__all__ = [
+    "JsonLoads",
+    "LazyParsed",
+    "ParseMode",
+    "default_json_loads",
+    "msgspec_loads",
+    "orjson_loads",
+    "resolve",
+    "stdlib_loads",
+]
@@ -0,0 +1,97 @@
+"""Contains the description of an API operation and the executor shared by every endpoint function"""
+
+from enum import Enum
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .decoding import LazyParsed, default_json_loads
+from .types import UNSET, Response
+
+
+@define(frozen=True)
+class Endpoint:
+    """Describes an API operation. Each module in ``api`` holds one as ``ENDPOINT``, and its functions send their
+    requests through it.
+
+    Attributes:
+        method: The HTTP method, in lower case
+        url: The URL path
+        params: Maps keyword arguments to the names of the query parameters they are sent as
+        body: The type of the JSON body passed as the ``body`` keyword argument, or None if the operation has none
+        responses: Maps each documented status code to how its body is parsed: a model class (``from_dict``),
+            ``Any`` for the decoded JSON as is, or None for no parsed value
+    """
+
+    method: str
+    url: str
+    params: dict[str, str] = field(factory=dict)
+    body: Any = None
+    responses: dict[int, Any] = field(factory=dict)
+
+    def request_kwargs(self, **kwargs: Any) -> dict[str, Any]:
+        """Get the arguments of ``httpx.Client.request`` for a call with the given endpoint arguments"""
+        request: dict[str, Any] = {"method": self.method, "url": self.url}
+        if self.params:
+            params: dict[str, Any] = {}
+            for name, param in self.params.items():
+                value = kwargs.get(name, UNSET)
+                if isinstance(value, Enum):
+                    value = value.value
+                if value is not UNSET and value is not None:
+                    params[param] = value
+            request["params"] = params
+        if self.body is not None:
+            body = kwargs["body"]
+            request["json"] = body.to_dict() if hasattr(body, "to_dict") else body
+            request["headers"] = {"Content-Type": "application/json"}
+        return request
+
+    def parse_response(self, *, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Any:
+        if response.status_code in self.responses:
+            model = self.responses[response.status_code]
+            if model is None or client.parse_mode == "raw":
+                return None
+            loads = client.json_loads or default_json_loads()
+
+            def parse(content: bytes) -> Any:
+                data = loads(content)
+                return data if model is Any else model.from_dict(data)
+
+            if client.parse_mode == "lazy":
+                return LazyParsed(response.content, parse)
+            return parse(response.content)
+        if client.raise_on_unexpected_status:
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        return None
+
+    def build_response(self, *, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+        if client.archive is not None:
+            client.archive.write(response)
+        return Response(
+            status_code=HTTPStatus(response.status_code),
+            content=response.content,
+            headers=response.headers,
+            parsed=self.parse_response(client=client, response=response),
+        )
+
+    def sync_detailed(self, *, client: Union[AuthenticatedClient, Client], **kwargs: Any) -> Response[Any]:
+        response = client.get_httpx_client().request(**self.request_kwargs(**kwargs))
+        return self.build_response(client=client, response=response)
+
+    def sync(self, *, client: Union[AuthenticatedClient, Client], **kwargs: Any) -> Optional[Any]:
+        return self.sync_detailed(client=client, **kwargs).parsed
+
+    async def asyncio_detailed(self, *, client: Union[AuthenticatedClient, Client], **kwargs: Any) -> Response[Any]:
+        response = await client.get_async_httpx_client().request(**self.request_kwargs(**kwargs))
+        return self.build_response(client=client, response=response)
+
+    async def asyncio(self, *, client: Union[AuthenticatedClient, Client], **kwargs: Any) -> Optional[Any]:
+        return (await self.asyncio_detailed(client=client, **kwargs)).parsed
+
+
+__all__ = ["Endpoint"]
@@ -1,5 +1,7 @@
 """Contains shared errors types that can be raised from API functions"""
 
+from typing import Any
+
 
 class UnexpectedStatus(Exception):
     """Raised by api functions when the response status an undocumented status and Client.raise_on_unexpected_status is True"""
@@ -13,4 +15,21 @@ class UnexpectedStatus(Exception):
         )
 
 
-__all__ = ["UnexpectedStatus"]
+class PartialSweepError(Exception):
+    """Raised by batching.sweep when some chunks of keys still fail after their retries
+
+    Attributes:
+        results: The results of every chunk that succeeded
+        errors: The last exception of each key whose chunk failed
+    """
+
+    def __init__(self, results: dict[Any, Any], errors: dict[Any, Exception]):
+        self.results = results
+        self.errors = errors
+
+        super().__init__(
+            f"{len(errors)} keys failed ({len(results)} succeeded), first error: {next(iter(errors.values()))!r}"
+        )
+
+
+__all__ = ["PartialSweepError", "UnexpectedStatus"]
@@ -0,0 +1,231 @@
+"""Contains the export of crawled items to Parquet or Arrow files, batch by batch as they are fetched
+
+Needs pyarrow, which is an optional dependency: ``pip install "tikhub_generated_python_client[arrow]"``.
+
+Items are buffered into batches of ``batch_size``, each written as one Parquet row group (or Arrow record batch), so
+a crawl of any length is exported in constant memory. Items are written either as they are, one column per top-level
+key, or converted into columns first by ``to_columns`` (e.g. ``normalize.normalize_videos``).
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterable, Callable, Iterable, Sequence
+from typing import IO, TYPE_CHECKING, Any, Literal, Optional, Union, get_args
+
+from attrs import fields
+
+from .normalize import Columns
+
+if TYPE_CHECKING:
+    import pyarrow
+
+ExportFormat = Literal["parquet", "arrow"]
+
+# String columns that repeat a lot within a crawl, and are dictionary-encoded by default when present
+DICTIONARY_COLUMNS = frozenset(
+    {"author_id", "author_sec_uid", "user_id", "user_nickname", "owner_id", "video_id", "music_id", "hashtags"}
+)
+
+
+def import_pyarrow() -> Any:
+    """Import pyarrow, which is an optional dependency
+
+    Raises:
+        ImportError: If pyarrow is not installed, saying how to install it.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            'Exporting needs pyarrow, install it with: pip install "tikhub_generated_python_client[arrow]"'
+        ) from None
+    return pyarrow
+
+
+def record_schema(record_type: type, dictionary_columns: Iterable[str] = DICTIONARY_COLUMNS) -> "pyarrow.Schema":
+    """Get the Arrow schema of the columns of a record type (see records), such as those of normalize_videos"""
+    pa = import_pyarrow()
+    dictionary_columns = frozenset(dictionary_columns)
+    arrow_fields = []
+    for attribute in fields(record_type):
+        arrow_type = pa.int64() if int in (attribute.type, *get_args(attribute.type)) else pa.string()
+        if attribute.name in dictionary_columns and arrow_type == pa.string():
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        arrow_fields.append(pa.field(attribute.name, arrow_type))
+    return pa.schema(arrow_fields)
+
+
+def _finish_schema(schema: "pyarrow.Schema", dictionary_columns: frozenset[str]) -> "pyarrow.Schema":
+    pa = import_pyarrow()
+    arrow_fields = []
+    for arrow_field in schema:
+        arrow_type = arrow_field.type
+        if pa.types.is_null(arrow_type):
+            # Nothing was seen in this column while inferring, assume it holds text
+            arrow_type = pa.string()
+        if arrow_field.name in dictionary_columns:
+            if pa.types.is_string(arrow_type):
+                arrow_type = pa.dictionary(pa.int32(), pa.string())
+            elif pa.types.is_list(arrow_type) and pa.types.is_string(arrow_type.value_type):
+                arrow_type = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+        arrow_fields.append(arrow_field.with_type(arrow_type))
+    return pa.schema(arrow_fields)
+
+
+class ArrowExporter:
+    """Writes items to a Parquet or Arrow IPC file in batches
+
+    Use it as a context manager, or call ``close`` once done; ``write`` can be called any number of times in between.
+
+    Without ``schema``, the schema is inferred from the first ``infer_rows`` items: columns with no values in those
+    become strings, and string columns (or lists of strings) named in ``dictionary_columns`` are dictionary-encoded.
+    A later item whose value does not fit its column's type makes ``write`` raise pyarrow.ArrowInvalid, so prefer
+    ``to_columns`` with a fixed schema (see record_schema) for items whose shape varies.
+
+    ``format="arrow"`` writes the Arrow IPC stream format (read it with ``pyarrow.ipc.open_stream``), which unlike the
+    IPC file format lets every batch have its own dictionaries.
+
+    Attributes:
+        sink: The path or binary file to write to
+        format: "parquet" or "arrow"
+        batch_size: The number of items in each row group or record batch
+        infer_rows: The number of items the schema is inferred from
+        to_columns: Converts a batch of items into columns; without it, items must be dicts and are written as rows
+        schema: The Arrow schema of the file, inferred if None
+        dictionary_columns: The names of the columns to dictionary-encode when inferring the schema
+        compression: The Parquet compression codec
+        rows_written: The number of items written so far
+    """
+
+    def __init__(
+        self,
+        sink: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = 10_000,
+        infer_rows: int = 1_000,
+        to_columns: Optional[Callable[[Sequence[Any]], Columns]] = None,
+        schema: Optional["pyarrow.Schema"] = None,
+        dictionary_columns: Iterable[str] = DICTIONARY_COLUMNS,
+        compression: str = "zstd",
+    ):
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown export format {format!r}, expected 'parquet' or 'arrow'")
+        self._pa = import_pyarrow()
+        self.sink = sink
+        self.format = format
+        self.batch_size = batch_size
+        self.infer_rows = infer_rows
+        self.to_columns = to_columns
+        self.schema = schema
+        self.dictionary_columns = frozenset(dictionary_columns)
+        self.compression = compression
+        self.rows_written = 0
+        self._buffer: list[Any] = []
+        self._writer: Any = None
+
+    def write(self, items: Iterable[Any]) -> None:
+        """Add items, writing out every batch that fills up"""
+        for item in items:
+            self._buffer.append(item)
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write out the buffered items as a batch, even if it is not full"""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._write_batch(batch)
+
+    def _table(self, batch: list[Any], schema: Optional["pyarrow.Schema"]) -> "pyarrow.Table":
+        if self.to_columns is not None:
+            return self._pa.Table.from_pydict(self.to_columns(batch), schema=schema)
+        return self._pa.Table.from_pylist(batch, schema=schema)
+
+    def _open(self) -> None:
+        if self.format == "parquet":
+            import pyarrow.parquet
+
+            self._writer = pyarrow.parquet.ParquetWriter(self.sink, self.schema, compression=self.compression)
+        else:
+            self._writer = self._pa.ipc.new_stream(self.sink, self.schema)
+
+    def _write_batch(self, batch: list[Any]) -> None:
+        if self.schema is None:
+            self.schema = _finish_schema(self._table(batch[: self.infer_rows], None).schema, self.dictionary_columns)
+        table = self._table(batch, self.schema)
+        if self._writer is None:
+            self._open()
+        if self.format == "parquet":
+            self._writer.write_table(table, row_group_size=len(batch))
+        else:
+            self._writer.write_table(table)
+        self.rows_written += len(batch)
+
+    def close(self) -> None:
+        """Write out the buffered items and finish the file
+
+        Nothing is written (and no file is created) if no items were written at all and there is no ``schema``.
+        """
+        self.flush()
+        if self._writer is None and self.schema is not None:
+            self._open()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ArrowExporter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def export(items: Iterable[Any], sink: Union[str, "os.PathLike[str]", IO[bytes]], **options: Any) -> int:
+    """Write all ``items`` (e.g. ``pagination.iter_items(...)``) to ``sink``, see ArrowExporter for the options
+
+    Returns:
+        The number of items written
+    """
+    with ArrowExporter(sink, **options) as exporter:
+        exporter.write(items)
+    return exporter.rows_written
+
+
+async def aexport(items: AsyncIterable[Any], sink: Union[str, "os.PathLike[str]", IO[bytes]], **options: Any) -> int:
+    """Like export, for async iterators (e.g. ``pagination.aiter_items(...)``)
+
+    Batches are written in a worker thread, so the next pages keep being fetched meanwhile.
+    """
+    exporter = ArrowExporter(sink, **options)
+    pending: Optional[asyncio.Future[None]] = None
+    batch: list[Any] = []
+    try:
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= exporter.batch_size:
+                if pending is not None:
+                    await pending
+                pending = asyncio.ensure_future(asyncio.to_thread(exporter.write, batch))
+                batch = []
+        if pending is not None:
+            await pending
+            pending = None
+        exporter.write(batch)
+    finally:
+        if pending is not None:
+            await pending
+        exporter.close()
+    return exporter.rows_written
+
+
+__all__ = [
+    "DICTIONARY_COLUMNS",
+    "ArrowExporter",
+    "ExportFormat",
+    "aexport",
+    "export",
+    "import_pyarrow",
+    "record_schema",
+]
@@ -0,0 +1,111 @@
+"""Contains the endpoint facade of clients: ``client.douyin_web.fetch_one_video(aweme_id=...)``
+
+Namespaces and endpoint names come from the endpoint URLs: ``/api/v1/douyin/web/fetch_one_video`` is
+``client.douyin_web.fetch_one_video``. An endpoint's module is only imported the first time it is accessed.
+"""
+
+import importlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .api._index import NAMESPACES
+from .types import Response
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient, Client
+
+
+class BoundEndpoint:
+    """An endpoint module bound to a client
+
+    Calling it is the same as calling the module's ``sync``; ``sync_detailed``, ``asyncio`` and ``asyncio_detailed``
+    are the other forms, all taking the endpoint's arguments without ``client``. ``project`` and ``aproject`` get
+    only some fields of the response body, ``stream`` and ``astream`` yield the items of an array as they arrive.
+    """
+
+    def __init__(self, client: Union["AuthenticatedClient", "Client"], module: ModuleType):
+        self.client = client
+        self.module = module
+
+    def __call__(self, **kwargs: Any) -> Any:
+        return self.module.sync(client=self.client, **kwargs)
+
+    def sync(self, **kwargs: Any) -> Any:
+        return self.module.sync(client=self.client, **kwargs)
+
+    def sync_detailed(self, **kwargs: Any) -> Response[Any]:
+        return self.module.sync_detailed(client=self.client, **kwargs)
+
+    async def asyncio(self, **kwargs: Any) -> Any:
+        return await self.module.asyncio(client=self.client, **kwargs)
+
+    async def asyncio_detailed(self, **kwargs: Any) -> Response[Any]:
+        return await self.module.asyncio_detailed(client=self.client, **kwargs)
+
+    def project(self, fields: Iterable[str], **kwargs: Any) -> Any:
+        """Call the endpoint and get only ``fields`` (JSON paths) of its response body, see projection"""
+        from .projection import fetch_projected
+
+        return fetch_projected(self.module, client=self.client, fields=fields, **kwargs)
+
+    async def aproject(self, fields: Iterable[str], **kwargs: Any) -> Any:
+        """Like project, for use with await"""
+        from .projection import afetch_projected
+
+        return await afetch_projected(self.module, client=self.client, fields=fields, **kwargs)
+
+    def stream(self, path: Optional[str] = None, **kwargs: Any) -> Iterator[Any]:
+        """Call the endpoint and yield the items of the array at ``path`` as they arrive, see streaming"""
+        from .streaming import iter_array_items
+
+        return iter_array_items(self.module, client=self.client, path=path, **kwargs)
+
+    def astream(self, path: Optional[str] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        """Like stream, for use with async for"""
+        from .streaming import aiter_array_items
+
+        return aiter_array_items(self.module, client=self.client, path=path, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<BoundEndpoint {self.module.ENDPOINT.method.upper()} {self.module.ENDPOINT.url}>"
+
+
+class Namespace:
+    """The endpoints of one API namespace bound to a client, e.g. ``client.douyin_web``
+
+    Each bound endpoint is created on first access and then stored on the namespace.
+    """
+
+    def __init__(self, client: Union["AuthenticatedClient", "Client"], name: str):
+        self._client = client
+        self._name = name
+        self._package, self._modules = NAMESPACES[name]
+
+    def __getattr__(self, name: str) -> BoundEndpoint:
+        module = self._modules.get(name)
+        if module is None:
+            raise AttributeError(f"API namespace {self._name!r} has no endpoint {name!r}")
+        endpoint = BoundEndpoint(self._client, importlib.import_module(f"{__package__}.api.{self._package}.{module}"))
+        setattr(self, name, endpoint)
+        return endpoint
+
+    def __dir__(self) -> list[str]:
+        return sorted({*super().__dir__(), *self._modules})
+
+    def __repr__(self) -> str:
+        return f"<Namespace {self._name}>"
+
+
+def get_namespace(client: Union["AuthenticatedClient", "Client"], name: str) -> Namespace:
+    """Get the namespace ``name`` bound to ``client``
+
+    Raises:
+        AttributeError: If there is no such namespace.
+    """
+    if name not in NAMESPACES:
+        raise AttributeError(f"{type(client).__name__!r} object has no attribute {name!r}")
+    return Namespace(client, name)
+
+
+__all__ = ["NAMESPACES", "BoundEndpoint", "Namespace", "get_namespace"]
@@ -0,0 +1,191 @@
+"""Contains hedged requests: a duplicate of a slow read-only request is sent and the first response wins"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+# The connection limit of httpx clients that are not given one
+_DEFAULT_MAX_CONNECTIONS = 100
+
+
+@define
+class LatencyTracker:
+    """Keeps the most recent latencies observed for each endpoint
+
+    Endpoint URLs in this API have no path parameters, so the URL path identifies the endpoint.
+
+    Attributes:
+        window: The number of recent latencies kept per endpoint
+    """
+
+    window: int = 200
+    _samples: dict[str, deque[float]] = field(init=False, factory=dict)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def record(self, path: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(path)
+            if samples is None:
+                samples = self._samples[path] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, path: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Get the ``q`` quantile (0-1) of the recent latencies of ``path``, or None with fewer than ``min_samples``"""
+        with self._lock:
+            samples = sorted(self._samples.get(path, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+@define
+class HedgePolicy:
+    """Decides whether and when a duplicate of a slow request is sent
+
+    A request is hedged once it has taken longer than the ``percentile`` latency of its endpoint. Each endpoint may
+    hedge at most ``budget`` of its requests, which bounds the extra cost to that fraction.
+
+    Attributes:
+        percentile: The latency quantile (0-1) after which a duplicate is sent
+        budget: The maximum fraction of each endpoint's requests that may be hedged
+        min_samples: The number of latencies an endpoint needs before its requests are hedged
+        min_delay: The shortest time in seconds to wait before hedging
+        methods: The methods that may be hedged, which must be read-only
+        tracker: Where latencies are recorded
+    """
+
+    percentile: float = 0.95
+    budget: float = 0.05
+    min_samples: int = 20
+    min_delay: float = 0.05
+    methods: frozenset[str] = field(factory=lambda: frozenset({"GET"}))
+    tracker: LatencyTracker = field(factory=LatencyTracker)
+    _requests: defaultdict[str, int] = field(init=False, factory=lambda: defaultdict(int))
+    _hedges: defaultdict[str, int] = field(init=False, factory=lambda: defaultdict(int))
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def hedge_delay(self, request: httpx.Request) -> Optional[float]:
+        """Count a new request, returning how long to wait before hedging it or None if it is never hedged"""
+        if request.method not in self.methods:
+            return None
+        path = request.url.path
+        with self._lock:
+            self._requests[path] += 1
+        delay = self.tracker.percentile(path, self.percentile, self.min_samples)
+        return None if delay is None else max(delay, self.min_delay)
+
+    def take_hedge(self, request: httpx.Request) -> bool:
+        """Whether the endpoint of ``request`` has budget left for a hedge, using it up if so"""
+        path = request.url.path
+        with self._lock:
+            if self._hedges[path] + 1 > self.budget * self._requests[path]:
+                return False
+            self._hedges[path] += 1
+            return True
+
+
+class HedgingTransport(httpx.BaseTransport):
+    """An httpx transport that hedges slow requests according to a HedgePolicy
+
+    Requests that may be hedged run on a worker thread so the transport can wait on them with a timeout. A blocking
+    request cannot be interrupted, so the losing request runs to completion in the background and is then closed.
+    ``max_workers`` should be at least the connection limit of the client (the default is that of httpx), so requests
+    do not queue for a worker; the hedge delay is counted from when a worker picks the request up.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, policy: HedgePolicy, max_workers: Optional[int] = None):
+        self.transport = transport
+        self.policy = policy
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or _DEFAULT_MAX_CONNECTIONS, thread_name_prefix="hedging"
+        )
+
+    def _send(self, request: httpx.Request, started: Optional[threading.Event] = None) -> httpx.Response:
+        if started is not None:
+            started.set()
+        started_at = time.monotonic()
+        response = self.transport.handle_request(request)
+        self.policy.tracker.record(request.url.path, time.monotonic() - started_at)
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.policy.hedge_delay(request)
+        if delay is None:
+            return self._send(request)
+        started = threading.Event()
+        attempts = [self._executor.submit(self._send, request, started)]
+        # Time spent waiting for a free worker is not the endpoint being slow
+        started.wait()
+        done, _ = wait(attempts, timeout=delay)
+        if not done and self.policy.take_hedge(request):
+            attempts.append(self._executor.submit(self._send, request))
+        winner = None
+        pending = set(attempts)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((attempt for attempt in done if attempt.exception() is None), None)
+        for attempt in attempts:
+            if attempt is not winner:
+                attempt.add_done_callback(_close_response)
+        # If every attempt failed, report the original request's error
+        return (winner or attempts[0]).result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.transport.close()
+
+
+def _close_response(attempt: "Future[httpx.Response]") -> None:
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().close()
+
+
+class AsyncHedgingTransport(httpx.AsyncBaseTransport):
+    """Like HedgingTransport, for httpx.AsyncClient. The losing request is cancelled."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: HedgePolicy):
+        self.transport = transport
+        self.policy = policy
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        self.policy.tracker.record(request.url.path, time.monotonic() - started_at)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.policy.hedge_delay(request)
+        if delay is None:
+            return await self._send(request)
+        attempts = [asyncio.ensure_future(self._send(request))]
+        winner = None
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and self.policy.take_hedge(request):
+                attempts.append(asyncio.ensure_future(self._send(request)))
+            pending = set(attempts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((attempt for attempt in done if attempt.exception() is None), None)
+            # If every attempt failed, report the original request's error
+            return (winner or attempts[0]).result()
+        finally:
+            for attempt in attempts:
+                if attempt is winner:
+                    continue
+                if not attempt.done():
+                    attempt.cancel()
+                elif not attempt.cancelled() and attempt.exception() is None:
+                    await attempt.result().aclose()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = ["AsyncHedgingTransport", "HedgePolicy", "HedgingTransport", "LatencyTracker"]
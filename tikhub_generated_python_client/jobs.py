@@ -0,0 +1,397 @@
+"""Contains a runner for bulk jobs: files of endpoint calls, run concurrently, with their results streamed to a sink
+
+Run it with ``python -m tikhub_generated_python_client.jobs tasks.jsonl results.jsonl`` (``--help`` for the options),
+or call run_jobs. Each line of the input is a task::
+
+    {"endpoint": "douyin_web.fetch_one_video", "params": {"aweme_id": "7345492945006595379"}, "id": "optional"}
+
+``endpoint`` is a facade name (see facade) or an endpoint's URL path; ``params`` are the endpoint function's
+arguments. A task's ID defaults to its line number. Tasks are read one at a time as the earlier ones finish, and
+results are written as they come, so neither the input nor the output is ever held in memory.
+
+Sinks:
+
+    JsonlSink: one line per finished task, ``{"id", "endpoint", "status", "body"}`` with the response body as it was
+    received (or ``"error"`` for tasks that raised)
+
+    ParquetSink: a directory of Parquet files with the columns id, endpoint, status, body and error. Needs pyarrow.
+
+Tasks that already have a result with status 200 in the sink are skipped, so after a crash the same command picks up
+where it stopped; tasks that failed are run again.
+"""
+
+import argparse
+import asyncio
+import functools
+import importlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Optional, Union
+
+import httpx
+from attrs import define
+
+from .api._index import NAMESPACES
+from .archive import BODY_KEY
+from .client import AuthenticatedClient, Client
+from .decoding import default_json_loads
+from .export import ArrowExporter, import_pyarrow
+from .rate_limit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
+
+# How far back JsonlSink looks at a time for the end of the last complete line
+_TAIL_SIZE = 1 << 16
+
+
+@define
+class Task:
+    """A call of an endpoint
+
+    Attributes:
+        id: Identifies the task in the results
+        endpoint: A facade name such as ``douyin_web.fetch_one_video``, or an endpoint URL path
+        params: The keyword arguments of the endpoint function
+    """
+
+    id: str
+    endpoint: str
+    params: dict[str, Any]
+
+
+@define
+class JobResult:
+    """The outcome of a task
+
+    Attributes:
+        task: The task
+        status: The response status code, None if the task raised
+        content: The response body
+        error: The exception the task raised, as text
+    """
+
+    task: Task
+    status: Optional[int] = None
+    content: bytes = b""
+    error: Optional[str] = None
+
+
+@define
+class JobStats:
+    """Counts of the tasks of a run
+
+    Attributes:
+        skipped: Tasks that already had a result
+        succeeded: Tasks with a 200 response
+        failed: Tasks with another response, or that raised
+    """
+
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+@functools.cache
+def endpoint_module(endpoint: str) -> ModuleType:
+    """Get the module of an endpoint from its facade name (``douyin_web.fetch_one_video``) or its URL path
+
+    Raises:
+        KeyError: If there is no such endpoint.
+    """
+    if endpoint.startswith("/"):
+        *namespace, name = endpoint.removeprefix("/api/v1/").split("/")
+        endpoint = f"{'_'.join(namespace)}.{name}"
+    namespace, _, name = endpoint.partition(".")
+    package, modules = NAMESPACES.get(namespace, ("", {}))
+    if name not in modules:
+        raise KeyError(f"Unknown endpoint {endpoint!r}")
+    return importlib.import_module(f"{__package__}.api.{package}.{modules[name]}")
+
+
+def read_tasks(path: Union[str, "os.PathLike[str]"]) -> Iterator[Task]:
+    """Read the tasks of a JSONL file one line at a time, skipping blank lines
+
+    Raises:
+        ValueError: If a line is not a task.
+    """
+    json_loads = default_json_loads()
+    with open(path, "rb") as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                task = json_loads(line)
+                yield Task(str(task.get("id", number)), task["endpoint"], task.get("params") or {})
+            except (ValueError, KeyError, AttributeError) as error:
+                raise ValueError(f"Line {number} of {path} is not a task: {error!r}") from None
+
+
+def _complete_lines_end(file: IO[bytes]) -> int:
+    # The size of the file up to and including its last newline
+    end = file.seek(0, os.SEEK_END)
+    position = end
+    with open(file.name, "rb") as reader:
+        while position:
+            start = max(0, position - _TAIL_SIZE)
+            reader.seek(start)
+            newline = reader.read(position - start).rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            position = start
+    return 0
+
+
+class JsonlSink:
+    """Appends results to a JSONL file
+
+    Attributes:
+        path: The file, created if it does not exist
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self.path = path
+        self._file: IO[bytes] = open(path, "ab")
+        end = _complete_lines_end(self._file)
+        if self._file.tell() > end:
+            # The last line was cut short by a crash: drop it, its task is run again
+            self._file.truncate(end)
+
+    def completed(self) -> set[str]:
+        """Get the IDs of the tasks with a result with status 200
+
+        Only whole records count: a line that does not end with ``}`` and a newline, or whose fields before the body
+        do not parse, is skipped. The bodies themselves are not decoded.
+        """
+        json_loads = default_json_loads()
+        completed = set()
+        with open(self.path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"}\n"):
+                    continue
+                # id and status are written before the body, which JSON escaping keeps BODY_KEY out of
+                body_start = line.find(BODY_KEY)
+                try:
+                    record = json_loads(line if body_start == -1 else line[:body_start] + b"}")
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("status") == 200:
+                    completed.add(record["id"])
+        return completed
+
+    def write(self, result: JobResult) -> None:
+        record: dict[str, Any] = {"id": result.task.id, "endpoint": result.task.endpoint}
+        if result.error is not None:
+            record["error"] = result.error
+            self._file.write(json.dumps(record, ensure_ascii=False).encode() + b"\n")
+            return
+        record["status"] = result.status
+        header = json.dumps(record, ensure_ascii=False).encode()
+        content = result.content
+        if content.lstrip()[:1] in (b"{", b"["):
+            content = content.replace(b"\n", b" ").replace(b"\r", b" ")
+        else:
+            content = json.dumps(content.decode(errors="replace"), ensure_ascii=False).encode()
+        self._file.write(b"".join((header[:-1], BODY_KEY, content, b"}\n")))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink:
+    """Writes results to new Parquet files in a directory, next to the files of earlier runs
+
+    A file is only readable once it is closed, so a new file is started every ``batch_size`` results: a crash only
+    loses the results of the file being written, whose tasks are run again.
+
+    Attributes:
+        directory: The directory, created if it does not exist
+        batch_size: The number of results in each file
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], *, batch_size: int = 1_000):
+        pa = import_pyarrow()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._schema = pa.schema(
+            [
+                pa.field("id", pa.string()),
+                pa.field("endpoint", pa.dictionary(pa.int32(), pa.string())),
+                pa.field("status", pa.int64()),
+                pa.field("body", pa.string()),
+                pa.field("error", pa.string()),
+            ]
+        )
+        numbers = [path.stem.removeprefix("part-") for path in self.directory.glob("part-*.parquet")]
+        parts = [int(number) for number in numbers if number.isdigit()]
+        self._next_part = max(parts, default=-1) + 1
+        self._exporter: Optional[ArrowExporter] = None
+        self._rows = 0
+
+    def _open(self) -> ArrowExporter:
+        path = self.directory / f"part-{self._next_part:05d}.parquet"
+        self._next_part += 1
+        self._rows = 0
+        return ArrowExporter(path, batch_size=self.batch_size, schema=self._schema)
+
+    def completed(self) -> set[str]:
+        """Get the IDs of the tasks with a result with status 200, in the files that were closed"""
+        pa = import_pyarrow()
+        import pyarrow.compute
+        import pyarrow.parquet
+
+        completed = set()
+        for path in sorted(self.directory.glob("part-*.parquet")):
+            try:
+                table = pyarrow.parquet.read_table(path, columns=["id", "status"])
+            except (pa.ArrowInvalid, OSError):
+                continue
+            completed.update(table.filter(pyarrow.compute.equal(table["status"], 200))["id"].to_pylist())
+        return completed
+
+    def write(self, result: JobResult) -> None:
+        if self._exporter is None:
+            self._exporter = self._open()
+        self._exporter.write(
+            [
+                {
+                    "id": result.task.id,
+                    "endpoint": result.task.endpoint,
+                    "status": result.status,
+                    "body": result.content.decode(errors="replace") if result.error is None else None,
+                    "error": result.error,
+                }
+            ]
+        )
+        self._rows += 1
+        if self._rows >= self.batch_size:
+            self._exporter.close()
+            self._exporter = None
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._exporter is not None:
+            self._exporter.close()
+            self._exporter = None
+
+
+Sink = Union[JsonlSink, ParquetSink]
+
+
+async def run_task(client: Union[AuthenticatedClient, Client], task: Task) -> JobResult:
+    """Call the endpoint of a task, turning any exception into the result's error"""
+    try:
+        endpoint = endpoint_module(task.endpoint)
+        response = await client.get_async_httpx_client().request(**endpoint._get_kwargs(**task.params))
+    except Exception as error:
+        return JobResult(task, error=repr(error))
+    return JobResult(task, response.status_code, response.content)
+
+
+async def run_jobs(
+    client: Union[AuthenticatedClient, Client],
+    tasks: Iterable[Task],
+    sink: Sink,
+    *,
+    concurrency: int = 16,
+    resume: bool = True,
+) -> JobStats:
+    """Run tasks, up to ``concurrency`` at a time, writing each result to ``sink`` as soon as it arrives
+
+    With ``resume``, the tasks that already have a result with status 200 in ``sink`` are skipped.
+    """
+    completed = sink.completed() if resume else set()
+    stats = JobStats()
+    tasks = iter(tasks)
+    running: set[asyncio.Task[JobResult]] = set()
+    try:
+        while True:
+            for task in tasks:
+                if task.id in completed:
+                    stats.skipped += 1
+                    continue
+                running.add(asyncio.ensure_future(run_task(client, task)))
+                if len(running) >= concurrency:
+                    break
+            if not running:
+                return stats
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                result = finished.result()
+                sink.write(result)
+                if result.status == 200:
+                    stats.succeeded += 1
+                else:
+                    stats.failed += 1
+            sink.flush()
+    finally:
+        for pending in running:
+            pending.cancel()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m tikhub_generated_python_client.jobs", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("tasks", type=Path, help="JSONL file of tasks")
+    parser.add_argument("output", type=Path, help="JSONL file, or directory for --format parquet")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), default="jsonl", help="How results are written")
+    parser.add_argument("--concurrency", type=int, default=16, help="Tasks run at a time")
+    parser.add_argument("--rate", type=float, help="Most requests per second")
+    parser.add_argument("--retries", type=int, default=2, help="Times a failed request is sent again")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds a request may take")
+    parser.add_argument("--base-url", default="https://api.tikhub.io")
+    parser.add_argument("--token", default=os.environ.get("TIKHUB_TOKEN"), help="Defaults to $TIKHUB_TOKEN")
+    parser.add_argument("--no-resume", action="store_true", help="Run tasks that already have a result again")
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("--token or $TIKHUB_TOKEN is required")
+
+    client = AuthenticatedClient(
+        base_url=args.base_url,
+        token=args.token,
+        timeout=httpx.Timeout(args.timeout),
+        retry=RetryPolicy(max_attempts=args.retries + 1),
+        rate_limiter=RateLimiter(TokenBucket(args.rate)) if args.rate else None,
+    )
+    sink: Sink = ParquetSink(args.output) if args.format == "parquet" else JsonlSink(args.output)
+
+    async def run() -> JobStats:
+        async with client:
+            return await run_jobs(
+                client, read_tasks(args.tasks), sink, concurrency=args.concurrency, resume=not args.no_resume
+            )
+
+    try:
+        stats = asyncio.run(run())
+    finally:
+        sink.close()
+    print(f"{stats.succeeded} succeeded, {stats.failed} failed, {stats.skipped} skipped", file=sys.stderr)
+    if stats.failed:
+        sys.exit(1)
+
+
+__all__ = [
+    "JobResult",
+    "JobStats",
+    "JsonlSink",
+    "ParquetSink",
+    "Task",
+    "endpoint_module",
+    "main",
+    "read_tasks",
+    "run_jobs",
+    "run_task",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Contains bulk resolution of share links to IDs, with the ``get_all_*`` endpoints and a persistent link cache
+
+Each endpoint takes a list of up to 10 or 20 links. ``resolve_links`` takes any number: it skips repeated links,
+answers the links it has resolved before from a LinkCache, sends the others in chunks of the endpoint's limit,
+several at once, and returns the IDs in the order of the links given.
+
+The response cache of clients (cache.SQLiteCache) keeps these endpoints too, but by whole request, so it only helps
+when exactly the same list of links is sent again. LinkCache stores every link on its own.
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from attrs import define, field
+
+from .batching import fetch_data, sweep
+from .client import AuthenticatedClient
+
+# What each kind of link resolves to: the namespace and endpoint resolving it, and the most links it takes at once
+RESOLVERS: dict[str, tuple[str, str, int]] = {
+    "douyin_aweme_id": ("douyin_web", "get_all_aweme_id", 20),
+    "douyin_sec_user_id": ("douyin_web", "get_all_sec_user_id", 10),
+    "douyin_webcast_id": ("douyin_web", "get_all_webcast_id", 20),
+    "tiktok_aweme_id": ("tiktok_web", "get_all_aweme_id", 20),
+    "tiktok_sec_user_id": ("tiktok_web", "get_all_sec_user_id", 10),
+    "tiktok_unique_id": ("tiktok_web", "get_all_unique_id", 20),
+    "lemon8_item_id": ("lemon8_app", "get_item_ids", 10),
+    "lemon8_user_id": ("lemon8_app", "get_user_ids", 10),
+}
+
+# SQLite's default limit on the parameters of one statement is 999
+_LOOKUP_SIZE = 500
+
+
+@define
+class LinkCache:
+    """The IDs links were resolved to, in an SQLite database shared by every process that opens the same file
+
+    Links are stored per kind (see RESOLVERS) and never expire: a share link keeps pointing at the same video or user.
+
+    Attributes:
+        path: The database file, created if it does not exist
+        timeout: How long in seconds to wait for another process's write lock before giving up
+    """
+
+    path: Union[str, os.PathLike[str]] = "tikhub_links.sqlite3"
+    timeout: float = 30.0
+    _local: threading.local = field(init=False, factory=threading.local)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so each thread opens its own
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(os.fspath(self.path), timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS links (kind TEXT, link TEXT, id TEXT, PRIMARY KEY (kind, link)) "
+                "WITHOUT ROWID"
+            )
+            self._local.connection = connection
+        return connection
+
+    def get_many(self, kind: str, links: list[str]) -> dict[str, str]:
+        """Get the IDs of the links of ``kind`` that are stored, by link"""
+        found: dict[str, str] = {}
+        for start in range(0, len(links), _LOOKUP_SIZE):
+            batch = links[start : start + _LOOKUP_SIZE]
+            found.update(
+                self._connection().execute(
+                    f"SELECT link, id FROM links WHERE kind = ? AND link IN ({','.join('?' * len(batch))})",
+                    (kind, *batch),
+                )
+            )
+        return found
+
+    def set_many(self, kind: str, ids: dict[str, str]) -> None:
+        """Store the IDs of links of ``kind``, in one transaction"""
+        if not ids:
+            return
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?)", [(kind, link, id) for link, id in ids.items()]
+            )
+
+    def clear(self) -> None:
+        """Remove every stored link"""
+        self._connection().execute("DELETE FROM links")
+
+    def close(self) -> None:
+        """Close this thread's connection to the database"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def _as_id(value: Any) -> Optional[str]:
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        return None
+    return str(value) or None
+
+
+def resolved_ids(links: list[str], data: Any) -> dict[str, str]:
+    """Get the IDs a ``get_all_*`` response's ``data`` gives for ``links``, by link
+
+    Accepts a list of IDs in the order of the links, a mapping of links to IDs, or either of those under a single
+    key. Links the API could not resolve (given back as they were, or as null) are left out.
+    """
+    ids: dict[str, Optional[str]] = {}
+    if isinstance(data, dict):
+        if any(link in data for link in links):
+            ids = {link: _as_id(data.get(link)) for link in links}
+        else:
+            for value in data.values():
+                if isinstance(value, (list, dict)):
+                    return resolved_ids(links, value)
+    elif isinstance(data, list) and len(data) == len(links):
+        ids = {link: _as_id(value) for link, value in zip(links, data)}
+    elif len(links) == 1:
+        ids = {links[0]: _as_id(data)}
+    return {link: id for link, id in ids.items() if id is not None and id != link}
+
+
+async def resolve_links(
+    client: AuthenticatedClient,
+    links: Iterable[str],
+    kind: str,
+    *,
+    cache: Optional[LinkCache] = None,
+    concurrency: int = 8,
+    retries: int = 2,
+) -> list[Optional[str]]:
+    """Resolve share links of ``kind`` (a key of RESOLVERS, e.g. "douyin_aweme_id") to IDs
+
+    Returns:
+        The ID of each link, in the order of ``links``, or None for links the API could not resolve
+
+    Raises:
+        ValueError: If ``kind`` is not a key of RESOLVERS.
+        errors.PartialSweepError: If some chunks of links still fail after their retries (see batching.sweep).
+            The links resolved by the others are in the cache by then.
+    """
+    if kind not in RESOLVERS:
+        raise ValueError(f"Unknown kind of link {kind!r}, expected one of {', '.join(RESOLVERS)}")
+    namespace, name, limit = RESOLVERS[kind]
+    endpoint = getattr(getattr(client, namespace), name).module
+    links = [link.strip() for link in links]
+    unique = list(dict.fromkeys(links))
+    ids = cache.get_many(kind, unique) if cache is not None else {}
+
+    async def resolve(chunk: list[str]) -> dict[str, str]:
+        resolved = resolved_ids(chunk, await fetch_data(endpoint, client=client, body=chunk))
+        if cache is not None:
+            cache.set_many(kind, resolved)
+        return resolved
+
+    missing = [link for link in unique if link not in ids]
+    if missing:
+        ids.update(await sweep(missing, resolve, chunk_size=limit, concurrency=concurrency, retries=retries))
+    return [ids.get(link) for link in links]
+
+
+__all__ = ["RESOLVERS", "LinkCache", "resolve_links", "resolved_ids"]
@@ -1,169 +1,305 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
+
+Models are imported the first time they are accessed, so importing this package (or one model module) does not
+import every model.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .a_bogus_model import ABogusModel
+    from .api_key_data import APIKeyData
+    from .body_amazon_captcha_api_v1_captcha_amazon_captcha_post import BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPost
+    from .body_amazon_captcha_api_v1_captcha_amazon_captcha_post_proxy import (
+        BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPostProxy,
+    )
+    from .body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post import (
+        BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
+    )
+    from .body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post_proxy import (
+        BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePostProxy,
+    )
+    from .body_fetch_home_feed_api_v1_tiktok_web_fetch_home_feed_post import (
+        BodyFetchHomeFeedApiV1TiktokWebFetchHomeFeedPost,
+    )
+    from .body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post import (
+        BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPost,
+    )
+    from .body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post_query_tag import (
+        BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPostQueryTag,
+    )
+    from .body_fetch_hot_calendar_list_api_v1_douyin_billboard_fetch_hot_calendar_list_post import (
+        BodyFetchHotCalendarListApiV1DouyinBillboardFetchHotCalendarListPost,
+    )
+    from .body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post import (
+        BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
+    )
+    from .body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post_tags_item import (
+        BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPostTagsItem,
+    )
+    from .body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post import (
+        BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPost,
+    )
+    from .body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post_tags_item import (
+        BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPostTagsItem,
+    )
+    from .body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post import (
+        BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPost,
+    )
+    from .body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post_tags_item import (
+        BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPostTagsItem,
+    )
+    from .body_fetch_hot_total_high_search_list_api_v1_douyin_billboard_fetch_hot_total_high_search_list_post import (
+        BodyFetchHotTotalHighSearchListApiV1DouyinBillboardFetchHotTotalHighSearchListPost,
+    )
+    from .body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post import (
+        BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPost,
+    )
+    from .body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post_tags_item import (
+        BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPostTagsItem,
+    )
+    from .body_fetch_hot_total_hot_word_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_list_post import (
+        BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
+    )
+    from .body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post import (
+        BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPost,
+    )
+    from .body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post_tags_item import (
+        BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPostTagsItem,
+    )
+    from .body_fetch_hot_total_search_list_api_v1_douyin_billboard_fetch_hot_total_search_list_post import (
+        BodyFetchHotTotalSearchListApiV1DouyinBillboardFetchHotTotalSearchListPost,
+    )
+    from .body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post import (
+        BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPost,
+    )
+    from .body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post_tags_item import (
+        BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPostTagsItem,
+    )
+    from .body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post import (
+        BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPost,
+    )
+    from .body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post_tags_item import (
+        BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPostTagsItem,
+    )
+    from .body_fetch_user_collection_videos_api_v1_douyin_web_fetch_user_collection_videos_post import (
+        BodyFetchUserCollectionVideosApiV1DouyinWebFetchUserCollectionVideosPost,
+    )
+    from .body_fetch_user_collects_api_v1_douyin_web_fetch_user_collects_post import (
+        BodyFetchUserCollectsApiV1DouyinWebFetchUserCollectsPost,
+    )
+    from .body_fetch_user_like_videos_api_v1_douyin_web_fetch_user_like_videos_post import (
+        BodyFetchUserLikeVideosApiV1DouyinWebFetchUserLikeVideosPost,
+    )
+    from .body_hcaptcha_api_v1_captcha_hcaptcha_post import BodyHcaptchaApiV1CaptchaHcaptchaPost
+    from .body_hcaptcha_api_v1_captcha_hcaptcha_post_proxy import BodyHcaptchaApiV1CaptchaHcaptchaPostProxy
+    from .body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post import BodyRecaptchaV2ApiV1CaptchaRecaptchaV2Post
+    from .body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post_proxy import (
+        BodyRecaptchaV2ApiV1CaptchaRecaptchaV2PostProxy,
+    )
+    from .body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post import BodyRecaptchaV3ApiV1CaptchaRecaptchaV3Post
+    from .body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post_proxy import (
+        BodyRecaptchaV3ApiV1CaptchaRecaptchaV3PostProxy,
+    )
+    from .body_tencent_captcha_api_v1_captcha_tencent_captcha_post import (
+        BodyTencentCaptchaApiV1CaptchaTencentCaptchaPost,
+    )
+    from .body_tencent_captcha_api_v1_captcha_tencent_captcha_post_proxy import (
+        BodyTencentCaptchaApiV1CaptchaTencentCaptchaPostProxy,
+    )
+    from .challenge_post_request import ChallengePostRequest
+    from .challenge_search_v1_request import ChallengeSearchV1Request
+    from .challenge_search_v2_request import ChallengeSearchV2Request
+    from .challenge_suggest_request import ChallengeSuggestRequest
+    from .collect_request import CollectRequest
+    from .discuss_search_request import DiscussSearchRequest
+    from .encrypt_post_payload_api_v1_net_ease_cloud_music_app_encrypt_post_payload_post_payload import (
+        EncryptPostPayloadApiV1NetEaseCloudMusicAppEncryptPostPayloadPostPayload,
+    )
+    from .experience_search_request import ExperienceSearchRequest
+    from .fetch_scholar_search_v3_api_v1_zhihu_web_fetch_scholar_search_v3_post_filter_fields import (
+        FetchScholarSearchV3ApiV1ZhihuWebFetchScholarSearchV3PostFilterFields,
+    )
+    from .follow_request import FollowRequest
+    from .forward_request import ForwardRequest
+    from .general_search_v1_request import GeneralSearchV1Request
+    from .general_search_v2_request import GeneralSearchV2Request
+    from .general_search_v3_request import GeneralSearchV3Request
+    from .get_account_health_request import GetAccountHealthRequest
+    from .get_account_overview_request import GetAccountOverviewRequest
+    from .get_creator_account_info_request import GetCreatorAccountInfoRequest
+    from .get_home_feed_request import GetHomeFeedRequest
+    from .get_live_overview_request import GetLiveOverviewRequest
+    from .get_note_info_v5_request import GetNoteInfoV5Request
+    from .get_product_list_request import GetProductListRequest
+    from .get_product_related_videos_request import GetProductRelatedVideosRequest
+    from .get_showcase_product_list_request import GetShowcaseProductListRequest
+    from .get_video_associated_product_list_request import GetVideoAssociatedProductListRequest
+    from .get_video_audience_stats_request import GetVideoAudienceStatsRequest
+    from .get_video_detailed_stats_request import GetVideoDetailedStatsRequest
+    from .get_video_list_request import GetVideoListRequest
+    from .get_video_overview_request import GetVideoOverviewRequest
+    from .get_video_to_product_stats_request import GetVideoToProductStatsRequest
+    from .get_violation_record_request import GetViolationRecordRequest
+    from .health_check_response import HealthCheckResponse
+    from .http_validation_error import HTTPValidationError
+    from .image_search_request import ImageSearchRequest
+    from .ios_shortcut import IOSShortcut
+    from .like_request import LikeRequest
+    from .live_room_batch_check_request import LiveRoomBatchCheckRequest
+    from .live_search_v1_request import LiveSearchV1Request
+    from .live_search_v2_request import LiveSearchV2Request
+    from .mode_enum import ModeEnum
+    from .multi_search_request import MultiSearchRequest
+    from .music_search_request import MusicSearchRequest
+    from .post_comment_request import PostCommentRequest
+    from .reply_comment_request import ReplyCommentRequest
+    from .response_model import ResponseModel
+    from .school_search_request import SchoolSearchRequest
+    from .search_challenge_request import SearchChallengeRequest
+    from .search_suggest_request import SearchSuggestRequest
+    from .subtitle_format import SubtitleFormat
+    from .tik_tok_app_encrypt_request import TikTokAPPEncryptRequest
+    from .tik_tok_app_encrypt_request_device_info import TikTokAPPEncryptRequestDeviceInfo
+    from .tik_tok_app_login_encrypt_decrypt_request import TikTokAPPLoginEncryptDecryptRequest
+    from .tik_tok_appv3_content_translate import TikTokAPPV3ContentTranslate
+    from .tik_tok_appv3_home_feed import TikTokAPPV3HomeFeed
+    from .update_check_response import UpdateCheckResponse
+    from .url_access_mode import UrlAccessMode
+    from .user_data import UserData
+    from .user_info_response_model import UserInfoResponseModel
+    from .user_search_request import UserSearchRequest
+    from .user_search_request_v2 import UserSearchRequestV2
+    from .validation_error import ValidationError
+    from .video_search_v1_request import VideoSearchV1Request
+    from .video_search_v2_request import VideoSearchV2Request
+    from .videos_audios_mode import VideosAudiosMode
+    from .x_bogus_model import XBogusModel
+    from .xhs_web_sign_request_model import XhsWebSignRequestModel
+    from .xhs_web_sign_request_model_data import XhsWebSignRequestModelData
+
+# Maps each model to the module that defines it
+_MODULES = {
+    "ABogusModel": "a_bogus_model",
+    "APIKeyData": "api_key_data",
+    "BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPost": "body_amazon_captcha_api_v1_captcha_amazon_captcha_post",
+    "BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPostProxy": "body_amazon_captcha_api_v1_captcha_amazon_captcha_post_proxy",
+    "BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost": "body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post",
+    "BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePostProxy": "body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post_proxy",
+    "BodyFetchHomeFeedApiV1TiktokWebFetchHomeFeedPost": "body_fetch_home_feed_api_v1_tiktok_web_fetch_home_feed_post",
+    "BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPost": "body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post",
+    "BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPostQueryTag": "body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post_query_tag",
+    "BodyFetchHotCalendarListApiV1DouyinBillboardFetchHotCalendarListPost": "body_fetch_hot_calendar_list_api_v1_douyin_billboard_fetch_hot_calendar_list_post",
+    "BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost": "body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post",
+    "BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPostTagsItem": "body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post_tags_item",
+    "BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPost": "body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post",
+    "BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPostTagsItem": "body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post_tags_item",
+    "BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPost": "body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post",
+    "BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPostTagsItem": "body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post_tags_item",
+    "BodyFetchHotTotalHighSearchListApiV1DouyinBillboardFetchHotTotalHighSearchListPost": "body_fetch_hot_total_high_search_list_api_v1_douyin_billboard_fetch_hot_total_high_search_list_post",
+    "BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPost": "body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post",
+    "BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPostTagsItem": "body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post_tags_item",
+    "BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost": "body_fetch_hot_total_hot_word_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_list_post",
+    "BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPost": "body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post",
+    "BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPostTagsItem": "body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post_tags_item",
+    "BodyFetchHotTotalSearchListApiV1DouyinBillboardFetchHotTotalSearchListPost": "body_fetch_hot_total_search_list_api_v1_douyin_billboard_fetch_hot_total_search_list_post",
+    "BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPost": "body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post",
+    "BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPostTagsItem": "body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post_tags_item",
+    "BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPost": "body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post",
+    "BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPostTagsItem": "body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post_tags_item",
+    "BodyFetchUserCollectionVideosApiV1DouyinWebFetchUserCollectionVideosPost": "body_fetch_user_collection_videos_api_v1_douyin_web_fetch_user_collection_videos_post",
+    "BodyFetchUserCollectsApiV1DouyinWebFetchUserCollectsPost": "body_fetch_user_collects_api_v1_douyin_web_fetch_user_collects_post",
+    "BodyFetchUserLikeVideosApiV1DouyinWebFetchUserLikeVideosPost": "body_fetch_user_like_videos_api_v1_douyin_web_fetch_user_like_videos_post",
+    "BodyHcaptchaApiV1CaptchaHcaptchaPost": "body_hcaptcha_api_v1_captcha_hcaptcha_post",
+    "BodyHcaptchaApiV1CaptchaHcaptchaPostProxy": "body_hcaptcha_api_v1_captcha_hcaptcha_post_proxy",
+    "BodyRecaptchaV2ApiV1CaptchaRecaptchaV2Post": "body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post",
+    "BodyRecaptchaV2ApiV1CaptchaRecaptchaV2PostProxy": "body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post_proxy",
+    "BodyRecaptchaV3ApiV1CaptchaRecaptchaV3Post": "body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post",
+    "BodyRecaptchaV3ApiV1CaptchaRecaptchaV3PostProxy": "body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post_proxy",
+    "BodyTencentCaptchaApiV1CaptchaTencentCaptchaPost": "body_tencent_captcha_api_v1_captcha_tencent_captcha_post",
+    "BodyTencentCaptchaApiV1CaptchaTencentCaptchaPostProxy": "body_tencent_captcha_api_v1_captcha_tencent_captcha_post_proxy",
+    "ChallengePostRequest": "challenge_post_request",
+    "ChallengeSearchV1Request": "challenge_search_v1_request",
+    "ChallengeSearchV2Request": "challenge_search_v2_request",
+    "ChallengeSuggestRequest": "challenge_suggest_request",
+    "CollectRequest": "collect_request",
+    "DiscussSearchRequest": "discuss_search_request",
+    "EncryptPostPayloadApiV1NetEaseCloudMusicAppEncryptPostPayloadPostPayload": "encrypt_post_payload_api_v1_net_ease_cloud_music_app_encrypt_post_payload_post_payload",
+    "ExperienceSearchRequest": "experience_search_request",
+    "FetchScholarSearchV3ApiV1ZhihuWebFetchScholarSearchV3PostFilterFields": "fetch_scholar_search_v3_api_v1_zhihu_web_fetch_scholar_search_v3_post_filter_fields",
+    "FollowRequest": "follow_request",
+    "ForwardRequest": "forward_request",
+    "GeneralSearchV1Request": "general_search_v1_request",
+    "GeneralSearchV2Request": "general_search_v2_request",
+    "GeneralSearchV3Request": "general_search_v3_request",
+    "GetAccountHealthRequest": "get_account_health_request",
+    "GetAccountOverviewRequest": "get_account_overview_request",
+    "GetCreatorAccountInfoRequest": "get_creator_account_info_request",
+    "GetHomeFeedRequest": "get_home_feed_request",
+    "GetLiveOverviewRequest": "get_live_overview_request",
+    "GetNoteInfoV5Request": "get_note_info_v5_request",
+    "GetProductListRequest": "get_product_list_request",
+    "GetProductRelatedVideosRequest": "get_product_related_videos_request",
+    "GetShowcaseProductListRequest": "get_showcase_product_list_request",
+    "GetVideoAssociatedProductListRequest": "get_video_associated_product_list_request",
+    "GetVideoAudienceStatsRequest": "get_video_audience_stats_request",
+    "GetVideoDetailedStatsRequest": "get_video_detailed_stats_request",
+    "GetVideoListRequest": "get_video_list_request",
+    "GetVideoOverviewRequest": "get_video_overview_request",
+    "GetVideoToProductStatsRequest": "get_video_to_product_stats_request",
+    "GetViolationRecordRequest": "get_violation_record_request",
+    "HealthCheckResponse": "health_check_response",
+    "HTTPValidationError": "http_validation_error",
+    "ImageSearchRequest": "image_search_request",
+    "IOSShortcut": "ios_shortcut",
+    "LikeRequest": "like_request",
+    "LiveRoomBatchCheckRequest": "live_room_batch_check_request",
+    "LiveSearchV1Request": "live_search_v1_request",
+    "LiveSearchV2Request": "live_search_v2_request",
+    "ModeEnum": "mode_enum",
+    "MultiSearchRequest": "multi_search_request",
+    "MusicSearchRequest": "music_search_request",
+    "PostCommentRequest": "post_comment_request",
+    "ReplyCommentRequest": "reply_comment_request",
+    "ResponseModel": "response_model",
+    "SchoolSearchRequest": "school_search_request",
+    "SearchChallengeRequest": "search_challenge_request",
+    "SearchSuggestRequest": "search_suggest_request",
+    "SubtitleFormat": "subtitle_format",
+    "TikTokAPPEncryptRequest": "tik_tok_app_encrypt_request",
+    "TikTokAPPEncryptRequestDeviceInfo": "tik_tok_app_encrypt_request_device_info",
+    "TikTokAPPLoginEncryptDecryptRequest": "tik_tok_app_login_encrypt_decrypt_request",
+    "TikTokAPPV3ContentTranslate": "tik_tok_appv3_content_translate",
+    "TikTokAPPV3HomeFeed": "tik_tok_appv3_home_feed",
+    "UpdateCheckResponse": "update_check_response",
+    "UrlAccessMode": "url_access_mode",
+    "UserData": "user_data",
+    "UserInfoResponseModel": "user_info_response_model",
+    "UserSearchRequest": "user_search_request",
+    "UserSearchRequestV2": "user_search_request_v2",
+    "ValidationError": "validation_error",
+    "VideoSearchV1Request": "video_search_v1_request",
+    "VideoSearchV2Request": "video_search_v2_request",
+    "VideosAudiosMode": "videos_audios_mode",
+    "XBogusModel": "x_bogus_model",
+    "XhsWebSignRequestModel": "xhs_web_sign_request_model",
+    "XhsWebSignRequestModelData": "xhs_web_sign_request_model_data",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-from .a_bogus_model import ABogusModel
-from .api_key_data import APIKeyData
-from .body_amazon_captcha_api_v1_captcha_amazon_captcha_post import BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPost
-from .body_amazon_captcha_api_v1_captcha_amazon_captcha_post_proxy import (
-    BodyAmazonCaptchaApiV1CaptchaAmazonCaptchaPostProxy,
-)
-from .body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post import (
-    BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePost,
-)
-from .body_cloudflare_turnstile_api_v1_captcha_cloudflare_turnstile_post_proxy import (
-    BodyCloudflareTurnstileApiV1CaptchaCloudflareTurnstilePostProxy,
-)
-from .body_fetch_home_feed_api_v1_tiktok_web_fetch_home_feed_post import (
-    BodyFetchHomeFeedApiV1TiktokWebFetchHomeFeedPost,
-)
-from .body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post import (
-    BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPost,
-)
-from .body_fetch_hot_account_list_api_v1_douyin_billboard_fetch_hot_account_list_post_query_tag import (
-    BodyFetchHotAccountListApiV1DouyinBillboardFetchHotAccountListPostQueryTag,
-)
-from .body_fetch_hot_calendar_list_api_v1_douyin_billboard_fetch_hot_calendar_list_post import (
-    BodyFetchHotCalendarListApiV1DouyinBillboardFetchHotCalendarListPost,
-)
-from .body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post import (
-    BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPost,
-)
-from .body_fetch_hot_total_high_fan_list_api_v1_douyin_billboard_fetch_hot_total_high_fan_list_post_tags_item import (
-    BodyFetchHotTotalHighFanListApiV1DouyinBillboardFetchHotTotalHighFanListPostTagsItem,
-)
-from .body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post import (
-    BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPost,
-)
-from .body_fetch_hot_total_high_like_list_api_v1_douyin_billboard_fetch_hot_total_high_like_list_post_tags_item import (
-    BodyFetchHotTotalHighLikeListApiV1DouyinBillboardFetchHotTotalHighLikeListPostTagsItem,
-)
-from .body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post import (
-    BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPost,
-)
-from .body_fetch_hot_total_high_play_list_api_v1_douyin_billboard_fetch_hot_total_high_play_list_post_tags_item import (
-    BodyFetchHotTotalHighPlayListApiV1DouyinBillboardFetchHotTotalHighPlayListPostTagsItem,
-)
-from .body_fetch_hot_total_high_search_list_api_v1_douyin_billboard_fetch_hot_total_high_search_list_post import (
-    BodyFetchHotTotalHighSearchListApiV1DouyinBillboardFetchHotTotalHighSearchListPost,
-)
-from .body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post import (
-    BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPost,
-)
-from .body_fetch_hot_total_high_topic_list_api_v1_douyin_billboard_fetch_hot_total_high_topic_list_post_tags_item import (
-    BodyFetchHotTotalHighTopicListApiV1DouyinBillboardFetchHotTotalHighTopicListPostTagsItem,
-)
-from .body_fetch_hot_total_hot_word_list_api_v1_douyin_billboard_fetch_hot_total_hot_word_list_post import (
-    BodyFetchHotTotalHotWordListApiV1DouyinBillboardFetchHotTotalHotWordListPost,
-)
-from .body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post import (
-    BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPost,
-)
-from .body_fetch_hot_total_low_fan_list_api_v1_douyin_billboard_fetch_hot_total_low_fan_list_post_tags_item import (
-    BodyFetchHotTotalLowFanListApiV1DouyinBillboardFetchHotTotalLowFanListPostTagsItem,
-)
-from .body_fetch_hot_total_search_list_api_v1_douyin_billboard_fetch_hot_total_search_list_post import (
-    BodyFetchHotTotalSearchListApiV1DouyinBillboardFetchHotTotalSearchListPost,
-)
-from .body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post import (
-    BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPost,
-)
-from .body_fetch_hot_total_topic_list_api_v1_douyin_billboard_fetch_hot_total_topic_list_post_tags_item import (
-    BodyFetchHotTotalTopicListApiV1DouyinBillboardFetchHotTotalTopicListPostTagsItem,
-)
-from .body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post import (
-    BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPost,
-)
-from .body_fetch_hot_total_video_list_api_v1_douyin_billboard_fetch_hot_total_video_list_post_tags_item import (
-    BodyFetchHotTotalVideoListApiV1DouyinBillboardFetchHotTotalVideoListPostTagsItem,
-)
-from .body_fetch_user_collection_videos_api_v1_douyin_web_fetch_user_collection_videos_post import (
-    BodyFetchUserCollectionVideosApiV1DouyinWebFetchUserCollectionVideosPost,
-)
-from .body_fetch_user_collects_api_v1_douyin_web_fetch_user_collects_post import (
-    BodyFetchUserCollectsApiV1DouyinWebFetchUserCollectsPost,
-)
-from .body_fetch_user_like_videos_api_v1_douyin_web_fetch_user_like_videos_post import (
-    BodyFetchUserLikeVideosApiV1DouyinWebFetchUserLikeVideosPost,
-)
-from .body_hcaptcha_api_v1_captcha_hcaptcha_post import BodyHcaptchaApiV1CaptchaHcaptchaPost
-from .body_hcaptcha_api_v1_captcha_hcaptcha_post_proxy import BodyHcaptchaApiV1CaptchaHcaptchaPostProxy
-from .body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post import BodyRecaptchaV2ApiV1CaptchaRecaptchaV2Post
-from .body_recaptcha_v2_api_v1_captcha_recaptcha_v2_post_proxy import BodyRecaptchaV2ApiV1CaptchaRecaptchaV2PostProxy
-from .body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post import BodyRecaptchaV3ApiV1CaptchaRecaptchaV3Post
-from .body_recaptcha_v3_api_v1_captcha_recaptcha_v3_post_proxy import BodyRecaptchaV3ApiV1CaptchaRecaptchaV3PostProxy
-from .body_tencent_captcha_api_v1_captcha_tencent_captcha_post import BodyTencentCaptchaApiV1CaptchaTencentCaptchaPost
-from .body_tencent_captcha_api_v1_captcha_tencent_captcha_post_proxy import (
-    BodyTencentCaptchaApiV1CaptchaTencentCaptchaPostProxy,
-)
-from .challenge_post_request import ChallengePostRequest
-from .challenge_search_v1_request import ChallengeSearchV1Request
-from .challenge_search_v2_request import ChallengeSearchV2Request
-from .challenge_suggest_request import ChallengeSuggestRequest
-from .collect_request import CollectRequest
-from .discuss_search_request import DiscussSearchRequest
-from .encrypt_post_payload_api_v1_net_ease_cloud_music_app_encrypt_post_payload_post_payload import (
-    EncryptPostPayloadApiV1NetEaseCloudMusicAppEncryptPostPayloadPostPayload,
-)
-from .experience_search_request import ExperienceSearchRequest
-from .fetch_scholar_search_v3_api_v1_zhihu_web_fetch_scholar_search_v3_post_filter_fields import (
-    FetchScholarSearchV3ApiV1ZhihuWebFetchScholarSearchV3PostFilterFields,
-)
-from .follow_request import FollowRequest
-from .forward_request import ForwardRequest
-from .general_search_v1_request import GeneralSearchV1Request
-from .general_search_v2_request import GeneralSearchV2Request
-from .general_search_v3_request import GeneralSearchV3Request
-from .get_account_health_request import GetAccountHealthRequest
-from .get_account_overview_request import GetAccountOverviewRequest
-from .get_creator_account_info_request import GetCreatorAccountInfoRequest
-from .get_home_feed_request import GetHomeFeedRequest
-from .get_live_overview_request import GetLiveOverviewRequest
-from .get_note_info_v5_request import GetNoteInfoV5Request
-from .get_product_list_request import GetProductListRequest
-from .get_product_related_videos_request import GetProductRelatedVideosRequest
-from .get_showcase_product_list_request import GetShowcaseProductListRequest
-from .get_video_associated_product_list_request import GetVideoAssociatedProductListRequest
-from .get_video_audience_stats_request import GetVideoAudienceStatsRequest
-from .get_video_detailed_stats_request import GetVideoDetailedStatsRequest
-from .get_video_list_request import GetVideoListRequest
-from .get_video_overview_request import GetVideoOverviewRequest
-from .get_video_to_product_stats_request import GetVideoToProductStatsRequest
-from .get_violation_record_request import GetViolationRecordRequest
-from .health_check_response import HealthCheckResponse
-from .http_validation_error import HTTPValidationError
-from .image_search_request import ImageSearchRequest
-from .ios_shortcut import IOSShortcut
-from .like_request import LikeRequest
-from .live_room_batch_check_request import LiveRoomBatchCheckRequest
-from .live_search_v1_request import LiveSearchV1Request
-from .live_search_v2_request import LiveSearchV2Request
-from .mode_enum import ModeEnum
-from .multi_search_request import MultiSearchRequest
-from .music_search_request import MusicSearchRequest
-from .post_comment_request import PostCommentRequest
-from .reply_comment_request import ReplyCommentRequest
-from .response_model import ResponseModel
-from .school_search_request import SchoolSearchRequest
-from .search_challenge_request import SearchChallengeRequest
-from .search_suggest_request import SearchSuggestRequest
-from .subtitle_format import SubtitleFormat
-from .tik_tok_app_encrypt_request import TikTokAPPEncryptRequest
-from .tik_tok_app_encrypt_request_device_info import TikTokAPPEncryptRequestDeviceInfo
-from .tik_tok_app_login_encrypt_decrypt_request import TikTokAPPLoginEncryptDecryptRequest
-from .tik_tok_appv3_content_translate import TikTokAPPV3ContentTranslate
-from .tik_tok_appv3_home_feed import TikTokAPPV3HomeFeed
-from .update_check_response import UpdateCheckResponse
-from .url_access_mode import UrlAccessMode
-from .user_data import UserData
-from .user_info_response_model import UserInfoResponseModel
-from .user_search_request import UserSearchRequest
-from .user_search_request_v2 import UserSearchRequestV2
-from .validation_error import ValidationError
-from .video_search_v1_request import VideoSearchV1Request
-from .video_search_v2_request import VideoSearchV2Request
-from .videos_audios_mode import VideosAudiosMode
-from .x_bogus_model import XBogusModel
-from .xhs_web_sign_request_model import XhsWebSignRequestModel
-from .xhs_web_sign_request_model_data import XhsWebSignRequestModelData
 
 __all__ = (
     "ABogusModel",
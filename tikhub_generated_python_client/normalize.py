@@ -0,0 +1,414 @@
+"""Contains normalization of pages of videos, users and comments from every platform into one columnar schema
+
+The schema is the fields of the records in ``records`` (``Video``, ``User``, ``Comment``). A page of items is
+converted in one pass per column rather than per item: each path is looked up level by level over the whole page,
+and levels shared by several columns (like ``statistics``) are looked up once. The result maps every column name to
+a list with one value per item, None where an item has no value.
+
+Each platform's JSON shape is described by a dict of Column in VIDEO_SHAPES, USER_SHAPES and COMMENT_SHAPES, keyed
+by shape name. The Douyin and TikTok shapes match the records' constructors; the others follow the field names
+those APIs document, so add or replace entries there for endpoints whose items differ.
+"""
+
+from collections.abc import Callable, Sequence
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from attrs import define, field, fields
+
+from .records import Comment, User, Video, to_int
+
+VIDEO_COLUMNS = tuple(attribute.name for attribute in fields(Video))
+USER_COLUMNS = tuple(attribute.name for attribute in fields(User))
+COMMENT_COLUMNS = tuple(attribute.name for attribute in fields(Comment))
+
+Columns = dict[str, list[Any]]
+Converter = Callable[[list[Any]], list[Any]]
+
+
+def _number(value: Any) -> Union[int, float, None]:
+    # Whole numbers sent as strings stay ints, like the ints the column already has
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def ints(values: list[Any]) -> list[Any]:
+    """Convert a column to int, for counts and timestamps sent as strings"""
+    return [value if value is None or type(value) is int else to_int(value) for value in values]
+
+
+def ints_or_floats(values: list[Any]) -> list[Any]:
+    """Convert a column to numbers, keeping fractions"""
+    return [value if value is None or type(value) in (int, float) else _number(value) for value in values]
+
+
+def strs(values: list[Any]) -> list[Any]:
+    """Convert a column to str, for IDs sent as numbers"""
+    return [value if value is None or type(value) is str else str(value) for value in values]
+
+
+def no_zero_ids(values: list[Any]) -> list[Any]:
+    """Convert a column of IDs to str, with the 0 some APIs send for "none" as None"""
+    return [None if value in ("0", "") else value for value in strs(values)]
+
+
+def seconds_to_ms(values: list[Any]) -> list[Any]:
+    """Convert a column of durations in seconds to milliseconds"""
+    return [None if value is None else round(value * 1000) for value in ints_or_floats(values)]
+
+
+def ms_to_seconds(values: list[Any]) -> list[Any]:
+    """Convert a column of timestamps in milliseconds to seconds"""
+    return [None if value is None else value // 1000 for value in ints(values)]
+
+
+@define(frozen=True)
+class Column:
+    """Where the values of one column are in the items of one platform
+
+    Attributes:
+        paths: Dotted paths (as in ``pagination.get_path``) tried in order, the first value that is not None is kept
+        convert: Applied to the whole column after lookup, e.g. ``ints`` for counts sent as strings
+    """
+
+    paths: tuple[str, ...] = field(converter=lambda paths: (paths,) if isinstance(paths, str) else tuple(paths))
+    convert: Optional[Converter] = None
+
+
+def _key(segment: str) -> Union[str, int]:
+    return int(segment) if segment.isdigit() else segment
+
+
+def _lookup(items: Sequence[Any], path: str, levels: dict[str, list[Any]]) -> list[Any]:
+    """Look up ``path`` in every item at once, reusing (and adding to) the looked up prefixes in ``levels``"""
+    if path in levels:
+        return levels[path]
+    parent, _, last = path.rpartition(".")
+    values = _lookup(items, parent, levels) if parent else items
+    key = _key(last)
+    if isinstance(key, int):
+        column = [value[key] if type(value) is list and key < len(value) else None for value in values]
+    else:
+        column = [value.get(key) if type(value) is dict else None for value in values]
+    levels[path] = column
+    return column
+
+
+def to_columns(items: Sequence[Any], shape: dict[str, Column], columns: Sequence[str]) -> Columns:
+    """Convert decoded JSON items into ``columns``, finding each value where ``shape`` says
+
+    Columns the shape does not describe are all None.
+    """
+    levels: dict[str, list[Any]] = {}
+    result: Columns = {}
+    for name in columns:
+        column = shape.get(name)
+        if column is None:
+            result[name] = [None] * len(items)
+            continue
+        first, *fallbacks = column.paths
+        values = _lookup(items, first, levels)
+        for path in fallbacks:
+            if None in values:
+                fallback = _lookup(items, path, levels)
+                values = [value if value is not None else other for value, other in zip(values, fallback)]
+        result[name] = column.convert(values) if column.convert is not None else list(values)
+    return result
+
+
+VIDEO_SHAPES: dict[str, dict[str, Column]] = {
+    # douyin_web, douyin_app_v3 and tiktok_app_v3 awemes
+    "aweme": {
+        "id": Column("aweme_id", strs),
+        "desc": Column("desc"),
+        "create_time": Column("create_time", ints),
+        "author_id": Column("author.uid", strs),
+        "author_sec_uid": Column("author.sec_uid"),
+        "duration_ms": Column(("video.duration", "duration"), ints),
+        "digg_count": Column("statistics.digg_count", ints),
+        "comment_count": Column("statistics.comment_count", ints),
+        "share_count": Column("statistics.share_count", ints),
+        "play_count": Column("statistics.play_count", ints),
+        "collect_count": Column("statistics.collect_count", ints),
+        "cover_url": Column("video.cover.url_list.0"),
+    },
+    "tiktok_web": {
+        "id": Column("id", strs),
+        "desc": Column("desc"),
+        "create_time": Column("createTime", ints),
+        "author_id": Column("author.id", strs),
+        "author_sec_uid": Column("author.secUid"),
+        "duration_ms": Column("video.duration", seconds_to_ms),
+        "digg_count": Column("stats.diggCount", ints),
+        "comment_count": Column("stats.commentCount", ints),
+        "share_count": Column("stats.shareCount", ints),
+        "play_count": Column("stats.playCount", ints),
+        "collect_count": Column("stats.collectCount", ints),
+        "cover_url": Column("video.cover"),
+    },
+    "kuaishou": {
+        "id": Column("photo_id", strs),
+        "desc": Column("caption"),
+        "create_time": Column("timestamp", ms_to_seconds),
+        "author_id": Column("user_id", strs),
+        "duration_ms": Column("duration", ints),
+        "digg_count": Column("like_count", ints),
+        "comment_count": Column("comment_count", ints),
+        "share_count": Column("forward_count", ints),
+        "play_count": Column("view_count", ints),
+        "cover_url": Column("cover_thumbnail_urls.0.url"),
+    },
+    "xigua": {
+        "id": Column(("group_id", "item_id"), strs),
+        "desc": Column("title"),
+        "create_time": Column("publish_time", ints),
+        "author_id": Column("user_info.user_id", strs),
+        "duration_ms": Column("video_duration", seconds_to_ms),
+        "digg_count": Column("digg_count", ints),
+        "comment_count": Column("comment_count", ints),
+        "share_count": Column("share_count", ints),
+        "play_count": Column(("video_detail_info.video_watch_count", "play_count"), ints),
+        "cover_url": Column(("large_image.url", "middle_image.url")),
+    },
+    "bilibili": {
+        "id": Column("bvid"),
+        "desc": Column("title"),
+        "create_time": Column(("pubdate", "created"), ints),
+        "author_id": Column(("owner.mid", "mid"), strs),
+        "duration_ms": Column("duration", seconds_to_ms),
+        "digg_count": Column("stat.like", ints),
+        "comment_count": Column(("stat.reply", "comment"), ints),
+        "share_count": Column("stat.share", ints),
+        "play_count": Column(("stat.view", "play"), ints),
+        "collect_count": Column("stat.favorite", ints),
+        "cover_url": Column("pic"),
+    },
+    "youtube": {
+        "id": Column(("video_id", "videoId", "id")),
+        "desc": Column(("title", "description")),
+        "duration_ms": Column(("length_seconds", "lengthSeconds"), seconds_to_ms),
+        "play_count": Column(("view_count", "viewCount"), ints),
+        "cover_url": Column(("thumbnails.0.url", "thumbnail")),
+    },
+    "instagram": {
+        "id": Column(("pk", "id"), strs),
+        "desc": Column("caption.text"),
+        "create_time": Column("taken_at", ints),
+        "author_id": Column(("user.pk", "owner.id"), strs),
+        "duration_ms": Column("video_duration", seconds_to_ms),
+        "digg_count": Column("like_count", ints),
+        "comment_count": Column("comment_count", ints),
+        "share_count": Column("reshare_count", ints),
+        "play_count": Column(("play_count", "view_count"), ints),
+        "cover_url": Column(("image_versions2.candidates.0.url", "thumbnail_url", "display_url")),
+    },
+    "pipixia": {
+        "id": Column(("item_id", "item.item_id"), strs),
+        "desc": Column(("content", "item.content")),
+        "create_time": Column(("create_time", "item.create_time"), ints),
+        "author_id": Column(("author.id", "item.author.id"), strs),
+        "duration_ms": Column(("video.duration", "item.video.duration"), seconds_to_ms),
+        "digg_count": Column(("stats.like_count", "item.stats.like_count"), ints),
+        "comment_count": Column(("stats.comment_count", "item.stats.comment_count"), ints),
+        "share_count": Column(("stats.share_count", "item.stats.share_count"), ints),
+        "play_count": Column(("stats.play_count", "item.stats.play_count"), ints),
+        "cover_url": Column(("cover.url_list.0.url", "item.cover.url_list.0.url")),
+    },
+}
+
+USER_SHAPES: dict[str, dict[str, Column]] = {
+    "aweme": {
+        "id": Column("uid", strs),
+        "sec_uid": Column("sec_uid"),
+        "unique_id": Column(("unique_id", "short_id")),
+        "nickname": Column("nickname"),
+        "signature": Column("signature"),
+        "follower_count": Column("follower_count", ints),
+        "following_count": Column("following_count", ints),
+        "video_count": Column("aweme_count", ints),
+        "like_count": Column("total_favorited", ints),
+        "avatar_url": Column("avatar_thumb.url_list.0"),
+    },
+    # userInfo ({"user": ..., "stats": ...})
+    "tiktok_web": {
+        "id": Column("user.id", strs),
+        "sec_uid": Column("user.secUid"),
+        "unique_id": Column("user.uniqueId"),
+        "nickname": Column("user.nickname"),
+        "signature": Column("user.signature"),
+        "follower_count": Column("stats.followerCount", ints),
+        "following_count": Column("stats.followingCount", ints),
+        "video_count": Column("stats.videoCount", ints),
+        "like_count": Column(("stats.heartCount", "stats.heart"), ints),
+        "avatar_url": Column("user.avatarThumb"),
+    },
+    "bilibili": {
+        "id": Column("mid", strs),
+        "nickname": Column(("name", "uname")),
+        "signature": Column("sign"),
+        "follower_count": Column(("follower", "fans"), ints),
+        "following_count": Column(("following", "attention"), ints),
+        "video_count": Column("archive_count", ints),
+        "avatar_url": Column("face"),
+    },
+    "instagram": {
+        "id": Column(("pk", "id"), strs),
+        "unique_id": Column("username"),
+        "nickname": Column("full_name"),
+        "signature": Column("biography"),
+        "follower_count": Column(("follower_count", "edge_followed_by.count"), ints),
+        "following_count": Column(("following_count", "edge_follow.count"), ints),
+        "video_count": Column(("media_count", "edge_owner_to_timeline_media.count"), ints),
+        "avatar_url": Column("profile_pic_url"),
+    },
+}
+
+_AWEME_COMMENT = {
+    "id": Column("cid", strs),
+    "video_id": Column("aweme_id", strs),
+    "text": Column("text"),
+    "create_time": Column("create_time", ints),
+    "digg_count": Column("digg_count", ints),
+    "reply_count": Column("reply_comment_total", ints),
+    "reply_to_id": Column("reply_id", no_zero_ids),
+    "user_id": Column("user.uid", strs),
+    "user_nickname": Column("user.nickname"),
+}
+
+COMMENT_SHAPES: dict[str, dict[str, Column]] = {
+    "aweme": _AWEME_COMMENT,
+    # tiktok_web comments come in the aweme shape
+    "tiktok_web": _AWEME_COMMENT,
+    "kuaishou": {
+        "id": Column("comment_id", strs),
+        "video_id": Column("photo_id", strs),
+        "text": Column("content"),
+        "create_time": Column("timestamp", ms_to_seconds),
+        "digg_count": Column(("likedCount", "like_count"), ints),
+        "reply_count": Column("subCommentCount", ints),
+        "reply_to_id": Column("replyTo", no_zero_ids),
+        "user_id": Column("author_id", strs),
+        "user_nickname": Column("author_name"),
+    },
+    "bilibili": {
+        "id": Column("rpid", strs),
+        "video_id": Column("oid", strs),
+        "text": Column("content.message"),
+        "create_time": Column("ctime", ints),
+        "digg_count": Column("like", ints),
+        "reply_count": Column("rcount", ints),
+        "reply_to_id": Column("parent", no_zero_ids),
+        "user_id": Column("mid", strs),
+        "user_nickname": Column("member.uname"),
+    },
+    "youtube": {
+        "id": Column(("comment_id", "commentId")),
+        "text": Column(("content", "text")),
+        "digg_count": Column(("like_count", "likeCount"), ints),
+        "reply_count": Column(("reply_count", "replyCount"), ints),
+        "user_id": Column(("author_channel_id", "channelId")),
+        "user_nickname": Column(("author", "authorText")),
+    },
+    "instagram": {
+        "id": Column(("pk", "id"), strs),
+        "video_id": Column("media_id", strs),
+        "text": Column("text"),
+        "create_time": Column("created_at", ints),
+        "digg_count": Column(("comment_like_count", "like_count"), ints),
+        "reply_count": Column("child_comment_count", ints),
+        "reply_to_id": Column("parent_comment_id", no_zero_ids),
+        "user_id": Column(("user.pk", "user.id"), strs),
+        "user_nickname": Column("user.username"),
+    },
+}
+
+# The shape of each API namespace (see facade) that returns these entities
+NAMESPACE_SHAPES: dict[str, str] = {
+    "douyin_web": "aweme",
+    "douyin_app_v3": "aweme",
+    "douyin_search": "aweme",
+    "tiktok_app_v3": "aweme",
+    "tiktok_web": "tiktok_web",
+    "kuaishou_app": "kuaishou",
+    "xigua_app_v2": "xigua",
+    "bilibili_web": "bilibili",
+    "youtube_web": "youtube",
+    "instagram_web_app": "instagram",
+    "pipixia_app": "pipixia",
+}
+
+
+def shape_of(endpoint: ModuleType) -> str:
+    """Get the shape name of the items an endpoint module returns, from its URL
+
+    Raises:
+        KeyError: If the endpoint's namespace is not in NAMESPACE_SHAPES.
+    """
+    namespace = "_".join(endpoint.ENDPOINT.url.split("/")[3:-1])
+    try:
+        return NAMESPACE_SHAPES[namespace]
+    except KeyError:
+        raise KeyError(f"No item shape is known for {namespace}, pass a shape name explicitly") from None
+
+
+def _normalize(
+    items: Sequence[Any],
+    shape: Union[str, ModuleType],
+    shapes: dict[str, dict[str, Column]],
+    columns: Sequence[str],
+) -> Columns:
+    name = shape if isinstance(shape, str) else shape_of(shape)
+    try:
+        mapping = shapes[name]
+    except KeyError:
+        raise KeyError(f"No mapping is registered for {name!r} items") from None
+    return to_columns(items, mapping, columns)
+
+
+def normalize_videos(items: Sequence[Any], shape: Union[str, ModuleType]) -> Columns:
+    """Convert a page of videos into the VIDEO_COLUMNS columns
+
+    ``shape`` is a key of VIDEO_SHAPES, or the endpoint module the items came from.
+
+    Raises:
+        KeyError: If there is no mapping for the shape.
+    """
+    return _normalize(items, shape, VIDEO_SHAPES, VIDEO_COLUMNS)
+
+
+def normalize_users(items: Sequence[Any], shape: Union[str, ModuleType]) -> Columns:
+    """Like normalize_videos, for users (USER_SHAPES, USER_COLUMNS)"""
+    return _normalize(items, shape, USER_SHAPES, USER_COLUMNS)
+
+
+def normalize_comments(items: Sequence[Any], shape: Union[str, ModuleType]) -> Columns:
+    """Like normalize_videos, for comments (COMMENT_SHAPES, COMMENT_COLUMNS)"""
+    return _normalize(items, shape, COMMENT_SHAPES, COMMENT_COLUMNS)
+
+
+__all__ = [
+    "COMMENT_COLUMNS",
+    "COMMENT_SHAPES",
+    "NAMESPACE_SHAPES",
+    "USER_COLUMNS",
+    "USER_SHAPES",
+    "VIDEO_COLUMNS",
+    "VIDEO_SHAPES",
+    "Column",
+    "Columns",
+    "ints",
+    "ints_or_floats",
+    "ms_to_seconds",
+    "no_zero_ids",
+    "normalize_comments",
+    "normalize_users",
+    "normalize_videos",
+    "seconds_to_ms",
+    "shape_of",
+    "strs",
+    "to_columns",
+]
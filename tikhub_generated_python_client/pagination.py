@@ -0,0 +1,528 @@
+"""Contains helpers for walking cursor-paginated endpoints page by page or item by item"""
+
+import asyncio
+import inspect
+import urllib.parse
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from types import ModuleType
+from typing import Any, Optional, Union, cast
+
+from attrs import define
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .decoding import default_json_loads, resolve
+from .models.response_model import ResponseModel
+from .types import Response, Unset
+
+# Cursor values some upstreams send instead of dropping the field on the last page
+_EXHAUSTED_CURSORS = (None, "", "no_more")
+
+_DONE = object()
+
+
+@define(frozen=True)
+class CursorPagination:
+    """Describes how a cursor-paginated endpoint moves from one page to the next
+
+    Paths are dotted lookups relative to ``ResponseModel.data``, e.g. ``"aweme_list"`` or ``"data.items"``.
+
+    Attributes:
+        cursor_param: The keyword argument of the endpoint function that receives the cursor
+        next_cursor: The path of the cursor to send for the next page
+        items: The path of the list of items on a page
+        has_more: The path of the "more pages available" flag, or None if the endpoint does not send one
+        is_end: The path of a "last page" flag, for endpoints that send that instead of ``has_more``
+        next_cursor_query: If ``next_cursor`` is the URL of the next page rather than a cursor, the query parameter
+            of that URL holding the cursor
+    """
+
+    cursor_param: str
+    next_cursor: str
+    items: str
+    has_more: Optional[str] = None
+    is_end: Optional[str] = None
+    next_cursor_query: Optional[str] = None
+
+
+@define(frozen=True)
+class OffsetPagination:
+    """Describes an endpoint whose pages are addressed by a plain offset or page number
+
+    Later pages do not depend on earlier responses, so they can be requested concurrently.
+
+    Attributes:
+        offset_param: The keyword argument of the endpoint function that receives the offset or page number
+        items: The path (relative to ``ResponseModel.data``) of the list of items on a page
+        page_size_param: The keyword argument that sets the page size, if the endpoint has one
+        page_size: The number of items on a full page, used when there is no ``page_size_param``
+        numbered_pages: Whether ``offset_param`` counts pages (1, 2, 3, ...) rather than items
+    """
+
+    offset_param: str
+    items: str
+    page_size_param: Optional[str] = None
+    page_size: Optional[int] = None
+    numbered_pages: bool = False
+
+
+_AWEME_MAX_CURSOR = CursorPagination(
+    cursor_param="max_cursor", next_cursor="max_cursor", items="aweme_list", has_more="has_more"
+)
+_AWEME_CURSOR = CursorPagination(cursor_param="cursor", next_cursor="cursor", items="aweme_list", has_more="has_more")
+_COMMENTS_CURSOR = CursorPagination(cursor_param="cursor", next_cursor="cursor", items="comments", has_more="has_more")
+_TIKTOK_WEB_ITEMS = CursorPagination(cursor_param="cursor", next_cursor="cursor", items="itemList", has_more="hasMore")
+_INSTAGRAM_TOKEN = CursorPagination(cursor_param="pagination_token", next_cursor="pagination_token", items="data.items")
+_YOUTUBE_VIDEOS = CursorPagination(cursor_param="continuation_token", next_cursor="continuation_token", items="videos")
+# Zhihu's comment offsets are opaque ("1739257701_11108372663_0"), only found in the URL of the next page
+_ZHIHU_COMMENTS = CursorPagination(
+    cursor_param="offset", next_cursor="paging.next", items="data", is_end="paging.is_end", next_cursor_query="offset"
+)
+
+PAGINATION: dict[str, CursorPagination] = {
+    # Douyin
+    "/api/v1/douyin/web/fetch_user_post_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/douyin/web/fetch_user_mix_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/douyin/web/fetch_user_collects_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/douyin/web/fetch_video_comments": _COMMENTS_CURSOR,
+    "/api/v1/douyin/web/fetch_video_comment_replies": _COMMENTS_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_user_post_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_user_like_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_hashtag_video_list": _AWEME_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_music_video_list": _AWEME_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_video_mix_post_list": _AWEME_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_video_comments": _COMMENTS_CURSOR,
+    "/api/v1/douyin/app/v3/fetch_video_comment_replies": _COMMENTS_CURSOR,
+    # TikTok
+    "/api/v1/tiktok/app/v3/fetch_user_post_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/tiktok/app/v3/fetch_user_like_videos": _AWEME_MAX_CURSOR,
+    "/api/v1/tiktok/app/v3/fetch_hashtag_video_list": _AWEME_CURSOR,
+    "/api/v1/tiktok/app/v3/fetch_music_video_list": _AWEME_CURSOR,
+    "/api/v1/tiktok/app/v3/fetch_video_comments": _COMMENTS_CURSOR,
+    "/api/v1/tiktok/app/v3/fetch_video_comment_replies": _COMMENTS_CURSOR,
+    "/api/v1/tiktok/web/fetch_user_post": _TIKTOK_WEB_ITEMS,
+    "/api/v1/tiktok/web/fetch_user_like": _TIKTOK_WEB_ITEMS,
+    "/api/v1/tiktok/web/fetch_user_collect": _TIKTOK_WEB_ITEMS,
+    "/api/v1/tiktok/web/fetch_user_mix": _TIKTOK_WEB_ITEMS,
+    "/api/v1/tiktok/web/fetch_tag_post": _TIKTOK_WEB_ITEMS,
+    "/api/v1/tiktok/web/fetch_post_comment": _COMMENTS_CURSOR,
+    "/api/v1/tiktok/web/fetch_post_comment_reply": _COMMENTS_CURSOR,
+    # Kuaishou
+    "/api/v1/kuaishou/app/fetch_user_post_v2": CursorPagination(
+        cursor_param="pcursor", next_cursor="pcursor", items="feeds"
+    ),
+    "/api/v1/kuaishou/app/fetch_user_hot_post": CursorPagination(
+        cursor_param="pcursor", next_cursor="pcursor", items="feeds"
+    ),
+    "/api/v1/kuaishou/app/fetch_one_video_comment": CursorPagination(
+        cursor_param="pcursor", next_cursor="pcursor", items="rootComments"
+    ),
+    # Xiaohongshu
+    "/api/v1/xiaohongshu/web_v2/fetch_home_notes": CursorPagination(
+        cursor_param="cursor", next_cursor="cursor", items="notes", has_more="has_more"
+    ),
+    "/api/v1/xiaohongshu/web_v2/fetch_note_comments": _COMMENTS_CURSOR,
+    "/api/v1/xiaohongshu/web_v2/fetch_sub_comments": _COMMENTS_CURSOR,
+    # Instagram
+    "/api/v1/instagram/web_app/fetch_user_posts_and_reels_by_user_id": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_posts_and_reels_by_username": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_posts_and_reels_by_url": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_reels_by_username": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_reels_by_url": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_followers_by_username": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_user_following_by_username": _INSTAGRAM_TOKEN,
+    "/api/v1/instagram/web_app/fetch_post_comments_by_url": _INSTAGRAM_TOKEN,
+    # Twitter
+    "/api/v1/twitter/web/fetch_user_post_tweet": CursorPagination(
+        cursor_param="cursor", next_cursor="next_cursor", items="timeline"
+    ),
+    "/api/v1/twitter/web/fetch_search_timeline": CursorPagination(
+        cursor_param="cursor", next_cursor="next_cursor", items="timeline"
+    ),
+    "/api/v1/twitter/web/fetch_post_comments": CursorPagination(
+        cursor_param="cursor", next_cursor="next_cursor", items="thread"
+    ),
+    "/api/v1/twitter/web/fetch_user_followers": CursorPagination(
+        cursor_param="cursor", next_cursor="next_cursor", items="followers"
+    ),
+    "/api/v1/twitter/web/fetch_user_followings": CursorPagination(
+        cursor_param="cursor", next_cursor="next_cursor", items="following"
+    ),
+    # YouTube
+    "/api/v1/youtube/web/get_channel_videos": _YOUTUBE_VIDEOS,
+    "/api/v1/youtube/web/get_channel_short_videos": _YOUTUBE_VIDEOS,
+    "/api/v1/youtube/web/get_channel_videos_v2": CursorPagination(
+        cursor_param="next_token", next_cursor="nextToken", items="items"
+    ),
+    "/api/v1/youtube/web/get_video_comments": CursorPagination(
+        cursor_param="continuation_token", next_cursor="continuation_token", items="comments"
+    ),
+    # Zhihu
+    "/api/v1/zhihu/web/fetch_comment_v5": _ZHIHU_COMMENTS,
+    "/api/v1/zhihu/web/fetch_sub_comment_v5": _ZHIHU_COMMENTS,
+}
+
+
+_ZHIHU_SEARCH = OffsetPagination(offset_param="offset", items="data", page_size_param="limit")
+
+
+def _tiktok_ads_pages(items: str) -> OffsetPagination:
+    return OffsetPagination(offset_param="page", items=items, page_size_param="limit", numbered_pages=True)
+
+
+OFFSET_PAGINATION: dict[str, OffsetPagination] = {
+    "/api/v1/zhihu/web/fetch_article_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_column_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_ebook_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_salt_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_topic_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_user_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_video_search_v3": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_user_followers": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_user_followees": _ZHIHU_SEARCH,
+    "/api/v1/zhihu/web/fetch_column_articles": _ZHIHU_SEARCH,
+    # TikTok Ads (Creative Center), paths as in the endpoints' documented examples
+    "/api/v1/tiktok/ads/get_creative_patterns": _tiktok_ads_pages("list"),
+    "/api/v1/tiktok/ads/get_creator_list": _tiktok_ads_pages("data.creators"),
+    "/api/v1/tiktok/ads/get_hashtag_list": _tiktok_ads_pages("data.list"),
+    "/api/v1/tiktok/ads/get_keyword_details": _tiktok_ads_pages("data.keyword_list"),
+    "/api/v1/tiktok/ads/get_keyword_insights": _tiktok_ads_pages("data.keyword_list"),
+    "/api/v1/tiktok/ads/get_keyword_list": _tiktok_ads_pages("keyword_info_list"),
+    "/api/v1/tiktok/ads/get_popular_trends": _tiktok_ads_pages("data.videos"),
+    "/api/v1/tiktok/ads/get_related_keywords": _tiktok_ads_pages("list"),
+    "/api/v1/tiktok/ads/get_sound_rank_list": _tiktok_ads_pages("data.sound_list"),
+    "/api/v1/tiktok/ads/get_top_ads_spotlight": _tiktok_ads_pages("data.materials"),
+    "/api/v1/tiktok/ads/get_top_products": _tiktok_ads_pages("data.list"),
+    "/api/v1/tiktok/ads/search_ads": _tiktok_ads_pages("materials"),
+    "/api/v1/tiktok/ads/search_creators": _tiktok_ads_pages("data.creators"),
+    "/api/v1/tiktok/ads/search_sound": _tiktok_ads_pages("sound_list"),
+    "/api/v1/tiktok/ads/search_sound_hint": _tiktok_ads_pages("sound_list"),
+}
+
+
+def get_path(data: Any, path: str) -> Any:
+    """Look up a dotted path such as ``"data.items.0.id"`` in decoded JSON, returning None if any step is missing"""
+    for key in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def get_pagination(endpoint: ModuleType, **kwargs: Any) -> CursorPagination:
+    """Get the pagination description of an endpoint module for the given call arguments
+
+    Raises:
+        KeyError: If the endpoint is not listed in PAGINATION.
+    """
+    url = endpoint._get_kwargs(**kwargs)["url"]
+    try:
+        return PAGINATION[url]
+    except KeyError:
+        raise KeyError(f"No pagination is registered for {url}, pass pagination= explicitly") from None
+
+
+def get_items(page: ResponseModel, pagination: Union[CursorPagination, OffsetPagination]) -> list[Any]:
+    """Get the list of items on a page, or an empty list if there are none"""
+    items = get_path(page.data, pagination.items)
+    return items if isinstance(items, list) else []
+
+
+def next_page_kwargs(
+    page: ResponseModel, pagination: CursorPagination, kwargs: dict[str, Any]
+) -> Optional[dict[str, Any]]:
+    """Get the endpoint arguments for the page after ``page``, or None if ``page`` was the last one"""
+    if pagination.has_more is not None and not get_path(page.data, pagination.has_more):
+        return None
+    if pagination.is_end is not None and get_path(page.data, pagination.is_end):
+        return None
+    cursor = get_path(page.data, pagination.next_cursor)
+    if pagination.next_cursor_query is not None and isinstance(cursor, str):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(cursor).query)
+        cursor = query.get(pagination.next_cursor_query, [None])[0]
+    if cursor in _EXHAUSTED_CURSORS or cursor == kwargs.get(pagination.cursor_param):
+        return None
+    if not get_items(page, pagination):
+        return None
+    return {**kwargs, pagination.cursor_param: cursor}
+
+
+def _check_page(response: Response[Any], client: Union[AuthenticatedClient, Client]) -> ResponseModel:
+    parsed = resolve(response.parsed)
+    if parsed is None and response.status_code == 200 and client.parse_mode == "raw":
+        # Paginators need the page to find the next cursor, so they parse it even when the client does not
+        parsed = ResponseModel.from_dict((client.json_loads or default_json_loads())(response.content))
+    if not isinstance(parsed, ResponseModel):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return parsed
+
+
+def _resolve(endpoint: ModuleType, pagination: Optional[CursorPagination], kwargs: dict[str, Any]) -> CursorPagination:
+    if pagination is not None:
+        return pagination
+    return get_pagination(endpoint, **{k: v for k, v in kwargs.items() if not isinstance(v, Unset)})
+
+
+def iter_pages(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[CursorPagination] = None,
+    max_pages: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[ResponseModel]:
+    """Lazily request the pages of a cursor-paginated endpoint, starting from the cursor in ``kwargs`` (if any)
+
+    Args:
+        endpoint: The endpoint module, e.g. ``api.tik_tok_web_api.fetch_user_post_api_v1_tiktok_web_fetch_user_post_get``
+        client: The client to make the requests with
+        pagination: How to page through the endpoint. Looked up in PAGINATION by URL if not given.
+        max_pages: Stop after this many pages
+        **kwargs: Arguments for the endpoint's ``sync_detailed``
+
+    Raises:
+        errors.UnexpectedStatus: If a page does not come back as a ResponseModel.
+        httpx.TimeoutException: If a request takes longer than Client.timeout.
+    """
+    pagination = _resolve(endpoint, pagination, kwargs)
+    page_kwargs: Optional[dict[str, Any]] = kwargs
+    pages = 0
+    while page_kwargs is not None and (max_pages is None or pages < max_pages):
+        page = _check_page(endpoint.sync_detailed(client=client, **page_kwargs), client)
+        pages += 1
+        yield page
+        page_kwargs = next_page_kwargs(page, pagination, page_kwargs)
+
+
+def iter_items(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[CursorPagination] = None,
+    max_pages: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Like iter_pages, but yield the individual items of each page"""
+    pagination = _resolve(endpoint, pagination, kwargs)
+    for page in iter_pages(endpoint, client=client, pagination=pagination, max_pages=max_pages, **kwargs):
+        yield from get_items(page, pagination)
+
+
+async def _aiter_pages_sequentially(
+    endpoint: ModuleType,
+    client: Union[AuthenticatedClient, Client],
+    pagination: CursorPagination,
+    max_pages: Optional[int],
+    kwargs: dict[str, Any],
+) -> AsyncGenerator[ResponseModel, None]:
+    page_kwargs: Optional[dict[str, Any]] = kwargs
+    pages = 0
+    while page_kwargs is not None and (max_pages is None or pages < max_pages):
+        page = _check_page(await endpoint.asyncio_detailed(client=client, **page_kwargs), client)
+        pages += 1
+        # Work out the next cursor before handing the page over, so a prefetching producer can issue it right away
+        page_kwargs = next_page_kwargs(page, pagination, page_kwargs)
+        yield page
+
+
+async def _aiter_pages_prefetching(
+    pages: AsyncGenerator[ResponseModel, None], prefetch: int
+) -> AsyncGenerator[ResponseModel, None]:
+    queue: asyncio.Queue[Union[ResponseModel, BaseException, object]] = asyncio.Queue(maxsize=prefetch)
+    stopped = False
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await queue.put(page)
+        except BaseException as exc:
+            # Nobody reads the queue once the consumer has stopped and cancelled this task
+            if stopped:
+                raise
+            await queue.put(exc)
+        else:
+            await queue.put(_DONE)
+        finally:
+            await pages.aclose()
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is _DONE:
+                return
+            if isinstance(page, BaseException):
+                raise page
+            yield cast(ResponseModel, page)
+    finally:
+        stopped = True
+        producer.cancel()
+
+
+async def aiter_pages(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[CursorPagination] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> AsyncIterator[ResponseModel]:
+    """Like iter_pages but async, using the endpoint's ``asyncio_detailed``
+
+    With ``prefetch`` set, the request for the next page is sent as soon as the current page's cursor is known,
+    while the caller is still processing earlier pages. At most ``prefetch`` unconsumed pages are buffered; the
+    pages are still requested one after another, so this does not add concurrency against the same upstream.
+    """
+    pagination = _resolve(endpoint, pagination, kwargs)
+    pages = _aiter_pages_sequentially(endpoint, client, pagination, max_pages, kwargs)
+    if prefetch > 0:
+        pages = _aiter_pages_prefetching(pages, prefetch)
+    async for page in pages:
+        yield page
+
+
+async def aiter_items(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[CursorPagination] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Like iter_items but async, using the endpoint's ``asyncio_detailed``"""
+    pagination = _resolve(endpoint, pagination, kwargs)
+    async for page in aiter_pages(
+        endpoint, client=client, pagination=pagination, max_pages=max_pages, prefetch=prefetch, **kwargs
+    ):
+        for item in get_items(page, pagination):
+            yield item
+
+
+def _resolve_offset(
+    endpoint: ModuleType, pagination: Optional[OffsetPagination], kwargs: dict[str, Any]
+) -> OffsetPagination:
+    if pagination is not None:
+        return pagination
+    url = endpoint._get_kwargs(**{k: v for k, v in kwargs.items() if not isinstance(v, Unset)})["url"]
+    try:
+        return OFFSET_PAGINATION[url]
+    except KeyError:
+        raise KeyError(f"No offset pagination is registered for {url}, pass pagination= explicitly") from None
+
+
+def _get_default(endpoint: ModuleType, name: str) -> Any:
+    parameter = inspect.signature(endpoint._get_kwargs).parameters.get(name)
+    if parameter is None or parameter.default is inspect.Parameter.empty or isinstance(parameter.default, Unset):
+        return None
+    return parameter.default
+
+
+async def aiter_offset_pages(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[OffsetPagination] = None,
+    concurrency: int = 4,
+    max_pages: Optional[int] = None,
+    **kwargs: Any,
+) -> AsyncIterator[ResponseModel]:
+    """Request the pages of an offset-paginated endpoint concurrently and yield them in order
+
+    Up to ``concurrency`` pages starting at the offset in ``kwargs`` (or the endpoint's default) are in flight at
+    once over the client's shared ``httpx.AsyncClient``. Iteration stops at the first empty or short page, and any
+    requests for pages after it that are still in flight are cancelled.
+
+    Args:
+        endpoint: The endpoint module, e.g. ``api.zhihu_web_api.fetch_user_search_v3_api_v1_zhihu_web_fetch_user_search_v3_get``
+        client: The client to make the requests with
+        pagination: How to page through the endpoint. Looked up in OFFSET_PAGINATION by URL if not given.
+        concurrency: The maximum number of pages requested at the same time
+        max_pages: Stop after this many pages
+        **kwargs: Arguments for the endpoint's ``asyncio_detailed``
+
+    Raises:
+        errors.UnexpectedStatus: If a page does not come back as a ResponseModel.
+        httpx.TimeoutException: If a request takes longer than Client.timeout.
+    """
+    pagination = _resolve_offset(endpoint, pagination, kwargs)
+    page_size = pagination.page_size
+    if pagination.page_size_param is not None:
+        page_size = int(kwargs.get(pagination.page_size_param) or _get_default(endpoint, pagination.page_size_param))
+    if page_size is None:
+        raise ValueError("OffsetPagination needs either page_size_param or page_size")
+
+    first = kwargs.get(pagination.offset_param)
+    if first is None or isinstance(first, Unset):
+        first = _get_default(endpoint, pagination.offset_param) or (1 if pagination.numbered_pages else 0)
+    # Some endpoints take the offset as a string, keep sending whatever type they were given
+    offset_type = type(first)
+    step = 1 if pagination.numbered_pages else page_size
+
+    pending: deque[asyncio.Future[Response[Any]]] = deque()
+    launched = 0
+
+    def launch() -> None:
+        nonlocal launched
+        offset = offset_type(int(first) + launched * step)
+        pending.append(
+            asyncio.ensure_future(
+                endpoint.asyncio_detailed(client=client, **{**kwargs, pagination.offset_param: offset})
+            )
+        )
+        launched += 1
+
+    try:
+        while len(pending) < max(concurrency, 1) and (max_pages is None or launched < max_pages):
+            launch()
+        while pending:
+            page = _check_page(await pending.popleft(), client)
+            yield page
+            if len(get_items(page, pagination)) < page_size:
+                return
+            if max_pages is None or launched < max_pages:
+                launch()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aiter_offset_items(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    pagination: Optional[OffsetPagination] = None,
+    concurrency: int = 4,
+    max_pages: Optional[int] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Like aiter_offset_pages, but yield the individual items of each page, in order"""
+    pagination = _resolve_offset(endpoint, pagination, kwargs)
+    async for page in aiter_offset_pages(
+        endpoint, client=client, pagination=pagination, concurrency=concurrency, max_pages=max_pages, **kwargs
+    ):
+        for item in get_items(page, pagination):
+            yield item
+
+
+__all__ = [
+    "OFFSET_PAGINATION",
+    "PAGINATION",
+    "CursorPagination",
+    "OffsetPagination",
+    "aiter_items",
+    "aiter_offset_items",
+    "aiter_offset_pages",
+    "aiter_pages",
+    "get_items",
+    "get_pagination",
+    "get_path",
+    "iter_items",
+    "iter_pages",
+    "next_page_kwargs",
+]
@@ -0,0 +1,213 @@
+"""Contains field projection: keeping only the requested JSON paths of large responses
+
+With msgspec installed, bodies are decoded into Struct types generated from the paths, so the values no path reaches
+are skipped by the decoder without ever being built. Without it, the body is decoded in full and the requested
+fields are copied out, which saves memory afterwards but not while decoding.
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from types import ModuleType
+from typing import Any, Optional, Union
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .decoding import JsonLoads, default_json_loads
+
+# Selects every item of a list in a projection tree
+_EACH = object()
+# Marks values that a path does not reach
+_MISSING = object()
+_SEGMENT = re.compile(r"\.?([^.\[\]]+)|\[(\*|\d+)\]")
+
+
+def _parse_path(path: str) -> list[Any]:
+    segments: list[Any] = []
+    position = 0
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        if match is None or (match.group(0).startswith(".") and position == 0):
+            raise ValueError(f"Invalid JSON path {path!r} at position {position}")
+        key, index = match.groups()
+        segments.append(key if key is not None else _EACH if index == "*" else int(index))
+        position = match.end()
+    if not segments:
+        raise ValueError("JSON paths can't be empty")
+    return segments
+
+
+@define
+class Projection:
+    """A set of JSON paths to keep, like ``data.aweme_list[*].statistics.digg_count``
+
+    Paths are dot-separated object keys; ``[*]`` selects every item of a list and ``[N]`` its N-th item. A path that
+    ends at an object or list keeps all of it. Projecting a value keeps its shape but drops every key that no path
+    reaches, and list items that no path selects.
+
+    Attributes:
+        paths: The JSON paths to keep
+    """
+
+    paths: tuple[str, ...] = field(converter=tuple)
+    _tree: dict[Any, Any] = field(init=False, factory=dict)
+    _decoder: Optional[Callable[[bytes], Any]] = field(init=False, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        for path in self.paths:
+            node: dict[Any, Any] = self._tree
+            *parents, last = _parse_path(path)
+            for segment in parents:
+                child = node.setdefault(segment, {})
+                if child is None:
+                    # A shorter path already keeps everything below here
+                    break
+                node = child
+            else:
+                node[last] = None
+
+    def apply(self, data: Any) -> Any:
+        """Get the parts of ``data`` (decoded JSON) that the paths reach"""
+        projected = _project(data, self._tree)
+        return None if projected is _MISSING else projected
+
+    def decode(self, content: bytes, json_loads: Optional[JsonLoads] = None) -> Any:
+        """Decode a JSON body, keeping only the parts the paths reach
+
+        The values no path reaches are skipped while decoding if msgspec is installed. Otherwise, and for bodies
+        whose shape does not fit the paths (e.g. an object where a path expects a list), the body is decoded in full
+        with ``json_loads`` (default: decoding.default_json_loads) and then projected.
+        """
+        msgspec = _import_msgspec()
+        if msgspec is not None:
+            if self._decoder is None:
+                self._decoder = msgspec.json.Decoder(_struct_type(msgspec, self._tree)).decode
+            try:
+                projected = _from_struct(msgspec, self._decoder(content), self._tree)
+            except msgspec.MsgspecError:
+                pass
+            else:
+                return None if projected is _MISSING else projected
+        return self.apply((json_loads or default_json_loads())(content))
+
+
+def _project(value: Any, tree: Union[dict[Any, Any], None]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, dict):
+        projected_object = {}
+        for key, subtree in tree.items():
+            if isinstance(key, str) and key in value:
+                child = _project(value[key], subtree)
+                if child is not _MISSING:
+                    projected_object[key] = child
+        return projected_object
+    if isinstance(value, list):
+        if _EACH in tree:
+            children = (_project(item, tree[_EACH]) for item in value)
+            return [child for child in children if child is not _MISSING]
+        projected_list = []
+        for key, subtree in tree.items():
+            if isinstance(key, int) and -len(value) <= key < len(value):
+                child = _project(value[key], subtree)
+                if child is not _MISSING:
+                    projected_list.append(child)
+        return projected_list
+    return _MISSING
+
+
+def _import_msgspec() -> Any:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec
+
+
+def _struct_type(msgspec: Any, tree: Union[dict[Any, Any], None]) -> Any:
+    """Get the msgspec type that decodes only what ``tree`` reaches; null is accepted wherever a path goes deeper"""
+    if tree is None:
+        return Any
+    if _EACH in tree:
+        return Optional[list[_struct_type(msgspec, tree[_EACH])]]  # type: ignore[misc]
+    if not all(isinstance(key, str) for key in tree):
+        # Single list items can't be selected by a type: decode the list and project it afterwards
+        return Any
+    fields = [
+        (
+            f"f{number}",
+            Union[_struct_type(msgspec, subtree), msgspec.UnsetType],
+            msgspec.field(name=key, default=msgspec.UNSET),
+        )
+        for number, (key, subtree) in enumerate(tree.items())
+    ]
+    return Optional[msgspec.defstruct("Projected", fields)]
+
+
+def _from_struct(msgspec: Any, value: Any, tree: Union[dict[Any, Any], None]) -> Any:
+    """Turn what a _struct_type decoded into the same plain JSON values that _project gives"""
+    if tree is None:
+        return value
+    if isinstance(value, msgspec.Struct):
+        projected_object = {}
+        for (key, subtree), name in zip(tree.items(), value.__struct_fields__):
+            child = getattr(value, name)
+            if child is not msgspec.UNSET:
+                child = _from_struct(msgspec, child, subtree)
+                if child is not _MISSING:
+                    projected_object[key] = child
+        return projected_object
+    if isinstance(value, list) and _EACH in tree:
+        children = (_from_struct(msgspec, item, tree[_EACH]) for item in value)
+        return [child for child in children if child is not _MISSING]
+    return _project(value, tree)
+
+
+def project(data: Any, paths: Union[Projection, Iterable[str]]) -> Any:
+    """Get the parts of ``data`` (decoded JSON) reached by ``paths``, see Projection"""
+    projection = paths if isinstance(paths, Projection) else Projection(paths)
+    return projection.apply(data)
+
+
+def _parse(client: Union[AuthenticatedClient, Client], response: httpx.Response, projection: Projection) -> Any:
+    if response.status_code != 200:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return projection.decode(response.content, client.json_loads)
+
+
+def fetch_projected(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    fields: Union[Projection, Iterable[str]],
+    **kwargs: Any,
+) -> Any:
+    """Call an endpoint module and get only the ``fields`` (JSON paths, see Projection) of its response body
+
+    Unlike the endpoint's own functions, this returns plain decoded JSON rather than models.
+
+    Raises:
+        errors.UnexpectedStatus: If the response status is not 200.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """
+    projection = fields if isinstance(fields, Projection) else Projection(fields)
+    response = client.get_httpx_client().request(**endpoint._get_kwargs(**kwargs))
+    return _parse(client, response, projection)
+
+
+async def afetch_projected(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    fields: Union[Projection, Iterable[str]],
+    **kwargs: Any,
+) -> Any:
+    """Like fetch_projected, for httpx.AsyncClient"""
+    projection = fields if isinstance(fields, Projection) else Projection(fields)
+    response = await client.get_async_httpx_client().request(**endpoint._get_kwargs(**kwargs))
+    return _parse(client, response, projection)
+
+
+__all__ = ["Projection", "afetch_projected", "fetch_projected", "project"]
@@ -0,0 +1,118 @@
+"""Contains a token bucket rate limiter that clients apply to every request before it is sent"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+
+@define
+class TokenBucket:
+    """A thread-safe token bucket allowing ``rate`` requests per second on average, in bursts of up to ``burst``
+
+    Callers reserve a token up front and then sleep until it becomes available, so waiting never spins and
+    concurrent callers are released in the order they arrived.
+
+    Attributes:
+        rate: The number of tokens added per second
+        burst: The maximum number of tokens that can accumulate while idle. Defaults to ``rate`` (at least 1).
+    """
+
+    rate: float
+    burst: Optional[float] = None
+    _tokens: float = field(init=False)
+    _updated_at: float = field(init=False, factory=time.monotonic)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst is None:
+            self.burst = max(self.rate, 1.0)
+        self._tokens = self.burst
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds the caller has to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst or 1.0, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@define
+class RateLimiter:
+    """Limits requests with a global token bucket plus optional buckets for URL path prefixes
+
+    A request first takes a token from the bucket of the longest prefix matching its path, and once that token is
+    available, one from the global bucket.
+
+    Attributes:
+        global_limit: The bucket every request draws from, if any
+        prefixes: Buckets for URL path prefixes, e.g. ``{"/api/v1/douyin/web/": TokenBucket(rate=5)}``. A trailing
+            ``*`` is ignored, so ``"/api/v1/tiktok/app/v3/*"`` works too.
+    """
+
+    global_limit: Optional[TokenBucket] = None
+    prefixes: dict[str, TokenBucket] = field(factory=dict)
+
+    def __attrs_post_init__(self) -> None:
+        self.prefixes = {prefix.rstrip("*"): bucket for prefix, bucket in self.prefixes.items()}
+
+    def bucket_for(self, path: str) -> Optional[TokenBucket]:
+        """Get the bucket of the longest prefix matching ``path``, if any"""
+        matches = [prefix for prefix in self.prefixes if path.startswith(prefix)]
+        return self.prefixes[max(matches, key=len)] if matches else None
+
+    def acquire(self, path: str) -> None:
+        """Block until a request to ``path`` may be sent"""
+        # The global token is only taken once the prefix allows the request, so a backlog on one slow prefix
+        # does not use up the global budget of the others
+        for bucket in (self.bucket_for(path), self.global_limit):
+            delay = bucket.reserve() if bucket is not None else 0.0
+            if delay > 0:
+                time.sleep(delay)
+
+    async def acquire_async(self, path: str) -> None:
+        """Wait until a request to ``path`` may be sent, without blocking the event loop"""
+        for bucket in (self.bucket_for(path), self.global_limit):
+            delay = bucket.reserve() if bucket is not None else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """An httpx transport that waits for the rate limiter before handing each request to the wrapped transport"""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter):
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.limiter.acquire(request.url.path)
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Like RateLimitTransport, for httpx.AsyncClient"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.acquire_async(request.url.path)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = ["AsyncRateLimitTransport", "RateLimitTransport", "RateLimiter", "TokenBucket"]
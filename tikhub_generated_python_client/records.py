@@ -0,0 +1,304 @@
+"""Contains compact typed records for the entities most endpoints return: videos, users, comments and live rooms
+
+``ResponseModel.data`` is plain decoded JSON, and a video's dict tree takes a few KB. A record keeps only the
+commonly used fields in slots, which is a small fraction of that, and makes them attributes. Each record has
+constructors for the JSON shapes of the Douyin and TikTok endpoints and converts back to a flat dict with ``to_dict``.
+
+Two shapes are covered: the "aweme" shape of douyin_web, douyin_app_v3 and tiktok_app_v3 (``aweme_id``,
+``statistics.digg_count``, ...) and the camelCase shape of tiktok_web (``id``, ``stats.diggCount``, ...).
+"""
+
+import abc
+from collections.abc import Iterable
+from typing import Any, Optional, TypeVar
+
+from attrs import define
+
+T = TypeVar("T", bound="_Record")
+
+_EMPTY: dict[str, Any] = {}
+
+
+def to_int(value: Any) -> Optional[int]:
+    """Convert a count or timestamp to int, accepting strings ("1234", "1,234"); None for anything else
+
+    Counts some APIs only send abbreviated ("1.2万", "3K views") are dropped rather than guessed.
+    """
+    if type(value) is int:
+        return value
+    try:
+        return int(value.replace(",", "") if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _first_url(image: Any) -> Optional[str]:
+    if not image:
+        return None
+    if isinstance(image, str):
+        return image
+    urls = image.get("url_list")
+    return urls[0] if urls else None
+
+
+class _Record(abc.ABC):
+    __slots__ = ()
+
+    @classmethod
+    @abc.abstractmethod
+    def from_dict(cls: type[T], src_dict: dict[str, Any]) -> T:
+        """Build a record from the dict of an entity"""
+
+    @classmethod
+    def from_dicts(cls: type[T], src_dicts: Iterable[dict[str, Any]]) -> list[T]:
+        """Build a record from each dict, see from_dict"""
+        from_dict = cls.from_dict
+        return [from_dict(src_dict) for src_dict in src_dicts]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a flat dict of the record's fields"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@define(weakref_slot=False)
+class Video(_Record):
+    """A video (Douyin aweme or TikTok item)
+
+    Attributes:
+        id: The video ID (``aweme_id``)
+        desc: The caption
+        create_time: The Unix timestamp of the upload
+        author_id: The author's user ID (``uid``)
+        author_sec_uid: The author's ``sec_uid``
+        duration_ms: The duration in milliseconds
+        digg_count: The number of likes
+        comment_count: The number of comments
+        share_count: The number of shares
+        play_count: The number of plays
+        collect_count: The number of times the video was saved
+        cover_url: The first URL of the cover image
+    """
+
+    id: str
+    desc: Optional[str] = None
+    create_time: Optional[int] = None
+    author_id: Optional[str] = None
+    author_sec_uid: Optional[str] = None
+    duration_ms: Optional[int] = None
+    digg_count: Optional[int] = None
+    comment_count: Optional[int] = None
+    share_count: Optional[int] = None
+    play_count: Optional[int] = None
+    collect_count: Optional[int] = None
+    cover_url: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, src_dict: dict[str, Any]) -> "Video":
+        """Build a video from either shape, telling them apart by ``aweme_id``"""
+        if "aweme_id" in src_dict:
+            return cls.from_aweme(src_dict)
+        return cls.from_tiktok_web(src_dict)
+
+    @classmethod
+    def from_aweme(cls, d: dict[str, Any]) -> "Video":
+        """Build a video from an aweme (douyin_web, douyin_app_v3, tiktok_app_v3)"""
+        author = d.get("author") or _EMPTY
+        statistics = d.get("statistics") or _EMPTY
+        video = d.get("video") or _EMPTY
+        return cls(
+            str(d["aweme_id"]),
+            d.get("desc"),
+            to_int(d.get("create_time")),
+            author.get("uid"),
+            author.get("sec_uid"),
+            to_int(video.get("duration") or d.get("duration")),
+            to_int(statistics.get("digg_count")),
+            to_int(statistics.get("comment_count")),
+            to_int(statistics.get("share_count")),
+            to_int(statistics.get("play_count")),
+            to_int(statistics.get("collect_count")),
+            _first_url(video.get("cover")),
+        )
+
+    @classmethod
+    def from_tiktok_web(cls, d: dict[str, Any]) -> "Video":
+        """Build a video from a tiktok_web item (``itemStruct`` or an ``itemList`` entry)"""
+        author = d.get("author") or _EMPTY
+        stats = d.get("stats") or _EMPTY
+        video = d.get("video") or _EMPTY
+        duration = video.get("duration")
+        return cls(
+            str(d["id"]),
+            d.get("desc"),
+            to_int(d.get("createTime")),
+            author.get("id"),
+            author.get("secUid"),
+            # tiktok_web gives the duration in seconds
+            None if duration is None else int(duration) * 1000,
+            to_int(stats.get("diggCount")),
+            to_int(stats.get("commentCount")),
+            to_int(stats.get("shareCount")),
+            to_int(stats.get("playCount")),
+            to_int(stats.get("collectCount")),
+            _first_url(video.get("cover")),
+        )
+
+
+@define(weakref_slot=False)
+class User(_Record):
+    """A user profile
+
+    Attributes:
+        id: The user ID (``uid``)
+        sec_uid: The ``sec_uid`` most endpoints take to address a user
+        unique_id: The handle
+        nickname: The display name
+        signature: The bio
+        follower_count: The number of followers
+        following_count: The number of followed users
+        video_count: The number of videos
+        like_count: The number of likes over all videos
+        avatar_url: The first URL of the avatar thumbnail
+    """
+
+    id: str
+    sec_uid: Optional[str] = None
+    unique_id: Optional[str] = None
+    nickname: Optional[str] = None
+    signature: Optional[str] = None
+    follower_count: Optional[int] = None
+    following_count: Optional[int] = None
+    video_count: Optional[int] = None
+    like_count: Optional[int] = None
+    avatar_url: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, src_dict: dict[str, Any]) -> "User":
+        """Build a user from either shape, telling them apart by ``uid``"""
+        if "uid" in src_dict:
+            return cls.from_aweme(src_dict)
+        return cls.from_tiktok_web(src_dict)
+
+    @classmethod
+    def from_aweme(cls, d: dict[str, Any]) -> "User":
+        """Build a user from an aweme author or user profile (douyin_web, douyin_app_v3, tiktok_app_v3)"""
+        return cls(
+            str(d["uid"]),
+            d.get("sec_uid"),
+            d.get("unique_id") or d.get("short_id"),
+            d.get("nickname"),
+            d.get("signature"),
+            to_int(d.get("follower_count")),
+            to_int(d.get("following_count")),
+            to_int(d.get("aweme_count")),
+            to_int(d.get("total_favorited")),
+            _first_url(d.get("avatar_thumb")),
+        )
+
+    @classmethod
+    def from_tiktok_web(cls, d: dict[str, Any], stats: Optional[dict[str, Any]] = None) -> "User":
+        """Build a user from tiktok_web's ``userInfo`` (``{"user": ..., "stats": ...}``) or a ``user``/``author``
+
+        Pass an item's ``authorStats`` as ``stats`` to get the counts of its author.
+        """
+        if "user" in d:
+            d, stats = d["user"], d.get("stats")
+        stats = stats or _EMPTY
+        return cls(
+            str(d["id"]),
+            d.get("secUid"),
+            d.get("uniqueId"),
+            d.get("nickname"),
+            d.get("signature"),
+            to_int(stats.get("followerCount")),
+            to_int(stats.get("followingCount")),
+            to_int(stats.get("videoCount")),
+            to_int(stats.get("heartCount") or stats.get("heart")),
+            _first_url(d.get("avatarThumb")),
+        )
+
+
+@define(weakref_slot=False)
+class Comment(_Record):
+    """A comment on a video, or a reply to one
+
+    Douyin and all TikTok endpoints share one comment shape.
+
+    Attributes:
+        id: The comment ID (``cid``)
+        video_id: The ID of the commented video
+        text: The text
+        create_time: The Unix timestamp of the comment
+        digg_count: The number of likes
+        reply_count: The number of replies
+        reply_to_id: The ID of the comment this replies to, or None for top-level comments
+        user_id: The commenter's user ID
+        user_nickname: The commenter's display name
+    """
+
+    id: str
+    video_id: Optional[str] = None
+    text: Optional[str] = None
+    create_time: Optional[int] = None
+    digg_count: Optional[int] = None
+    reply_count: Optional[int] = None
+    reply_to_id: Optional[str] = None
+    user_id: Optional[str] = None
+    user_nickname: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, src_dict: dict[str, Any]) -> "Comment":
+        d = src_dict
+        user = d.get("user") or _EMPTY
+        reply_id = d.get("reply_id")
+        return cls(
+            str(d["cid"]),
+            d.get("aweme_id"),
+            d.get("text"),
+            to_int(d.get("create_time")),
+            to_int(d.get("digg_count")),
+            to_int(d.get("reply_comment_total")),
+            None if reply_id in (None, "", "0") else str(reply_id),
+            user.get("uid"),
+            user.get("nickname"),
+        )
+
+
+@define(weakref_slot=False)
+class LiveRoom(_Record):
+    """A Douyin or TikTok live room
+
+    Attributes:
+        id: The room ID
+        title: The title
+        status: The room status, 2 while live
+        user_count: The number of viewers
+        owner_id: The host's user ID
+        owner_nickname: The host's display name
+    """
+
+    id: str
+    title: Optional[str] = None
+    status: Optional[int] = None
+    user_count: Optional[int] = None
+    owner_id: Optional[str] = None
+    owner_nickname: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, src_dict: dict[str, Any]) -> "LiveRoom":
+        d = src_dict
+        owner = d.get("owner") or _EMPTY
+        user_count = d.get("user_count")
+        if user_count is None:
+            user_count = (d.get("stats") or _EMPTY).get("total_user")
+        return cls(
+            str(d.get("id_str") or d["id"]),
+            d.get("title"),
+            to_int(d.get("status")),
+            to_int(user_count),
+            owner.get("id_str") or owner.get("uid"),
+            owner.get("nickname"),
+        )
+
+
+__all__ = ["Comment", "LiveRoom", "User", "Video", "to_int"]
@@ -0,0 +1,173 @@
+"""Contains the retry policy that clients apply to transient failures at the transport level"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+# Failures where the request never reached the server, so any method can safely be sent again
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Failures where the server may already have acted on the request
+_MAYBE_SENT_ERRORS = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+@define
+class RetryPolicy:
+    """Decides when and how long to wait before a failed request is sent again
+
+    Connection failures and 429 responses are retried for every method, since the server has not acted on the
+    request. Other errors, timeouts and 5xx responses are only retried for idempotent methods, and for POST
+    endpoints listed in ``idempotent_paths`` (many of this API's POST endpoints only read data).
+
+    Delays use decorrelated jitter: each one is drawn between ``base_delay`` and three times the previous one,
+    capped at ``max_delay``. A ``Retry-After`` header from the server takes precedence.
+
+    Attributes:
+        max_attempts: The maximum number of times a request is sent, including the first attempt
+        base_delay: The smallest delay between attempts, in seconds
+        max_delay: The largest computed delay between attempts, in seconds
+        deadline: The total time in seconds a request may take across all attempts and delays. No further attempt
+            is made if its delay would end past the deadline.
+        retry_statuses: Response status codes worth retrying
+        idempotent_methods: Methods that are always safe to send again
+        idempotent_paths: URL path prefixes of non-idempotent-method endpoints that are nevertheless safe to retry
+        respect_retry_after: Whether to wait as long as a ``Retry-After`` header asks
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    deadline: Optional[float] = None
+    retry_statuses: frozenset[int] = field(factory=lambda: frozenset({429, 500, 502, 503, 504}))
+    idempotent_methods: frozenset[str] = field(factory=lambda: frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}))
+    idempotent_paths: tuple[str, ...] = ()
+    respect_retry_after: bool = True
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        """Whether sending ``request`` twice has the same effect as sending it once"""
+        return request.method in self.idempotent_methods or request.url.path.startswith(self.idempotent_paths)
+
+    def should_retry_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        return response.status_code in self.retry_statuses and self.is_idempotent(request)
+
+    def should_retry_error(self, request: httpx.Request, error: Exception) -> bool:
+        if isinstance(error, _NOT_SENT_ERRORS):
+            return True
+        return isinstance(error, _MAYBE_SENT_ERRORS) and self.is_idempotent(request)
+
+    def next_delay(self, previous: float, response: Optional[httpx.Response] = None) -> float:
+        """Get the delay before the next attempt, given the previous delay and the response that failed (if any)"""
+        if response is not None and self.respect_retry_after:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return min(self.max_delay, random.uniform(self.base_delay, max(previous, self.base_delay) * 3))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@define
+class _Attempts:
+    """Tracks the attempts of a single request against a RetryPolicy"""
+
+    policy: RetryPolicy
+    started_at: float = field(factory=time.monotonic)
+    count: int = 0
+    delay: float = 0.0
+
+    def next_delay(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """Get the delay before the next attempt, or None if there should not be one"""
+        if self.count >= self.policy.max_attempts:
+            return None
+        self.delay = self.policy.next_delay(self.delay, response)
+        if self.policy.deadline is not None and (
+            time.monotonic() - self.started_at + self.delay > self.policy.deadline
+        ):
+            return None
+        return self.delay
+
+
+class RetryTransport(httpx.BaseTransport):
+    """An httpx transport that sends requests through the wrapped transport again according to a RetryPolicy"""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy):
+        self.transport = transport
+        self.policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = _Attempts(self.policy)
+        while True:
+            attempts.count += 1
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as error:
+                delay = attempts.next_delay() if self.policy.should_retry_error(request, error) else None
+                if delay is None:
+                    raise
+            else:
+                if not self.policy.should_retry_response(request, response):
+                    return response
+                delay = attempts.next_delay(response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Like RetryTransport, for httpx.AsyncClient"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy):
+        self.transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = _Attempts(self.policy)
+        while True:
+            attempts.count += 1
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as error:
+                delay = attempts.next_delay() if self.policy.should_retry_error(request, error) else None
+                if delay is None:
+                    raise
+            else:
+                if not self.policy.should_retry_response(request, response):
+                    return response
+                delay = attempts.next_delay(response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = ["AsyncRetryTransport", "RetryPolicy", "RetryTransport"]
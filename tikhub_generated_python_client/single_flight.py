@@ -0,0 +1,185 @@
+"""Contains request coalescing: identical requests made at the same time share a single HTTP round trip"""
+
+import asyncio
+import hashlib
+import threading
+from typing import Any, Optional
+
+import httpx
+from attrs import define, field
+
+# A request extension marking requests whose response is read as a stream, which middleware must not buffer
+STREAM_EXTENSION = "tikhub_stream"
+
+
+def is_streamed(request: httpx.Request) -> bool:
+    """Whether a request's response is read as a stream (see STREAM_EXTENSION), so it must not be read in full"""
+    return bool(request.extensions.get(STREAM_EXTENSION))
+
+
+def request_key(request: httpx.Request) -> str:
+    """Get a key identifying what a request asks for: its method, URL path, sorted query parameters and body hash
+
+    Two calls of an endpoint function with the same arguments produce the same key, whatever the order of the
+    query parameters.
+    """
+    params = "&".join(f"{name}={value}" for name, value in sorted(request.url.params.multi_items()))
+    body = hashlib.sha256(request.content).hexdigest() if request.content else ""
+    return f"{request.method} {request.url.path}?{params} {body}"
+
+
+@define(frozen=True)
+class RawResponse:
+    """A fully read response that can be replayed to any number of callers
+
+    The body is kept exactly as it came off the wire (possibly still compressed), so each replayed httpx.Response
+    decodes it the same way the original would have.
+    """
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    extensions: dict[str, Any] = field(factory=dict)
+
+    @classmethod
+    def read(cls, response: httpx.Response) -> "RawResponse":
+        """Read and close a response returned by a transport, which has not decoded its body yet"""
+        try:
+            content = b"".join(response.stream)
+        finally:
+            response.close()
+        return cls._from(response, content)
+
+    @classmethod
+    async def aread(cls, response: httpx.Response) -> "RawResponse":
+        """Like read, for a response returned by an async transport"""
+        try:
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return cls._from(response, content)
+
+    @classmethod
+    def _from(cls, response: httpx.Response, content: bytes) -> "RawResponse":
+        extensions = {
+            key: response.extensions[key] for key in ("http_version", "reason_phrase") if key in response.extensions
+        }
+        return cls(response.status_code, response.headers.raw, content, extensions)
+
+    def replay(self, request: httpx.Request) -> httpx.Response:
+        """Get a new response to ``request`` with this status, headers and body"""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            request=request,
+            extensions=self.extensions,
+        )
+
+
+@define(frozen=True)
+class SingleFlight:
+    """Decides which requests are coalesced
+
+    Streamed requests (see is_streamed) are never coalesced, since that reads their whole response.
+
+    Attributes:
+        methods: Methods whose requests are coalesced
+        paths: URL path prefixes of other endpoints whose requests are coalesced whatever their method, e.g. POST
+            endpoints that only read data
+    """
+
+    methods: frozenset[str] = field(factory=lambda: frozenset({"GET", "HEAD"}))
+    paths: tuple[str, ...] = ()
+
+    def applies_to(self, request: httpx.Request) -> bool:
+        if is_streamed(request):
+            return False
+        return request.method in self.methods or request.url.path.startswith(self.paths)
+
+
+@define
+class _Call:
+    done: threading.Event = field(factory=threading.Event)
+    result: Optional[RawResponse] = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """An httpx transport that lets concurrent identical requests from different threads share one request
+
+    The first caller sends the request; the others wait for it and each get their own copy of its response.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, policy: SingleFlight):
+        self.transport = transport
+        self.policy = policy
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.applies_to(request):
+            return self.transport.handle_request(request)
+        key = request_key(request)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if leader:
+            try:
+                call.result = RawResponse.read(self.transport.handle_request(request))
+            except BaseException as error:
+                call.error = error
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        assert call.result is not None
+        return call.result.replay(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+    """Like SingleFlightTransport, for concurrent coroutines using httpx.AsyncClient
+
+    The shared request runs in its own task, so it is not cancelled when one of the callers waiting for it is.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: SingleFlight):
+        self.transport = transport
+        self.policy = policy
+        self._calls: dict[str, asyncio.Future[RawResponse]] = {}
+
+    async def _fetch(self, request: httpx.Request) -> RawResponse:
+        return await RawResponse.aread(await self.transport.handle_async_request(request))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.applies_to(request):
+            return await self.transport.handle_async_request(request)
+        key = request_key(request)
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(self._fetch(request))
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        return (await asyncio.shield(call)).replay(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "STREAM_EXTENSION",
+    "AsyncSingleFlightTransport",
+    "RawResponse",
+    "SingleFlight",
+    "SingleFlightTransport",
+    "is_streamed",
+    "request_key",
+]
@@ -0,0 +1,205 @@
+"""Contains streaming parsing: yielding the items of an array in a response body while it is still arriving
+
+Only the text of the item being received is kept in memory, so peak memory per request depends on the size of one
+item rather than of the whole body.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator, Generator, Iterator
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .pagination import OFFSET_PAGINATION, PAGINATION
+from .single_flight import STREAM_EXTENSION
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = frozenset("-0123456789")
+# "" is in it too: a number at the very end of the text is not known to be complete
+_NUMBER_PART = "0123456789.eE+-"
+_MAX_RETRY_STEP = 256 * 1024
+
+
+class ArrayItemParser:
+    """Decodes the items of the array at ``path`` (dotted object keys, e.g. ``"data.aweme_list"``) in a JSON document
+    fed to it in chunks
+
+    Only the objects along ``path`` are walked key by key. Every item, and every value beside the path, is decoded in
+    one go by the standard library's C decoder once it has fully arrived, so the body is never held in full. An
+    incomplete value is retried once its text has doubled (or grown by 256 KiB), which keeps large values close to
+    linear; call ``close`` after the last chunk to get the items still held back.
+    """
+
+    def __init__(self, path: str):
+        self.path = path.split(".") if path else []
+        self.done = False
+        self._text = ""
+        self._position = 0
+        self._retry_at = 0
+        self._eof = False
+        self._items: list[Any] = []
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._parser = self._parse()
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse the next chunk of the document, returning the items it completes"""
+        return self._resume(self._utf8.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """Signal the end of the document, returning the items left
+
+        Raises:
+            json.JSONDecodeError: If the array at ``path`` was cut off.
+        """
+        self._eof = True
+        return self._resume(self._utf8.decode(b"", final=True))
+
+    def _resume(self, text: str) -> list[Any]:
+        if self.done:
+            return []
+        self._text = self._text[self._position :] + text
+        self._retry_at -= self._position
+        self._position = 0
+        if len(self._text) >= self._retry_at or self._eof:
+            try:
+                next(self._parser)
+            except StopIteration:
+                self.done = True
+        items, self._items = self._items, []
+        return items
+
+    def _next_char(self) -> Generator[None, None, str]:
+        """Skip whitespace and get the next character without consuming it"""
+        while True:
+            self._position = _WHITESPACE.match(self._text, self._position).end()
+            if self._position < len(self._text):
+                return self._text[self._position]
+            if self._eof:
+                raise json.JSONDecodeError("Unexpected end of document", self._text, self._position)
+            yield
+
+    def _take(self) -> Generator[None, None, str]:
+        char = yield from self._next_char()
+        self._position += 1
+        return char
+
+    def _value(self) -> Generator[None, None, Any]:
+        """Decode the next value once it has fully arrived"""
+        yield from self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._position)
+                # A number may go on in the next chunk ("-25" of "-2500.0"), so it is only complete once
+                # something else follows it
+                number = self._text[self._position] in _NUMBER_START
+                if not number or self._eof or self._text[end : end + 1] not in _NUMBER_PART:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            pending = len(self._text) - self._position
+            self._retry_at = len(self._text) + min(pending, _MAX_RETRY_STEP)
+            yield
+
+    def _parse(self) -> Generator[None, None, None]:
+        for key in self.path:
+            if (yield from self._take()) != "{":
+                return
+            while True:
+                if (yield from self._next_char()) != '"':
+                    return
+                name = yield from self._value()
+                if (yield from self._take()) != ":":
+                    return
+                if name == key:
+                    break
+                # Skip a value beside the path
+                yield from self._value()
+                if (yield from self._take()) != ",":
+                    return
+        if (yield from self._take()) != "[":
+            return
+        if (yield from self._next_char()) == "]":
+            return
+        while True:
+            item = yield from self._value()
+            self._items.append(item)
+            if (yield from self._take()) != ",":
+                return
+
+
+def default_items_path(endpoint: ModuleType) -> str:
+    """Get the path of the items array of a paginated endpoint module, from PAGINATION or OFFSET_PAGINATION
+
+    Raises:
+        KeyError: If the endpoint is in neither.
+    """
+    url = endpoint.ENDPOINT.url
+    pagination = PAGINATION.get(url) or OFFSET_PAGINATION.get(url)
+    if pagination is None:
+        raise KeyError(f"No items path is known for {url}, pass path= explicitly")
+    return f"data.{pagination.items}"
+
+
+def _stream_kwargs(endpoint: ModuleType, kwargs: dict[str, Any]) -> dict[str, Any]:
+    # Marked so the client's cache and single flight pass the response through instead of reading it in full
+    request_kwargs = endpoint._get_kwargs(**kwargs)
+    request_kwargs["extensions"] = {**request_kwargs.get("extensions", {}), STREAM_EXTENSION: True}
+    return request_kwargs
+
+
+def iter_array_items(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    path: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Call an endpoint module and yield the decoded items of the array at ``path`` as they arrive
+
+    ``path`` defaults to the items of paginated endpoints (see default_items_path). Items are plain decoded JSON
+    (decoded by the standard library, whatever the client's json_loads); reading stops as soon as the array ends.
+    Nothing is yielded if the body has no array at ``path``.
+
+    Raises:
+        errors.UnexpectedStatus: If the response status is not 200.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+    """
+    parser = ArrayItemParser(path if path is not None else default_items_path(endpoint))
+    with client.get_httpx_client().stream(**_stream_kwargs(endpoint, kwargs)) as response:
+        if response.status_code != 200:
+            raise errors.UnexpectedStatus(response.status_code, response.read())
+        for chunk in response.iter_bytes():
+            yield from parser.feed(chunk)
+            if parser.done:
+                return
+        yield from parser.close()
+
+
+async def aiter_array_items(
+    endpoint: ModuleType,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    path: Optional[str] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Like iter_array_items, for httpx.AsyncClient"""
+    parser = ArrayItemParser(path if path is not None else default_items_path(endpoint))
+    async with client.get_async_httpx_client().stream(**_stream_kwargs(endpoint, kwargs)) as response:
+        if response.status_code != 200:
+            raise errors.UnexpectedStatus(response.status_code, await response.aread())
+        async for chunk in response.aiter_bytes():
+            for item in parser.feed(chunk):
+                yield item
+            if parser.done:
+                return
+        for item in parser.close():
+            yield item
+
+
+__all__ = ["ArrayItemParser", "aiter_array_items", "default_items_path", "iter_array_items"]
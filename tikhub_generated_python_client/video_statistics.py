@@ -0,0 +1,220 @@
+"""Contains a sweeper that refreshes the counters of any number of Douyin videos with fetch_multi_video_statistics
+
+``douyin_app_v3.fetch_multi_video_statistics`` returns the counters of up to 50 videos per request, 50 times fewer
+requests than ``fetch_video_statistics`` video by video. ``aiter_video_statistics`` reads the IDs lazily (from any
+iterable, e.g. ``read_ids(path)``), sends them 50 at a time with adaptive concurrency, and yields the counters as
+VideoStatisticsRows: columns of machine integers in ``array.array`` buffers, about 56 bytes per video.
+"""
+
+import asyncio
+import heapq
+import time
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import Any, Optional, Union
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from .batching import fetch_data, find_awemes
+from .client import AuthenticatedClient
+
+# The most IDs fetch_multi_video_statistics takes in one request
+CHUNK_SIZE = 50
+# Stored for counters a response does not have
+MISSING = -1
+
+_COUNTERS = ("play_count", "digg_count", "comment_count", "share_count", "collect_count")
+
+
+@define
+class AdaptiveConcurrency:
+    """Limits the number of requests in flight, growing it while requests succeed and halving it when they are throttled
+
+    The limit grows by about one per round of ``limit`` successful requests (additive increase) and is halved by
+    429 responses, 5xx responses and transport errors (multiplicative decrease).
+
+    Attributes:
+        initial: The limit to start with
+        minimum: The smallest limit
+        maximum: The largest limit
+    """
+
+    initial: float = 4
+    minimum: float = 1
+    maximum: float = 32
+    limit: float = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.limit = self.initial
+
+    def succeeded(self) -> None:
+        """Record a successful request"""
+        self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def failed(self, error: Exception) -> None:
+        """Record a failed request, lowering the limit if ``error`` says the server is overloaded"""
+        if isinstance(error, httpx.TransportError) or (
+            isinstance(error, errors.UnexpectedStatus) and (error.status_code == 429 or error.status_code >= 500)
+        ):
+            self.limit = max(self.minimum, self.limit / 2)
+
+
+class VideoStatisticsRows:
+    """Rows of ``(aweme_id, play, digg, comment, share, collect, ts)``, stored column by column
+
+    Counters a response does not have are MISSING (-1); ``ts`` is the Unix time in seconds the counters were fetched.
+
+    Attributes:
+        aweme_id: The video IDs, as unsigned 64-bit integers
+        play: The play counts, as signed 64-bit integers like digg, comment, share, collect and ts
+    """
+
+    __slots__ = ("aweme_id", "collect", "comment", "digg", "play", "share", "ts")
+
+    def __init__(self) -> None:
+        self.aweme_id = array("Q")
+        self.play = array("q")
+        self.digg = array("q")
+        self.comment = array("q")
+        self.share = array("q")
+        self.collect = array("q")
+        self.ts = array("q")
+
+    def append(self, aweme_id: int, play: int, digg: int, comment: int, share: int, collect: int, ts: int) -> None:
+        """Add a row"""
+        self.aweme_id.append(aweme_id)
+        self.play.append(play)
+        self.digg.append(digg)
+        self.comment.append(comment)
+        self.share.append(share)
+        self.collect.append(collect)
+        self.ts.append(ts)
+
+    def __len__(self) -> int:
+        return len(self.aweme_id)
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int, int, int, int]]:
+        return zip(self.aweme_id, self.play, self.digg, self.comment, self.share, self.collect, self.ts)
+
+    def columns(self) -> dict[str, array]:
+        """Get the columns by name, e.g. for ``pyarrow.table`` (pass ``pyarrow.array(memoryview(column))``)"""
+        return {name: getattr(self, name) for name in ("aweme_id", "play", "digg", "comment", "share", "collect", "ts")}
+
+
+def read_ids(path: str) -> Iterator[str]:
+    """Read IDs from a text file, one per line, skipping blank lines, without reading the whole file at once"""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _counter(statistics: dict[str, Any], key: str) -> int:
+    value = statistics.get(key)
+    try:
+        return MISSING if value is None else int(value)
+    except (TypeError, ValueError):
+        return MISSING
+
+
+def add_statistics(rows: VideoStatisticsRows, data: Any, ts: int) -> None:
+    """Add the counters of every video (dicts with an ``aweme_id``) in a response's ``data`` to ``rows``"""
+    for aweme_id, video in find_awemes(data).items():
+        if not aweme_id.isdigit():
+            continue
+        statistics = video.get("statistics") or video
+        rows.append(int(aweme_id), *(_counter(statistics, key) for key in _COUNTERS), ts)
+
+
+async def aiter_video_statistics(
+    client: AuthenticatedClient,
+    aweme_ids: Iterable[Union[str, int]],
+    *,
+    buffer_size: int = 10_000,
+    concurrency: Optional[AdaptiveConcurrency] = None,
+    retries: int = 2,
+    retry_delay: float = 1.0,
+) -> AsyncIterator[VideoStatisticsRows]:
+    """Fetch the counters of ``aweme_ids`` with ``douyin_app_v3.fetch_multi_video_statistics``, 50 videos per request
+
+    IDs are read from ``aweme_ids`` only as fast as requests go out, so it can be a generator over millions of them.
+    Rows are yielded in buffers of at least ``buffer_size`` (the last one may be smaller), in the order responses
+    arrive. A chunk that fails is sent again after ``retry_delay`` seconds, doubled on each further attempt, up to
+    ``retries`` more times. Videos the API does not return get no row.
+
+    Raises:
+        errors.PartialSweepError: Once the other rows have been yielded, if chunks still failed after their retries.
+            Its ``errors`` has the last exception of each of their IDs; its ``results`` is empty.
+    """
+    endpoint = client.douyin_app_v3.fetch_multi_video_statistics.module
+    limit = concurrency or AdaptiveConcurrency()
+    loop = asyncio.get_running_loop()
+    ids = iter(aweme_ids)
+    exhausted = False
+    # Chunks to send again, with the loop time they are due at; waiting for it does not take up a slot
+    retrying: list[tuple[float, int, list[str]]] = []
+    running: dict[asyncio.Task[Any], tuple[list[str], int]] = {}
+    failed: dict[Any, Exception] = {}
+    rows = VideoStatisticsRows()
+
+    try:
+        while True:
+            while len(running) < int(limit.limit):
+                if retrying and retrying[0][0] <= loop.time():
+                    _, attempt, chunk = heapq.heappop(retrying)
+                elif not exhausted:
+                    chunk, attempt = [str(aweme_id) for aweme_id in islice(ids, CHUNK_SIZE)], 0
+                    if not chunk:
+                        exhausted = True
+                        continue
+                else:
+                    break
+                task = asyncio.ensure_future(fetch_data(endpoint, client=client, aweme_ids=",".join(chunk)))
+                running[task] = (chunk, attempt)
+            if not running and not retrying:
+                break
+            timeout = max(0.0, retrying[0][0] - loop.time()) if retrying else None
+            if not running:
+                await asyncio.sleep(timeout or 0)
+                continue
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                chunk, attempt = running.pop(task)
+                error = task.exception()
+                if error is None:
+                    limit.succeeded()
+                    add_statistics(rows, task.result(), int(time.time()))
+                elif isinstance(error, Exception):
+                    limit.failed(error)
+                    if attempt < retries:
+                        ready_at = loop.time() + retry_delay * 2**attempt
+                        heapq.heappush(retrying, (ready_at, attempt + 1, chunk))
+                    else:
+                        failed.update(dict.fromkeys(chunk, error))
+                else:
+                    raise error
+            if len(rows) >= buffer_size:
+                yield rows
+                rows = VideoStatisticsRows()
+    finally:
+        for task in running:
+            task.cancel()
+    if rows:
+        yield rows
+    if failed:
+        raise errors.PartialSweepError({}, failed)
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "MISSING",
+    "AdaptiveConcurrency",
+    "VideoStatisticsRows",
+    "add_statistics",
+    "aiter_video_statistics",
+    "read_ids",
+]